@@ -0,0 +1,490 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Module     : run_benchmark.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.4.0 (2026-10-17)
+
+This module provides a headless benchmark runner for the stream scenarios of examples 1a to 3b. Each
+scenario is instantiated without visualization and logging, run for a configurable number of cycles
+and dimensions in a separate process and measured. The results are written as a JSON file.
+
+Cases 2a-np and 2b-np run the scenarios of examples 2a and 2b with the native NumPy KMeans
+(mlwa.oa.tasks.KMeans) instead of KMeans@River for comparison. Accordingly, cases 3a-inc and 3b-inc
+run the scenarios of examples 3a and 3b with the incremental LOF (mlwa.oa.tasks.AnomalyDetectorLOF)
+instead of LOF@scikit-learn.
+
+Cases 1a and 1b read OpenML dataset 1477, whose data file is not part of this repository (see
+example1/dataset/note.md). If the dataset is neither cached nor OpenML reachable, they are skipped.
+
+Measured values per benchmark case:
+- cycles/sec
+- p50/p99/max cycle latency in microseconds
+- peak resident set size (RSS) of the benchmark process in MB
+
+Usage (from the root folder of this repository):
+
+    python benchmark/run_benchmark.py [-h] [--cases 1a 2a ...] [--cycles N] [--dims N]
+                                      [--output results.json] [--baseline results_old.json]
+                                      [--tolerance 0.1] [--record DIR | --replay DIR]
+
+If a baseline file is specified, the throughput of each case is compared with the related baseline
+result. The runner terminates with exit code 1 if at least one case is slower than the baseline by more
+than the given tolerance.
+
+With option --record, the input stream of each case is recorded into the stream log <DIR>/<case>.slog
+(see class mlwa.streams.StreamRecorder). With option --replay, each case is fed by this log at maximum
+speed instead of its original stream (see class mlwa.streams.StreamReplay). This way, the exact input
+of a run can be processed again by a later version of the code. Recording adds the cost of writing
+the log to the measured cycles.
+
+"""
+
+import sys
+import os
+import glob
+import socket
+import argparse
+import json
+import platform
+import importlib.util
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from time import perf_counter_ns
+
+import numpy as np
+
+from mlpro.bf.various import Log
+from mlpro.bf.ops import Mode
+
+
+
+
+# Root folder of this repository
+C_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+## -------------------------------------------------------------------------------------------------
+def _dims_feature_ids(p_dims : int) -> list:
+    # Consecutive feature ids of OpenML dataset 1477 starting with feature V5
+    return list(range(4, 4 + p_dims))
+
+
+## -------------------------------------------------------------------------------------------------
+def _dims_num_dim(p_dims : int) -> int:
+    return p_dims
+
+
+## -------------------------------------------------------------------------------------------------
+def _dims_functions(p_dims : int) -> list:
+    functions = ['sin', 'cos', 'const']
+    return [ functions[i % len(functions)] for i in range(p_dims) ]
+
+
+## -------------------------------------------------------------------------------------------------
+def _check_openml_1477() -> str:
+    # Dataset 1477 is available offline, if OpenML or the columnar cache holds its data
+    import openml
+
+    cache_dir = openml.config.get_cache_directory()
+    if os.path.isdir(os.path.join(cache_dir, 'columnar', '1477')): return None
+    if len(glob.glob(os.path.join(cache_dir, '**', '1477', 'dataset*.*'), recursive=True)) > 0: return None
+
+    try:
+        socket.create_connection(('api.openml.org', 443), timeout=5).close()
+        return None
+    except OSError:
+        return 'OpenML dataset 1477 is not cached and OpenML is not reachable (see example1/dataset/note.md)'
+
+
+## -------------------------------------------------------------------------------------------------
+def _attrs_kmeans_numpy() -> dict:
+    from mlwa.oa.tasks import KMeans
+    return { 'C_CLS_CLUSTERER' : KMeans }
+
+
+## -------------------------------------------------------------------------------------------------
+def _attrs_lof_incremental() -> dict:
+    return { 'C_INCREMENTAL_LOF' : True }
+
+
+# Benchmark cases: module path, scenario class, default number of cycles, default number of
+# dimensions, the class attribute that is set to change the dimensionality of the scenario and
+# optionally a function returning further class attributes to be set and a function returning a
+# reason to skip the case
+C_CASES = { '1a' : dict( module = 'example1/example1a_auto_renormalization_minmax.py',
+                         scenario = 'DemoScenario',
+                         cycles = 100,
+                         dims = 3,
+                         dim_attr = 'C_FEATURE_IDS',
+                         dim_fct = _dims_feature_ids ,
+                         check_fct = _check_openml_1477 ),
+            '1b' : dict( module = 'example1/example1b_auto_renormalization_ztrans.py',
+                         scenario = 'DemoScenario',
+                         cycles = 100,
+                         dims = 3,
+                         dim_attr = 'C_FEATURE_IDS',
+                         dim_fct = _dims_feature_ids ,
+                         check_fct = _check_openml_1477 ),
+            '2a' : dict( module = 'example2/example2a_online_clustering_of_stream_data_2d.py',
+                         scenario = 'Static2DScenario',
+                         cycles = 500,
+                         dims = 2,
+                         dim_attr = 'C_NUM_DIM',
+                         dim_fct = _dims_num_dim ),
+            '2b' : dict( module = 'example2/example2b_online_clustering_of_stream_data_3d.py',
+                         scenario = 'Static3DScenario',
+                         cycles = 600,
+                         dims = 3,
+                         dim_attr = 'C_NUM_DIM',
+                         dim_fct = _dims_num_dim ),
+            '2a-np' : dict( module = 'example2/example2a_online_clustering_of_stream_data_2d.py',
+                            scenario = 'Static2DScenario',
+                            cycles = 500,
+                            dims = 2,
+                            dim_attr = 'C_NUM_DIM',
+                            dim_fct = _dims_num_dim,
+                            attr_fct = _attrs_kmeans_numpy ),
+            '2b-np' : dict( module = 'example2/example2b_online_clustering_of_stream_data_3d.py',
+                            scenario = 'Static3DScenario',
+                            cycles = 600,
+                            dims = 3,
+                            dim_attr = 'C_NUM_DIM',
+                            dim_fct = _dims_num_dim,
+                            attr_fct = _attrs_kmeans_numpy ),
+            '3a' : dict( module = 'example3/example3a_anomaly_detection_3d.py',
+                         scenario = 'AdScenario4ADlof',
+                         cycles = 360,
+                         dims = 3,
+                         dim_attr = 'C_FUNCTIONS',
+                         dim_fct = _dims_functions ),
+            '3b' : dict( module = 'example3/example3b_anomaly_detection_nd.py',
+                         scenario = 'AdScenario4ADlof',
+                         cycles = 95,
+                         dims = 3,
+                         dim_attr = 'C_FUNCTIONS',
+                         dim_fct = _dims_functions ),
+            '3a-inc' : dict( module = 'example3/example3a_anomaly_detection_3d.py',
+                             scenario = 'AdScenario4ADlof',
+                             cycles = 360,
+                             dims = 3,
+                             dim_attr = 'C_FUNCTIONS',
+                             dim_fct = _dims_functions,
+                             attr_fct = _attrs_lof_incremental ),
+            '3b-inc' : dict( module = 'example3/example3b_anomaly_detection_nd.py',
+                             scenario = 'AdScenario4ADlof',
+                             cycles = 95,
+                             dims = 3,
+                             dim_attr = 'C_FUNCTIONS',
+                             dim_fct = _dims_functions,
+                             attr_fct = _attrs_lof_incremental ) }
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+def get_peak_rss_mb():
+    """
+    Returns the peak resident set size of the current process in MB or None, if it can't be
+    determined on the current platform.
+    """
+
+    try:
+        import resource
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == 'darwin': return peak_rss / 1048576
+        return peak_rss / 1024
+    except ImportError:
+        pass
+
+    try:
+        import psutil
+        return psutil.Process().memory_info().peak_wset / 1048576
+    except (ImportError, AttributeError, OSError):
+        return None
+
+
+## -------------------------------------------------------------------------------------------------
+def load_scenario_class(p_case : str, p_dims : int = None):
+    """
+    Loads the scenario class of a benchmark case from its example module. If a number of dimensions
+    is specified or the case defines further class attributes, a derived scenario class with adjusted
+    attributes is returned.
+
+    Parameters
+    ----------
+    p_case : str
+        Id of the benchmark case. See C_CASES.
+    p_dims : int
+        Optional number of dimensions. Default = None (dimensionality of the example).
+
+    Returns
+    -------
+    type
+        Scenario class.
+    """
+
+    case      = C_CASES[p_case]
+    path      = os.path.join(C_ROOT, case['module'])
+    name      = os.path.splitext(os.path.basename(path))[0]
+    spec      = importlib.util.spec_from_file_location(name, path)
+    module    = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    scenario_cls = getattr(module, case['scenario'])
+
+    attrs = case['attr_fct']() if 'attr_fct' in case else {}
+    if ( p_dims is not None ) and ( p_dims != case['dims'] ): attrs[case['dim_attr']] = case['dim_fct'](p_dims)
+
+    if len(attrs) == 0: return scenario_cls
+
+    return type( scenario_cls.__name__, (scenario_cls,), attrs )
+
+
+## -------------------------------------------------------------------------------------------------
+def replace_stream(p_scenario, p_record : str = None, p_replay : str = None):
+    """
+    Wraps the stream of a scenario by a stream recorder or replaces it by the replay of a stream log.
+
+    Parameters
+    ----------
+    p_scenario
+        Stream scenario.
+    p_record : str
+        Optional path of the stream log to be recorded. Default = None.
+    p_replay : str
+        Optional path of the stream log to be replayed. Default = None.
+    """
+
+    from mlwa.streams import StreamRecorder, StreamReplay
+
+    stream = p_scenario.get_stream()
+
+    if p_record is not None:
+        stream = StreamRecorder( p_stream = stream, p_path = p_record, p_logging = Log.C_LOG_NOTHING )
+    elif p_replay is not None:
+        stream = StreamReplay( p_path = p_replay,
+                               p_feature_space = stream.get_feature_space(),
+                               p_label_space = stream.get_label_space(),
+                               p_logging = Log.C_LOG_NOTHING )
+    else:
+        return
+
+    p_scenario._stream = stream
+    p_scenario.get_workflow().get_so().assign_stream( p_stream = stream )
+
+
+## -------------------------------------------------------------------------------------------------
+def run_case(p_case : str, p_cycles : int = None, p_dims : int = None, p_record : str = None, p_replay : str = None) -> dict:
+    """
+    Runs a single benchmark case headless in the current process. Cycles that hit the end of the
+    stream are not measured.
+
+    Parameters
+    ----------
+    p_case : str
+        Id of the benchmark case. See C_CASES.
+    p_cycles : int
+        Optional number of cycles. Default = None (number of cycles of the example).
+    p_dims : int
+        Optional number of dimensions. Default = None (dimensionality of the example).
+    p_record : str
+        Optional folder for recording the input stream. Default = None.
+    p_replay : str
+        Optional folder with the recorded input stream to be replayed. Default = None.
+
+    Returns
+    -------
+    dict
+        Benchmark result.
+    """
+
+    case   = C_CASES[p_case]
+    cycles = p_cycles or case['cycles']
+    dims   = p_dims or case['dims']
+    result = dict( case = p_case, scenario = case['scenario'], cycles = cycles, dims = dims )
+
+    skip = case['check_fct']() if 'check_fct' in case else None
+    if skip is not None:
+        result['skipped'] = skip
+        return result
+
+    try:
+        scenario_cls = load_scenario_class( p_case = p_case, p_dims = dims )
+        scenario     = scenario_cls( p_mode = Mode.C_MODE_SIM,
+                                     p_cycle_limit = cycles,
+                                     p_visualize = False,
+                                     p_logging = Log.C_LOG_NOTHING )
+
+        replace_stream( p_scenario = scenario,
+                        p_record = os.path.join(p_record, p_case + '.slog') if p_record else None,
+                        p_replay = os.path.join(p_replay, p_case + '.slog') if p_replay else None )
+        scenario.reset()
+
+        latencies = np.zeros(cycles, dtype=np.int64)
+        num_cycles = 0
+
+        for num_cycles in range(cycles):
+            tp_before = perf_counter_ns()
+            end_of_data = scenario.run_cycle()[5]
+            latencies[num_cycles] = perf_counter_ns() - tp_before
+            if end_of_data: break
+        else:
+            num_cycles = cycles
+
+        if p_record: scenario.get_stream().close()
+
+    except Exception as e:
+        result['error'] = type(e).__name__ + ': ' + str(e)
+        return result
+
+    if num_cycles == 0:
+        result['error'] = 'No data'
+        return result
+
+    latencies_usec = latencies[:num_cycles] / 1000
+    duration_sec   = latencies_usec.sum() / 1000000
+
+    result['cycles']           = num_cycles
+    result['duration_sec']     = round(duration_sec, 4)
+    result['cycles_per_sec']   = round(num_cycles / duration_sec, 1)
+    result['latency_p50_usec'] = round(float(np.percentile(latencies_usec, 50)), 1)
+    result['latency_p99_usec'] = round(float(np.percentile(latencies_usec, 99)), 1)
+    result['latency_max_usec'] = round(float(latencies_usec.max()), 1)
+    result['peak_rss_mb']      = get_peak_rss_mb()
+    if result['peak_rss_mb'] is not None: result['peak_rss_mb'] = round(result['peak_rss_mb'], 1)
+
+    return result
+
+
+## -------------------------------------------------------------------------------------------------
+def run_benchmark(p_cases : list, p_cycles : int = None, p_dims : int = None, p_record : str = None, p_replay : str = None) -> list:
+    """
+    Runs the given benchmark cases one after another, each in a fresh process, so that the peak RSS
+    values are not influenced by other cases. See function run_case() for the parameters.
+
+    Returns
+    -------
+    list
+        List of benchmark results.
+    """
+
+    results = []
+    mp_ctx  = multiprocessing.get_context('spawn')
+
+    for case in p_cases:
+        with ProcessPoolExecutor(max_workers=1, mp_context=mp_ctx) as executor:
+            result = executor.submit(run_case, case, p_cycles, p_dims, p_record, p_replay).result()
+
+        results.append(result)
+        print_result(result)
+
+    return results
+
+
+## -------------------------------------------------------------------------------------------------
+def print_result(p_result : dict):
+    if 'skipped' in p_result:
+        print(f"{p_result['case']:6} {p_result['scenario']:18} SKIPPED: {p_result['skipped']}")
+        return
+
+    if 'error' in p_result:
+        print(f"{p_result['case']:6} {p_result['scenario']:18} ERROR: {p_result['error']}")
+        return
+
+    print( f"{p_result['case']:6} {p_result['scenario']:18} dims={p_result['dims']:<4} cycles={p_result['cycles']:<7}",
+           f"cycles/sec={p_result['cycles_per_sec']:<10} p50={p_result['latency_p50_usec']}us",
+           f"p99={p_result['latency_p99_usec']}us peak_rss={p_result['peak_rss_mb']}MB" )
+
+
+## -------------------------------------------------------------------------------------------------
+def check_regressions(p_results : list, p_baseline : list, p_tolerance : float) -> list:
+    """
+    Compares the throughput of the given results with baseline results of the same case, number of
+    cycles and dimensions.
+
+    Returns
+    -------
+    list
+        List of tuples (case, cycles/sec, baseline cycles/sec) of all regressions.
+    """
+
+    baseline = { (r['case'], r['cycles'], r['dims']) : r for r in p_baseline if ( 'error' not in r ) and ( 'skipped' not in r ) }
+    regressions = []
+
+    for result in p_results:
+        if ( 'error' in result ) or ( 'skipped' in result ): continue
+
+        try:
+            ref = baseline[(result['case'], result['cycles'], result['dims'])]
+        except KeyError:
+            continue
+
+        if result['cycles_per_sec'] < ref['cycles_per_sec'] * ( 1 - p_tolerance ):
+            regressions.append( (result['case'], result['cycles_per_sec'], ref['cycles_per_sec']) )
+
+    return regressions
+
+
+
+
+if __name__ == '__main__':
+
+    # 1 Command line arguments
+    parser = argparse.ArgumentParser(description='Headless benchmark of the MLWA example scenarios')
+    parser.add_argument('--cases', nargs='+', default=list(C_CASES.keys()), choices=list(C_CASES.keys()))
+    parser.add_argument('--cycles', type=int, default=None, help='Number of cycles (default: as in the examples)')
+    parser.add_argument('--dims', type=int, default=None, help='Number of dimensions (default: as in the examples)')
+    parser.add_argument('--output', default='benchmark_results.json', help='Output file (JSON)')
+    parser.add_argument('--baseline', default=None, help='Optional baseline file (JSON) for regression checks')
+    parser.add_argument('--tolerance', type=float, default=0.1, help='Tolerated relative throughput loss')
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('--record', default=None, help='Optional folder for recording the input streams')
+    group.add_argument('--replay', default=None, help='Optional folder with recorded input streams to be replayed')
+    args = parser.parse_args()
+
+    if args.record is not None: os.makedirs(args.record, exist_ok=True)
+
+
+    # 2 Run the benchmark cases
+    results = run_benchmark( p_cases = args.cases,
+                             p_cycles = args.cycles,
+                             p_dims = args.dims,
+                             p_record = args.record,
+                             p_replay = args.replay )
+
+
+    # 3 Store the results
+    try:
+        from importlib.metadata import version
+        mlpro_version = version('mlpro')
+    except Exception:
+        mlpro_version = ''
+
+    report = dict( tstamp = datetime.now().isoformat(timespec='seconds'),
+                   python = platform.python_version(),
+                   platform = platform.platform(),
+                   mlpro = mlpro_version,
+                   results = results )
+
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    print('\nResults written to', args.output)
+
+
+    # 4 Optional regression check
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+
+        regressions = check_regressions( p_results = results, p_baseline = baseline, p_tolerance = args.tolerance )
+
+        for case, cps, cps_ref in regressions:
+            print(f'REGRESSION {case}: {cps} cycles/sec (baseline {cps_ref} cycles/sec)')
+
+        if len(regressions) > 0: sys.exit(1)
@@ -0,0 +1,18 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Module     : conftest.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-17)
+
+Configuration of the test suite. The tests run headless and import package mlwa from this folder.
+
+"""
+
+import os
+
+os.environ.setdefault('MPLBACKEND', 'agg')
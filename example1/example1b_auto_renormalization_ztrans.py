@@ -7,25 +7,35 @@
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.0.0 (2025-07-07)
+Ver. 1.7.0 (2026-10-17)
 
 This experiment demonstrates how to
 - access and process data sets from OpenML using MLPro's integration package mlpro_int_openml
 - set up a stream workflow consisting of numerous stream tasks
+- process a range of a stream without fast-forwarding through the skipped instances
+- buffer data in a sliding window with incremental statistics
+- optionally process the stream in micro-batches (parameter p_batch_size)
+- optionally run independent workflow branches concurrently (workflow range C_RANGE_THREAD) or
+  the workflow as a pipeline of processes (workflow range C_RANGE_PROCESS)
+- plot long horizons in the ND view from bounded, downsampled plot buffers
 - configure MLPro's auto-renormalization mechanism using Z-transformation
 
 """
 
+import sys
+import os
+
 from mlpro.bf.various import Log
 from mlpro.bf.plot import PlotSettings
 from mlpro.bf.ops import Mode
-from mlpro.bf.streams.tasks import Rearranger, RingBuffer
-
-from mlpro.oa.streams import OAStreamTask, OAStreamWorkflow, OAStreamScenario, OAStreamAdaptationType
-from mlpro.oa.streams.tasks import NormalizerZTransform, MovingAverage
+from mlpro.oa.streams import OAStreamAdaptationType
 from mlpro.oa.streams.helpers import OAObserver
 
-from mlpro_int_openml import WrStreamProviderOpenML
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from mlwa.streams.tasks import Rearranger, RingBuffer
+from mlwa.oa import OAStreamTask, OAStreamWorkflow, OAStreamScenario
+from mlwa.oa.tasks import NormalizerZTransform, MovingAverage
+from mlwa.wrappers.openml import WrStreamProviderOpenML
 
 
 
@@ -34,7 +44,8 @@ from mlpro_int_openml import WrStreamProviderOpenML
 ## -------------------------------------------------------------------------------------------------
 class DemoScenario (OAStreamScenario):
 
-    C_NAME = 'Auto-renormalization MinMax'
+    C_NAME        = 'Auto-renormalization MinMax'
+    C_FEATURE_IDS = [4,5,6]     # Features V5,V6,V7
 
 ## -------------------------------------------------------------------------------------------------
     def __init__( self, 
@@ -44,7 +55,8 @@ class DemoScenario (OAStreamScenario):
                   p_num_features : int = 2,
                   p_num_inst : int = 1000,
                   p_visualize : bool = False, 
-                  p_logging = Log.C_LOG_ALL ):
+                  p_logging = Log.C_LOG_ALL,
+                  p_batch_size : int = 1 ):
         
         self._num_features  = p_num_features
         self._num_inst      = p_num_inst
@@ -53,17 +65,19 @@ class DemoScenario (OAStreamScenario):
                           p_ada = p_ada, 
                           p_cycle_limit = p_cycle_limit, 
                           p_visualize = p_visualize, 
-                          p_logging = p_logging )
+                          p_logging = p_logging,
+                          p_batch_size = p_batch_size )
 
 
 ## -------------------------------------------------------------------------------------------------
     def _setup(self, p_mode, p_ada: bool, p_visualize: bool, p_logging):
 
-        # 1 Load the OpenML data stream 1477 'gas-drift'
-        stream        = WrStreamProviderOpenML( p_logging = p_logging ).get_stream( p_id = '1477' )
+        # 1 Load the OpenML data stream 1477 'gas-drift' (a local copy is provided in subfolder 'dataset')
+        local_dirs    = [ os.path.join( os.path.dirname(os.path.abspath(__file__)), 'dataset' ) ]
+        stream        = WrStreamProviderOpenML( p_local_dirs = local_dirs, p_logging = p_logging ).get_stream( p_id = '1477' )
         feature_space = stream.get_feature_space()
         features      = feature_space.get_dims()
-        features_new  = [ features[i] for i in [4,5,6] ]  # Features V5, V6,V7
+        features_new  = [ features[i] for i in self.C_FEATURE_IDS ]
         
 
         # 2 Set up the stream workflow 
@@ -167,64 +181,62 @@ class DemoScenario (OAStreamScenario):
 
 
 
-# 1 Demo setup
+if __name__ == '__main__':
+
+    # 1 Demo setup
 
-# 1.1 Default values
-time_index_start    = 1300
-time_index_stop     = 1400
-logging             = Log.C_LOG_ALL
-visualize           = True
-step_rate           = 1
+    # 1.1 Default values
+    time_index_start    = 1300
+    time_index_stop     = 1400
+    logging             = Log.C_LOG_ALL
+    visualize           = True
+    step_rate           = 1
 
- 
-# 1.2 Welcome message
-print('\n\n-----------------------------------------------------------------------------------------')
-print('Publication: "MLPro 2.0 - Online machine learning in Python"')
-print('Journal    : ScienceDirect, Machine Learning with Applications (MLWA)')
-print('Authors    : D. Arend, L.S. Baheti, S. Yuwono, S.P.S. Kumar, A. Schwung')
-print('Affiliation: South Westphalia University of Applied Sciences, Germany')
-print('Sample     : 1b Auto-renormalization of drifting stream data (Z-transformation)')
-print('-----------------------------------------------------------------------------------------\n\n')
 
-# 1.3 User input and derived values
-i = input(f'Start time index (press ENTER for {time_index_start}): ')
-if i != '': time_index_start = int(i)
-i = input(f'End time index (press ENTER for {time_index_stop}): ')
-if i != '': time_index_stop = int(i)
+    # 1.2 Welcome message
+    print('\n\n-----------------------------------------------------------------------------------------')
+    print('Publication: "MLPro 2.0 - Online machine learning in Python"')
+    print('Journal    : ScienceDirect, Machine Learning with Applications (MLWA)')
+    print('Authors    : D. Arend, L.S. Baheti, S. Yuwono, S.P.S. Kumar, A. Schwung')
+    print('Affiliation: South Westphalia University of Applied Sciences, Germany')
+    print('Sample     : 1b Auto-renormalization of drifting stream data (Z-transformation)')
+    print('-----------------------------------------------------------------------------------------\n\n')
 
-if time_index_start >= time_index_stop:
-    print('\nERROR: Start time index must be less than end time index')
-    exit(1)
+    # 1.3 User input and derived values
+    i = input(f'Start time index (press ENTER for {time_index_start}): ')
+    if i != '': time_index_start = int(i)
+    i = input(f'End time index (press ENTER for {time_index_stop}): ')
+    if i != '': time_index_stop = int(i)
 
-i = input(f'Visualization step rate (press ENTER for {step_rate}): ')
-if i != '': step_rate = int(i)
+    if time_index_start >= time_index_stop:
+        print('\nERROR: Start time index must be less than end time index')
+        exit(1)
 
-cycle_limit  = time_index_stop - time_index_start
-plot_horizon = cycle_limit
-data_horizon = 0
+    i = input(f'Visualization step rate (press ENTER for {step_rate}): ')
+    if i != '': step_rate = int(i)
 
-# 2 Instantiate the stream scenario
-myscenario = DemoScenario( p_mode=Mode.C_MODE_SIM,
-                           p_cycle_limit=cycle_limit,
-                           p_visualize=visualize,
-                           p_logging=logging )
+    cycle_limit  = time_index_stop - time_index_start
+    plot_horizon = cycle_limit
+    data_horizon = 0
 
+    # 2 Instantiate the stream scenario
+    myscenario = DemoScenario( p_mode=Mode.C_MODE_SIM,
+                               p_cycle_limit=cycle_limit,
+                               p_visualize=visualize,
+                               p_logging=logging )
 
-# 3 Reset and run own stream scenario
-myscenario.reset()
 
-# 3.1 Fast forward to start time index
-stream_iterator = myscenario._iterator
-for ti in range(time_index_start): inst = next(stream_iterator)
+    # 3 Reset and run own stream scenario in the range [start time index, end time index)
+    myscenario.reset()
 
-myscenario.init_plot( p_plot_settings=PlotSettings( p_view = PlotSettings.C_VIEW_ND,
-                                                    p_view_autoselect = False,
-                                                    p_step_rate = step_rate,
-                                                    p_plot_horizon = plot_horizon,
-                                                    p_data_horizon = data_horizon ) )
+    myscenario.init_plot( p_plot_settings=PlotSettings( p_view = PlotSettings.C_VIEW_ND,
+                                                        p_view_autoselect = False,
+                                                        p_step_rate = step_rate,
+                                                        p_plot_horizon = plot_horizon,
+                                                        p_data_horizon = data_horizon ) )
 
-input('\n\nPlease arrange all windows and press ENTER to start stream processing...')
+    input('\n\nPlease arrange all windows and press ENTER to start stream processing...')
 
-myscenario.run()
+    myscenario.run( p_start = time_index_start, p_stop = time_index_stop )
 
-input('Press ENTER to exit...')
\ No newline at end of file
+    input('Press ENTER to exit...')
\ No newline at end of file
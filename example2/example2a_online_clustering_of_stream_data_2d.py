@@ -7,7 +7,7 @@
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.0.0 (2024-12-12)
+Ver. 1.6.0 (2026-10-17)
 
 This example demonstrates online cluster analysis of normalized static 2D random point clouds using the wrapped
 River implementation of stream algorithm KMeans. To this regard, the systematics of sub-framework 
@@ -24,30 +24,59 @@ In particular you will learn:
 
 4. How to reuse native MLPro online adaptive min-max normalization for data preprocessing
 
+The wrapped River KMeans can be replaced by the native NumPy implementation mlwa.oa.tasks.KMeans
+with the same parameters (class attribute C_CLS_CLUSTERER).
+
+The benchmark stream is taken from mlwa.streams.streams.StreamMLProClouds, a drop-in replacement of the
+native MLPro stream that generates the same instances block-wise.
+
+The scenario is taken from mlwa.oa.OAStreamScenario. With a frame rate > 0, the plots are drawn by
+mlwa.streams.Renderer at a limited frame rate, so that the visualization slows down the stream
+processing only slightly. Frame rate 0 updates all windows inline with each cycle.
+
+With an export path, the example runs without windows (also without a display) and the plots are
+exported as animated GIF files into this directory by mlwa.streams.FrameExporter.
+
 """
 
+import sys
+import os
 from datetime import datetime
 
-from mlpro.bf.streams.streams import StreamMLProClouds
 from mlpro.bf.various import Log
 from mlpro.bf.plot import PlotSettings
 from mlpro.bf.ops import Mode
-from mlpro.oa.streams import OAStreamScenario, OAStreamWorkflow
+from mlpro.oa.streams import OAStreamWorkflow
 from mlpro.oa.streams.tasks import BoundaryDetector, NormalizerMinMax
 
-from mlpro_int_river.wrappers.clusteranalyzers import WrRiverKMeans2MLPro
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from mlwa.streams.streams import StreamMLProClouds
+from mlwa.streams import Renderer, FrameExporter, init_headless
+from mlwa.oa import OAStreamScenario
+from mlwa.wrappers.river import WrRiverKMeans2MLPro
+from mlwa.oa.tasks import KMeans
 
 
 
 # Prepare a scenario for Static 2D Point Clouds
 class Static2DScenario(OAStreamScenario):
 
-    C_NAME = 'Static2DScenario'
+    C_NAME    = 'Static2DScenario'
+    C_NUM_DIM = 2
+
+    # Cluster analyzer class: WrRiverKMeans2MLPro or KMeans
+    C_CLS_CLUSTERER = WrRiverKMeans2MLPro
 
     def _setup(self, p_mode, p_ada: bool, p_visualize: bool, p_logging):
 
+        # 0 Name of the cluster analyzer (wrapped River or native implementation)
+        if issubclass(self.C_CLS_CLUSTERER, WrRiverKMeans2MLPro):
+            name_clusterer = 'KMeans@River'
+        else:
+            name_clusterer = 'KMeans@MLWA'
+
         # 1 Get stream from StreamMLProClouds
-        stream = StreamMLProClouds( p_num_dim = 2,
+        stream = StreamMLProClouds( p_num_dim = self.C_NUM_DIM,
                                     p_num_instances = 2000,
                                     p_num_clouds = 5,
                                     p_seed = 1,
@@ -58,7 +87,7 @@ class Static2DScenario(OAStreamScenario):
         # 2 Set up a stream workflow based on a custom stream task
 
         # 2.1 Creation of a workflow
-        workflow = OAStreamWorkflow( p_name = 'Cluster Analysis using KMeans@River',
+        workflow = OAStreamWorkflow( p_name = 'Cluster Analysis using ' + name_clusterer,
                                      p_range_max = OAStreamWorkflow.C_RANGE_NONE,
                                      p_ada = p_ada,
                                      p_visualize = p_visualize,
@@ -87,15 +116,15 @@ class Static2DScenario(OAStreamScenario):
         workflow.add_task( p_task = task_norm_minmax, p_pred_tasks=[task_bd] )
 
         # Cluster Analyzer
-        task_clusterer = WrRiverKMeans2MLPro( p_name = '#3: KMeans@River',
-                                              p_n_clusters = 5,
-                                              p_halflife = 0.3, 
-                                              p_sigma = 0.1, 
-                                              p_mu = 0.0,
-                                              p_seed = 3, 
-                                              p_p = 1,
-                                              p_visualize = p_visualize,
-                                              p_logging = p_logging )
+        task_clusterer = self.C_CLS_CLUSTERER( p_name = '#3: ' + name_clusterer,
+                                               p_n_clusters = 5,
+                                               p_halflife = 0.3, 
+                                               p_sigma = 0.1, 
+                                               p_mu = 0.0,
+                                               p_seed = 3, 
+                                               p_p = 1,
+                                               p_visualize = p_visualize,
+                                               p_logging = p_logging )
         
         task_norm_minmax.register_event_handler( p_event_id = NormalizerMinMax.C_EVENT_ADAPTED,
                                                  p_event_handler = task_clusterer.renormalize_on_event )
@@ -108,57 +137,76 @@ class Static2DScenario(OAStreamScenario):
 
 
 
-# 1 Demo setup
-
-# 1.1 Default values
-cycle_limit = 500
-logging     = Log.C_LOG_ALL
-visualize   = True
-step_rate   = 1
-
-# 1.2 Welcome message
-print('\n\n-----------------------------------------------------------------------------------------')
-print('Publication: "MLPro 2.0 - Online machine learning in Python"')
-print('Journal    : ScienceDirect, Machine Learning with Applications (MLWA)')
-print('Authors    : D. Arend, L.S. Baheti, S. Yuwono, S.P.S. Kumar, A. Schwung')
-print('Affiliation: South Westphalia University of Applied Sciences, Germany')
-print('Sample     : 2a Online clustering of stream data (2D)')
-print('-----------------------------------------------------------------------------------------\n')
-
-
-# 2 Instantiate the stream scenario
-myscenario = Static2DScenario( p_mode = Mode.C_MODE_SIM,
-                               p_cycle_limit = cycle_limit,
-                               p_visualize = visualize,
-                               p_logging=logging )
-
-
-
-# 3 Reset and run own stream scenario
-myscenario.reset()
-myscenario.init_plot( p_plot_settings=PlotSettings( p_view = PlotSettings.C_VIEW_ND,
-                                                    p_step_rate = step_rate ) )
-
-input('\nPlease arrange all windows and press ENTER to start stream processing...')
-
-tp_before           = datetime.now()
-myscenario.run()
-tp_after            = datetime.now()
-tp_delta            = tp_after - tp_before
-duraction_sec       = ( tp_delta.seconds * 1000000 + tp_delta.microseconds + 1 ) / 1000000
-myscenario.log(Log.C_LOG_TYPE_S, 'Duration [sec]:', round(duraction_sec,2), ', Cycles/sec:', round(cycle_limit/duraction_sec,2))
-
-clusters            = myscenario.get_workflow()._tasks[2].clusters
-number_of_clusters  = len(clusters)
-
-myscenario.log(Log.C_LOG_TYPE_I, '-------------------------------------------------------')
-myscenario.log(Log.C_LOG_TYPE_I, '-------------------------------------------------------')
-myscenario.log(Log.C_LOG_TYPE_I, 'Here is the recap of the cluster analyzer')
-myscenario.log(Log.C_LOG_TYPE_I, 'Number of clusters: ', number_of_clusters)
-for x in range(number_of_clusters):
-    myscenario.log(Log.C_LOG_TYPE_I, 'Center of Cluster ', str(x+1), ': ', list(clusters[x].centroid.value))
-    myscenario.log(Log.C_LOG_TYPE_I, 'Size of Cluster ', str(x+1), ': ', clusters[x].size.value)
-myscenario.log(Log.C_LOG_TYPE_I, '-------------------------------------------------------')
-myscenario.log(Log.C_LOG_TYPE_I, '-------------------------------------------------------')
-
-input('Press ENTER to exit...')
\ No newline at end of file
+if __name__ == '__main__':
+
+    # 1 Demo setup
+
+    # 1.1 Default values
+    cycle_limit = 500
+    logging     = Log.C_LOG_ALL
+    visualize   = True
+    step_rate   = 1
+    frame_rate  = 10
+    export_path = None
+
+    # 1.2 Welcome message
+    print('\n\n-----------------------------------------------------------------------------------------')
+    print('Publication: "MLPro 2.0 - Online machine learning in Python"')
+    print('Journal    : ScienceDirect, Machine Learning with Applications (MLWA)')
+    print('Authors    : D. Arend, L.S. Baheti, S. Yuwono, S.P.S. Kumar, A. Schwung')
+    print('Affiliation: South Westphalia University of Applied Sciences, Germany')
+    print('Sample     : 2a Online clustering of stream data (2D)')
+    print('-----------------------------------------------------------------------------------------\n')
+
+
+    # 2 Instantiate the stream scenario
+    if export_path is not None:
+        init_headless()
+        renderer = FrameExporter( p_path = export_path, p_logging = logging )
+    elif frame_rate > 0:
+        renderer = Renderer( p_frame_rate = frame_rate, p_logging = logging )
+    else:
+        renderer = None
+
+    myscenario = Static2DScenario( p_mode = Mode.C_MODE_SIM,
+                                   p_cycle_limit = cycle_limit,
+                                   p_visualize = visualize,
+                                   p_renderer = renderer,
+                                   p_logging=logging )
+
+
+
+    # 3 Reset and run own stream scenario
+    myscenario.reset()
+    myscenario.init_plot( p_plot_settings=PlotSettings( p_view = PlotSettings.C_VIEW_ND,
+                                                        p_step_rate = step_rate ) )
+
+    if export_path is None:
+        input('\nPlease arrange all windows and press ENTER to start stream processing...')
+
+    tp_before           = datetime.now()
+    myscenario.run()
+    tp_after            = datetime.now()
+    tp_delta            = tp_after - tp_before
+    duraction_sec       = ( tp_delta.seconds * 1000000 + tp_delta.microseconds + 1 ) / 1000000
+    myscenario.log(Log.C_LOG_TYPE_S, 'Duration [sec]:', round(duraction_sec,2), ', Cycles/sec:', round(cycle_limit/duraction_sec,2))
+
+    clusterer           = myscenario.get_workflow()._tasks[2]
+    centroids           = clusterer.get_centroids()
+    sizes               = clusterer.get_cluster_sizes()
+    number_of_clusters  = len(clusterer.clusters)
+
+    myscenario.log(Log.C_LOG_TYPE_I, '-------------------------------------------------------')
+    myscenario.log(Log.C_LOG_TYPE_I, '-------------------------------------------------------')
+    myscenario.log(Log.C_LOG_TYPE_I, 'Here is the recap of the cluster analyzer')
+    myscenario.log(Log.C_LOG_TYPE_I, 'Number of clusters: ', number_of_clusters)
+    for x in range(number_of_clusters):
+        myscenario.log(Log.C_LOG_TYPE_I, 'Center of Cluster ', str(x+1), ': ', list(centroids[x]))
+        myscenario.log(Log.C_LOG_TYPE_I, 'Size of Cluster ', str(x+1), ': ', sizes[x])
+    myscenario.log(Log.C_LOG_TYPE_I, '-------------------------------------------------------')
+    myscenario.log(Log.C_LOG_TYPE_I, '-------------------------------------------------------')
+
+    if export_path is None:
+        input('Press ENTER to exit...')
+    else:
+        renderer.close()
@@ -7,7 +7,7 @@
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.0.0 (2025-04-26)
+Ver. 1.5.0 (2026-10-17)
 
 This module demonstrates the use of anomaly detector based on local outlier factor algorithm with MLPro.
 To this regard, a stream of a stream provider is combined with a stream workflow to a stream scenario.
@@ -24,17 +24,42 @@ You will learn:
 4) How to reuse an anomaly detector algorithm from scikitlearn (https://scikit-learn.org/), specifically
 Local Outlier Factor
 
+The wrapped scikit-learn LOF can be replaced by the incremental sliding-window LOF
+mlwa.oa.tasks.AnomalyDetectorLOF, which does not refit the model on each instance (class attribute
+C_INCREMENTAL_LOF).
+
+The scikit-learn LOF is wrapped by mlwa.wrappers.sklearn.WrAnomalyDetectorSklearn2MLPro, which can
+optionally score all instances of a micro-batch at once (parameter p_batch_scoring).
+
+The benchmark stream is taken from mlwa.streams.streams.StreamMLProPOutliers, a drop-in replacement of the
+native MLPro stream that generates the same instances block-wise.
+
+The scenario is taken from mlwa.oa.OAStreamScenario. With a frame rate > 0, the plots are drawn by
+mlwa.streams.Renderer at a limited frame rate, so that the visualization slows down the stream
+processing only slightly. Frame rate 0 updates all windows inline with each cycle.
+
+With an export path, the example runs without windows (also without a display) and the plots are
+exported as animated GIF files into this directory by mlwa.streams.FrameExporter.
+
 """
 
 
+import sys
+import os
+
 from mlpro.bf.various import Log
 from mlpro.bf.ops import Mode
 from mlpro.bf.plot import PlotSettings
-from mlpro.bf.streams.streams import StreamMLProPOutliers
-from mlpro.oa.streams import OAStreamWorkflow, OAStreamScenario
+from mlpro.oa.streams import OAStreamWorkflow
 
 from sklearn.neighbors import LocalOutlierFactor as LOF
-from mlpro_int_sklearn.wrappers.anomalydetectors import WrAnomalyDetectorSklearn2MLPro
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from mlwa.streams.streams import StreamMLProPOutliers
+from mlwa.streams import Renderer, FrameExporter, init_headless
+from mlwa.oa import OAStreamScenario
+from mlwa.wrappers.sklearn import WrAnomalyDetectorSklearn2MLPro
+from mlwa.oa.tasks import AnomalyDetectorLOF
 
 
 
@@ -42,13 +67,17 @@ from mlpro_int_sklearn.wrappers.anomalydetectors import WrAnomalyDetectorSklearn
 ## -------------------------------------------------------------------------------------------------
 class AdScenario4ADlof (OAStreamScenario):
 
-    C_NAME = 'AdScenario4ADlof'
+    C_NAME      = 'AdScenario4ADlof'
+    C_FUNCTIONS = ['sin', 'cos', 'const']
+
+    # Anomaly detector: LOF@scikit-learn (False) or incremental LOF (True)
+    C_INCREMENTAL_LOF = False
 
 ## -------------------------------------------------------------------------------------------------
     def _setup(self, p_mode, p_ada: bool, p_visualize: bool, p_logging):
 
         # 1 Get the native stream from MLPro stream provider
-        mystream = StreamMLProPOutliers( p_functions = ['sin', 'cos', 'const'],
+        mystream = StreamMLProPOutliers( p_functions = self.C_FUNCTIONS,
                                          p_outlier_rate = 0.022,
                                          p_seed = 6, 
                                          p_visualize = p_visualize,
@@ -61,12 +90,19 @@ class AdScenario4ADlof (OAStreamScenario):
                                      p_visualize = p_visualize, 
                                      p_logging = p_logging )
 
-        # 3 Set up and wrap the LOF anomaly detector provided by scikit-learn
-        wrapped_lof = WrAnomalyDetectorSklearn2MLPro( p_algo_scikit_learn = LOF( n_neighbors = 3 ),
-                                                      p_group_anomaly_det = False, 
-                                                      p_delay = 3, 
-                                                      p_visualize = p_visualize,
-                                                      p_logging = p_logging )
+        # 3 Set up the incremental LOF or wrap the LOF anomaly detector provided by scikit-learn
+        if self.C_INCREMENTAL_LOF:
+            wrapped_lof = AnomalyDetectorLOF( p_window_size = 20,
+                                              p_n_neighbors = 3,
+                                              p_group_anomaly_det = False,
+                                              p_visualize = p_visualize,
+                                              p_logging = p_logging )
+        else:
+            wrapped_lof = WrAnomalyDetectorSklearn2MLPro( p_algo_scikit_learn = LOF( n_neighbors = 3 ),
+                                                          p_group_anomaly_det = False, 
+                                                          p_delay = 3, 
+                                                          p_visualize = p_visualize,
+                                                          p_logging = p_logging )
 
         # 4 Add anomaly detection task to workflow
         workflow.add_task( p_task = wrapped_lof )
@@ -77,40 +113,57 @@ class AdScenario4ADlof (OAStreamScenario):
 
 
 
-# 1 Demo setup
+if __name__ == '__main__':
+
+    # 1 Demo setup
+
+    # 1.1 Default values
+    cycle_limit = 360
+    logging     = Log.C_LOG_ALL
+    visualize   = True
+    step_rate   = 2
+    frame_rate  = 10
+    export_path = None
+
+    # 1.2 Welcome message
+    print('\n\n-----------------------------------------------------------------------------------------')
+    print('Publication: "MLPro 2.0 - Online machine learning in Python"')
+    print('Journal    : ScienceDirect, Machine Learning with Applications (MLWA)')
+    print('Authors    : D. Arend, L.S. Baheti, S. Yuwono, S.P.S. Kumar, A. Schwung')
+    print('Affiliation: South Westphalia University of Applied Sciences, Germany')
+    print('Sample     : 3a Anomaly detection (3D)')
+    print('-----------------------------------------------------------------------------------------\n')
 
-# 1.1 Default values
-cycle_limit = 360
-logging     = Log.C_LOG_ALL
-visualize   = True
-step_rate   = 2
-  
-# 1.2 Welcome message
-print('\n\n-----------------------------------------------------------------------------------------')
-print('Publication: "MLPro 2.0 - Online machine learning in Python"')
-print('Journal    : ScienceDirect, Machine Learning with Applications (MLWA)')
-print('Authors    : D. Arend, L.S. Baheti, S. Yuwono, S.P.S. Kumar, A. Schwung')
-print('Affiliation: South Westphalia University of Applied Sciences, Germany')
-print('Sample     : 3a Anomaly detection (3D)')
-print('-----------------------------------------------------------------------------------------\n')
 
+    # 2 Instantiate the stream scenario
+    if export_path is not None:
+        init_headless()
+        renderer = FrameExporter( p_path = export_path, p_logging = logging )
+    elif frame_rate > 0:
+        renderer = Renderer( p_frame_rate = frame_rate, p_logging = logging )
+    else:
+        renderer = None
 
-# 2 Instantiate the stream scenario
-myscenario = AdScenario4ADlof( p_mode = Mode.C_MODE_SIM,
-                               p_cycle_limit = cycle_limit,
-                               p_visualize = visualize,
-                               p_logging = logging )
+    myscenario = AdScenario4ADlof( p_mode = Mode.C_MODE_SIM,
+                                   p_cycle_limit = cycle_limit,
+                                   p_visualize = visualize,
+                                   p_renderer = renderer,
+                                   p_logging = logging )
 
 
-# 3 Reset and run own stream scenario
-myscenario.reset()
+    # 3 Reset and run own stream scenario
+    myscenario.reset()
 
-myscenario.init_plot( p_plot_settings=PlotSettings( p_view = PlotSettings.C_VIEW_ND,
-                                                    p_view_autoselect = True,
-                                                    p_step_rate = step_rate ) )
+    myscenario.init_plot( p_plot_settings=PlotSettings( p_view = PlotSettings.C_VIEW_ND,
+                                                        p_view_autoselect = True,
+                                                        p_step_rate = step_rate ) )
 
-input('\nPlease arrange all windows and press ENTER to start stream processing...')
+    if export_path is None:
+        input('\nPlease arrange all windows and press ENTER to start stream processing...')
 
-myscenario.run()
+    myscenario.run()
 
-input('Press ENTER to exit...')   
\ No newline at end of file
+    if export_path is None:
+        input('Press ENTER to exit...')
+    else:
+        renderer.close()
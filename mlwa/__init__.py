@@ -0,0 +1,3 @@
+"""
+### MLWA - Extensions of MLPro used by the examples of the paper 'MLPro 2.0 - Online machine learning in Python' ('mlwa')
+"""
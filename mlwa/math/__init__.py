@@ -0,0 +1,5 @@
+"""
+### Extensions of MLPro's mathematical basics ('mlwa.math')
+"""
+
+from .basics import *
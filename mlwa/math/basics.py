@@ -0,0 +1,238 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Package    : mlwa.math
+## -- Module     : basics.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.3.0 (2026-10-17)
+
+This module provides extensions of MLPro's mathematical basic classes.
+
+"""
+
+import threading
+
+import numpy as np
+
+from mlpro.bf.math import Set, Element
+from mlpro.bf.math.normalizers import Normalizer
+
+
+
+# Export list for public API
+__all__ = [ 'get_renormalization',
+            'get_values_ro',
+            'ElementCOW' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+def get_renormalization(p_normalizer : Normalizer):
+    """
+    Determines the renormalization of a normalizer as a single affine transformation per dimension.
+    Renormalizing data x (denormalization with the previous and normalization with the current
+    parameters) is equivalent to x * scale + offset.
+
+    Parameters
+    ----------
+    p_normalizer : Normalizer
+        Normalizer with previous and current parameters.
+
+    Returns
+    -------
+    scale : np.ndarray
+        Scale factor per dimension or None, if the renormalization can't be expressed as affine
+        transformation (no previous parameters, zero scale factors).
+    offset : np.ndarray
+        Offset per dimension or None.
+    """
+
+    param_old = p_normalizer._param_old
+    param_new = p_normalizer._param_new
+
+    if ( param_old is None ) or ( param_new is None ) or np.any( param_old[0] == 0 ): return None, None
+
+    scale  = param_new[0] / param_old[0]
+    offset = param_new[1] - param_old[1] * scale
+    return scale, offset
+
+
+## -------------------------------------------------------------------------------------------------
+def get_values_ro(p_element : Element):
+    """
+    Returns the values of an element for read-only access. Elements of type ElementCOW provide their
+    (possibly shared) value buffer without copying it. Other elements return their values as usual.
+
+    Parameters
+    ----------
+    p_element : Element
+        Element to be read.
+
+    Returns
+    -------
+    values
+        Values of the element. They must not be changed.
+    """
+
+    if isinstance(p_element, ElementCOW): return p_element.get_values_ro()
+    return p_element.get_values()
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class ElementCOW (Element):
+    """
+    Element with copy-on-write semantics. Duplicates created by methods share() and copy() refer to
+    the value buffer of the original element, and the elements sharing a buffer are counted. Before
+    the buffer can be changed, an element takes over its own copy of it. This is the case on access
+    via method get_values() (the returned array may be changed in place), set_value() and
+    set_values(). The last element of a sharing group keeps the buffer without copying it. Methods
+    get_value() and get_values_ro() read the shared buffer.
+
+    Only elements of this type can share their buffer, since the write accesses of other elements
+    can't be tracked. Duplicates of other elements (and of non-numeric elements with values stored as
+    list) get their own copy of the values immediately.
+
+    Parameters
+    ----------
+    p_set : Set
+        Underlying set.
+    """
+
+    C_LOCK = threading.Lock()
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_set : Set):
+
+        super().__init__( p_set = p_set )
+        self._sharing = None
+
+
+## -------------------------------------------------------------------------------------------------
+    @classmethod
+    def adopt(cls, p_element : Element):
+        """
+        Returns an element of this type that takes over the value buffer of the given element without
+        copying it. Afterwards, the given element shall not be used anymore.
+
+        Parameters
+        ----------
+        p_element : Element
+            Element to be taken over.
+
+        Returns
+        -------
+        ElementCOW
+            The given element, if it is of this type already. Otherwise, a new element with the set
+            and the value buffer of the given element.
+        """
+
+        if isinstance(p_element, cls): return p_element
+
+        element          = cls.__new__(cls)
+        element._set     = p_element.get_related_set()
+        element._values  = p_element.get_values()
+        element._sharing = None
+        return element
+
+
+## -------------------------------------------------------------------------------------------------
+    @classmethod
+    def share(cls, p_element : Element):
+        """
+        Creates a copy-on-write duplicate of an element.
+
+        Parameters
+        ----------
+        p_element : Element
+            Element to be duplicated.
+
+        Returns
+        -------
+        ElementCOW
+            Duplicate sharing the value buffer of the given element, if it is a numeric element of
+            this type. Otherwise, a duplicate with a copy of the values.
+        """
+
+        duplicate      = cls.__new__(cls)
+        duplicate._set = p_element.get_related_set()
+
+        if ( not isinstance(p_element, ElementCOW) ) or ( not isinstance(p_element._values, np.ndarray) ):
+            duplicate._values  = p_element.get_values().copy()
+            duplicate._sharing = None
+            return duplicate
+
+        with cls.C_LOCK:
+            if p_element._sharing is None: p_element._sharing = [1]
+            p_element._sharing[0] += 1
+            duplicate._values      = p_element._values
+            duplicate._sharing     = p_element._sharing
+
+        return duplicate
+
+
+## -------------------------------------------------------------------------------------------------
+    def is_shared(self) -> bool:
+        """
+        Returns True, if the value buffer is shared with other elements.
+        """
+
+        return ( self._sharing is not None ) and ( self._sharing[0] > 1 )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _leave_sharing(self, p_copy : bool):
+        """
+        Leaves the sharing group of the value buffer. Optionally, an own copy of the buffer is taken
+        over, unless the element is the last one of the group.
+        """
+
+        with self.C_LOCK:
+            if p_copy and ( self._sharing[0] > 1 ): self._values = self._values.copy()
+            self._sharing[0] -= 1
+            self._sharing     = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_values(self):
+        if self._sharing is not None: self._leave_sharing( p_copy = True )
+        return self._values
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_values_ro(self):
+        """
+        Returns the values without leaving the sharing group. A shared buffer is returned as read-only
+        view, so that it can't be changed by mistake.
+        """
+
+        if not self.is_shared(): return self._values
+
+        values = self._values.view()
+        values.flags.writeable = False
+        return values
+
+
+## -------------------------------------------------------------------------------------------------
+    def set_values(self, p_values):
+        if self._sharing is not None: self._leave_sharing( p_copy = False )
+        self._values = p_values
+
+
+## -------------------------------------------------------------------------------------------------
+    def set_value(self, p_dim_id, p_value):
+        if self._sharing is not None: self._leave_sharing( p_copy = True )
+        super().set_value( p_dim_id = p_dim_id, p_value = p_value )
+
+
+## -------------------------------------------------------------------------------------------------
+    def copy(self):
+        return self.share(self)
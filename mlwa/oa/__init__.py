@@ -0,0 +1,5 @@
+"""
+### Extensions of MLPro-OA for online-adaptive stream processing ('mlwa.oa')
+"""
+
+from .basics import *
@@ -0,0 +1,1105 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Package    : mlwa.oa
+## -- Module     : basics.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.15.0 (2026-10-17)
+
+This module provides extensions of MLPro's template classes for online-adaptive stream processing.
+
+"""
+
+import io
+import pickle
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import dill
+import multiprocess as mp
+
+from mlpro.bf.exceptions import Error, ParamError
+from mlpro.bf.various import Log
+from mlpro.bf.events import Event
+from mlpro.bf.ops import Mode
+from mlpro.bf.mt import Range
+from mlpro.bf.math import Set
+from mlpro.bf.streams import InstTypeNew, InstDict, StreamTask
+from mlpro.bf.streams.tasks import Rearranger
+from mlpro.oa.streams import OAStreamShared, OAStreamAdaptationType
+from mlpro.oa.streams import OAStreamTask as OAStreamTaskMLPro
+from mlpro.oa.streams import OAStreamWorkflow as OAStreamWorkflowMLPro
+from mlpro.oa.streams import OAStreamScenario as OAStreamScenarioMLPro
+
+from mlwa.math import get_renormalization
+from mlwa.streams import StreamColumnar, StreamTaskPlotND, Renderer, CycleScheduler
+
+
+
+# Export list for public API
+__all__ = [ 'get_renormalization',
+            'OAStreamTask',
+            'OAStreamWorkflow',
+            'OAStreamScenario' ]
+
+
+
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+class _MessagePickler (pickle.Pickler):
+    """
+    Internal use. Pickles data between the processes of a pipeline. References to the registered
+    objects are pickled by their id, which is identical in all processes after the fork.
+    """
+
+    def __init__(self, p_file, p_registry : dict):
+        super().__init__(p_file, protocol = pickle.HIGHEST_PROTOCOL)
+        self._registry = p_registry
+
+    def persistent_id(self, p_obj):
+        if id(p_obj) in self._registry: return id(p_obj)
+        return None
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+class _StatePickler (dill.Pickler):
+    """
+    Internal use. Like class _MessagePickler, but able to pickle the complete states of tasks and
+    helpers (including lambda functions etc.).
+    """
+
+    def __init__(self, p_file, p_registry : dict):
+        super().__init__(p_file)
+        self._registry = p_registry
+
+    def persistent_id(self, p_obj):
+        if id(p_obj) in self._registry: return id(p_obj)
+        return None
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+class _RefUnpickler (dill.Unpickler):
+    """
+    Internal use. Counterpart of classes _MessagePickler and _StatePickler.
+    """
+
+    def __init__(self, p_file, p_registry : dict):
+        super().__init__(p_file)
+        self._registry = p_registry
+
+    def persistent_load(self, p_pid):
+        return self._registry[p_pid]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+def _dumps(p_obj, p_registry : dict, p_pickler = _MessagePickler) -> bytes:
+    try:
+        file = io.BytesIO()
+        p_pickler( file, p_registry ).dump(p_obj)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        # Objects created after the fork may contain lambda functions etc.
+        if p_pickler is _StatePickler: raise
+        file = io.BytesIO()
+        _StatePickler( file, p_registry ).dump(p_obj)
+
+    return file.getvalue()
+
+
+def _loads(p_data : bytes, p_registry : dict):
+    return _RefUnpickler( io.BytesIO(p_data), p_registry ).load()
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+def _run_pipeline_stage( p_stage_id : int,
+                         p_objects : list,
+                         p_keys_out : list,
+                         p_queue_in,
+                         p_queue_out,
+                         p_queue_result,
+                         p_registry : dict ):
+    """
+    Internal use. Main loop of a pipeline stage in a forked worker process. The tasks of the stage
+    (first entries of p_objects without helpers) are run on each incoming message until the message
+    None arrives. Finally, the states of all given objects are sent back to the parent process.
+    """
+
+    tasks = [ obj for obj in p_objects if isinstance(obj, StreamTask) ]
+    so    = tasks[0].get_so()
+    error = None
+
+    while True:
+        msg = p_queue_in.get()
+        if msg is None: break
+        if error is not None: continue
+
+        try:
+            tstamp, instances = _loads( msg, p_registry )
+
+            try:
+                so._stream.set_tstamp(tstamp)
+            except AttributeError:
+                pass
+
+            so._instances = instances
+            for task in tasks: task.run( p_range = Range.C_RANGE_NONE )
+
+            if p_queue_out is not None:
+                p_queue_out.put( _dumps( ( tstamp, { key : so._instances[key] for key in p_keys_out } ), p_registry ) )
+
+        except Exception:
+            error = traceback.format_exc()
+
+    if p_queue_out is not None: p_queue_out.put(None)
+
+    state = None
+    try:
+        state = _dumps( [ obj.__dict__ for obj in p_objects ], p_registry, p_pickler = _StatePickler )
+    except Exception:
+        if error is None: error = traceback.format_exc()
+
+    p_queue_result.put( ( p_stage_id, error, state ) )
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class OAStreamTask (StreamTaskPlotND, OAStreamTaskMLPro):
+    """
+    Drop-in replacement for class mlpro.oa.streams.OAStreamTask. Tasks can optionally implement the
+    custom method _adapt_net() to adapt on the new and the obsolete instances of a run together. A
+    net adaptation results in at most one reverse and one forward adaptation event per run, each
+    with the number of instances that triggered it. If a task does not implement method
+    _adapt_net(), the instance-wise adaptation of the parent class is carried out.
+
+    The default ND view keeps its plot data in a bounded buffer (see class mlwa.streams.StreamTaskPlotND).
+
+    See class mlpro.oa.streams.OAStreamTask for a description of the parameters.
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def adapt(self, p_instances : InstDict) -> bool:
+
+        if not self._adaptivity: return False
+
+        inst_new = []
+        inst_del = []
+
+        for inst_id, (inst_type, inst) in sorted(p_instances.items()):
+            if inst_type == InstTypeNew:
+                inst_new.append(inst)
+            else:
+                inst_del.append(inst)
+
+        try:
+            num_inst_forward, num_inst_reverse = self._adapt_net( p_instances_new = inst_new, p_instances_del = inst_del )
+        except NotImplementedError:
+            return super().adapt( p_instances = p_instances )
+
+        if ( num_inst_forward + num_inst_reverse ) == 0:
+            self.log(self.C_LOG_TYPE_S, 'Net adaptation done without changes')
+            self._set_adapted( p_adapted = False )
+            return False
+
+        # As with the instance-wise adaptation, reverse and forward adaptations raise separate events
+        self.log(self.C_LOG_TYPE_S, 'Net adaptation done with changes')
+
+        if num_inst_reverse > 0:
+            self._set_adapted( p_adapted = True,
+                               p_subtype = OAStreamAdaptationType.REVERSE,
+                               p_num_inst = num_inst_reverse )
+
+        if num_inst_forward > 0:
+            self._set_adapted( p_adapted = True,
+                               p_subtype = OAStreamAdaptationType.FORWARD,
+                               p_num_inst = num_inst_forward )
+
+        return True
+
+
+## -------------------------------------------------------------------------------------------------
+    def _adapt_net(self, p_instances_new : list, p_instances_del : list):
+        """
+        Optional custom method for a net adaptation on all new and obsolete instances of a run. It
+        replaces the instance-wise adaptation including the pre- and postprocessing steps.
+
+        Parameters
+        ----------
+        p_instances_new : list
+            New instances in the order of their ids.
+        p_instances_del : list
+            Obsolete instances in the order of their ids.
+
+        Returns
+        -------
+        num_inst_forward : int
+            Number of new instances that triggered a forward adaptation.
+        num_inst_reverse : int
+            Number of obsolete instances that triggered a reverse adaptation.
+        """
+
+        raise NotImplementedError
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class OAStreamWorkflow (StreamTaskPlotND, OAStreamWorkflowMLPro):
+    """
+    Drop-in replacement for class mlpro.oa.streams.OAStreamWorkflow. With range C_RANGE_THREAD, the
+    workflow executes independent branches of its task graph concurrently on a pool of worker
+    threads. With range C_RANGE_PROCESS, it executes groups of consecutive tasks as a pipeline of
+    worker processes.
+
+    Before the first run, the tasks are arranged in levels according to their predecessor relations
+    (see method add_task()). Level 0 contains the entry tasks, level n the tasks whose predecessors
+    are on the levels 0 to n-1.
+
+    Thread mode: the levels are processed one after another. All tasks of a level run concurrently
+    and are joined in the order of their addition to the workflow before the next level starts, so
+    that the results don't depend on the thread timing. Exceptions of a task are re-raised by method
+    run(). The tasks of a level must not modify each other, neither directly nor via event handlers
+    (e.g. renormalization). The workflow always runs synchronously, i.e. method run() returns after
+    all tasks have finished.
+
+    Process mode: the levels are grouped to stages (see method get_stages()). Each stage runs in its
+    own worker process, which is forked on the first run. The stages are connected by queues, so
+    that a stage processes the instances of run k+1 while its successor stages still process the
+    instances of run k. Method run() just hands over the instances to the first stage and returns.
+    Method wait_async_tasks() waits until all stages have finished, takes over the states of their
+    tasks and helpers and terminates the worker processes, which are forked again on the next run.
+    Levels whose tasks are coupled by event handlers (e.g. a normalizer and a renormalized
+    successor) or refer to each other are placed in the same stage. Instances are handed over to the
+    next stage as copies, so tasks that modify their incoming instances have to duplicate them
+    (parameter p_duplicate_data). Visualization is not supported, and events C_EVENT_FINISHED of the
+    workflow are only raised by method wait_async_tasks(). The process mode requires the start
+    method 'fork'. Otherwise, the workflow falls back to the thread mode.
+
+    With range C_RANGE_NONE, the workflow processes the instances exactly like the original class.
+    The ND view of the workflow keeps its plot data in a bounded buffer (see class
+    mlwa.streams.StreamTaskPlotND).
+
+    Parameters
+    ----------
+    p_name : str
+        Optional name of the workflow. Default is None.
+    p_range_max : int
+        Maximum range of asynchonicity. See class Range. Default is Range.C_RANGE_THREAD.
+    p_class_shared
+        Optional class for a shared object (class OAShared or a child class of OAShared)
+    p_ada : bool
+        Boolean switch for adaptivitiy. Default = True.
+    p_num_workers : int
+        Maximum number of worker threads or processes. Default = None (number of tasks on the widest
+        level or number of stages).
+    p_visualize : bool
+        Boolean switch for visualisation. Default = False.
+    p_logging
+        Log level (see constants of class Log). Default: Log.C_LOG_ALL
+    p_kwargs : dict
+        Further optional named parameters.
+    """
+
+    C_PIPELINE_QUEUE_SIZE   = 16
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_name: str = None,
+                  p_range_max = OAStreamWorkflowMLPro.C_RANGE_THREAD,
+                  p_class_shared = OAStreamShared,
+                  p_ada : bool = True,
+                  p_num_workers : int = None,
+                  p_visualize : bool = False,
+                  p_logging = Log.C_LOG_ALL,
+                  **p_kwargs ):
+
+        if ( p_num_workers is not None ) and ( p_num_workers < 1 ):
+            raise ParamError('Number of workers must be at least 1')
+
+        self._num_workers = p_num_workers
+        self._levels      = None
+        self._pool        = None
+        self._pipeline    = None
+
+        # Tasks share the objects of the parent process in the worker processes after the fork, so
+        # the shared object is created for the thread range
+        self._process_mode = ( p_range_max == self.C_RANGE_PROCESS )
+        if self._process_mode and ( 'fork' not in mp.get_all_start_methods() ):
+            self._process_mode = False
+
+        super().__init__( p_name = p_name,
+                          p_range_max = min( p_range_max, self.C_RANGE_THREAD ),
+                          p_class_shared = p_class_shared,
+                          p_ada = p_ada,
+                          p_visualize = p_visualize,
+                          p_logging = p_logging,
+                          **p_kwargs )
+
+        if ( p_range_max == self.C_RANGE_PROCESS ) and not self._process_mode:
+            self.log(self.C_LOG_TYPE_W, 'Start method "fork" not available -> thread mode')
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_levels(self) -> list:
+        """
+        Returns the tasks of the workflow arranged in levels of mutually independent tasks.
+
+        Returns
+        -------
+        levels : list
+            List of task lists. The tasks of a level depend on tasks of previous levels only.
+        """
+
+        levels  = []
+        level_of = {}
+
+        def get_level(p_task) -> int:
+            try:
+                return level_of[p_task]
+            except KeyError:
+                pass
+
+            level = 0
+            for task_pred in p_task.get_predecessors():
+                if task_pred in self._tasks: level = max( level, get_level(task_pred) + 1 )
+
+            level_of[p_task] = level
+            return level
+
+        for task in self._tasks:
+            level = get_level(task)
+            while len(levels) <= level: levels.append([])
+            levels[level].append(task)
+
+        return levels
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_stages(self) -> list:
+        """
+        Returns the pipeline stages of the process mode. Initially, each level forms a stage. Levels
+        whose tasks are coupled by event handlers (directly or via a common helper) or refer to each
+        other (e.g. a boundary detector using the statistics of a ring buffer) are merged into one
+        stage. Finally, adjacent stages with the lowest number of tasks are merged until the maximum
+        number of workers is reached.
+
+        Returns
+        -------
+        stages : list
+            List of task lists.
+        """
+
+        levels   = self.get_levels()
+        level_of = { id(task) : i for i, level in enumerate(levels) for task in level }
+        helpers  = { id(helper) : None for helper in self._helpers }
+        cuts     = set(range(len(levels) - 1))
+
+        # 1 Levels coupled by event handlers or by references between tasks are merged
+        for task in self._tasks:
+            level   = level_of[id(task)]
+            targets = [ value for value in vars(task).values() if ( id(value) in level_of ) and ( value is not task ) ]
+
+            for handlers in task._registered_handlers.values():
+                for handler in handlers:
+                    # The chaining of successors is replaced by the pipeline
+                    if getattr(handler, '__name__', None) != 'run_on_event': targets.append( getattr(handler, '__self__', None) )
+
+            for target in targets:
+                if id(target) in level_of:
+                    level_target = level_of[id(target)]
+                elif id(target) in helpers:
+                    if helpers[id(target)] is None: helpers[id(target)] = level
+                    level_target = helpers[id(target)]
+                else:
+                    continue
+
+                cuts.difference_update( range(min(level, level_target), max(level, level_target)) )
+
+        stages = []
+        for i, level in enumerate(levels):
+            if ( i == 0 ) or ( i - 1 in cuts ):
+                stages.append(list(level))
+            else:
+                stages[-1].extend(level)
+
+
+        # 2 Number of stages is limited to the maximum number of workers
+        if self._num_workers is not None:
+            while len(stages) > self._num_workers:
+                sizes = [ len(stages[i]) + len(stages[i+1]) for i in range(len(stages) - 1) ]
+                i     = sizes.index(min(sizes))
+                stages[i].extend(stages.pop(i+1))
+
+        return stages
+
+
+## -------------------------------------------------------------------------------------------------
+    def _prepare_levels(self):
+        """
+        Arranges the tasks in levels and detaches the event-based chaining of the tasks, which is
+        replaced by the level-wise execution.
+        """
+
+        self._levels = self.get_levels()
+
+        for task in self._tasks:
+            task.remove_event_handler( p_event_id = self.C_EVENT_FINISHED, p_event_handler = self.event_forwarder )
+
+            for task_pred in task.get_predecessors():
+                task_pred.remove_event_handler( p_event_id = self.C_EVENT_FINISHED, p_event_handler = task.run_on_event )
+
+        self._first_run = False
+        if self._process_mode: return
+
+        num_workers = max( len(level) for level in self._levels )
+        if self._num_workers is not None: num_workers = min( num_workers, self._num_workers )
+
+        self.log(self.C_LOG_TYPE_I, 'Task graph arranged in', len(self._levels), 'levels, using', num_workers, 'worker threads')
+
+        if num_workers > 1:
+            self._pool = ThreadPoolExecutor( max_workers = num_workers, thread_name_prefix = self.get_name() )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_registry(self, p_instances : InstDict) -> dict:
+        """
+        Internal use. Returns all objects that are referenced by id between the processes of the
+        pipeline: the workflow, its shared object, tasks, helpers and stream as well as all spaces and
+        dimensions they or the first instances refer to.
+        """
+
+        so      = self.get_so()
+        objects = [ self, so ] + self._tasks + self._helpers
+
+        try:
+            objects.append(so._stream)
+        except AttributeError:
+            pass
+
+        spaces = [ value for obj in objects for value in vars(obj).values() if isinstance(value, Set) ]
+
+        for inst_type, inst in p_instances.values():
+            spaces.append( inst.get_feature_data().get_related_set() )
+            if inst.get_label_data() is not None: spaces.append( inst.get_label_data().get_related_set() )
+
+        registry = { id(obj) : obj for obj in objects + spaces }
+
+        for space in spaces:
+            for dim in space.get_dims(): registry[id(dim)] = dim
+
+        return registry
+
+
+## -------------------------------------------------------------------------------------------------
+    def _start_pipeline(self, p_instances : InstDict):
+        """
+        Internal use. Forks one worker process per stage and connects them by queues.
+        """
+
+        for task in self._tasks:
+            if task.get_visualization():
+                raise Error('Process mode of workflow "' + self.get_name() + '" does not support visualization')
+
+        stages   = self.get_stages()
+        stage_of = { task : i for i, stage in enumerate(stages) for task in stage }
+        ctx      = mp.get_context('fork')
+
+
+        # 1 Instances required by each stage from its predecessor stages
+        keys_in = []
+        for i, stage in enumerate(stages):
+            keys = set()
+            for task in stage:
+                if len(task.get_predecessors()) == 0: keys.add('wf')
+
+                for task_pred in task.get_predecessors():
+                    if stage_of.get(task_pred, -1) < i: keys.add(task_pred.get_tid())
+
+            keys_in.append(keys)
+
+        keys_out = []
+        for i in range(len(stages)):
+            keys = set()
+            for keys_later in keys_in[i+1:]: keys.update(keys_later)
+            keys_out.append( [ key for key in keys if ( key == 'wf' ) or ( stage_of.get(self._get_task(key), -1) <= i ) ] )
+
+
+        # 2 Helpers are placed in the stage of the tasks they observe
+        objects = [ list(stage) for stage in stages ]
+        for helper in self._helpers:
+            for task in self._tasks:
+                if any( getattr(handler, '__self__', None) is helper for handlers in task._registered_handlers.values() for handler in handlers ):
+                    objects[stage_of[task]].append(helper)
+                    break
+
+
+        # 3 Forking of the worker processes
+        registry     = self._get_registry( p_instances = p_instances )
+        queues       = [ ctx.Queue( maxsize = self.C_PIPELINE_QUEUE_SIZE ) for i in range(len(stages)) ]
+        queue_result = ctx.Queue()
+        processes    = []
+
+        for i in range(len(stages)):
+            process = ctx.Process( target = _run_pipeline_stage,
+                                   kwargs = { 'p_stage_id' : i,
+                                              'p_objects' : objects[i],
+                                              'p_keys_out' : keys_out[i],
+                                              'p_queue_in' : queues[i],
+                                              'p_queue_out' : queues[i+1] if i + 1 < len(stages) else None,
+                                              'p_queue_result' : queue_result,
+                                              'p_registry' : registry },
+                                   daemon = True )
+            process.start()
+            processes.append(process)
+
+        self.log(self.C_LOG_TYPE_I, 'Pipeline started with', len(stages), 'stages:', [ [ task.get_name() for task in stage ] for stage in stages ])
+        self._pipeline = ( objects, queues, queue_result, processes, registry )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_task(self, p_tid):
+        for task in self._tasks:
+            if task.get_tid() == p_tid: return task
+
+
+## -------------------------------------------------------------------------------------------------
+    def _stop_pipeline(self):
+        """
+        Internal use. Waits until all stages have finished, takes over the states of the objects in the
+        worker processes and terminates them.
+        """
+
+        objects, queues, queue_result, processes, registry = self._pipeline
+        self._pipeline = None
+
+        queues[0].put(None)
+        results = sorted( queue_result.get() for i in range(len(processes)) )
+
+        for process in processes: process.join()
+
+        for stage_id, error, state in results:
+            if state is None: continue
+            states = _loads( state, registry )
+            for obj, obj_state in zip(objects[stage_id], states): obj.__dict__.update(obj_state)
+
+        self.log(self.C_LOG_TYPE_I, 'Pipeline stopped')
+
+        errors = [ error for (stage_id, error, state) in results if error is not None ]
+        if len(errors) > 0:
+            raise Error('Pipeline stage of workflow "' + self.get_name() + '" failed:\n' + errors[0])
+
+
+## -------------------------------------------------------------------------------------------------
+    def run( self,
+             p_range : int = None,
+             p_wait: bool = False,
+             p_instances : InstDict = None ):
+        """
+        Runs all stream tasks according to their predecessor relations. See class description for
+        details of the thread and process mode.
+
+        Parameters
+        ----------
+        p_range : int
+            Optional deviating range of asynchonicity. See class Range. Default is None what means that
+            the maximum range defined during instantiation is taken. Oterwise the minimum range of both
+            is taken.
+        p_wait : bool
+            If True, the method waits until all (a)synchronous tasks are finished.
+        p_instances : InstDict
+            Optional list of stream instances to be processed. If None, the list of the shared object
+            is used instead. Default = None.
+        """
+
+        if p_range is None:
+            range_run = self.C_RANGE_PROCESS if self._process_mode else self._range
+        else:
+            range_run = min( p_range, self.C_RANGE_PROCESS if self._process_mode else self._range )
+
+        if ( range_run == self.C_RANGE_NONE ) and ( self._levels is None ):
+            return super().run( p_range = p_range, p_wait = p_wait, p_instances = p_instances )
+
+        if self._levels is None:
+            self._prepare_levels()
+
+
+        # 1 Process mode
+        if range_run == self.C_RANGE_PROCESS:
+            if p_instances is None: p_instances = self.get_so().get_instances( p_task_ids = [] )
+            if self._pipeline is None: self._start_pipeline( p_instances = p_instances )
+
+            self._finished.clear()
+            self._pipeline[1][0].put( _dumps( ( self.get_so().tstamp, { 'wf' : p_instances } ), self._pipeline[4] ) )
+
+            if p_wait: self.wait_async_tasks()
+            return
+
+        if self._pipeline is not None: self.wait_async_tasks()
+
+
+        # 2 Thread mode (or sequential execution after the first run in thread/process mode)
+        if p_instances is not None:
+            self.get_so().reset( p_instances = p_instances )
+
+        self._finished.clear()
+        self.log(self.C_LOG_TYPE_S, 'Started in thread mode')
+        self.update_plot()
+
+        for level in self._levels:
+
+            if ( len(level) == 1 ) or ( self._pool is None ) or ( range_run != self.C_RANGE_THREAD ):
+                for task in level: task.run( p_range = self.C_RANGE_NONE )
+
+            else:
+                futures = [ self._pool.submit( task.run, p_range = self.C_RANGE_NONE ) for task in level ]
+                for future in futures: future.result()
+
+        self.log(self.C_LOG_TYPE_S, 'Stopped')
+        self._finished.set()
+        self._raise_event( self.C_EVENT_FINISHED, Event(p_raising_object=self) )
+
+
+## -------------------------------------------------------------------------------------------------
+    def wait_async_tasks(self):
+        """
+        Waits until all tasks are finished. In process mode, the states of the tasks and helpers are
+        taken over from the worker processes.
+        """
+
+        if self._pipeline is not None:
+            self._stop_pipeline()
+            self._finished.set()
+            self._raise_event( self.C_EVENT_FINISHED, Event(p_raising_object=self) )
+
+        elif not self._first_run:
+            super().wait_async_tasks()
+
+
+## -------------------------------------------------------------------------------------------------
+    def reset(self, **p_kwargs):
+        if self._pipeline is not None: self._stop_pipeline()
+        super().reset(**p_kwargs)
+
+
+## -------------------------------------------------------------------------------------------------
+    def __del__(self):
+        try:
+            for process in self._pipeline[3]: process.terminate()
+        except Exception:
+            pass
+
+        if self._pool is not None: self._pool.shutdown( wait = False )
+        super().__del__()
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class OAStreamScenario (OAStreamScenarioMLPro):
+    """
+    Drop-in replacement for class mlpro.oa.streams.OAStreamScenario. Additionally, the stream of the
+    scenario can be moved to an instance index (method seek()) and a range of instances can be
+    processed (method run() with parameters p_start, p_stop).
+
+    If all entry tasks of the workflow are rearrangers (class mlpro.bf.streams.tasks.Rearranger) and
+    the stream supports column-wise access (class mlwa.streams.StreamColumnar), the features used by
+    the rearrangers are pushed down into the stream during setup. The stream then reads and
+    materializes only these features. The pushdown can be turned off by constant C_FEATURE_PUSHDOWN.
+
+    Optionally, the scenario runs in micro-batch mode (parameter p_batch_size > 1). Then, each cycle
+    pulls up to p_batch_size instances from the stream and lets the workflow process them at once.
+    The cycle counter and the cycle limit still refer to single instances. Each task adapts instance
+    by instance in the order of the instance ids, while the normalizers of package mlwa.oa.tasks
+    normalize the batch with the parameters after the last step. Successors that renormalize on the
+    adaptation events therefore end up in the same state as with instance-wise processing, as long as
+    the batch size does not exceed the size of sliding windows (see class mlwa.streams.tasks.RingBuffer).
+    Tasks of packages mlwa.streams.tasks and mlwa.oa.tasks process batches as 2D arrays.
+
+    Optionally, the visualization is decoupled from the processing by a renderer (parameter
+    p_renderer, see class mlwa.streams.Renderer). Then, the workflow and its tasks publish their plot
+    updates to the renderer, which draws them at a limited frame rate between two cycles and drops
+    all intermediate frames. Without a renderer, each task window is updated inline as usual.
+    The frame exporter mlwa.streams.FrameExporter can be used as renderer as well. It captures the
+    plots every n cycles and exports them as animations, also without a display.
+
+    In real-time mode, the cycles can be paced by a deadline-aware scheduler (parameter p_scheduler,
+    see class mlwa.streams.CycleScheduler). It records lateness, jitter and deadline misses of the
+    cycles, which are logged at the end of each run. A deadline miss is reported as timeout of the
+    cycle (see parameter p_term_on_timeout of method run()). On load shedding, the scenario skips the
+    visualization (frames of the renderer or, without renderer, by a plot step rate increased by
+    factor C_SHED_PLOT_STEP_RATE) and drops instances according to the sampling factor of the
+    scheduler. In simulation mode, the scheduler is not used.
+
+    Parameters
+    ----------
+    p_mode
+        Operation mode. See bf.ops.Mode.C_VALID_MODES for valid values. Default = Mode.C_MODE_SIM.
+    p_ada : bool
+        Boolean switch for adaptivitiy. Default = True.
+    p_cycle_limit : int
+        Maximum number of cycles (0=no limit, -1=get from env). Default = 0.
+    p_visualize : bool
+        Boolean switch for env/agent visualisation. Default = False.
+    p_logging
+        Log level (see constants of class mlpro.bf.various.Log). Default = Log.C_LOG_WE.
+    p_batch_size : int
+        Number of instances processed per workflow run. Default = 1 (no micro-batching).
+    p_renderer : Renderer
+        Optional renderer for the plots of the workflow. Default = None (inline plot updates).
+    p_scheduler : CycleScheduler
+        Optional scheduler for the cycles in real-time mode. Default = None.
+    **p_kwargs
+        Custom keyword arguments handed over to the custom method setup().
+    """
+
+    C_FEATURE_PUSHDOWN      = True
+    C_SHED_PLOT_STEP_RATE   = 100
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_mode = Mode.C_MODE_SIM,
+                  p_ada : bool = True,
+                  p_cycle_limit = 0,
+                  p_visualize : bool = False,
+                  p_logging = Log.C_LOG_ALL,
+                  p_batch_size : int = 1,
+                  p_renderer : Renderer = None,
+                  p_scheduler : CycleScheduler = None,
+                  **p_kwargs ):
+
+        if p_batch_size < 1:
+            raise ParamError('Batch size must be at least 1')
+
+        self._batch_size    = p_batch_size
+        self._renderer      = p_renderer
+        self._scheduler     = p_scheduler
+        self._scheduling    = False
+        self._plots_skipped = False
+        self._step_rates    = {}
+
+        super().__init__( p_mode = p_mode,
+                          p_ada = p_ada,
+                          p_cycle_limit = p_cycle_limit,
+                          p_visualize = p_visualize,
+                          p_logging = p_logging,
+                          **p_kwargs )
+
+## -------------------------------------------------------------------------------------------------
+    def setup(self, **p_kwargs):
+        """
+        Sets up the stream and workflow of the scenario (see method mlpro.bf.streams.StreamScenario.setup())
+        and pushes down the features required by the workflow into the stream. If visualization is on,
+        an optional renderer takes over the plot updates of the workflow.
+        """
+
+        super().setup(**p_kwargs)
+
+        if self.C_FEATURE_PUSHDOWN: self._push_down_features()
+
+        if ( self._renderer is not None ) and self._visualize: self._renderer.attach(self._workflow)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _push_down_features(self):
+        """
+        Determines the stream features used by the rearrangers at the entry of the workflow and restricts
+        the stream to them.
+        """
+
+        if not isinstance(self._stream, StreamColumnar): return
+
+        entry_tasks = [ task for task in self._workflow.get_tasks() if len(task.get_predecessors()) == 0 ]
+        if len(entry_tasks) == 0: return
+
+        features = []
+
+        for task in entry_tasks:
+            if not isinstance(task, Rearranger): return
+
+            for origin, dims in task._features_new + task._labels_new:
+                if origin != 'F': continue
+                for dim in dims:
+                    if dim not in features: features.append(dim)
+
+        num_features = self._stream.get_feature_space().get_num_dim()
+        if len(features) == num_features: return
+
+        self.log(self.C_LOG_TYPE_I, 'Pushing down', len(features), 'of', num_features, 'features into the stream')
+        self._stream.select_features( p_features = features )
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_batch_size(self) -> int:
+        return self._batch_size
+
+
+## -------------------------------------------------------------------------------------------------
+    def _run_cycle(self):
+        """
+        Gets the next instance or micro-batch of instances from the stream and lets process it by the
+        stream workflow. See method mlpro.bf.streams.StreamScenario._run_cycle().
+        """
+
+        if self._batch_size == 1: return super()._run_cycle()
+
+        # 1 Number of instances to be pulled (the cycle limit refers to instances)
+        num_inst = self._batch_size
+        if self._cycle_limit > 0:
+            num_inst = max(1, min(num_inst, self._cycle_limit - self._cycle_id))
+
+
+        # 2 Pull instances from the stream
+        instances = {}
+
+        try:
+            for i in range(num_inst):
+                inst_new = next(self._iterator)
+                instances[inst_new.id] = (InstTypeNew, inst_new)
+        except StopIteration:
+            if len(instances) == 0: return False, False, False, True
+
+
+        # 3 Process the batch and advance the cycle counter to the last instance
+        self._workflow.run( p_instances = instances )
+        self._cycle_id += len(instances) - 1
+
+        return False, False, False, False
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_renderer(self) -> Renderer:
+        return self._renderer
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_scheduler(self) -> CycleScheduler:
+        return self._scheduler
+
+
+## -------------------------------------------------------------------------------------------------
+    def run_cycle(self):
+        """
+        Runs a single process cycle (see method mlpro.bf.ops.ScenarioBase.run_cycle()). With a
+        scheduler in real-time mode, the cycle applies the load shedding of the scheduler and waits for
+        the next time slot afterwards.
+        """
+
+        if not self._scheduling: return super().run_cycle()
+
+        # 1 Start of the schedule with the first cycle
+        if self._scheduler_start:
+            self._scheduler.start()
+            self._scheduler_start = False
+
+
+        # 2 Load shedding
+        if self._scheduler.get_skip_plots() != self._plots_skipped:
+            self._skip_plots( p_skip = not self._plots_skipped )
+
+        stream_index = self.get_stream_index()
+        self._drop_instances( p_num = self._scheduler.get_sampling() - 1 )
+
+
+        # 3 Regular cycle
+        success, error, timeout, limit, adapted, end_of_data = super().run_cycle()
+
+
+        # 4 Wait for the next time slot. The cycle owns the slots of all instances consumed.
+        num_slots = max(1, self.get_stream_index() - stream_index)
+        if not self._scheduler.wait( p_num_slots = num_slots ): timeout = True
+
+        return success, error, timeout, limit, adapted, end_of_data
+
+
+## -------------------------------------------------------------------------------------------------
+    def _drop_instances(self, p_num : int):
+        """
+        Drops the next instances of the stream for load shedding. They count as processed cycles.
+        """
+
+        if self._cycle_limit > 0:
+            p_num = min( p_num, self._cycle_limit - self._cycle_id - 1 )
+
+        try:
+            for i in range(p_num):
+                next(self._iterator)
+                self._cycle_id += 1
+        except StopIteration:
+            pass
+
+
+## -------------------------------------------------------------------------------------------------
+    def _skip_plots(self, p_skip : bool):
+        """
+        Turns the skipping of the visualization on load shedding on/off. Without renderer, the plot step
+        rates of the workflow and its tasks are increased by factor C_SHED_PLOT_STEP_RATE.
+        """
+
+        self._plots_skipped = p_skip
+        if ( self._renderer is not None ) or ( not self._visualize ): return
+
+        if p_skip:
+            for plot_obj in [ self._workflow ] + self._workflow.get_tasks():
+                if not plot_obj.get_visualization(): continue
+                settings = plot_obj.get_plot_settings()
+                if ( settings is None ) or ( id(settings) in self._step_rates ): continue
+                self._step_rates[id(settings)] = ( settings, settings.step_rate )
+                settings.step_rate = settings.step_rate * self.C_SHED_PLOT_STEP_RATE
+        else:
+            for settings, step_rate in self._step_rates.values():
+                settings.step_rate = step_rate
+            self._step_rates = {}
+
+
+## -------------------------------------------------------------------------------------------------
+    def update_plot(self, **p_kwargs):
+        """
+        Plot updates take place during workflow/task processing. With a renderer, the published plot
+        updates are drawn here if the next frame is due (see method mlwa.streams.Renderer.render()).
+        """
+
+        if self._plots_skipped: return
+        if self._renderer is not None: self._renderer.render()
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_stream_index(self) -> int:
+        """
+        Returns the index of the next instance to be processed.
+        """
+
+        if self._iterator is None:
+            raise Error('Please reset the scenario before')
+
+        return self._iterator._next_inst_id
+
+
+## -------------------------------------------------------------------------------------------------
+    def seek(self, p_index : int):
+        """
+        Moves the stream of the scenario to the given instance index. Seekable streams (see class
+        mlwa.streams.StreamSeekable) jump directly to the index. All other streams are fast-forwarded
+        by iteration. Please reset the scenario before.
+
+        Parameters
+        ----------
+        p_index : int
+            Index of the next instance to be processed.
+        """
+
+        index = self.get_stream_index()
+
+        try:
+            self._iterator.seek(p_index)
+            return
+        except (AttributeError, NotImplementedError):
+            pass
+
+        num_skip = p_index - index
+        if num_skip < 0:
+            raise ParamError('The stream can not be moved backwards. Please reset the scenario before.')
+
+        self.log(self.C_LOG_TYPE_W, 'Stream is not seekable -> fast forward by', num_skip, 'instances')
+
+        try:
+            for i in range(num_skip): next(self._iterator)
+        except StopIteration:
+            raise ParamError('Instance index ' + str(p_index) + ' exceeds the number of instances')
+
+
+## -------------------------------------------------------------------------------------------------
+    def run( self,
+             p_term_on_success : bool = True,
+             p_term_on_error : bool = True,
+             p_term_on_timeout : bool = False,
+             p_start : int = None,
+             p_stop : int = None ):
+        """
+        Runs the scenario as a sequence of single process steps until a terminating event occures.
+        Optionally, only the instances in the range [p_start, p_stop) are processed.
+
+        Parameters
+        ----------
+        p_term_on_success : bool
+            If True, the run terminates on success. Default = True.
+        p_term_on_error : bool
+            If True, the run terminates on error. Default = True.
+        p_term_on_timeout : bool
+            If True, the run terminates on timeout. Default = False.
+        p_start : int
+            Optional index of the first instance to be processed. See method seek(). Default = None.
+        p_stop : int
+            Optional index of the first instance not to be processed. If specified, it replaces the
+            cycle limit of the scenario. Default = None.
+
+        Returns
+        -------
+        See method mlpro.bf.ops.ScenarioBase.run().
+        """
+
+        if p_start is not None:
+            self.seek(p_index = p_start)
+
+        if p_stop is not None:
+            num_cycles = p_stop - self.get_stream_index()
+            if num_cycles <= 0:
+                raise ParamError('Stop index must be greater than the current instance index')
+
+            self.set_cycle_limit(num_cycles)
+
+        self._scheduling      = ( self._scheduler is not None ) and ( self.get_mode() == Mode.C_MODE_REAL )
+        self._scheduler_start = self._scheduling
+
+        result = super().run( p_term_on_success = p_term_on_success,
+                              p_term_on_error = p_term_on_error,
+                              p_term_on_timeout = p_term_on_timeout )
+
+        if self._scheduling:
+            if self._plots_skipped: self._skip_plots( p_skip = False )
+            self._scheduler.log_statistics()
+            self._scheduling = False
+
+        # Workflows in process mode continue asynchronously and hand back their state here
+        if isinstance(self._workflow, OAStreamWorkflow): self._workflow.wait_async_tasks()
+
+        # Adaptation events deferred by the tasks are raised before the run ends
+        self._flush_adaptations()
+
+        # The last frame shows the final state
+        if ( self._renderer is not None ) and self._visualize: self._renderer.flush()
+
+        return result
+
+
+## -------------------------------------------------------------------------------------------------
+    def _flush_adaptations(self):
+        """
+        Lets all tasks of the workflow raise their deferred adaptation events (see e.g. method
+        mlwa.oa.tasks.NormalizerMinMax.flush_adaptation()).
+        """
+
+        for task in self._workflow.get_tasks():
+            flush_adaptation = getattr(task, 'flush_adaptation', None)
+            if flush_adaptation is not None: flush_adaptation()
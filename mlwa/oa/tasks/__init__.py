@@ -0,0 +1,9 @@
+"""
+### Online-adaptive stream tasks ('mlwa.oa.tasks')
+"""
+
+from .boundarydetectors import *
+from .normalizers import *
+from .moving_average import *
+from .clusteranalyzers import *
+from .anomalydetectors import *
@@ -0,0 +1,628 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Package    : mlwa.oa.tasks
+## -- Module     : anomalydetectors.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.4.0 (2026-10-17)
+
+This module provides an incremental local outlier factor (LOF) anomaly detector on a sliding window
+and a bounded anomaly store with a sorted time index for the anomaly buffer of anomaly detectors.
+
+"""
+
+from collections.abc import MutableMapping
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from mlpro.bf.exceptions import ParamError
+from mlpro.bf.various import Log
+from mlpro.bf.streams import StreamTask, Instance
+from mlpro.oa.streams.tasks.changedetectors.anomalydetectors.instancebased import AnomalyDetectorIBPG
+from mlpro.oa.streams.tasks.changedetectors.anomalydetectors.anomalies.instancebased import PointAnomaly
+
+from mlwa.math import get_values_ro
+
+
+
+# Export list for public API
+__all__ = [ 'AnomalyStore',
+            'AnomalyDetectorLOF' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class AnomalyStore (MutableMapping):
+    """
+    Bounded anomaly buffer with a sorted time index. It can replace the dictionary self.anomalies
+    (resp. self.changes) of MLPro's anomaly detectors, which is accessed by anomaly ids.
+
+    Retention
+    - Count: If more than p_max_count anomalies are stored, the oldest ones are removed.
+    - Time: Anomalies whose time stamp is older than the newest one minus p_max_age are removed.
+
+    Removed anomalies lose their plots as in MLPro's change buffer.
+
+    Besides the anomaly objects, the store keeps a compact record per anomaly in NumPy arrays sorted
+    by time stamp: anomaly id, time stamp, ids of the first and last related instance and an optional
+    score (e.g. the outlier score of the detector, NaN if unknown). Time-range queries are answered
+    by binary search on these arrays (see methods get_range() and get_records()).
+
+    Time stamps of type datetime, timedelta or numbers are supported. All anomalies of a store need to
+    have the same type of time stamp. Anomalies without time stamp (None) are stored as well, but are
+    not part of any time range. The type of the time index is determined by the first anomaly with a
+    time stamp.
+
+    Parameters
+    ----------
+    p_max_count : int
+        Maximum number of stored anomalies. Default = 100. None means unlimited.
+    p_max_age
+        Maximum age of stored anomalies relative to the newest one, given as a number or a timedelta
+        according to the time stamps. Default = None (unlimited).
+    """
+
+    C_CAPACITY_MIN  = 64
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_max_count : int = 100, p_max_age = None):
+
+        if ( p_max_count is not None ) and ( p_max_count < 1 ):
+            raise ParamError('Please set the parameter "p_max_count" >= 1 or None')
+
+        self._max_count   = p_max_count
+        self._max_age     = p_max_age
+        self._max_age_key = None
+        self._anomalies   = {}
+
+        self._tstamps     = None
+        self._typed       = False
+        self._ids         = None
+        self._inst_first  = None
+        self._inst_last   = None
+        self._scores      = None
+        self._start       = 0
+        self._end         = 0
+
+
+## -------------------------------------------------------------------------------------------------
+    def _init_index(self, p_tstamp):
+        """
+        Creates the index arrays. The data type of the time stamps is derived from the first anomaly
+        with a time stamp. Until then, the time index is untyped and all its time stamps are NaN. It is
+        converted on the first time stamp.
+        """
+
+        if isinstance(p_tstamp, datetime):
+            dtype = 'datetime64[us]'
+        elif isinstance(p_tstamp, timedelta):
+            dtype = 'timedelta64[us]'
+        else:
+            dtype = np.float64
+
+        self._typed = p_tstamp is not None
+
+        if self._tstamps is not None:
+            # Conversion of an untyped time index, whose records have no time stamps
+            self._tstamps = np.full(self._tstamps.size, np.array(np.nan).astype(dtype))
+        else:
+            capacity         = self.C_CAPACITY_MIN
+            self._tstamps    = np.empty(capacity, dtype=dtype)
+            self._ids        = np.empty(capacity, dtype=np.int64)
+            self._inst_first = np.empty(capacity, dtype=np.int64)
+            self._inst_last  = np.empty(capacity, dtype=np.int64)
+            self._scores     = np.empty(capacity, dtype=np.float64)
+
+        if ( self._max_age is not None ) and self._typed:
+            if dtype == np.float64:
+                self._max_age_key = np.float64(self._max_age)
+            else:
+                self._max_age_key = np.timedelta64(self._max_age, 'us')
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_key(self, p_tstamp):
+        """
+        Converts a time stamp into the data type of the time index. None is mapped to NaN/NaT, which is
+        sorted behind all other time stamps and is not part of any time range.
+        """
+
+        if p_tstamp is None: return np.array(np.nan).astype(self._tstamps.dtype)
+        return np.array(p_tstamp, dtype=self._tstamps.dtype)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_num_tstamps(self) -> int:
+        """
+        Returns the number of records with time stamp. They precede the records without time stamp.
+        """
+
+        if not self._typed: return 0
+        return int(np.searchsorted(self._tstamps[self._start:self._end], self._get_key(None), side='left'))
+
+
+## -------------------------------------------------------------------------------------------------
+    def _reserve(self):
+        """
+        Ensures space for a further record at the end of the index arrays by moving the records to
+        the front or by doubling the capacity.
+        """
+
+        capacity = self._tstamps.size
+        if self._end < capacity: return
+
+        num = self._end - self._start
+        if num > capacity // 2: capacity *= 2
+
+        for name in ('_tstamps', '_ids', '_inst_first', '_inst_last', '_scores'):
+            array = getattr(self, name)
+            if capacity == array.size:
+                array[:num] = array[self._start:self._end]
+            else:
+                array_new       = np.empty(capacity, dtype=array.dtype)
+                array_new[:num] = array[self._start:self._end]
+                setattr(self, name, array_new)
+
+        self._start = 0
+        self._end   = num
+
+
+## -------------------------------------------------------------------------------------------------
+    def _find(self, p_id : int) -> int:
+        """
+        Returns the index position of the record of the given anomaly id.
+        """
+
+        start, end = self._start, self._end
+        key        = self._get_key(self._anomalies[p_id].tstamp)
+        lo         = start + np.searchsorted(self._tstamps[start:end], key, side='left')
+        hi         = start + np.searchsorted(self._tstamps[start:end], key, side='right')
+        pos        = np.flatnonzero(self._ids[lo:hi] == p_id)
+        if pos.size > 0: return lo + int(pos[0])
+
+        # Time stamp changed after insertion or NaN/NaT
+        return start + int(np.flatnonzero(self._ids[start:end] == p_id)[0])
+
+
+## -------------------------------------------------------------------------------------------------
+    def _remove_record(self, p_pos : int):
+
+        if p_pos == self._start:
+            self._start += 1
+            return
+
+        for array in (self._tstamps, self._ids, self._inst_first, self._inst_last, self._scores):
+            array[p_pos:self._end-1] = array[p_pos+1:self._end]
+
+        self._end -= 1
+
+
+## -------------------------------------------------------------------------------------------------
+    def _evict(self, p_id : int):
+
+        self._remove_record( p_pos = self._find(p_id) )
+        self._anomalies.pop(p_id).remove_plot()
+
+
+## -------------------------------------------------------------------------------------------------
+    def __getitem__(self, p_id : int):
+        return self._anomalies[p_id]
+
+
+## -------------------------------------------------------------------------------------------------
+    def __setitem__(self, p_id : int, p_anomaly):
+
+        if p_id in self._anomalies: del self[p_id]
+
+        # 1 Insertion of the record according to the time stamp of the anomaly
+        if ( self._tstamps is None ) or ( ( not self._typed ) and ( p_anomaly.tstamp is not None ) ):
+            self._init_index( p_tstamp = p_anomaly.tstamp )
+
+        self._reserve()
+
+        start, end = self._start, self._end
+        key        = self._get_key(p_anomaly.tstamp)
+        pos        = start + int(np.searchsorted(self._tstamps[start:end], key, side='right'))
+
+        if pos < end:
+            for array in (self._tstamps, self._ids, self._inst_first, self._inst_last, self._scores):
+                array[pos+1:end+1] = array[pos:end]
+
+        try:
+            instances = p_anomaly.instances
+        except AttributeError:
+            instances = None
+
+        self._tstamps[pos]    = key
+        self._ids[pos]        = p_id
+        self._inst_first[pos] = instances[0].id if instances else -1
+        self._inst_last[pos]  = instances[-1].id if instances else -1
+        self._scores[pos]     = np.nan
+        self._end            += 1
+        self._anomalies[p_id] = p_anomaly
+
+
+        # 2 Retention by count
+        if self._max_count is not None:
+            while len(self._anomalies) > self._max_count:
+                self._evict( p_id = next(iter(self._anomalies)) )
+
+
+        # 3 Retention by time
+        num_tstamps = self._get_num_tstamps()
+        if ( self._max_age_key is not None ) and ( num_tstamps > 0 ):
+            limit = self._tstamps[self._start+num_tstamps-1] - self._max_age_key
+            num   = int(np.searchsorted(self._tstamps[self._start:self._end], limit, side='left'))
+            for anomaly_id in self._ids[self._start:self._start+num].tolist():
+                self._anomalies.pop(anomaly_id).remove_plot()
+            self._start += num
+
+
+## -------------------------------------------------------------------------------------------------
+    def __delitem__(self, p_id : int):
+
+        self._remove_record( p_pos = self._find(p_id) )
+        del self._anomalies[p_id]
+
+
+## -------------------------------------------------------------------------------------------------
+    def __iter__(self):
+        return iter(self._anomalies)
+
+
+## -------------------------------------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._anomalies)
+
+
+## -------------------------------------------------------------------------------------------------
+    def keys(self):
+        return self._anomalies.keys()
+
+
+## -------------------------------------------------------------------------------------------------
+    def values(self):
+        return self._anomalies.values()
+
+
+## -------------------------------------------------------------------------------------------------
+    def items(self):
+        return self._anomalies.items()
+
+
+## -------------------------------------------------------------------------------------------------
+    def set_score(self, p_id : int, p_score : float):
+        """
+        Sets the score of a stored anomaly. Unknown anomaly ids are ignored.
+
+        Parameters
+        ----------
+        p_id : int
+            Anomaly id.
+        p_score : float
+            Score of the anomaly.
+        """
+
+        if p_id not in self._anomalies: return
+        self._scores[self._find(p_id)] = p_score
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_slice(self, p_tstamp_from, p_tstamp_to) -> slice:
+
+        start, end = self._start, self._end
+
+        # Without time stamps, no anomaly is part of a bounded time range
+        if ( not self._typed ) and ( ( p_tstamp_from is not None ) or ( p_tstamp_to is not None ) ):
+            return slice(start, start)
+
+        tstamps = self._tstamps[start:end]
+        lo = 0 if p_tstamp_from is None else np.searchsorted(tstamps, self._get_key(p_tstamp_from), side='left')
+
+        if p_tstamp_to is not None:
+            hi = np.searchsorted(tstamps, self._get_key(p_tstamp_to), side='right')
+        elif p_tstamp_from is not None:
+            hi = self._get_num_tstamps()
+        else:
+            hi = end - start
+
+        return slice(start + int(lo), start + int(max(lo, hi)))
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_range(self, p_tstamp_from = None, p_tstamp_to = None) -> list:
+        """
+        Returns all stored anomalies within the given time range in the order of their time stamps.
+
+        Parameters
+        ----------
+        p_tstamp_from
+            Inclusive lower bound of the time stamps. Default = None (no lower bound).
+        p_tstamp_to
+            Inclusive upper bound of the time stamps. Default = None (no upper bound).
+
+        Returns
+        -------
+        list
+            List of anomalies.
+        """
+
+        if self._ids is None: return []
+
+        ids = self._ids[self._get_slice(p_tstamp_from, p_tstamp_to)]
+        return [ self._anomalies[anomaly_id] for anomaly_id in ids.tolist() ]
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_records(self, p_tstamp_from = None, p_tstamp_to = None) -> dict:
+        """
+        Returns the records of all stored anomalies within the given time range in the order of their
+        time stamps.
+
+        Parameters
+        ----------
+        p_tstamp_from
+            Inclusive lower bound of the time stamps. Default = None (no lower bound).
+        p_tstamp_to
+            Inclusive upper bound of the time stamps. Default = None (no upper bound).
+
+        Returns
+        -------
+        dict
+            Copies of the record arrays with keys 'id', 'tstamp', 'inst_id_first', 'inst_id_last' and
+            'score'.
+        """
+
+        if self._tstamps is None: self._init_index( p_tstamp = None )
+
+        s = self._get_slice(p_tstamp_from, p_tstamp_to)
+        return { 'id'            : self._ids[s].copy(),
+                 'tstamp'        : self._tstamps[s].copy(),
+                 'inst_id_first' : self._inst_first[s].copy(),
+                 'inst_id_last'  : self._inst_last[s].copy(),
+                 'score'         : self._scores[s].copy() }
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class AnomalyDetectorLOF (AnomalyDetectorIBPG):
+    """
+    Incremental local outlier factor (LOF) anomaly detector on a sliding window. It behaves like
+    class mlpro_int_sklearn.wrappers.anomalydetectors.WrAnomalyDetectorSklearn2MLPro wrapping
+    sklearn.neighbors.LocalOutlierFactor with a detection step rate of 1, but does not refit the
+    model on each instance.
+
+    The detector keeps the Euclidean distances between all instances of the window in a matrix,
+    which serves as neighborhood index. When a new instance replaces the oldest one, only the
+    affected entries are updated:
+    - the k nearest neighbors and k-distances of all instances that had the evicted instance as
+      neighbor or have the new instance closer than their k-distance
+    - the local reachability densities of these instances and of all instances having one of them
+      as neighbor
+    - the LOF scores of all instances with changed densities and of their reverse neighbors
+
+    An insert costs O(W*d) for the new distance row (window size W, d dimensions) plus O(W) per
+    affected instance, and the matrix needs O(W^2) memory. For the window sizes of online anomaly
+    detection, this is cheaper than a tree index, since the distance row answers the reverse
+    neighbor query (which instances have the new one within their k-distance) at the same time.
+
+    Once the window is filled, each instance of the window whose LOF score exceeds the threshold is
+    reported once as a point anomaly. The anomalies are buffered in an anomaly store (see class
+    AnomalyStore) together with their LOF scores.
+
+    Parameters
+    ----------
+    p_name : str
+        Optional name of the task. Default is None.
+    p_range_max : int
+        Maximum range of asynchonicity. See class Range. Default is Range.C_RANGE_THREAD.
+    p_duplicate_data : bool
+        If True, instances will be duplicated before processing. Default = False.
+    p_visualize : bool
+        Boolean switch for visualisation. Default = False.
+    p_logging
+        Log level (see constants of class Log). Default: Log.C_LOG_ALL
+    p_anomaly_buffer_size : int = 100
+        Size of the internal anomaly buffer self.anomalies. Default = 100.
+    p_anomaly_max_age
+        Maximum age of buffered anomalies relative to the newest one (see class AnomalyStore).
+        Default = None (unlimited).
+    p_window_size : int
+        Number of instances of the sliding window. Default = 20.
+    p_n_neighbors : int
+        Number of neighbors k. Default = 20 (limited to p_window_size - 1).
+    p_threshold : float
+        Instances with a LOF score above this threshold are outliers. Default = 1.5 (as the automatic
+        contamination of scikit-learn).
+    p_group_anomaly_det : bool
+        Paramter to activate group anomaly detection. Default is True.
+    p_kwargs : dict
+        Further optional named parameters.
+    """
+
+    C_TYPE = 'Anomaly Detector (incremental LOF)'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_name : str = None,
+                  p_range_max = StreamTask.C_RANGE_THREAD,
+                  p_duplicate_data : bool = False,
+                  p_visualize : bool = False,
+                  p_logging = Log.C_LOG_ALL,
+                  p_anomaly_buffer_size : int = 100,
+                  p_anomaly_max_age = None,
+                  p_window_size : int = 20,
+                  p_n_neighbors : int = 20,
+                  p_threshold : float = 1.5,
+                  p_group_anomaly_det : bool = True,
+                  **p_kwargs ):
+
+        if p_window_size < 2:
+            raise ParamError('Please set the parameter "p_window_size" >= 2')
+
+        if p_n_neighbors < 1:
+            raise ParamError('Please set the parameter "p_n_neighbors" >= 1')
+
+        super().__init__( p_name = p_name,
+                          p_range_max = p_range_max,
+                          p_ada = True,
+                          p_duplicate_data = p_duplicate_data,
+                          p_visualize = p_visualize,
+                          p_logging = p_logging,
+                          p_anomaly_buffer_size = p_anomaly_buffer_size,
+                          p_thrs_inst = 1,
+                          p_group_anomaly_det = p_group_anomaly_det,
+                          **p_kwargs )
+
+        self.changes      = AnomalyStore( p_max_count = max(p_anomaly_buffer_size, 1), p_max_age = p_anomaly_max_age )
+        self.anomalies    = self.changes
+        self._window_size = p_window_size
+        self._k           = min(p_n_neighbors, p_window_size - 1)
+        self._threshold   = p_threshold
+
+        self._values      = None
+        self._dist        = None
+        self._knn         = None
+        self._kdist       = None
+        self._lrd         = None
+        self._lof         = None
+        self._inst_ref    = np.empty(p_window_size, dtype=object)
+        self._reported    = np.zeros(p_window_size, dtype=bool)
+        self._inst_count  = 0
+        self._pos         = 0
+
+
+## -------------------------------------------------------------------------------------------------
+    def _init_window(self, p_num_dim : int):
+
+        size             = self._window_size
+        self._values     = np.zeros( (size, p_num_dim), dtype=np.float64 )
+        self._dist       = np.full( (size, size), np.inf, dtype=np.float64 )
+        self._knn        = np.zeros( (size, self._k), dtype=np.int64 )
+        self._kdist      = np.zeros( size, dtype=np.float64 )
+        self._lrd        = np.zeros( size, dtype=np.float64 )
+        self._lof        = np.ones( size, dtype=np.float64 )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _update_neighbors(self, p_idx : np.ndarray) -> np.ndarray:
+        """
+        Determines the k nearest neighbors and k-distances of the given instances.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean mask of all instances with changed k-distance.
+        """
+
+        dist       = self._dist[p_idx]
+        knn        = np.argpartition( dist, self._k - 1, axis=1 )[:, :self._k]
+        kdist      = np.take_along_axis( dist, knn, axis=1 ).max(axis=1)
+
+        changed         = np.zeros( self._window_size, dtype=bool )
+        changed[p_idx]  = kdist != self._kdist[p_idx]
+
+        self._knn[p_idx]   = knn
+        self._kdist[p_idx] = kdist
+        return changed
+
+
+## -------------------------------------------------------------------------------------------------
+    def _update_scores(self, p_mask_knn : np.ndarray, p_mask_kdist : np.ndarray):
+        """
+        Updates the local reachability densities and LOF scores of all affected instances.
+
+        Parameters
+        ----------
+        p_mask_knn : np.ndarray
+            Boolean mask of all instances with changed neighbors.
+        p_mask_kdist : np.ndarray
+            Boolean mask of all instances with changed k-distance.
+        """
+
+        knn = self._knn
+
+        # 1 Local reachability densities
+        mask_lrd   = p_mask_knn | p_mask_kdist[knn].any(axis=1)
+        idx        = np.flatnonzero(mask_lrd)
+        knn_idx    = knn[idx]
+        reach_dist = np.maximum( self._kdist[knn_idx], np.take_along_axis(self._dist[idx], knn_idx, axis=1) )
+        self._lrd[idx] = 1 / ( reach_dist.mean(axis=1) + 1e-10 )
+
+        # 2 LOF scores
+        mask_lof   = mask_lrd | mask_lrd[knn].any(axis=1)
+        idx        = np.flatnonzero(mask_lof)
+        self._lof[idx] = self._lrd[knn[idx]].mean(axis=1) / self._lrd[idx]
+
+
+## -------------------------------------------------------------------------------------------------
+    def _detect(self, p_instance : Instance, **p_kwargs):
+
+        # 1 Intro
+        feature_values = np.asarray( get_values_ro(p_instance.get_feature_data()), dtype=np.float64 ).ravel()
+        if self._values is None: self._init_window( p_num_dim = feature_values.size )
+
+        size = self._window_size
+        slot = self._pos
+        full = self._inst_count >= size
+
+
+        # 2 The new instance replaces the oldest one in the distance matrix
+        self._values[slot]   = feature_values
+        self._inst_ref[slot] = p_instance
+        self._reported[slot] = False
+
+        if full: evicted = ( self._knn == slot ).any(axis=1)
+
+        dist_new          = np.sqrt( np.square( self._values - feature_values ).sum(axis=1) )
+        dist_new[slot]    = np.inf
+        if not full: dist_new[self._inst_count+1:] = np.inf
+        self._dist[slot]    = dist_new
+        self._dist[:, slot] = dist_new
+
+        self._pos       = ( slot + 1 ) % size
+        self._inst_count += 1
+
+
+        # 3 Update of neighborhoods and scores
+        if self._inst_count < size: return
+
+        if not full:
+            # 3.1 Window filled the first time: all instances are evaluated
+            mask_knn = np.ones( size, dtype=bool )
+            self._update_neighbors( p_idx = np.arange(size) )
+            self._update_scores( p_mask_knn = mask_knn, p_mask_kdist = mask_knn )
+        else:
+            # 3.2 Incremental update of all affected instances
+            mask_knn       = evicted | ( dist_new <= self._kdist )
+            mask_knn[slot] = True
+            mask_kdist     = self._update_neighbors( p_idx = np.flatnonzero(mask_knn) )
+            self._update_scores( p_mask_knn = mask_knn, p_mask_kdist = mask_kdist )
+
+
+        # 4 Report new outliers from the oldest to the newest instance
+        order    = ( np.arange(size) + self._pos ) % size
+        outliers = order[ ( self._lof[order] > self._threshold ) & ~self._reported[order] ]
+
+        for i in outliers:
+            self._reported[i] = True
+            related_instance  = self._inst_ref[i]
+
+            anomaly = PointAnomaly( p_status = True,
+                                    p_tstamp = related_instance.tstamp,
+                                    p_visualize = self.get_visualization(),
+                                    p_raising_object = self,
+                                    p_instances = [related_instance] )
+
+            self._raise_anomaly_event( p_anomaly = anomaly, p_instance = p_instance )
+            self.anomalies.set_score( p_id = anomaly.id, p_score = self._lof[i] )
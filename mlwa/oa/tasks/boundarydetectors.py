@@ -0,0 +1,123 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Package    : mlwa.oa.tasks
+## -- Module     : boundarydetectors.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.3.0 (2026-10-17)
+
+This module provides a boundary detector that supports several obsolete instances per run and
+adapts on all instances of a run by a single net update.
+
+"""
+
+import numpy as np
+
+from mlpro.bf.math.statistics import BoundarySide
+from mlpro.bf.streams import Instance
+from mlpro.oa.streams.tasks import BoundaryDetector as BoundaryDetectorMLPro
+
+from mlwa.oa.basics import OAStreamTask
+from mlwa.math import get_values_ro
+
+
+
+# Export list for public API
+__all__ = [ 'BoundaryDetector' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class BoundaryDetector (OAStreamTask, BoundaryDetectorMLPro):
+    """
+    Drop-in replacement for class mlpro.oa.streams.tasks.BoundaryDetector. The boundaries to be
+    reduced are accumulated over all obsolete instances of a run. The original only keeps the marks
+    of the last obsolete instance, which is sufficient for single instances per run but not for
+    micro-batches (see class mlwa.oa.OAStreamScenario).
+
+    The new and obsolete instances of a run are processed together by a single net update (see
+    method _adapt_net()). A boundary touched by an obsolete instance is only requested from the
+    boundary provider if no new instance of the same run holds it. As with the original, the new
+    instances that extended a boundary raise one adaptation event of type FORWARD and the obsolete
+    instances that touched a boundary one adaptation event of type REVERSE. Each event counts the
+    instances that triggered it as if the instances were processed one by one.
+
+    See class mlpro.oa.streams.tasks.BoundaryDetector for a description of the parameters.
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def _adapt_reverse(self, p_instance_del : Instance) -> bool:
+
+        # 0 First call: Preparation of boundary arrays
+        if self._boundaries is None: self._init_data_structures( p_instance = p_instance_del )
+
+
+        # 1 Mark boundaries for potential reduction
+        feature_values = get_values_ro(p_instance_del.get_feature_data())
+        reduce_upper   = np.greater_equal( feature_values, self._boundaries[:,BoundarySide.UPPER] )
+        reduce_lower   = np.less_equal( feature_values, self._boundaries[:,BoundarySide.LOWER] )
+
+        self._boundaries_reduce[:,BoundarySide.UPPER] |= reduce_upper
+        self._boundaries_reduce[:,BoundarySide.LOWER] |= reduce_lower
+
+
+        # 2 Determine if any boundary needs to be reduced
+        return bool( np.any(reduce_upper) or np.any(reduce_lower) )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _adapt_net(self, p_instances_new : list, p_instances_del : list):
+
+        # 0 First call: Preparation of boundary arrays
+        if ( len(p_instances_new) + len(p_instances_del) ) == 0: return 0, 0
+
+        if self._boundaries is None:
+            self._init_data_structures( p_instance = ( p_instances_new + p_instances_del )[0] )
+
+        upper            = self._boundaries[:,BoundarySide.UPPER]
+        lower            = self._boundaries[:,BoundarySide.LOWER]
+        num_inst_forward = 0
+        num_inst_reverse = 0
+
+
+        # 1 Boundary extension on the new instances. The running boundaries determine the instances
+        # that extended a boundary.
+        if len(p_instances_new) > 0:
+            values_new = np.array( [ get_values_ro(inst.get_feature_data()) for inst in p_instances_new ], dtype=np.float64 )
+            upper_run  = np.fmax.accumulate( np.vstack( (upper, values_new) ), axis=0 )
+            lower_run  = np.fmin.accumulate( np.vstack( (lower, values_new) ), axis=0 )
+            extended   = np.any( upper_run[1:] != upper_run[:-1], axis=1 ) | np.any( lower_run[1:] != lower_run[:-1], axis=1 )
+
+            num_inst_forward = int(np.count_nonzero(extended))
+            np.copyto( upper, upper_run[-1] )
+            np.copyto( lower, lower_run[-1] )
+
+
+        # 2 Boundary reduction on the obsolete instances
+        if len(p_instances_del) > 0:
+            values_del    = np.array( [ get_values_ro(inst.get_feature_data()) for inst in p_instances_del ], dtype=np.float64 )
+            touched_upper = values_del >= upper
+            touched_lower = values_del <= lower
+
+            num_inst_reverse = int(np.count_nonzero( np.any(touched_upper, axis=1) | np.any(touched_lower, axis=1) ))
+            self._boundaries_reduce[:,BoundarySide.UPPER] |= np.any( touched_upper, axis=0 )
+            self._boundaries_reduce[:,BoundarySide.LOWER] |= np.any( touched_lower, axis=0 )
+
+            # 2.1 Boundaries held by a new instance remain valid
+            if len(p_instances_new) > 0:
+                self._boundaries_reduce[:,BoundarySide.UPPER] &= ~np.any( values_new >= upper, axis=0 )
+                self._boundaries_reduce[:,BoundarySide.LOWER] &= ~np.any( values_new <= lower, axis=0 )
+
+            # 2.2 Remaining boundaries are requested from the boundary provider
+            for dim, side in np.argwhere(self._boundaries_reduce):
+                self._boundaries[dim,side] = self._boundary_provider.get_boundaries( p_dim = dim, p_side = side )
+
+            self._boundaries_reduce[...] = False
+
+        return num_inst_forward, num_inst_reverse
@@ -0,0 +1,240 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Package    : mlwa.oa.tasks
+## -- Module     : clusteranalyzers.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.3.0 (2026-10-17)
+
+This module provides a native online KMeans cluster analyzer based on NumPy.
+
+"""
+
+import random
+
+import numpy as np
+
+from mlpro.bf.various import Log
+from mlpro.bf.math.normalizers import Normalizer
+from mlpro.oa.streams.tasks.clusteranalyzers import ClusterAnalyzer
+from mlpro.oa.streams.tasks.clusteranalyzers.clusters import ClusterCentroid
+from mlpro.oa.streams.tasks.clusteranalyzers.clusters.properties import cprop_centroid1, cprop_size1
+
+from mlwa.oa.basics import OAStreamTask
+from mlwa.math import get_values_ro
+
+
+
+# Export list for public API
+__all__ = [ 'KMeans' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class KMeans (OAStreamTask, ClusterAnalyzer):
+    """
+    Native online KMeans cluster analyzer with the parameters and the behavior of River's KMeans.
+    It can be used as a drop-in replacement for class mlwa.wrappers.river.WrRiverKMeans2MLPro.
+
+    Each new instance is assigned to the cluster with the nearest centroid according to the
+    Minkowski metric. This centroid is moved towards the instance by the factor p_halflife. On the
+    first instance, the centroids are drawn from a normal distribution in the same order as River
+    does, so that both produce the same clusters for the same seed.
+
+    The centroids and cluster sizes are stored in NumPy arrays. All new instances of a run
+    (micro-batches, see class mlwa.oa.OAStreamScenario) are handed over to a single net adaptation
+    (see class mlwa.oa.OAStreamTask), which reads their feature values into one array. Since each
+    assignment depends on the centroid moved by the previous instance, the instances are still
+    assigned one by one in the order of their ids (as in River), each by a vectorized distance
+    computation to all centroids. The MLPro clusters are updated once per run.
+
+    Parameters
+    ----------
+    p_name : str
+        Name of the clusterer. Default: None.
+    p_range_max :
+        Maximum range of asynchonicity. Default: OAStreamTask.C_RANGE_THREAD.
+    p_ada : bool
+        Turn on adaptivity. Default: True.
+    p_visualize : bool
+        Turn on visualization. Default: False.
+    p_logging :
+        Set up type of logging. Default: Log.C_LOG_ALL.
+    p_n_clusters : int
+        Number of clusters. Default: 5.
+    p_halflife : float
+        Amount by which to move the cluster centers, a reasonable value is between 0 and 1.
+        Default: 0.5.
+    p_mu : float
+        Mean of the normal distribution used to instantiate cluster positions. Default: 0.
+    p_sigma : float
+        Standard deviation of the normal distribution used to instantiate cluster positions.
+        Default: 1.
+    p_p : int
+        Power parameter for the Minkowski metric. When p=1, this corresponds to the Manhattan
+        distance, while p=2 corresponds to the Euclidean distance. Default: 2.
+    p_seed : int
+        Random seed used for generating initial centroid positions. Default: None.
+    p_kwargs : dict
+        Further optional named parameters.
+    """
+
+    C_TYPE                  = 'Cluster Analyzer KMeans'
+
+    C_CLUSTER_PROPERTIES    = [ cprop_centroid1, cprop_size1 ]
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_name : str = None,
+                  p_range_max = OAStreamTask.C_RANGE_THREAD,
+                  p_ada : bool = True,
+                  p_visualize : bool = False,
+                  p_logging = Log.C_LOG_ALL,
+                  p_n_clusters : int = 5,
+                  p_halflife : float = 0.5,
+                  p_mu : float = 0,
+                  p_sigma : float = 1,
+                  p_p : int = 2,
+                  p_seed : int = None,
+                  **p_kwargs ):
+
+        super().__init__( p_cls_cluster = ClusterCentroid,
+                          p_cluster_limit = p_n_clusters,
+                          p_name = p_name,
+                          p_range_max = p_range_max,
+                          p_ada = p_ada,
+                          p_duplicate_data = False,
+                          p_visualize = p_visualize,
+                          p_logging = p_logging,
+                          **p_kwargs )
+
+        self._n_clusters = p_n_clusters
+        self._halflife   = p_halflife
+        self._mu         = p_mu
+        self._sigma      = p_sigma
+        self._p          = p_p
+        self._rng        = random.Random(p_seed)
+        self._centroids  = None
+        self._sizes      = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def _init_clusters(self, p_num_dim : int):
+        """
+        Draws the initial centroids and creates the related MLPro clusters.
+        """
+
+        self._centroids = np.array( [ [ self._rng.gauss(self._mu, self._sigma) for d in range(p_num_dim) ]
+                                      for c in range(self._n_clusters) ],
+                                    dtype=np.float64 )
+        self._sizes     = np.zeros( self._n_clusters, dtype=np.int64 )
+
+        for cluster_id in range(self._n_clusters):
+            cluster = self._cls_cluster( p_id = cluster_id,
+                                         p_properties = self._cluster_properties.values(),
+                                         p_visualize = self.get_visualization() )
+            cluster.centroid.value = self._centroids[cluster_id]
+            self._add_cluster( p_cluster = cluster )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_distances(self, p_values : np.ndarray) -> np.ndarray:
+        """
+        Returns the distances of the given feature values to all centroids according to the
+        Minkowski metric without the final root (as River does).
+        """
+
+        diff = self._centroids - p_values
+        if self._p == 2: return np.einsum('ij,ij->i', diff, diff)
+
+        np.abs( diff, out=diff )
+        if self._p == 1: return diff.sum(axis=1)
+        return ( diff ** self._p ).sum(axis=1)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _adapt_net(self, p_instances_new : list, p_instances_del : list):
+
+        if len(p_instances_new) == 0: return 0, 0
+
+        values = np.array( [ get_values_ro(inst.get_feature_data()) for inst in p_instances_new ], dtype=np.float64 )
+        values = values.reshape( len(p_instances_new), -1 )
+
+        if self._centroids is None: self._init_clusters( p_num_dim = values.shape[1] )
+
+
+        # 1 Sequential nearest-centroid assignment and centroid update
+        centroids = self._centroids
+        sizes     = self._sizes
+        halflife  = self._halflife
+        adapted   = set()
+
+        for x in values:
+            c = int(self._get_distances(x).argmin())
+            centroids[c] += halflife * ( x - centroids[c] )
+            sizes[c]     += 1
+            adapted.add(c)
+
+
+        # 2 Update of the related MLPro clusters
+        for cluster_id in adapted:
+            cluster = self._clusters[cluster_id]
+            cluster.centroid.value = centroids[cluster_id]
+            cluster.size.value     = int(sizes[cluster_id])
+
+        return len(p_instances_new), 0
+
+
+## -------------------------------------------------------------------------------------------------
+    def _renormalize(self, p_normalizer : Normalizer):
+        """
+        Internal renormalization of all centroids by a single vectorized operation.
+
+        Parameters
+        ----------
+        p_normalizer : Normalizer
+            Normalizer object to be applied on task-specific
+        """
+
+        if self._centroids is None: return
+
+        self._centroids = np.asarray( p_normalizer.renormalize( p_data = self._centroids ), dtype=np.float64 )
+
+        for cluster_id, centroid in enumerate(self._centroids):
+            self._clusters[cluster_id].centroid.value = centroid
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_centroids(self) -> np.ndarray:
+        """
+        Returns the centroids of all clusters.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (n_clusters, n_dims). Row i contains the centroid of the cluster with id i.
+            None, if no instance has been processed yet.
+        """
+
+        return self._centroids
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_cluster_sizes(self) -> np.ndarray:
+        """
+        Returns the sizes of all clusters.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (n_clusters,). Entry i contains the number of instances assigned to the
+            cluster with id i. None, if no instance has been processed yet.
+        """
+
+        return self._sizes
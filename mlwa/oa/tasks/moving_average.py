@@ -0,0 +1,215 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Package    : mlwa.oa.tasks
+## -- Module     : moving_average.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.3.0 (2026-10-17)
+
+This module provides a moving average task based on a running sum, which is renormalized by a
+single affine transformation.
+
+"""
+
+import numpy as np
+
+from mlpro.bf.various import Log
+from mlpro.bf.plot import PlotSettings
+from mlpro.bf.math import Element
+from mlpro.bf.math.normalizers import Normalizer
+from mlpro.bf.streams import InstDict, InstTypeNew, InstTypeDel, Instance
+from mlpro.oa.streams import OAStreamTask
+from mlpro.oa.streams.tasks import MovingAverage as MovingAverageMLPro
+
+from mlwa.streams import StreamTaskPlotND
+from mlwa.math import get_values_ro
+from mlwa.oa import get_renormalization
+
+
+
+# Export list for public API
+__all__ = [ 'MovingAverage' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class MovingAverage (StreamTaskPlotND, MovingAverageMLPro):
+    """
+    Drop-in replacement for class mlpro.oa.streams.tasks.MovingAverage. The task keeps the running
+    sum and the number of considered instances, so that adding and removing an instance is a
+    constant-time operation. A renormalization is applied as a single affine transformation on the
+    running sum and as one vectorized operation on the retained plot data (see function
+    mlwa.oa.get_renormalization()). Several incoming instances (micro-batches, see class
+    mlwa.oa.OAStreamScenario) are added and removed by one vectorized sum each.
+
+    Unlike the original, the task can be run without visualization.
+
+    See class mlpro.oa.streams.tasks.MovingAverage for a description of the parameters.
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_name = None,
+                  p_range_max = OAStreamTask.C_RANGE_THREAD,
+                  p_ada : bool = True,
+                  p_buffer_size : int = 0,
+                  p_duplicate_data : bool = False,
+                  p_visualize : bool = False,
+                  p_logging = Log.C_LOG_ALL,
+                  p_remove_obs : bool = True,
+                  p_renormalize_plot_data : bool = True,
+                  **p_kwargs ):
+
+        super().__init__( p_name = p_name,
+                          p_range_max = p_range_max,
+                          p_ada = p_ada,
+                          p_buffer_size = p_buffer_size,
+                          p_duplicate_data = p_duplicate_data,
+                          p_visualize = p_visualize,
+                          p_logging = p_logging,
+                          p_remove_obs = p_remove_obs,
+                          p_renormalize_plot_data = p_renormalize_plot_data,
+                          **p_kwargs )
+
+        self._sum = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def _run(self, p_instances : InstDict ):
+
+        # 0 Intro
+        inst_avg_id     = -1
+        inst_avg_tstamp = None
+
+
+        # 1 Process all incoming new/obsolete stream instances
+        values_new = []
+        values_del = []
+
+        for inst_id, (inst_type, inst) in p_instances.items():
+
+            if inst_type == InstTypeNew:
+                values_new.append( get_values_ro(inst.get_feature_data()) )
+            elif ( inst_type == InstTypeDel ) and self._remove_obs:
+                values_del.append( get_values_ro(inst.get_feature_data()) )
+
+            if inst_id > inst_avg_id:
+                inst_avg_id     = inst_id
+                inst_avg_tstamp = inst.tstamp
+                feature_set     = inst.get_feature_data().get_related_set()
+
+        if len(values_new) > 0:
+            if self._sum is None:
+                self._sum = np.zeros(len(values_new[0]))
+
+            self._sum      += values_new[0] if len(values_new) == 1 else np.sum(values_new, axis=0)
+            self._num_inst += len(values_new)
+
+        if ( len(values_del) > 0 ) and ( self._sum is not None ):
+            self._sum      -= values_del[0] if len(values_del) == 1 else np.sum(values_del, axis=0)
+            self._num_inst -= len(values_del)
+
+        if ( inst_avg_id == -1 ) or ( self._num_inst <= 0 ): return
+
+
+        # 2 Clear all incoming stream instances
+        p_instances.clear()
+
+
+        # 3 Add a new stream instance containing the moving average
+        self._moving_avg    = self._sum / self._num_inst
+        inst_avg_data       = Element( p_set = feature_set )
+        inst_avg_data.set_values( p_values = self._moving_avg.copy() )
+        inst_avg            = Instance( p_feature_data = inst_avg_data, p_tstamp = inst_avg_tstamp )
+        inst_avg.id         = inst_avg_id
+
+        p_instances[inst_avg.id] = ( InstTypeNew, inst_avg )
+
+        self.crosshair.value = self._moving_avg
+
+
+## -------------------------------------------------------------------------------------------------
+    def _renormalize(self, p_normalizer : Normalizer):
+
+        scale, offset = get_renormalization( p_normalizer = p_normalizer )
+
+        if self._sum is not None:
+            if scale is not None:
+                self._sum *= scale
+                self._sum += offset * self._num_inst
+            elif self._num_inst > 0:
+                # Fallback for non-affine cases: renormalization of the average
+                self._sum = p_normalizer.renormalize( p_data = self._sum / self._num_inst ) * self._num_inst
+
+            if self._num_inst > 0: self._moving_avg = self._sum / self._num_inst
+            self.log(Log.C_LOG_TYPE_W, 'Moving avg renormalized')
+
+        if self._renormalize_plot_data:
+            self._update_plot_data( p_normalizer = p_normalizer, p_scale = scale, p_offset = offset )
+
+
+## -------------------------------------------------------------------------------------------------
+    def init_plot(self, p_figure = None, p_plot_settings = None):
+        OAStreamTask.init_plot( self, p_figure = p_figure, p_plot_settings = p_plot_settings )
+
+        if not self.get_visualization(): return
+
+        if self.get_plot_settings().view != PlotSettings.C_VIEW_ND:
+            self.crosshair.init_plot( p_figure = self._figure,
+                                      p_plot_settings = self.get_plot_settings() )
+
+
+## -------------------------------------------------------------------------------------------------
+    def update_plot(self, p_instances : InstDict = None, **p_kwargs):
+        OAStreamTask.update_plot( self, p_instances = p_instances, **p_kwargs )
+
+        if not self.get_visualization(): return
+
+        if self.get_plot_settings().view != PlotSettings.C_VIEW_ND:
+            self.crosshair.update_plot( p_instances = p_instances, **p_kwargs )
+
+
+## -------------------------------------------------------------------------------------------------
+    def remove_plot(self, p_refresh = True):
+        OAStreamTask.remove_plot(self, p_refresh)
+
+        if self.get_visualization(): self.crosshair.remove_plot(p_refresh)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _update_plot_data(self, p_normalizer : Normalizer, p_scale : np.ndarray = None, p_offset : np.ndarray = None):
+
+        if not self.get_visualization(): return
+
+        if p_scale is None:
+            return super()._update_plot_data( p_normalizer = p_normalizer )
+
+        view = self.get_plot_settings().view
+
+        if view == PlotSettings.C_VIEW_2D:
+            columns = [ self._plot_2d_xdata, self._plot_2d_ydata ]
+        elif view == PlotSettings.C_VIEW_3D:
+            columns = [ self._plot_3d_xdata, self._plot_3d_ydata, self._plot_3d_zdata ]
+        elif view == PlotSettings.C_VIEW_ND:
+            # Bounded plot buffer (see class mlwa.streams.StreamTaskPlotND)
+            return self._update_plot_data_nd( p_normalizer = p_normalizer )
+        else:
+            columns = []
+
+        if ( len(columns) > 0 ) and ( len(columns[0]) > 0 ):
+            num_dim = len(columns)
+            data    = np.array(columns, dtype=np.float64)
+            data   *= p_scale[:num_dim, None]
+            data   += p_offset[:num_dim, None]
+
+            for column, values in zip(columns, data.tolist()):
+                column[:] = values
+
+        self._update_ax_limits = True
+        self._recalc_ax_limits = True
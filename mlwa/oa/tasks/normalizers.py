@@ -0,0 +1,356 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Package    : mlwa.oa.tasks
+## -- Module     : normalizers.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.7.0 (2026-10-17)
+
+This module provides online-adaptive normalizer tasks that normalize all incoming instances at once
+as 2D arrays. Optionally, the adaptation events of a run are coalesced into a single event.
+
+"""
+
+import numpy as np
+
+from mlpro.bf.exceptions import ParamError
+from mlpro.bf.various import Log
+from mlpro.bf.plot import PlotSettings
+from mlpro.bf.events import Event
+from mlpro.bf.streams import InstDict, InstTypeNew
+from mlpro.oa.streams import OAStreamTask, OAStreamAdaptationType
+from mlpro.oa.streams.tasks import NormalizerMinMax as NormalizerMinMaxMLPro
+from mlpro.oa.streams.tasks import NormalizerZTransform as NormalizerZTransformMLPro
+
+from mlwa.streams import StreamTaskPlotND
+from mlwa.math import get_values_ro
+
+
+
+# Export list for public API
+__all__ = [ 'NormalizerMinMax',
+            'NormalizerZTransform' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+def _normalize_instances(p_normalizer, p_instances : InstDict, p_param = None):
+    """
+    Normalizes the feature data of all given instances by one vectorized operation with the current
+    (or the given) parameters of the normalizer.
+    """
+
+    if len(p_instances) == 0: return
+
+    feature_data = [ inst.get_feature_data() for (inst_type, inst) in p_instances.values() ]
+    values       = np.array([ get_values_ro(fd) for fd in feature_data ], dtype=np.float64)
+
+    values       = p_normalizer.normalize( p_data = values, p_param = p_param )
+
+    for fd, row in zip(feature_data, values):
+        fd.set_values( p_values = row )
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class _CoalescedAdaptation:
+    """
+    Internal mixin for normalizer tasks that coalesces the adaptation events of a run. While a run is
+    in progress, adaptations only update the internal parameters. At the end of the adaptation
+    (method _publish_adaptation()), a single adaptation event is raised. Its normalizer provides the
+    parameters of the previous event as old and the current parameters as new parameters, so that
+    successors renormalize once by the net transformation.
+
+    With a tolerance > 0, the event is deferred as long as no normalized value in [-1,1] would be
+    shifted by more than the tolerance. Meanwhile, the task keeps normalizing with the parameters of
+    the last event, so that the data of its successors remain consistent.
+
+    An adaptation still pending at the end of a scenario run is published by method
+    flush_adaptation(), which is called by class mlwa.oa.OAStreamScenario.
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def _init_coalescing(self, p_coalesce_events : bool, p_tolerance : float):
+
+        if p_tolerance < 0:
+            raise ParamError('Tolerance must not be negative')
+
+        self._coalesce_events = p_coalesce_events or ( p_tolerance > 0 )
+        self._tolerance       = p_tolerance
+        self._param_pub       = None
+        self._adapt_pending   = False
+        self._adapt_subtype   = OAStreamAdaptationType.NONE
+        self._adapt_num_inst  = 0
+
+
+## -------------------------------------------------------------------------------------------------
+    def _set_adapted( self,
+                      p_adapted : bool,
+                      p_subtype : OAStreamAdaptationType = OAStreamAdaptationType.NONE,
+                      p_tstamp = None,
+                      p_num_inst = 1,
+                      **p_kwargs ):
+
+        if ( not self._coalesce_events ) or ( not p_adapted ):
+            return super()._set_adapted( p_adapted = p_adapted,
+                                         p_subtype = p_subtype,
+                                         p_tstamp = p_tstamp,
+                                         p_num_inst = p_num_inst,
+                                         **p_kwargs )
+
+        self._adapted         = True
+        self._adapt_pending   = True
+        self._adapt_subtype   = p_subtype
+        self._adapt_num_inst += p_num_inst
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_param_norm(self):
+        """
+        Returns the parameters to be used for normalization (None = current parameters).
+        """
+
+        if self._coalesce_events: return self._param_pub
+        return None
+
+
+## -------------------------------------------------------------------------------------------------
+    def flush_adaptation(self):
+        """
+        Raises a pending adaptation event regardless of the tolerance, e.g. at the end of a run.
+        """
+
+        self._publish_adaptation( p_force = True )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _publish_adaptation(self, p_force : bool = False):
+        """
+        Raises the pending adaptation event with the net parameter change since the previous event,
+        unless the change is within the tolerance.
+
+        Parameters
+        ----------
+        p_force : bool
+            If True, the tolerance is ignored. Default = False.
+        """
+
+        if not self._adapt_pending: return
+
+        param_pub = self._param_pub
+
+        if ( param_pub is not None ) and ( self._tolerance > 0 ) and ( not p_force ):
+            with np.errstate(divide='ignore', invalid='ignore'):
+                scale  = self._param_new[0] / param_pub[0]
+                offset = self._param_new[1] - param_pub[1] * scale
+                shift  = np.abs(scale - 1) + np.abs(offset)
+
+            if np.all( shift <= self._tolerance ):
+                self.log(self.C_LOG_TYPE_S, 'Parameter change within tolerance -> adaptation event deferred')
+                return
+
+        self._param_pub = self._param_new.copy()
+        self._param_old = param_pub
+
+        if self.get_visualization(): self._renormalize_plot_data()
+
+        subtype  = self._adapt_subtype
+        num_inst = self._adapt_num_inst
+        self._adapt_pending  = False
+        self._adapt_subtype  = OAStreamAdaptationType.NONE
+        self._adapt_num_inst = 0
+
+        super()._set_adapted( p_adapted = True, p_subtype = subtype, p_num_inst = num_inst )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _renormalize_plot_data(self):
+        """
+        Custom method to renormalize the plot data of the task from the old to the new parameters.
+        """
+
+        raise NotImplementedError
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class NormalizerMinMax (_CoalescedAdaptation, StreamTaskPlotND, NormalizerMinMaxMLPro):
+    """
+    Drop-in replacement for class mlpro.oa.streams.tasks.NormalizerMinMax. All incoming instances are
+    normalized by one vectorized operation.
+
+    Optionally, the boundary events received since the previous run are coalesced into a single
+    adaptation event, which is raised at the beginning of the next run. Successors then renormalize
+    once by the net transformation.
+
+    The ND plot data are kept in a bounded buffer (see class mlwa.streams.StreamTaskPlotND), which is
+    renormalized by one vectorized affine transformation.
+
+    See class mlpro.oa.streams.tasks.NormalizerMinMax for a description of the further parameters.
+
+    Parameters
+    ----------
+    p_coalesce_events : bool
+        If True, at most one adaptation event is raised per run. Default = False.
+    p_tolerance : float
+        Optional tolerance for coalesced events. An event is deferred as long as no normalized value
+        in [-1,1] would be shifted by more than the tolerance. A tolerance > 0 implies
+        p_coalesce_events = True. Default = 0.
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_name: str = None,
+                  p_range_max = OAStreamTask.C_RANGE_THREAD,
+                  p_ada : bool = True,
+                  p_duplicate_data : bool = False,
+                  p_visualize : bool = False,
+                  p_logging = Log.C_LOG_ALL,
+                  p_dst_boundaries : list = [-1, 1],
+                  p_coalesce_events : bool = False,
+                  p_tolerance : float = 0,
+                  **p_kwargs ):
+
+        self._init_coalescing( p_coalesce_events = p_coalesce_events, p_tolerance = p_tolerance )
+
+        super().__init__( p_name = p_name,
+                          p_range_max = p_range_max,
+                          p_ada = p_ada,
+                          p_duplicate_data = p_duplicate_data,
+                          p_visualize = p_visualize,
+                          p_logging = p_logging,
+                          p_dst_boundaries = p_dst_boundaries,
+                          **p_kwargs )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _run(self, p_instances : InstDict):
+
+        self._publish_adaptation()
+
+        if self._param_new is None: return super()._run( p_instances = p_instances )
+
+        _normalize_instances( p_normalizer = self, p_instances = p_instances, p_param = self._get_param_norm() )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _adapt_on_event(self, p_event_id : str, p_event_object : Event) -> bool:
+
+        if not self._coalesce_events:
+            return super()._adapt_on_event( p_event_id = p_event_id, p_event_object = p_event_object )
+
+        # The plot data are renormalized when the coalesced event is raised
+        return self.update_parameters( p_boundaries = p_event_object.get_raising_object().get_boundaries() )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _renormalize_plot_data(self):
+
+        view = self.get_plot_settings().view
+
+        if view == PlotSettings.C_VIEW_2D:
+            self._update_plot_data_2d()
+        elif view == PlotSettings.C_VIEW_3D:
+            self._update_plot_data_3d()
+        elif view == PlotSettings.C_VIEW_ND:
+            self._update_plot_data_nd()
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class NormalizerZTransform (_CoalescedAdaptation, StreamTaskPlotND, NormalizerZTransformMLPro):
+    """
+    Drop-in replacement for class mlpro.oa.streams.tasks.NormalizerZTransform. The parameters are
+    still adapted instance by instance (including the related adaptation events). Afterwards, all
+    incoming instances are normalized by one vectorized operation with the parameters after the last
+    adaptation step. Successors that renormalize on the adaptation events (e.g. class
+    mlwa.oa.tasks.MovingAverage) have already been renormalized to these parameters, so that their
+    state does not depend on the number of instances per run (e.g. in micro-batch mode).
+
+    Note: the stock task normalizes each instance of a run with the parameters of its own adaptation
+    step. If a run contains several instances (e.g. the delayed instances forwarded by a sliding
+    window), successors then combine data of different parameters, which this task avoids.
+
+    Optionally, the adaptation events of a run are coalesced into a single event with the net
+    parameter change, so that successors renormalize once per run (or micro-batch).
+
+    As with class NormalizerMinMax, the ND plot data are kept and renormalized in a bounded buffer.
+
+    See class mlpro.oa.streams.tasks.NormalizerZTransform for a description of the further parameters.
+
+    Parameters
+    ----------
+    p_coalesce_events : bool
+        If True, at most one adaptation event is raised per run. Default = False.
+    p_tolerance : float
+        Optional tolerance for coalesced events. An event is deferred as long as no normalized value
+        in [-1,1] would be shifted by more than the tolerance. A tolerance > 0 implies
+        p_coalesce_events = True. Default = 0.
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_name: str = None,
+                  p_range_max = OAStreamTask.C_RANGE_THREAD,
+                  p_ada : bool = True,
+                  p_duplicate_data : bool = False,
+                  p_visualize : bool = False,
+                  p_logging = Log.C_LOG_ALL,
+                  p_coalesce_events : bool = False,
+                  p_tolerance : float = 0,
+                  **p_kwargs ):
+
+        self._init_coalescing( p_coalesce_events = p_coalesce_events, p_tolerance = p_tolerance )
+
+        super().__init__( p_name = p_name,
+                          p_range_max = p_range_max,
+                          p_ada = p_ada,
+                          p_duplicate_data = p_duplicate_data,
+                          p_visualize = p_visualize,
+                          p_logging = p_logging,
+                          **p_kwargs )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _run(self, p_instances : InstDict):
+
+        if len(p_instances) == 0: return
+
+        # Obsolete and new instances are interleaved in the order of their arrival (as with
+        # instance-wise processing), so that the statistics never run empty within a batch
+        inst_new = sorted( item for item in p_instances.items() if item[1][0] == InstTypeNew )
+        inst_del = sorted( item for item in p_instances.items() if item[1][0] != InstTypeNew )
+        num_del  = len(inst_del) - len(inst_new)
+        inst_seq = inst_del[:max(0, num_del)]
+
+        for i in range(len(inst_new)):
+            if num_del + i >= 0: inst_seq.append( inst_del[num_del + i] )
+            inst_seq.append( inst_new[i] )
+
+        # The instances are normalized at once with the parameters after the last adaptation step.
+        # Successors have been renormalized to these parameters by the adaptation events before.
+        for inst_id, (inst_type, inst) in inst_seq:
+            self.adapt( p_instances = { inst_id : (inst_type, inst) } )
+            if not self._coalesce_events: self._update_plot_data()
+
+        self._publish_adaptation()
+        _normalize_instances( p_normalizer = self, p_instances = p_instances, p_param = self._get_param_norm() )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _renormalize_plot_data(self):
+        self._update_plot_data()
@@ -0,0 +1,11 @@
+"""
+### Extensions of MLPro's stream processing classes ('mlwa.streams')
+"""
+
+from .basics import *
+from .recording import *
+from .rendering import *
+from .plotting import *
+from .exporting import *
+from .scheduling import *
+from .ingesting import *
@@ -0,0 +1,173 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Package    : mlwa.streams
+## -- Module     : basics.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.3.0 (2026-10-17)
+
+This module provides extensions of MLPro's basic stream classes.
+
+"""
+
+from mlpro.bf.exceptions import ParamError
+from mlpro.bf.streams import Stream, Instance
+
+from mlwa.math import ElementCOW
+
+
+
+# Export list for public API
+__all__ = [ 'InstanceCOW',
+            'StreamSeekable',
+            'StreamColumnar' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class InstanceCOW (Instance):
+    """
+    Instance with copy-on-write semantics. Duplicates (e.g. created by stream tasks with parameter
+    p_duplicate_data=True) share the feature values with the original instead of copying them. On
+    duplication, the feature data of the original are taken over by an element of type
+    mlwa.math.ElementCOW and shared with the duplicate, so that the values are only copied when a
+    task accesses them for changes (see class mlwa.math.ElementCOW).
+
+    See class mlpro.bf.streams.Instance for a description of the parameters.
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def copy(self):
+        self._feature_data = ElementCOW.adopt(self._feature_data)
+
+        duplicate = self.__class__( p_feature_data=ElementCOW.share(self._feature_data),
+                                    p_label_data=self.get_label_data(),
+                                    p_tstamp=self.get_tstamp(),
+                                    p_kwargs=self._get_kwargs() )
+        duplicate.id = self.id
+        return duplicate
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class StreamSeekable (Stream):
+    """
+    Template class for streams with random access to their instances. Method seek() moves the stream
+    to an instance index without materializing the skipped instances.
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def seek(self, p_index : int):
+        """
+        Moves the stream to the given instance index by calling the custom method _seek(). The next
+        instance provided by the stream is the one with this index. Please reset the stream (see method
+        __iter__()) before.
+
+        Streams with a sampler can't be moved since the instance ids depend on the omitted instances.
+        In this case, exception NotImplementedError is raised.
+
+        Parameters
+        ----------
+        p_index : int
+            Index of the next instance.
+        """
+
+        if p_index < 0:
+            raise ParamError('Instance index must not be negative')
+
+        if ( self._num_instances > 0 ) and ( p_index > self._num_instances ):
+            raise ParamError('Instance index ' + str(p_index) + ' exceeds the number of instances')
+
+        if self._sampler is not None:
+            raise NotImplementedError('Streams with a sampler can not be moved')
+
+        self.log(self.C_LOG_TYPE_I, 'Seek to instance index', p_index)
+        self._seek(p_index)
+        self._next_inst_id = p_index
+
+
+## -------------------------------------------------------------------------------------------------
+    def _seek(self, p_index : int):
+        """
+        Custom method to move the internal data position to the given instance index. See method
+        seek() for further details.
+
+        Parameters
+        ----------
+        p_index : int
+            Index of the next instance.
+        """
+
+        raise NotImplementedError
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class StreamColumnar (Stream):
+    """
+    Template class for streams with column-wise access to their data. Method select_features()
+    restricts the feature data of the provided instances to a subset of the feature space, so that
+    the remaining columns are neither read nor materialized.
+
+    The feature space of the stream itself remains unchanged. The feature data of the instances refer
+    to a reduced feature space containing the same dimension objects, so that subsequent tasks can
+    still identify the features by their ids.
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def select_features(self, p_features : list = None):
+        """
+        Selects the features to be provided in the instances of the stream by calling the custom
+        method _select_features(). Please reset the stream (see method __iter__()) afterwards.
+
+        Parameters
+        ----------
+        p_features : list
+            List of feature dimensions of the feature space of the stream. Default = None (all features).
+        """
+
+        feature_space = self.get_feature_space()
+        ids           = feature_space.get_dim_ids()
+
+        if p_features is None:
+            self.log(self.C_LOG_TYPE_I, 'All features selected')
+            self._select_features( p_indices = None )
+            return
+
+        indices = []
+        for feature in p_features:
+            try:
+                indices.append( ids.index(feature.get_id()) )
+            except ValueError:
+                raise ParamError('Feature "' + feature.get_name_short() + '" is not part of the feature space')
+
+        self.log(self.C_LOG_TYPE_I, len(indices), 'of', len(ids), 'features selected')
+        self._select_features( p_indices = indices )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _select_features(self, p_indices : list):
+        """
+        Custom method to restrict the feature data of the instances to the given features. See method
+        select_features() for further details.
+
+        Parameters
+        ----------
+        p_indices : list
+            Indices of the selected features within the feature space of the stream. None means all
+            features.
+        """
+
+        raise NotImplementedError
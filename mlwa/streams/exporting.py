@@ -0,0 +1,487 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Package    : mlwa.streams
+## -- Module     : exporting.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.1.0 (2026-10-17)
+
+This module provides a headless export of the plots of stream workflows as animations (GIF/MP4).
+
+"""
+
+import os
+import sys
+import re
+import shutil
+import pickle
+import subprocess
+import tempfile
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+from PIL import Image
+
+from mlpro.bf.exceptions import Error, ParamError
+from mlpro.bf.various import Log
+
+from mlwa.streams.rendering import Renderer
+
+
+
+# Export list for public API
+__all__ = [ 'init_headless',
+            'FrameExporter' ]
+
+
+
+
+# Reference to the Qt application of the headless mode
+_qt_app = None
+
+
+## -------------------------------------------------------------------------------------------------
+def init_headless() -> bool:
+    """
+    Prepares MLPro's Qt plot backend for use without a display, e.g. on a server. To this regard, Qt's
+    offscreen platform is selected and a Qt application is created before the first plot is
+    initialized. The task windows are then created invisibly, but their plots are fully functional.
+    On systems with a display, nothing is changed.
+
+    Please call this function before instantiating the first plottable object (e.g. a scenario with
+    visualization).
+
+    Returns
+    -------
+    bool
+        True, if the headless mode is active. False otherwise.
+    """
+
+    global _qt_app
+
+    if sys.platform in ( 'win32', 'darwin' ): return False
+    if os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'): return False
+
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+    try:
+        from matplotlib.backends.qt_compat import QtWidgets
+    except ImportError:
+        return False
+
+    # With a running Qt application, Matplotlib accepts the Qt backend used by MLPro
+    _qt_app = QtWidgets.QApplication.instance()
+    if _qt_app is None: _qt_app = QtWidgets.QApplication([])
+
+    return True
+
+
+## -------------------------------------------------------------------------------------------------
+def _init_export_worker():
+    """
+    Internal use. Initializes a frame rendering process with Matplotlib's non-interactive backend.
+    """
+
+    matplotlib.use('agg')
+
+
+## -------------------------------------------------------------------------------------------------
+def _render_frame(p_snapshot : bytes, p_fname : str, p_dpi : float):
+    """
+    Internal use. Renders a pickled figure into a PNG file.
+    """
+
+    import matplotlib.pyplot as plt
+
+    figure = pickle.loads(p_snapshot)
+
+    # Artists drawn by blitting are excluded from regular drawing (see class StreamTaskPlotND)
+    for artist in figure.findobj( lambda p_artist: p_artist.get_animated() ):
+        artist.set_animated(False)
+
+    figure.savefig( p_fname, format = 'png', dpi = 'figure' if p_dpi is None else p_dpi )
+    plt.close(figure)
+
+
+## -------------------------------------------------------------------------------------------------
+def _encode_gif(p_frames : list, p_fname : str, p_fps : float):
+    """
+    Internal use. Encodes a sequence of PNG files into an animated GIF file.
+    """
+
+    def get_images():
+        for fname in p_frames[1:]:
+            with Image.open(fname) as image:
+                yield image.convert('RGB')
+
+    with Image.open(p_frames[0]) as image:
+        image.convert('RGB').save( p_fname,
+                                   save_all = True,
+                                   append_images = get_images(),
+                                   duration = int( round( 1000 / p_fps ) ),
+                                   loop = 0 )
+
+
+## -------------------------------------------------------------------------------------------------
+def _encode_mp4(p_pattern : str, p_fname : str, p_fps : float, p_ffmpeg : str):
+    """
+    Internal use. Encodes a sequence of PNG files into an MP4 file (H.264) by FFmpeg.
+    """
+
+    # H.264 requires even frame sizes
+    subprocess.run( [ p_ffmpeg, '-y', '-loglevel', 'error',
+                      '-framerate', str(p_fps),
+                      '-i', p_pattern,
+                      '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2',
+                      '-c:v', 'libx264',
+                      '-pix_fmt', 'yuv420p',
+                      p_fname ],
+                    check = True )
+
+
+## -------------------------------------------------------------------------------------------------
+def _draw_nothing(*p_args, **p_kwargs):
+    """
+    Internal use. Replaces the drawing of the canvases of exported figures.
+    """
+
+    pass
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class FrameExporter (Renderer):
+    """
+    Renderer that exports the plots of a stream workflow and its tasks as animations instead of
+    drawing them on the screen. It can be used as renderer of class mlwa.oa.OAStreamScenario (see
+    parameter p_renderer) and works without a display in combination with function init_headless().
+
+    - As with class Renderer, the tasks publish their plot updates to the exporter. Every
+      p_frame_cycles cycles of the scenario, the merged updates are applied to the plots and a frame
+      is captured. The frames do not depend on the wall-clock time.
+
+    - A frame consists of snapshots (pickled copies) of all figures of the workflow. The figures are
+      not drawn in the process of the scenario at all. Instead, the snapshots are rendered into PNG
+      files by a pool of worker processes using Matplotlib's non-interactive backend Agg. The pool
+      is started when the exporter is attached to a workflow, so that the first frames do not wait
+      for the start of the processes.
+
+    - The number of snapshots waiting for rendering is limited by p_max_pending, so that the memory
+      stays bounded for long runs. If the rendering falls behind, a frame is dropped as long as the
+      limit is reached (parameter p_drop_frames). The stream processing then keeps its pace, but the
+      animations skip the dropped frames and may differ from run to run. Without dropping, the
+      processing waits for the rendering instead, so that each run produces the same animation. The
+      last frame of a run is never dropped.
+
+    - At the end of a run (method flush(), called by mlwa.oa.OAStreamScenario.run()), the frames of
+      each figure are encoded into an animation file in directory p_path. GIF files are encoded by
+      Pillow, MP4 files by FFmpeg (see Matplotlib's parameter animation.ffmpeg_path).
+
+    Parameters
+    ----------
+    p_path : str
+        Directory of the exported animations.
+    p_format : str
+        Format of the animations. See constants C_FORMAT_*. Default = C_FORMAT_GIF.
+    p_fps : float
+        Frames per second of the animations. Default = C_FPS.
+    p_frame_cycles : int
+        Number of scenario cycles per frame. Default = C_FRAME_CYCLES.
+    p_dpi : float
+        Resolution of the frames in dots per inch. Default = None (resolution of the figures).
+    p_num_workers : int
+        Number of rendering processes. Default = None (number of processors).
+    p_max_pending : int
+        Maximum number of snapshots waiting for rendering. Default = None (4 per process).
+    p_drop_frames : bool
+        If True, frames are dropped while p_max_pending snapshots are waiting for rendering.
+        Otherwise, the processing waits. Default = True.
+    p_logging
+        Log level (see constants of class Log). Default: Log.C_LOG_ALL.
+    """
+
+    C_TYPE          = 'Frame Exporter'
+
+    C_FORMAT_GIF    = 'gif'
+    C_FORMAT_MP4    = 'mp4'
+    C_VALID_FORMATS = [ C_FORMAT_GIF, C_FORMAT_MP4 ]
+
+    C_FPS           = 10
+    C_FRAME_CYCLES  = 10
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_path : str,
+                  p_format : str = C_FORMAT_GIF,
+                  p_fps : float = C_FPS,
+                  p_frame_cycles : int = C_FRAME_CYCLES,
+                  p_dpi : float = None,
+                  p_num_workers : int = None,
+                  p_max_pending : int = None,
+                  p_drop_frames : bool = True,
+                  p_logging = Log.C_LOG_ALL ):
+
+        if p_format not in self.C_VALID_FORMATS:
+            raise ParamError('Invalid format "' + str(p_format) + '". See constants FrameExporter.C_FORMAT_*')
+
+        if p_fps <= 0:
+            raise ParamError('Please set the parameter "p_fps" > 0')
+
+        if p_frame_cycles < 1:
+            raise ParamError('Please set the parameter "p_frame_cycles" >= 1')
+
+        super().__init__( p_frame_rate = p_fps, p_logging = p_logging )
+
+        self._path          = p_path
+        self._format        = p_format
+        self._fps           = p_fps
+        self._frame_cycles  = p_frame_cycles
+        self._dpi           = p_dpi
+        self._num_workers   = p_num_workers or os.cpu_count() or 1
+        self._max_pending   = p_max_pending or 4 * self._num_workers
+        self._drop_frames   = p_drop_frames
+        self._num_dropped   = 0
+        self._num_cycles    = 0
+        self._figures       = {}
+        self._executor      = None
+        self._frames_dir    = None
+        self._futures       = deque()
+        self._files         = []
+
+
+## -------------------------------------------------------------------------------------------------
+    def attach(self, p_workflow):
+        """
+        Redirects the plot updates of a workflow and its tasks to the exporter (see method
+        mlwa.streams.Renderer.attach()) and starts the rendering processes.
+        """
+
+        super().attach(p_workflow)
+        self._start_pool()
+
+
+## -------------------------------------------------------------------------------------------------
+    def _start_pool(self):
+        """
+        Starts the rendering processes and waits until they are ready.
+        """
+
+        if self._executor is not None: return
+
+        self._frames_dir = tempfile.TemporaryDirectory( prefix = 'mlwa_frames_' )
+        self._executor   = ProcessPoolExecutor( max_workers = self._num_workers,
+                                                mp_context = multiprocessing.get_context('spawn'),
+                                                initializer = _init_export_worker )
+
+        # The processes are spawned on demand, so each of them gets a first task
+        futures = [ self._executor.submit( _draw_nothing ) for i in range(self._num_workers) ]
+        for future in futures: future.result()
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_num_dropped(self) -> int:
+        """
+        Returns the number of frames dropped since the rendering fell behind.
+        """
+
+        return self._num_dropped
+
+
+## -------------------------------------------------------------------------------------------------
+    def render(self, p_force : bool = False) -> bool:
+        """
+        Captures a frame with all pending plot updates, if the next frame is due. This method is
+        called once per cycle by class mlwa.oa.OAStreamScenario.
+
+        Parameters
+        ----------
+        p_force : bool
+            If True, pending updates are captured in any case. Default = False.
+
+        Returns
+        -------
+        bool
+            True, if a frame was captured. False otherwise.
+        """
+
+        if not p_force:
+            self._num_cycles += 1
+            if self._num_cycles % self._frame_cycles != 0: return False
+
+        pending = self._take_updates()
+        if p_force and ( len(pending) == 0 ): return False
+
+        self._apply_updates( p_pending = pending )
+        if not self._capture_frame( p_wait = p_force or not self._drop_frames ): return False
+        self._num_frames += 1
+
+        return True
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_figures(self) -> list:
+        """
+        Returns the figures of all attached objects in the order of their attachment.
+        """
+
+        figures = []
+
+        for plot_obj in self._plot_objs:
+            figure = getattr(plot_obj, '_figure', None)
+            if ( figure is not None ) and ( figure not in figures ): figures.append(figure)
+
+        return figures
+
+
+## -------------------------------------------------------------------------------------------------
+    def _capture_frame(self, p_wait : bool) -> bool:
+        """
+        Pickles the current state of all figures and hands them over to the rendering processes. If
+        the maximum number of snapshots is waiting for rendering, the frame is dropped or, with
+        p_wait = True, the rendering of the oldest snapshots is awaited.
+
+        Returns
+        -------
+        bool
+            True, if the frame was captured. False, if it was dropped.
+        """
+
+        self._start_pool()
+
+        # 1 Bounded number of snapshots waiting for rendering
+        while ( len(self._futures) > 0 ) and self._futures[0].done(): self._futures.popleft().result()
+
+        if p_wait:
+            while len(self._futures) >= self._max_pending: self._futures.popleft().result()
+        elif len(self._futures) >= self._max_pending:
+            self._num_dropped += 1
+            return False
+
+
+        # 2 Snapshots of all figures
+        for figure in self._get_figures():
+            try:
+                fig_info = self._figures[id(figure)]
+            except KeyError:
+                try:
+                    title = figure.canvas.manager.get_window_title()
+                except AttributeError:
+                    title = 'figure'
+
+                fig_info = [ figure, len(self._figures), title, 0 ]
+                self._figures[id(figure)] = fig_info
+
+                # From now on, the figure is drawn by the rendering processes only
+                figure.canvas.draw = _draw_nothing
+
+            fname        = self._get_frame_fname( fig_info[1], fig_info[3] )
+            fig_info[3] += 1
+
+            self._futures.append( self._executor.submit( _render_frame, pickle.dumps(figure, pickle.HIGHEST_PROTOCOL), fname, self._dpi ) )
+
+        return True
+
+
+## -------------------------------------------------------------------------------------------------
+    def flush(self):
+        """
+        Captures the pending plot updates, waits for the rendering of all frames and encodes the
+        frames of each figure into an animation file. The files contain all frames captured so far.
+        """
+
+        self.render( p_force = True )
+
+        while len(self._futures) > 0: self._futures.popleft().result()
+
+        if len(self._figures) == 0: return
+
+        if self._format == self.C_FORMAT_MP4:
+            ffmpeg = shutil.which( matplotlib.rcParams['animation.ffmpeg_path'] )
+            if ffmpeg is None:
+                raise Error('FFmpeg is required for the MP4 export. Please install it or set the Matplotlib parameter animation.ffmpeg_path')
+
+        os.makedirs(self._path, exist_ok=True)
+
+        # The animations are encoded in parallel by the rendering processes
+        files   = []
+        futures = []
+
+        for figure, fig_id, title, num_frames in self._figures.values():
+            name  = re.sub( r'[^\w\-]+', '_', title ).strip('_') or 'figure'
+            fname = os.path.join( self._path, '%02d_%s.%s' % ( fig_id, name, self._format ) )
+
+            if self._format == self.C_FORMAT_GIF:
+                frames = [ self._get_frame_fname(fig_id, frame) for frame in range(num_frames) ]
+                futures.append( self._executor.submit( _encode_gif, frames, fname, self._fps ) )
+            else:
+                pattern = os.path.join( self._frames_dir.name, '%03d_%%06d.png' % fig_id )
+                futures.append( self._executor.submit( _encode_mp4, pattern, fname, self._fps, ffmpeg ) )
+
+            files.append( ( fname, num_frames ) )
+
+        for future in futures: future.result()
+
+        if self._num_dropped > 0:
+            self.log(self.C_LOG_TYPE_W, self._num_dropped, 'frames dropped, since the rendering fell behind')
+
+        self._files = []
+        for fname, num_frames in files:
+            self._files.append(fname)
+            self.log(self.C_LOG_TYPE_I, 'Exported', num_frames, 'frames to', fname)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_frame_fname(self, p_fig_id : int, p_frame : int) -> str:
+        return os.path.join( self._frames_dir.name, '%03d_%06d.png' % ( p_fig_id, p_frame ) )
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_files(self) -> list:
+        """
+        Returns the paths of the animation files exported by the last call of method flush().
+        """
+
+        return self._files
+
+
+## -------------------------------------------------------------------------------------------------
+    def detach(self):
+        """
+        Exports the animations and restores the inline plot updates and the drawing of all figures.
+        """
+
+        super().detach()
+
+        for figure, fig_id, title, num_frames in self._figures.values():
+            try:
+                del figure.canvas.draw
+            except AttributeError:
+                pass
+
+
+## -------------------------------------------------------------------------------------------------
+    def close(self):
+        """
+        Stops the rendering processes and removes the frames. Please call method flush() before to
+        export the animations.
+        """
+
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+        if self._frames_dir is not None:
+            self._frames_dir.cleanup()
+            self._frames_dir = None
+
+        self._futures.clear()
+        self._figures     = {}
+        self._num_dropped = 0
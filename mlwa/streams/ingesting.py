@@ -0,0 +1,568 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Package    : mlwa.streams
+## -- Module     : ingesting.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.1.0 (2026-10-17)
+
+This module provides the ingestion of live data from sockets and appended files as streams.
+
+The records are text lines with delimiter-separated numeric values. They are read by an asyncio
+event loop in a background thread and buffered in a bounded queue, so that the ingestion of new
+records overlaps with the processing of the instances by the stream workflow.
+
+"""
+
+import os
+import sys
+import asyncio
+import threading
+from collections import deque
+
+import numpy as np
+
+from mlpro.bf.exceptions import Error, ParamError
+from mlpro.bf.various import Log
+from mlpro.bf.ops import Mode
+from mlpro.bf.math import Element, MSpace, Dimension
+from mlpro.bf.streams import Feature, Label, Instance, Stream
+
+from mlwa.streams.recording import _get_space
+
+
+
+# Export list for public API
+__all__ = [ 'StreamLive' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+def _get_dims(p_names : list) -> list:
+    """
+    Returns the description of real-valued dimensions with the given names (see function
+    mlwa.streams.recording._get_space()).
+    """
+
+    return [ dict( name_short = name,
+                   name_long = name,
+                   base_set = Dimension.C_BASE_SET_R,
+                   unit = '',
+                   boundaries = [] )
+             for name in p_names ]
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class StreamLive (Stream):
+    """
+    Live stream reading text records from a local socket or an appended file. Each line contains an
+    optional time stamp followed by the feature values and the label values, separated by
+    p_delimiter. Supported sources are:
+
+    - 'tcp://<host>:<port>': Client connection to a TCP server. The stream ends when the server
+      closes the connection.
+
+    - 'unix://<path>': Client connection to a UNIX domain socket. The stream ends when the server
+      closes the connection.
+
+    - 'file://<path>': File that is tailed like 'tail -f'. The stream does not end on its own. After a
+      truncation of the file (e.g. log rotation), it is read again from the beginning.
+
+    The source is read by an asyncio event loop in a background thread, which is (re)started on each
+    reset of the stream. Incoming data are parsed chunk-wise into blocks of instances, which are
+    buffered in a bounded queue of p_buffer_size instances. While the queue is full, the reader
+    pauses (backpressure). For sockets, the sender is then throttled by the flow control of the
+    operating system instead of the data piling up in memory. Method _get_next() only blocks if the
+    queue is empty, i.e. if the processing is faster than the source.
+
+    Without a time stamp column, the instances get the time stamps of the stream (see method
+    mlpro.bf.streams.Stream.get_tstamp()). The stream ends after p_num_instances instances, if no
+    instance has arrived for p_timeout seconds or when the source is closed.
+
+    Parameters
+    ----------
+    p_source : str
+        Source of the stream (see above).
+    p_features : list
+        Names of the features. Default = None (taken from p_feature_space).
+    p_labels : list
+        Names of the labels. Default = None (taken from p_label_space, if given).
+    p_tstamp : bool
+        If True, the first column contains the time stamps as floats. Default = False.
+    p_delimiter : str
+        Delimiter of the values. Default = ','.
+    p_buffer_size : int
+        Maximum number of buffered instances. Default = C_BUFFER_SIZE.
+    p_timeout : float
+        Optional maximum time in seconds to wait for the next instance. Default = None (no timeout).
+    p_from_start : bool
+        If True, an appended file is read from its beginning. Otherwise, only new lines are read.
+        Default = True.
+    p_poll_interval : float
+        Time in seconds between two checks of an appended file for new lines. Default =
+        C_POLL_INTERVAL.
+    p_feature_space : MSpace
+        Optional feature space providing the feature dimensions. Default = None.
+    p_label_space : MSpace
+        Optional label space providing the label dimensions. Default = None.
+    p_id
+        Optional id of the stream. Default = None (source).
+    p_name : str
+        Optional name of the stream. Default = '' (source).
+    p_num_instances : int
+        Optional number of instances. Default = 0 (unlimited).
+    p_mode
+        Operation mode. Default: Mode.C_MODE_REAL.
+    p_logging
+        Log level (see constants of class Log). Default: Log.C_LOG_ALL.
+    p_kwargs : dict
+        Further stream specific parameters.
+    """
+
+    C_TYPE              = 'Live Stream'
+
+    C_SOURCE_TCP        = 'tcp'
+    C_SOURCE_UNIX       = 'unix'
+    C_SOURCE_FILE       = 'file'
+
+    C_BUFFER_SIZE       = 10000
+    C_CHUNK_SIZE        = 65536
+    C_POLL_INTERVAL     = 0.05
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_source : str,
+                  p_features : list = None,
+                  p_labels : list = None,
+                  p_tstamp : bool = False,
+                  p_delimiter : str = ',',
+                  p_buffer_size : int = C_BUFFER_SIZE,
+                  p_timeout : float = None,
+                  p_from_start : bool = True,
+                  p_poll_interval : float = C_POLL_INTERVAL,
+                  p_feature_space : MSpace = None,
+                  p_label_space : MSpace = None,
+                  p_id = None,
+                  p_name : str = '',
+                  p_num_instances : int = 0,
+                  p_mode = Mode.C_MODE_REAL,
+                  p_logging = Log.C_LOG_ALL,
+                  **p_kwargs ):
+
+        try:
+            scheme, address = p_source.split('://', 1)
+        except ValueError:
+            raise ParamError('Invalid source "' + str(p_source) + '"')
+
+        if scheme not in [ self.C_SOURCE_TCP, self.C_SOURCE_UNIX, self.C_SOURCE_FILE ]:
+            raise ParamError('Invalid source type "' + scheme + '"')
+
+        if scheme == self.C_SOURCE_TCP:
+            host, _, port = address.rpartition(':')
+            if ( host == '' ) or ( not port.isdigit() ):
+                raise ParamError('Please specify a TCP source as "tcp://<host>:<port>"')
+            address = ( host.strip('[]'), int(port) )
+
+        if p_features is None:
+            if p_feature_space is None:
+                raise ParamError('Please specify the features by parameter "p_features" or "p_feature_space"')
+            p_features = [ p_feature_space.get_dim(dim_id).get_name_short() for dim_id in p_feature_space.get_dim_ids() ]
+
+        if ( p_labels is None ) and ( p_label_space is not None ):
+            p_labels = [ p_label_space.get_dim(dim_id).get_name_short() for dim_id in p_label_space.get_dim_ids() ]
+
+        if len(p_features) == 0:
+            raise ParamError('Please specify at least one feature')
+
+        if p_buffer_size < 1:
+            raise ParamError('Please set the parameter "p_buffer_size" > 0')
+
+        if ( p_timeout is not None ) and ( p_timeout <= 0 ):
+            raise ParamError('Please set the parameter "p_timeout" > 0')
+
+        if p_poll_interval <= 0:
+            raise ParamError('Please set the parameter "p_poll_interval" > 0')
+
+        self._source        = p_source
+        self._scheme        = scheme
+        self._address       = address
+        self._tstamp_col    = p_tstamp
+        self._delimiter     = p_delimiter.encode()
+        self._num_features  = len(p_features)
+        self._num_labels    = 0 if p_labels is None else len(p_labels)
+        self._num_cols      = int(p_tstamp) + self._num_features + self._num_labels
+        self._buffer_size   = p_buffer_size
+        self._timeout       = p_timeout
+        self._from_start    = p_from_start
+        self._poll_interval = p_poll_interval
+
+        # Bounded queue of instance blocks shared by the reader and the consumer
+        self._cond          = threading.Condition()
+        self._blocks        = deque()
+        self._num_buffered  = 0
+        self._end           = False
+        self._exception     = None
+        self._waiting       = False
+        self._space_event   = None
+
+        # Block currently consumed
+        self._block         = None
+        self._block_pos     = 0
+
+        self._loop          = None
+        self._thread        = None
+        self._task          = None
+        self._num_received  = 0
+        self._num_invalid   = 0
+        self._num_waits     = 0
+
+        super().__init__( p_id = p_id if p_id is not None else p_source,
+                          p_name = p_name if p_name != '' else p_source,
+                          p_num_instances = p_num_instances,
+                          p_feature_space = _get_space(_get_dims(p_features), Feature, p_feature_space),
+                          p_label_space = _get_space(_get_dims(p_labels or []), Label, p_label_space),
+                          p_mode = p_mode,
+                          p_logging = p_logging,
+                          **p_kwargs )
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_source(self) -> str:
+        return self._source
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_num_buffered(self) -> int:
+        """
+        Returns the number of instances buffered in the queue.
+        """
+
+        return self._num_buffered
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_num_received(self) -> int:
+        """
+        Returns the number of valid records received since the last reset.
+        """
+
+        return self._num_received
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_num_invalid(self) -> int:
+        """
+        Returns the number of invalid records skipped since the last reset.
+        """
+
+        return self._num_invalid
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_num_waits(self) -> int:
+        """
+        Returns the number of times the reader was paused by a full queue since the last reset.
+        """
+
+        return self._num_waits
+
+
+## -------------------------------------------------------------------------------------------------
+    def _reset(self):
+
+        self._stop()
+
+        self._blocks.clear()
+        self._num_buffered = 0
+        self._end          = False
+        self._exception    = None
+        self._waiting      = False
+        self._block        = None
+        self._block_pos    = 0
+        self._num_received = 0
+        self._num_invalid  = 0
+        self._num_waits    = 0
+
+        self._loop   = asyncio.new_event_loop()
+        self._thread = threading.Thread( target = self._loop.run_forever,
+                                         name = 'StreamLive',
+                                         daemon = True )
+        self._thread.start()
+        self._loop.call_soon_threadsafe(self._start_reader)
+
+        self.log(self.C_LOG_TYPE_I, 'Reading from', self._source)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _start_reader(self):
+        """
+        Creates the reader task. Runs in the event loop.
+        """
+
+        self._space_event = asyncio.Event()
+        self._task        = self._loop.create_task(self._read())
+
+
+## -------------------------------------------------------------------------------------------------
+    async def _cancel_reader(self):
+        """
+        Cancels the reader task. Runs in the event loop.
+        """
+
+        if self._task is None: return
+        self._task.cancel()
+
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+
+## -------------------------------------------------------------------------------------------------
+    def _stop(self):
+        """
+        Stops the reader and its event loop.
+        """
+
+        if self._loop is None: return
+
+        asyncio.run_coroutine_threadsafe(self._cancel_reader(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+        self._loop   = None
+        self._thread = None
+        self._task   = None
+
+        with self._cond:
+            self._end = True
+            self._cond.notify_all()
+
+
+## -------------------------------------------------------------------------------------------------
+    async def _read(self):
+        """
+        Reads the source until its end. Runs in the event loop.
+        """
+
+        try:
+            if self._scheme == self.C_SOURCE_FILE:
+                await self._read_file()
+            else:
+                if self._scheme == self.C_SOURCE_TCP:
+                    reader, writer = await asyncio.open_connection( self._address[0], self._address[1] )
+                else:
+                    reader, writer = await asyncio.open_unix_connection( self._address )
+
+                try:
+                    await self._read_socket(reader)
+                finally:
+                    writer.close()
+
+        except asyncio.CancelledError:
+            raise
+
+        except Exception as exception:
+            self._exception = exception
+
+        finally:
+            with self._cond:
+                self._end = True
+                self._cond.notify_all()
+
+
+## -------------------------------------------------------------------------------------------------
+    async def _read_socket(self, p_reader : asyncio.StreamReader):
+
+        rest = b''
+
+        while True:
+            chunk = await p_reader.read(self.C_CHUNK_SIZE)
+            if len(chunk) == 0: break
+            rest = await self._put_lines(rest + chunk)
+
+        if len(rest) > 0: await self._put_lines(rest + b'\n')
+
+
+## -------------------------------------------------------------------------------------------------
+    async def _read_file(self):
+
+        rest = b''
+
+        with open(self._address, 'rb') as file:
+            if not self._from_start: file.seek(0, os.SEEK_END)
+
+            while True:
+                # Reading a regular file does not block for long, so that it is done inline
+                chunk = file.read(self.C_CHUNK_SIZE)
+
+                if len(chunk) > 0:
+                    rest = await self._put_lines(rest + chunk)
+                    continue
+
+                if os.fstat(file.fileno()).st_size < file.tell():
+                    self.log(self.C_LOG_TYPE_W, 'File', self._address, 'truncated - reading from the beginning')
+                    file.seek(0)
+                    rest = b''
+                    continue
+
+                await asyncio.sleep(self._poll_interval)
+
+
+## -------------------------------------------------------------------------------------------------
+    async def _put_lines(self, p_data : bytes) -> bytes:
+        """
+        Parses and enqueues the complete lines of the given data and returns the incomplete rest.
+        """
+
+        end = p_data.rfind(b'\n') + 1
+        if end == 0: return p_data
+
+        block = self._parse( p_data = p_data[:end] )
+        for i in range(0, len(block), self._buffer_size):
+            await self._put( p_block = block[i:i + self._buffer_size] )
+
+        return p_data[end:]
+
+
+## -------------------------------------------------------------------------------------------------
+    def _parse(self, p_data : bytes) -> np.ndarray:
+        """
+        Parses complete lines into a block of values with one row per record. Empty lines are ignored,
+        invalid lines are skipped.
+        """
+
+        lines     = [ line for line in p_data.split(b'\n') if len(line.strip()) > 0 ]
+        num_delim = self._num_cols - 1
+
+        # Fast path: all values of the chunk are converted at once. A line with a wrong number of
+        # columns could be compensated by another one, so that the columns are checked per line.
+        if all( line.count(self._delimiter) == num_delim for line in lines ):
+            try:
+                values = np.array( self._delimiter.join(lines).split(self._delimiter), dtype=np.float64 )
+                self._num_received += len(lines)
+                return values.reshape( len(lines), self._num_cols )
+            except ValueError:
+                pass
+
+        # Slow path: line by line
+        rows = []
+        for line in lines:
+            try:
+                row = np.array( line.split(self._delimiter), dtype=np.float64 )
+            except ValueError:
+                row = None
+
+            if ( row is None ) or ( len(row) != self._num_cols ):
+                self._num_invalid += 1
+                self.log(self.C_LOG_TYPE_W, 'Invalid record skipped:', line[:80])
+                continue
+
+            rows.append(row)
+
+        self._num_received += len(rows)
+        return np.array(rows, dtype=np.float64).reshape( len(rows), self._num_cols )
+
+
+## -------------------------------------------------------------------------------------------------
+    async def _put(self, p_block : np.ndarray):
+        """
+        Enqueues a block of instances. While the queue is full, the reader pauses. Runs in the event loop.
+        """
+
+        while True:
+            with self._cond:
+                if self._num_buffered + len(p_block) <= self._buffer_size:
+                    self._blocks.append(p_block)
+                    self._num_buffered += len(p_block)
+                    self._cond.notify()
+                    return
+
+                self._space_event.clear()
+                self._waiting    = True
+                self._num_waits += 1
+
+            await self._space_event.wait()
+
+
+## -------------------------------------------------------------------------------------------------
+    def _take(self) -> np.ndarray:
+        """
+        Dequeues the next block of instances. Waits for at most p_timeout seconds if the queue is empty.
+        """
+
+        with self._cond:
+            if not self._cond.wait_for( lambda: ( len(self._blocks) > 0 ) or self._end, timeout = self._timeout ):
+                self.log(self.C_LOG_TYPE_W, 'No data received from', self._source, 'for', self._timeout, 'seconds')
+                raise StopIteration
+
+            if len(self._blocks) == 0:
+                if self._exception is not None:
+                    raise Error('Reading from "' + self._source + '" failed: ' + repr(self._exception))
+                raise StopIteration
+
+            block               = self._blocks.popleft()
+            self._num_buffered -= len(block)
+
+            if self._waiting and ( self._loop is not None ):
+                self._waiting = False
+                self._loop.call_soon_threadsafe(self._space_event.set)
+
+        return block
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_next(self) -> Instance:
+
+        if ( self._block is None ) or ( self._block_pos == len(self._block) ):
+            self._block     = self._take()
+            self._block_pos = 0
+
+        row              = self._block[self._block_pos]
+        self._block_pos += 1
+
+        # 1 Feature and label data as views of the block
+        col          = int(self._tstamp_col)
+        feature_data = Element( self._feature_space )
+        feature_data.set_values( row[col:col + self._num_features] )
+
+        if self._num_labels > 0:
+            label_data = Element( self._label_space )
+            label_data.set_values( row[col + self._num_features:] )
+        else:
+            label_data = None
+
+        return Instance( p_feature_data = feature_data,
+                         p_label_data = label_data,
+                         p_tstamp = float(row[0]) if self._tstamp_col else None )
+
+
+## -------------------------------------------------------------------------------------------------
+    def close(self):
+        """
+        Stops reading from the source. Buffered instances can still be taken until the next reset.
+        """
+
+        self._stop()
+
+
+## -------------------------------------------------------------------------------------------------
+    def __del__(self):
+
+        # On shutdown of the interpreter, the event loop thread may not run anymore
+        if sys.is_finalizing(): return
+
+        try:
+            self._stop()
+        except Exception:
+            pass
@@ -0,0 +1,491 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Package    : mlwa.streams
+## -- Module     : plotting.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.1.0 (2026-10-17)
+
+This module provides bounded NumPy buffers for the ND plots of stream tasks and a shape-preserving
+downsampling of long plot horizons.
+
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import matplotlib.dates as mdates
+from matplotlib.figure import Figure
+
+from mlpro.bf.math import Dimension
+from mlpro.bf.math.normalizers import Normalizer
+from mlpro.bf.plot import PlotSettings
+from mlpro.bf.streams import InstDict, InstTypeNew, StreamTask, StreamWorkflow
+
+from mlwa.math import get_renormalization, get_values_ro
+
+
+
+# Export list for public API
+__all__ = [ 'downsample_minmax',
+            'PlotBufferND',
+            'StreamTaskPlotND' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+def downsample_minmax(p_ydata : np.ndarray, p_num_buckets : int) -> np.ndarray:
+    """
+    Determines the rows of a shape-preserving downsampling by min/max bucketing. The rows are split
+    into p_num_buckets consecutive buckets. For each bucket and column, the rows of the minimum and
+    the maximum are kept in their chronological order. The first and the last row are always kept.
+    A line plot of the remaining points shows the same envelope (peaks, outliers) as the full data.
+
+    Parameters
+    ----------
+    p_ydata : np.ndarray
+        Data of shape (num_rows, num_columns).
+    p_num_buckets : int
+        Number of buckets, e.g. the width of the plot in pixels.
+
+    Returns
+    -------
+    np.ndarray
+        Row indices of shape (num_kept, num_columns) in ascending order per column.
+    """
+
+    num_rows, num_cols = p_ydata.shape
+    bucket_size        = -(-num_rows // max(1, p_num_buckets))
+    num_buckets        = -(-num_rows // bucket_size)
+
+    # Rows of the last bucket are padded by repeating the last row
+    rows    = np.minimum( np.arange(num_buckets * bucket_size), num_rows - 1 )
+    buckets = p_ydata[rows].reshape(num_buckets, bucket_size, num_cols)
+    base    = ( np.arange(num_buckets) * bucket_size )[:, None]
+
+    with np.errstate(invalid='ignore'):
+        idx_min = np.minimum( base + np.argmin(buckets, axis=1), num_rows - 1 )
+        idx_max = np.minimum( base + np.argmax(buckets, axis=1), num_rows - 1 )
+
+    idx          = np.empty( (2 * num_buckets + 2, num_cols), dtype=np.int64 )
+    idx[0]       = 0
+    idx[1:-1:2]  = np.minimum(idx_min, idx_max)
+    idx[2:-1:2]  = np.maximum(idx_min, idx_max)
+    idx[-1]      = num_rows - 1
+    return idx
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class PlotBufferND:
+    """
+    Fixed-size buffer for the plot data of an ND view. Each row holds the id of an instance, its time
+    stamp (x) and its feature values (y). The rows are stored in NumPy arrays of twice the capacity
+    and are always contiguous, so that the buffered data can be handed over to Matplotlib as views
+    without copying. When the end of the arrays is reached, the buffered rows are moved to the front
+    once. When the buffer is full, the oldest row is dropped on appending.
+
+    Parameters
+    ----------
+    p_capacity : int
+        Maximum number of rows.
+    p_num_dim : int
+        Number of feature values per row.
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_capacity : int, p_num_dim : int):
+
+        self._capacity = p_capacity
+        self._ids      = np.empty( 2 * p_capacity, dtype=np.int64 )
+        self._xdata    = np.empty( 2 * p_capacity, dtype=np.float64 )
+        self._ydata    = np.empty( (2 * p_capacity, p_num_dim), dtype=np.float64 )
+        self._start    = 0
+        self._end      = 0
+
+
+## -------------------------------------------------------------------------------------------------
+    def __len__(self):
+        return self._end - self._start
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_capacity(self) -> int:
+        return self._capacity
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_ids(self) -> np.ndarray:
+        return self._ids[self._start:self._end]
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_xdata(self) -> np.ndarray:
+        return self._xdata[self._start:self._end]
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_ydata(self) -> np.ndarray:
+        return self._ydata[self._start:self._end]
+
+
+## -------------------------------------------------------------------------------------------------
+    def append(self, p_id : int, p_x : float, p_values) -> bool:
+        """
+        Appends a row.
+
+        Returns
+        -------
+        bool
+            True, if the oldest row was dropped. False otherwise.
+        """
+
+        dropped = ( self._end - self._start ) == self._capacity
+        if dropped: self._start += 1
+
+        if self._end == self._ids.size:
+            num = self._end - self._start
+            self._ids[:num]   = self._ids[self._start:self._end]
+            self._xdata[:num] = self._xdata[self._start:self._end]
+            self._ydata[:num] = self._ydata[self._start:self._end]
+            self._start       = 0
+            self._end         = num
+
+        self._ids[self._end]   = p_id
+        self._xdata[self._end] = p_x
+        self._ydata[self._end] = p_values
+        self._end += 1
+        return dropped
+
+
+## -------------------------------------------------------------------------------------------------
+    def remove(self, p_id : int) -> bool:
+        """
+        Removes the row of an instance. Removing the oldest row takes constant time.
+
+        Returns
+        -------
+        bool
+            True, if the instance was found. False otherwise.
+        """
+
+        if self._end == self._start: return False
+
+        if self._ids[self._start] == p_id:
+            self._start += 1
+            return True
+
+        pos = np.flatnonzero( self.get_ids() == p_id )
+        if pos.size == 0: return False
+
+        idx = self._start + int(pos[0])
+        self._ids[idx:self._end-1]   = self._ids[idx+1:self._end]
+        self._xdata[idx:self._end-1] = self._xdata[idx+1:self._end]
+        self._ydata[idx:self._end-1] = self._ydata[idx+1:self._end]
+        self._end -= 1
+        return True
+
+
+## -------------------------------------------------------------------------------------------------
+    def rescale(self, p_scale : np.ndarray, p_offset : np.ndarray):
+        """
+        Transforms the buffered feature values y into y * p_scale + p_offset.
+        """
+
+        ydata  = self.get_ydata()
+        ydata *= p_scale
+        ydata += p_offset
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_limits(self):
+        """
+        Returns the minimum and maximum of all buffered feature values or (None, None).
+        """
+
+        if self._end == self._start: return None, None
+
+        with np.errstate(invalid='ignore'):
+            ydata = self.get_ydata()
+            y_min = np.nanmin(ydata)
+            y_max = np.nanmax(ydata)
+
+        if np.isnan(y_min): return None, None
+        return float(y_min), float(y_max)
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class StreamTaskPlotND:
+    """
+    Mixin for stream tasks that replaces the default ND view of class mlpro.bf.streams.StreamTask:
+
+    - The plot data are kept in a fixed-size NumPy buffer (class PlotBufferND). Its capacity is the
+      data horizon of the plot settings, alternatively the plot horizon or C_PLOT_ND_BUFFER_SIZE, so
+      that the memory is bounded even if both horizons are unlimited (0).
+
+    - Only the data within the plot horizon are handed over to the lines of the features. If they
+      exceed two points per pixel of the plot width, they are reduced by min/max bucketing (function
+      downsample_minmax()). Downsampling can be turned off by constant C_PLOT_ND_DOWNSAMPLING.
+
+    - The lines are updated in place and only in the steps that are drawn (see parameter
+      p_step_rate of class PlotSettings). The limits of the axes get a headroom of C_PLOT_ND_MARGIN
+      relative to the data range, so that they change only occasionally.
+
+    - If the task has a figure of its own and the canvas supports it, the lines are drawn by
+      blitting: as long as the limits of the axes are unchanged, the cached background (axes, ticks,
+      legend) is restored and only the lines are redrawn. Blitting can be turned off by constant
+      C_PLOT_ND_BLITTING.
+
+    Tasks with an own ND view (e.g. ring buffers, boundary detectors) keep it. The mixin has to
+    be inherited before the MLPro class of the task.
+    """
+
+    C_PLOT_ND_BUFFER_SIZE   = 100000
+    C_PLOT_ND_DOWNSAMPLING  = True
+    C_PLOT_ND_BLITTING      = True
+    C_PLOT_ND_MARGIN        = 0.1
+
+## -------------------------------------------------------------------------------------------------
+    def _is_plot_nd_buffered(self) -> bool:
+        """
+        Checks whether the task uses the default ND view of class StreamTask (or StreamWorkflow).
+        """
+
+        cls = type(self)
+
+        try:
+            return cls.__dict__['_plot_nd_buffered']
+        except KeyError:
+            pass
+
+        buffered = True
+        mro      = cls.__mro__
+
+        for method in [ '_init_plot_nd', '_update_plot_nd' ]:
+            for base in mro[mro.index(StreamTaskPlotND) + 1:]:
+                if method in base.__dict__:
+                    buffered = buffered and ( base in ( StreamTask, StreamWorkflow ) )
+                    break
+
+        setattr(cls, '_plot_nd_buffered', buffered)
+        return buffered
+
+
+## -------------------------------------------------------------------------------------------------
+    def _init_plot_nd(self, p_figure: Figure, p_settings: PlotSettings):
+
+        super()._init_plot_nd( p_figure = p_figure, p_settings = p_settings )
+
+        self._plot_nd_buffer     = None
+        self._plot_nd_dims       = None
+        self._plot_nd_xlim       = None
+        self._plot_nd_ylim       = None
+        self._plot_nd_blit       = False
+        self._plot_nd_background = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_plot_nd_x(self, p_inst_id : int, p_tstamp) -> float:
+
+        if isinstance(p_tstamp, timedelta): return p_tstamp.total_seconds()
+        if isinstance(p_tstamp, datetime): return mdates.date2num(p_tstamp)
+        if p_tstamp is None: return p_inst_id
+        return p_tstamp
+
+
+## -------------------------------------------------------------------------------------------------
+    def _init_plot_nd_blitting(self, p_settings : PlotSettings):
+        """
+        Turns on blitting, if the task is the only plot object of its own figure.
+        """
+
+        if not self.C_PLOT_ND_BLITTING: return
+        if not getattr(self, '_plot_own_figure', False): return
+        if len(p_settings._registered_obj) != 1: return
+        if not getattr(self._figure.canvas, 'supports_blit', False): return
+
+        for feature_plot in self._plot_nd_plots: feature_plot.set_animated(True)
+
+        # Each full redraw of the canvas (e.g. after resizing the window) renews the background
+        self._figure.canvas.mpl_connect('draw_event', self._on_plot_nd_draw)
+        self._plot_nd_blit = True
+
+
+## -------------------------------------------------------------------------------------------------
+    def _on_plot_nd_draw(self, p_event):
+
+        canvas = self._figure.canvas
+        self._plot_nd_background = canvas.copy_from_bbox(self._figure.bbox)
+        for feature_plot in self._plot_nd_plots: self._plot_settings.axes.draw_artist(feature_plot)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _refresh_plot(self):
+
+        if ( not getattr(self, '_plot_nd_blit', False) ) or ( self._plot_nd_background is None ):
+            return super()._refresh_plot()
+
+        canvas = self._figure.canvas
+        canvas.restore_region(self._plot_nd_background)
+        for feature_plot in self._plot_nd_plots: self._plot_settings.axes.draw_artist(feature_plot)
+        canvas.blit(self._figure.bbox)
+        canvas.flush_events()
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_plot_nd_limits(self, p_lim, p_min : float, p_max : float, p_sliding : bool):
+        """
+        Returns new limits for the range [p_min, p_max] or None, if the current limits p_lim can be
+        kept. With p_sliding = True, the headroom is only added at the upper end (time axis).
+        """
+
+        span = p_max - p_min
+        if span <= 0: return None
+
+        margin = span * self.C_PLOT_ND_MARGIN
+
+        if p_lim is not None:
+            if ( p_min >= p_lim[0] ) and ( p_max <= p_lim[1] ):
+                if p_sliding and ( p_min - p_lim[0] <= margin ): return None
+                if ( not p_sliding ) and ( p_lim[1] - p_lim[0] <= span + 4 * margin ): return None
+
+        if p_sliding: return ( p_min, p_max + margin )
+        return ( p_min - margin, p_max + margin )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _update_plot_nd( self,
+                         p_settings : PlotSettings,
+                         p_instances : InstDict,
+                         **p_kwargs ) -> bool:
+
+        if not self._is_plot_nd_buffered():
+            return super()._update_plot_nd( p_settings = p_settings, p_instances = p_instances, **p_kwargs )
+
+        # 1 Check: something to do?
+        if not p_instances: return False
+
+
+        # 2 Late initialization of the buffer and the feature plots
+        if self._plot_nd_buffer is None:
+            inst_ref      = next(iter(p_instances.values()))[1]
+            feature_space = inst_ref.get_feature_data().get_related_set()
+
+            self._plot_nd_dims  = []
+            self._plot_nd_plots = []
+
+            for i, feature in enumerate(feature_space.get_dims()):
+                if feature.get_base_set() in [ Dimension.C_BASE_SET_R, Dimension.C_BASE_SET_N, Dimension.C_BASE_SET_Z ]:
+                    feature_plot, = p_settings.axes.plot([], [], lw=1, label = feature.get_name_short() )
+                    self._plot_nd_dims.append(i)
+                    self._plot_nd_plots.append(feature_plot)
+
+            p_settings.axes.legend(title='Features', alignment='left', loc='upper right', draggable=True)
+
+            if p_settings.data_horizon > 0:
+                capacity = p_settings.data_horizon
+            elif p_settings.plot_horizon > 0:
+                capacity = p_settings.plot_horizon
+            else:
+                capacity = self.C_PLOT_ND_BUFFER_SIZE
+
+            self._plot_nd_buffer = PlotBufferND( p_capacity = capacity, p_num_dim = len(self._plot_nd_dims) )
+            if isinstance(inst_ref.tstamp, datetime): p_settings.axes.xaxis_date()
+
+            self._init_plot_nd_blitting( p_settings = p_settings )
+
+
+        # 3 Update of the buffer
+        buffer = self._plot_nd_buffer
+        dims   = self._plot_nd_dims
+
+        for inst_id, (inst_type, inst) in sorted(p_instances.items()):
+            if inst_type == InstTypeNew:
+                values = np.asarray( get_values_ro(inst.get_feature_data()) )[dims]
+                buffer.append( p_id = inst_id, p_x = self._get_plot_nd_x(inst_id, inst.tstamp), p_values = values )
+            else:
+                buffer.remove( p_id = inst_id )
+
+        if len(buffer) == 0: return False
+
+        # Lines and limits are only updated in steps that are drawn (see PlotSettings.step_rate)
+        if ( p_settings._plot_step_counter + 1 ) % p_settings.step_rate != 0: return True
+
+
+        # 4 Data within the plot horizon, optionally downsampled to the plot width
+        xdata = buffer.get_xdata()
+        ydata = buffer.get_ydata()
+
+        if ( p_settings.plot_horizon > 0 ) and ( len(buffer) > p_settings.plot_horizon ):
+            xdata = xdata[-p_settings.plot_horizon:]
+            ydata = ydata[-p_settings.plot_horizon:]
+
+        num_buckets = int(p_settings.axes.bbox.width)
+
+        if self.C_PLOT_ND_DOWNSAMPLING and ( num_buckets > 0 ) and ( xdata.size > 2 * num_buckets ):
+            idx = downsample_minmax( p_ydata = ydata, p_num_buckets = num_buckets )
+            for i, feature_plot in enumerate(self._plot_nd_plots):
+                feature_plot.set_data( xdata[idx[:, i]], ydata[idx[:, i], i] )
+        else:
+            for i, feature_plot in enumerate(self._plot_nd_plots):
+                feature_plot.set_data( xdata, ydata[:, i] )
+
+
+        # 5 Update of the axes limits. Changed limits require a full redraw of the background.
+        xlim = self._get_plot_nd_limits( self._plot_nd_xlim, float(xdata[0]), float(xdata[-1]), p_sliding = True )
+        if xlim is not None:
+            p_settings.axes.set_xlim(xlim)
+            self._plot_nd_xlim       = xlim
+            self._plot_nd_background = None
+
+        y_min, y_max = buffer.get_limits()
+        if y_min is not None:
+            ylim = self._get_plot_nd_limits( self._plot_nd_ylim, y_min, y_max, p_sliding = False )
+            if ylim is not None:
+                p_settings.axes.set_ylim(ylim)
+                self._plot_nd_ylim       = ylim
+                self._plot_nd_background = None
+
+        return True
+
+
+## -------------------------------------------------------------------------------------------------
+    def _update_plot_data_nd(self, p_normalizer : Normalizer = None):
+        """
+        Renormalizes the buffered ND plot data of a normalizer (p_normalizer = None) or of a successor
+        of a normalizer.
+        """
+
+        if not self._is_plot_nd_buffered():
+            if p_normalizer is None: return super()._update_plot_data_nd()
+            return super()._update_plot_data_nd( p_normalizer = p_normalizer )
+
+        buffer = getattr(self, '_plot_nd_buffer', None)
+        if ( buffer is None ) or ( len(buffer) == 0 ): return
+
+        normalizer    = self if p_normalizer is None else p_normalizer
+        scale, offset = get_renormalization( p_normalizer = normalizer )
+
+        if scale is not None:
+            buffer.rescale( p_scale = scale[self._plot_nd_dims], p_offset = offset[self._plot_nd_dims] )
+        else:
+            # Fallback for non-affine cases
+            ydata = buffer.get_ydata()
+            for i, dim in enumerate(self._plot_nd_dims):
+                column      = ydata[:, i].tolist()
+                normalizer.renormalize( p_data = column, p_dim = dim )
+                ydata[:, i] = column
+
+        self._plot_nd_ylim = None
@@ -0,0 +1,774 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Package    : mlwa.streams
+## -- Module     : recording.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.3.0 (2026-10-17)
+
+This module provides the recording of streams into binary stream logs and their replay.
+
+A stream log is an append-only binary file consisting of a header and a sequence of fixed-size
+records. The header contains a magic number, the format version and the meta data of the stream (name,
+feature and label dimensions, type of the time stamps) as JSON. Each record consists of the instance
+id, the time stamp, the time of recording relative to the first record and the feature and label
+values as 64-bit floats. The records are read as a memory-mapped NumPy array with a structured data
+type, so that the replay does not parse anything.
+
+"""
+
+import os
+import json
+import time
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from mlpro.bf.exceptions import Error, ParamError
+from mlpro.bf.various import Log
+from mlpro.bf.ops import Mode
+from mlpro.bf.math import Element, MSpace
+from mlpro.bf.streams import Feature, Label, Instance, Stream, StreamProvider
+
+from mlwa.streams.basics import StreamSeekable, StreamColumnar
+from mlwa.math import get_values_ro
+
+
+
+# Export list for public API
+__all__ = [ 'StreamLogWriter',
+            'StreamRecorder',
+            'StreamReplay',
+            'StreamProviderReplay' ]
+
+
+
+
+C_LOG_MAGIC         = b'MLWASLOG'
+C_LOG_VERSION       = 1
+C_LOG_ALIGNMENT     = 64
+
+C_TSTAMP_NONE       = 'none'
+C_TSTAMP_INT        = 'int'
+C_TSTAMP_FLOAT      = 'float'
+C_TSTAMP_DATETIME   = 'datetime'
+C_TSTAMP_TIMEDELTA  = 'timedelta'
+
+C_EPOCH             = datetime(1970, 1, 1)
+C_MICROSECOND       = timedelta(microseconds=1)
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+def _get_dtype(p_num_features : int, p_num_labels : int) -> np.dtype:
+    """
+    Returns the structured data type of the records of a stream log.
+    """
+
+    return np.dtype( [ ('id', '<i8'),
+                       ('tstamp', '<f8'),
+                       ('trec', '<f8'),
+                       ('features', '<f8', (p_num_features,)),
+                       ('labels', '<f8', (p_num_labels,)) ] )
+
+
+## -------------------------------------------------------------------------------------------------
+def _get_dims(p_space : MSpace) -> list:
+    """
+    Returns the description of the dimensions of a space for the header of a stream log.
+    """
+
+    if p_space is None: return []
+
+    return [ dict( name_short = dim.get_name_short(),
+                   name_long = dim.get_name_long(),
+                   base_set = dim.get_base_set(),
+                   unit = dim.get_unit(),
+                   boundaries = [ float(b) for b in dim.get_boundaries() ] )
+             for dim in ( p_space.get_dim(dim_id) for dim_id in p_space.get_dim_ids() ) ]
+
+
+## -------------------------------------------------------------------------------------------------
+def _get_space(p_dims : list, p_cls, p_space : MSpace = None) -> MSpace:
+    """
+    Sets up a space from the description of its dimensions in the header of a stream log. If a space
+    is given, its dimension objects are taken over by their short names.
+    """
+
+    if len(p_dims) == 0: return None
+
+    space = MSpace()
+    for dim in p_dims:
+        if p_space is not None:
+            try:
+                space.add_dim( p_space.get_dim_by_name(dim['name_short']) )
+            except KeyError:
+                raise Error('Dimension "' + dim['name_short'] + '" of the stream log not found')
+            continue
+
+        space.add_dim( p_cls( p_name_short = dim['name_short'],
+                              p_base_set = dim['base_set'],
+                              p_name_long = dim['name_long'],
+                              p_unit = dim['unit'],
+                              p_boundaries = dim['boundaries'] ) )
+    return space
+
+
+## -------------------------------------------------------------------------------------------------
+def _get_tstamp_type(p_tstamp) -> str:
+    if p_tstamp is None: return C_TSTAMP_NONE
+    if isinstance(p_tstamp, datetime): return C_TSTAMP_DATETIME
+    if isinstance(p_tstamp, timedelta): return C_TSTAMP_TIMEDELTA
+    if isinstance(p_tstamp, (int, np.integer)): return C_TSTAMP_INT
+    return C_TSTAMP_FLOAT
+
+
+## -------------------------------------------------------------------------------------------------
+def _encode_tstamp(p_tstamp) -> float:
+    """
+    Converts a time stamp into a float. Date/time values are stored as microseconds since the epoch
+    (time zone aware ones in UTC), time deltas as microseconds.
+    """
+
+    if p_tstamp is None: return np.nan
+
+    if isinstance(p_tstamp, datetime):
+        if p_tstamp.tzinfo is not None:
+            p_tstamp = p_tstamp.astimezone(timezone.utc).replace(tzinfo=None)
+        return float( ( p_tstamp - C_EPOCH ) // C_MICROSECOND )
+
+    if isinstance(p_tstamp, timedelta):
+        return float( p_tstamp // C_MICROSECOND )
+
+    return float(p_tstamp)
+
+
+## -------------------------------------------------------------------------------------------------
+def _decode_tstamp(p_value : float, p_type : str):
+    if p_type == C_TSTAMP_NONE: return None
+    if p_type == C_TSTAMP_INT: return int(p_value)
+    if p_type == C_TSTAMP_DATETIME: return C_EPOCH + timedelta(microseconds=int(p_value))
+    if p_type == C_TSTAMP_TIMEDELTA: return timedelta(microseconds=int(p_value))
+    return float(p_value)
+
+
+## -------------------------------------------------------------------------------------------------
+def _read_header(p_path : str) -> tuple:
+    """
+    Reads the header of a stream log.
+
+    Returns
+    -------
+    tuple
+        Meta data (dict) and offset of the first record.
+    """
+
+    with open(p_path, 'rb') as f:
+        magic = f.read(len(C_LOG_MAGIC))
+        if magic != C_LOG_MAGIC:
+            raise Error('File "' + p_path + '" is not a stream log')
+
+        version, meta_len = np.frombuffer(f.read(8), dtype='<u4').tolist()
+        if version != C_LOG_VERSION:
+            raise Error('Stream log "' + p_path + '" has the unsupported version ' + str(version))
+
+        meta = json.loads( f.read(meta_len).decode('utf-8') )
+
+    return meta, _get_offset(meta_len)
+
+
+## -------------------------------------------------------------------------------------------------
+def _get_offset(p_meta_len : int) -> int:
+    offset = len(C_LOG_MAGIC) + 8 + p_meta_len
+    return -( -offset // C_LOG_ALIGNMENT ) * C_LOG_ALIGNMENT
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class StreamLogWriter (Log):
+    """
+    Writes instances into a binary stream log (see module description). The log is created on the
+    first instance according to its feature and label spaces. The records are collected in a buffer
+    and appended to the file in chunks.
+
+    Parameters
+    ----------
+    p_path : str
+        Path of the stream log.
+    p_name : str
+        Name of the recorded stream stored in the header. Default = ''.
+    p_append : bool
+        If True, an existing log with the same dimensions is continued. Otherwise, it is replaced.
+        Default = False.
+    p_buffer_size : int
+        Number of records collected before they are appended to the file. Default = C_BUFFER_SIZE.
+    p_logging
+        Log level (see constants of class Log). Default: Log.C_LOG_ALL.
+    """
+
+    C_TYPE          = 'Stream Log Writer'
+    C_BUFFER_SIZE   = 256
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_path : str,
+                  p_name : str = '',
+                  p_append : bool = False,
+                  p_buffer_size : int = C_BUFFER_SIZE,
+                  p_logging = Log.C_LOG_ALL ):
+
+        if p_buffer_size < 1:
+            raise ParamError('Please set the parameter "p_buffer_size" >= 1')
+
+        Log.__init__(self, p_logging=p_logging)
+
+        self._path          = p_path
+        self._name          = p_name
+        self._append_init   = p_append
+        self._append        = p_append
+        self._buffer_size   = p_buffer_size
+        self._file          = None
+        self._record_labels = False
+        self._buffer        = None
+        self._buffer_pos    = 0
+        self._tstamp_type   = None
+        self._trec0         = None
+        self._num_records   = 0
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_path(self) -> str:
+        return self._path
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_num_records(self) -> int:
+        """
+        Returns the number of records of the log including the buffered ones.
+        """
+
+        return self._num_records + self._buffer_pos
+
+
+## -------------------------------------------------------------------------------------------------
+    def _open(self, p_instance : Instance):
+        """
+        Creates or continues the stream log for the spaces of the given instance.
+        """
+
+        feature_space = p_instance.get_feature_data().get_related_set()
+        label_data    = p_instance.get_label_data()
+        label_space   = label_data.get_related_set() if label_data is not None else None
+
+        if label_space is not None:
+            try:
+                np.asarray(get_values_ro(label_data), dtype=np.float64)
+            except (ValueError, TypeError):
+                self.log(self.C_LOG_TYPE_W, 'Labels are not numeric and will not be recorded')
+                label_space = None
+
+        self._record_labels = label_space is not None
+
+        meta = dict( name = self._name,
+                     tstamp_type = _get_tstamp_type(p_instance.tstamp),
+                     features = _get_dims(feature_space),
+                     labels = _get_dims(label_space) )
+
+        dtype = _get_dtype( len(meta['features']), len(meta['labels']) )
+
+        if self._append and os.path.isfile(self._path):
+            # 1 Continuation of an existing log behind its last complete record
+            meta_log, offset = _read_header(self._path)
+            if ( meta_log['features'] != meta['features'] ) or ( meta_log['labels'] != meta['labels'] ):
+                raise Error('Stream log "' + self._path + '" was recorded with different dimensions')
+
+            meta              = meta_log
+            self._num_records = ( os.path.getsize(self._path) - offset ) // dtype.itemsize
+            self._file        = open(self._path, 'r+b')
+            self._file.truncate( offset + self._num_records * dtype.itemsize )
+            self._file.seek(0, os.SEEK_END)
+
+            if self._num_records > 0:
+                trec_last   = np.fromfile( self._path, dtype=dtype, count=1, offset=offset + ( self._num_records - 1 ) * dtype.itemsize )['trec'][0]
+                self._trec0 = time.perf_counter() - trec_last
+
+            self.log(self.C_LOG_TYPE_I, 'Continuing stream log', self._path, 'after', self._num_records, 'records')
+
+        else:
+            # 2 New log
+            meta_bytes = json.dumps(meta).encode('utf-8')
+            offset     = _get_offset(len(meta_bytes))
+            header     = C_LOG_MAGIC + np.array([C_LOG_VERSION, len(meta_bytes)], dtype='<u4').tobytes() + meta_bytes
+
+            self._num_records = 0
+            self._file        = open(self._path, 'wb')
+            self._file.write( header + bytes(offset - len(header)) )
+
+            self.log(self.C_LOG_TYPE_I, 'Stream log', self._path, 'created')
+
+        self._tstamp_type = meta['tstamp_type']
+        self._buffer      = np.zeros(self._buffer_size, dtype=dtype)
+        self._buffer_pos  = 0
+
+
+## -------------------------------------------------------------------------------------------------
+    def write(self, p_instance : Instance):
+        """
+        Appends an instance to the stream log.
+
+        Parameters
+        ----------
+        p_instance : Instance
+            Instance to be recorded.
+        """
+
+        if self._file is None: self._open(p_instance)
+
+        now = time.perf_counter()
+        if self._trec0 is None: self._trec0 = now
+
+        record             = self._buffer[self._buffer_pos]
+        record['id']       = p_instance.id
+        record['tstamp']   = _encode_tstamp(p_instance.tstamp)
+        record['trec']     = now - self._trec0
+        record['features'] = get_values_ro(p_instance.get_feature_data())
+
+        if self._record_labels: record['labels'] = get_values_ro(p_instance.get_label_data())
+
+        self._buffer_pos += 1
+        if self._buffer_pos == self._buffer_size: self.flush()
+
+
+## -------------------------------------------------------------------------------------------------
+    def flush(self):
+        """
+        Appends the buffered records to the file.
+        """
+
+        if ( self._file is None ) or ( self._buffer_pos == 0 ): return
+
+        self._file.write( self._buffer[:self._buffer_pos].tobytes() )
+        self._file.flush()
+        self._num_records += self._buffer_pos
+        self._buffer_pos   = 0
+
+
+## -------------------------------------------------------------------------------------------------
+    def close(self):
+        """
+        Writes the buffered records and closes the file. Further instances are appended to the log.
+        """
+
+        if self._file is None: return
+
+        self.flush()
+        self._file.close()
+        self._file   = None
+        self._append = True
+        self.log(self.C_LOG_TYPE_I, 'Stream log', self._path, 'closed after', self._num_records, 'records')
+
+
+## -------------------------------------------------------------------------------------------------
+    def restart(self):
+        """
+        Closes the stream log. Without p_append, the next instance replaces the log by a new one.
+        Otherwise, the further instances are appended to it.
+        """
+
+        self.close()
+        self._append = self._append_init
+        self._trec0  = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def __del__(self):
+        try:
+            self.close()
+        except (OSError, ValueError) as error:
+            self.log(self.C_LOG_TYPE_E, 'Stream log', self._path, 'could not be closed:', error)
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class StreamRecorder (Stream):
+    """
+    Wraps a stream and records all instances it provides into a stream log (see class
+    StreamLogWriter). The instances are passed on unchanged, so that the recorder can replace the
+    stream in any stream scenario. Each reset of the recorder restarts the stream log, unless
+    p_append is set. Then, the instances of all passes through the stream are appended. To record
+    the instances at a later point of a workflow (e.g. after a rearranger), please use the stream
+    task mlwa.streams.tasks.StreamTaskRecorder.
+
+    Parameters
+    ----------
+    p_stream : Stream
+        Stream to be recorded.
+    p_path : str
+        Path of the stream log.
+    p_append : bool
+        If True, an existing log with the same dimensions is continued. Otherwise, it is replaced.
+        Default = False.
+    p_buffer_size : int
+        Number of records collected before they are appended to the file. Default =
+        StreamLogWriter.C_BUFFER_SIZE.
+    p_logging
+        Log level (see constants of class Log). Default: Log.C_LOG_ALL.
+    """
+
+    C_TYPE          = 'Stream Recorder'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_stream : Stream,
+                  p_path : str,
+                  p_append : bool = False,
+                  p_buffer_size : int = StreamLogWriter.C_BUFFER_SIZE,
+                  p_logging = Log.C_LOG_ALL ):
+
+        self._stream = p_stream
+        self._writer = StreamLogWriter( p_path = p_path,
+                                        p_name = p_stream.get_name(),
+                                        p_append = p_append,
+                                        p_buffer_size = p_buffer_size,
+                                        p_logging = p_logging )
+
+        super().__init__( p_id = p_stream.get_id(),
+                          p_name = p_stream.get_name(),
+                          p_num_instances = p_stream.get_num_instances(),
+                          p_version = p_stream.get_version(),
+                          p_feature_space = p_stream.get_feature_space(),
+                          p_label_space = p_stream.get_label_space(),
+                          p_sampler = None,
+                          p_mode = p_stream.get_mode(),
+                          p_logging = p_logging )
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_stream(self) -> Stream:
+        return self._stream
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_writer(self) -> StreamLogWriter:
+        return self._writer
+
+
+## -------------------------------------------------------------------------------------------------
+    def set_mode(self, p_mode):
+        super().set_mode(p_mode)
+        self._stream.set_mode(p_mode)
+
+
+## -------------------------------------------------------------------------------------------------
+    def set_random_seed(self, p_seed=None):
+        self._stream.set_random_seed(p_seed)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_tstamp(self):
+        return self._stream.get_tstamp()
+
+
+## -------------------------------------------------------------------------------------------------
+    def _reset(self):
+        self._writer.restart()
+        self._iterator = iter(self._stream)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_next(self) -> Instance:
+
+        try:
+            inst = next(self._iterator)
+        except StopIteration:
+            self._writer.flush()
+            raise
+
+        self._writer.write(inst)
+        return inst
+
+
+## -------------------------------------------------------------------------------------------------
+    def close(self):
+        """
+        Writes the remaining records and closes the stream log.
+        """
+
+        self._writer.close()
+
+
+## -------------------------------------------------------------------------------------------------
+    tstamp = property( fget = get_tstamp )
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class StreamReplay (StreamSeekable, StreamColumnar):
+    """
+    Replays a stream log (see class StreamLogWriter). The records are opened as a copy-on-write memory
+    map and the instances refer to row views of it, so that no values are parsed or copied. Tasks can
+    still change the feature values of the instances without affecting the log. The replayed
+    instances carry the recorded time stamps.
+
+    With timing C_TIMING_MAX, the instances are provided as fast as they are requested. With timing
+    C_TIMING_ORIGINAL, each instance is held back until its recorded time (relative to the first
+    instance provided after a reset or seek) divided by p_speed has passed.
+
+    The stream is seekable (see class mlwa.streams.StreamSeekable) and column-wise selectable (see
+    class mlwa.streams.StreamColumnar). Records appended to the log after construction are included
+    on the next reset.
+
+    By default, new dimension objects are set up from the header of the log. To feed a workflow that
+    refers to the dimensions of the recorded stream (e.g. by a rearranger), the feature and label
+    spaces of the recorded stream can be handed over. Their dimensions are then assigned by name.
+
+    Parameters
+    ----------
+    p_path : str
+        Path of the stream log.
+    p_timing : str
+        Timing of the replay. See constants C_TIMING_*. Default = C_TIMING_MAX.
+    p_speed : float
+        Speed factor of the original timing. Default = 1.0.
+    p_feature_space : MSpace
+        Optional feature space providing the feature dimensions. Default = None.
+    p_label_space : MSpace
+        Optional label space providing the label dimensions. Default = None.
+    p_id
+        Optional id of the stream. Default = None (path of the log).
+    p_name : str
+        Optional name of the stream. Default = '' (recorded name).
+    p_mode
+        Operation mode. Default: Mode.C_MODE_SIM.
+    p_logging
+        Log level (see constants of class Log). Default: Log.C_LOG_ALL.
+    p_kwargs : dict
+        Further stream specific parameters.
+    """
+
+    C_TYPE              = 'Stream Replay'
+
+    C_TIMING_MAX        = 'max'
+    C_TIMING_ORIGINAL   = 'original'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_path : str,
+                  p_timing : str = C_TIMING_MAX,
+                  p_speed : float = 1.0,
+                  p_feature_space : MSpace = None,
+                  p_label_space : MSpace = None,
+                  p_id = None,
+                  p_name : str = '',
+                  p_mode = Mode.C_MODE_SIM,
+                  p_logging = Log.C_LOG_ALL,
+                  **p_kwargs ):
+
+        if p_timing not in [ self.C_TIMING_MAX, self.C_TIMING_ORIGINAL ]:
+            raise ParamError('Invalid timing "' + str(p_timing) + '"')
+
+        if p_speed <= 0:
+            raise ParamError('Please set the parameter "p_speed" > 0')
+
+        self._path               = p_path
+        self._timing             = p_timing
+        self._speed              = p_speed
+        self._meta, self._offset = _read_header(p_path)
+        self._dtype              = _get_dtype( len(self._meta['features']), len(self._meta['labels']) )
+        self._records            = None
+        self._selected_indices   = None
+        self._inst_feature_space = None
+        self._index              = 0
+        self._time_ref           = None
+
+        super().__init__( p_id = p_id if p_id is not None else p_path,
+                          p_name = p_name if p_name != '' else self._meta['name'],
+                          p_num_instances = self._get_num_records(),
+                          p_version = str(C_LOG_VERSION),
+                          p_feature_space = _get_space(self._meta['features'], Feature, p_feature_space),
+                          p_label_space = _get_space(self._meta['labels'], Label, p_label_space),
+                          p_mode = p_mode,
+                          p_logging = p_logging,
+                          **p_kwargs )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_num_records(self) -> int:
+        return max(0, os.path.getsize(self._path) - self._offset) // self._dtype.itemsize
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_records(self) -> np.ndarray:
+        """
+        Returns the memory-mapped records of the log (structured array with the fields 'id', 'tstamp',
+        'trec', 'features' and 'labels'). Please reset the stream before.
+        """
+
+        return self._records
+
+
+## -------------------------------------------------------------------------------------------------
+    def _reset(self):
+
+        if self._inst_feature_space is None:
+            self._inst_feature_space = self.get_feature_space()
+
+        self._num_instances = self._get_num_records()
+
+        if self._num_instances > 0:
+            self._records = np.memmap( self._path,
+                                       dtype = self._dtype,
+                                       mode = 'c',
+                                       offset = self._offset,
+                                       shape = (self._num_instances,) )
+            self._features = self._records['features']
+            self._labels   = self._records['labels'] if self._label_space is not None else None
+            self._tstamps  = self._records['tstamp']
+            self._trec     = self._records['trec']
+        else:
+            self._records  = None
+
+        self._index    = 0
+        self._time_ref = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def _select_features(self, p_indices : list):
+
+        self._selected_indices = None if p_indices is None else np.array(p_indices, dtype=np.int64)
+
+        if p_indices is None:
+            self._inst_feature_space = self._feature_space
+        else:
+            self._inst_feature_space = MSpace()
+            ids = self._feature_space.get_dim_ids()
+            for i in p_indices:
+                self._inst_feature_space.add_dim( p_dim = self._feature_space.get_dim(ids[i]) )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _seek(self, p_index : int):
+        self._index    = p_index
+        self._time_ref = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def _wait(self, p_index : int):
+        """
+        Holds back the instance with the given index until its recorded time has passed.
+        """
+
+        now = time.perf_counter()
+
+        if self._time_ref is None:
+            self._time_ref = now - self._trec[p_index] / self._speed
+            return
+
+        delay = self._time_ref + self._trec[p_index] / self._speed - now
+        if delay > 0: time.sleep(delay)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_next(self) -> Instance:
+
+        i = self._index
+        if i >= self._num_instances: raise StopIteration
+
+        if self._timing == self.C_TIMING_ORIGINAL: self._wait(i)
+
+        # 1 Feature and label data as views of the record
+        feature_data = Element( self._inst_feature_space )
+        if self._selected_indices is None:
+            feature_data.set_values( self._features[i] )
+        else:
+            feature_data.set_values( self._features[i, self._selected_indices] )
+
+        if self._labels is not None:
+            label_data = Element( self._label_space )
+            label_data.set_values( self._labels[i] )
+        else:
+            label_data = None
+
+        self._index += 1
+
+        return Instance( p_feature_data = feature_data,
+                         p_label_data = label_data,
+                         p_tstamp = _decode_tstamp(self._tstamps[i], self._meta['tstamp_type']) )
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class StreamProviderReplay (StreamProvider):
+    """
+    Provides the stream logs of a folder (files with extension C_FILE_EXT) as streams of type
+    StreamReplay. The streams are identified by their file names without extension.
+
+    Parameters
+    ----------
+    p_path : str
+        Folder of the stream logs.
+    p_logging
+        Log level (see constants of class Log). Default: Log.C_LOG_ALL.
+    """
+
+    C_TYPE          = 'Stream Provider'
+    C_NAME          = 'Replay'
+    C_FILE_EXT      = '.slog'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_path : str,
+                  p_logging = Log.C_LOG_ALL ):
+
+        super().__init__( p_logging = p_logging )
+        self._path = p_path
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_stream_list(self, p_mode=Mode.C_MODE_SIM, p_logging=Log.C_LOG_ALL, **p_kwargs) -> list:
+
+        stream_list = []
+
+        for file in sorted(os.listdir(self._path)):
+            if not file.endswith(self.C_FILE_EXT): continue
+            stream_list.append( self._get_stream( p_id = file[:-len(self.C_FILE_EXT)],
+                                                  p_mode = p_mode,
+                                                  p_logging = p_logging,
+                                                  **p_kwargs ) )
+
+        return stream_list
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_stream(self, p_id: str = None, p_name: str = None, p_mode=Mode.C_MODE_SIM, p_logging=Log.C_LOG_ALL, **p_kwargs) -> Stream:
+
+        if p_id is None:
+            for stream in self._get_stream_list( p_mode = p_mode, p_logging = p_logging, **p_kwargs ):
+                if stream.get_name() == p_name: return stream
+            return None
+
+        path = os.path.join(self._path, str(p_id) + self.C_FILE_EXT)
+        if not os.path.isfile(path): return None
+
+        return StreamReplay( p_path = path,
+                             p_id = p_id,
+                             p_mode = p_mode,
+                             p_logging = p_logging,
+                             **p_kwargs )
@@ -0,0 +1,288 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Package    : mlwa.streams
+## -- Module     : rendering.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.1.0 (2026-10-17)
+
+This module provides a renderer that decouples the visualization of stream workflows from the
+processing of the instances.
+
+"""
+
+import threading
+import time
+
+from mlpro.bf.exceptions import ParamError
+from mlpro.bf.various import Log
+from mlpro.bf.streams import InstDict, InstTypeNew, InstTypeDel, StreamWorkflow
+
+
+
+# Export list for public API
+__all__ = [ 'Renderer' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class Renderer (Log):
+    """
+    Renderer for the plots of a stream workflow and its tasks. Instead of updating and redrawing
+    the task windows inline with each processed instance, the plot updates of the tasks are
+    published to the renderer and drawn as frames at a limited frame rate:
+
+    - The first plot update of each object is carried out immediately, so that the plot is
+      initialized (e.g. the view is autoselected) before the processing continues.
+
+    - On publishing, the instances of a plot update are taken over as snapshots (copies of the new
+      instances), so that later changes by subsequent tasks do not affect the frame. Updates of the
+      same task are merged until the next frame. Instances that are added and removed again in the
+      meantime are dropped.
+
+    - A frame applies the merged updates of all tasks at once, so that each figure is redrawn once
+      per frame (with plot step rate 1) instead of once per instance. Intermediate frames are never
+      drawn (frame dropping).
+
+    - The next frame is due after 1/p_frame_rate seconds, but not before the processing has got at
+      least (1 - p_max_load) of the time since the last frame. This way, slow figures (many or large
+      windows) reduce the frame rate instead of the processing throughput.
+
+    Matplotlib requires its GUI backends to be operated by the main thread and the plots of MLPro's
+    tasks read the current states of the tasks. Hence, the frames are drawn by the thread processing
+    the scenario between two cycles (see method render()), while the tasks may still publish their
+    updates from worker threads (see class mlwa.oa.OAStreamWorkflow).
+
+    Parameters
+    ----------
+    p_frame_rate : float
+        Maximum number of frames per second. Default = C_FRAME_RATE.
+    p_max_load : float
+        Maximum share of the time spent for rendering in ]0,1]. Default = C_MAX_LOAD.
+    p_logging
+        Log level (see constants of class Log). Default: Log.C_LOG_ALL.
+    """
+
+    C_TYPE          = 'Renderer'
+    C_NAME          = ''
+
+    C_FRAME_RATE    = 10.0
+    C_MAX_LOAD      = 0.1
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_frame_rate : float = C_FRAME_RATE,
+                  p_max_load : float = C_MAX_LOAD,
+                  p_logging = Log.C_LOG_ALL ):
+
+        if p_frame_rate <= 0:
+            raise ParamError('Please set the parameter "p_frame_rate" > 0')
+
+        if not ( 0 < p_max_load <= 1 ):
+            raise ParamError('Please set the parameter "p_max_load" in ]0,1]')
+
+        Log.__init__(self, p_logging=p_logging)
+
+        self._frame_len     = 1 / p_frame_rate
+        self._max_load      = p_max_load
+        self._lock          = threading.Lock()
+        self._plot_objs     = []
+        self._plot_methods  = {}
+        self._plot_inited   = set()
+        self._pending       = {}
+        self._tp_next_frame = 0
+        self._num_frames    = 0
+        self._num_updates   = 0
+
+
+## -------------------------------------------------------------------------------------------------
+    def attach(self, p_workflow : StreamWorkflow):
+        """
+        Redirects the plot updates of a workflow and its tasks to the renderer. The tasks are rendered
+        in the order of their addition to the workflow.
+
+        Parameters
+        ----------
+        p_workflow : StreamWorkflow
+            Stream workflow to be rendered.
+        """
+
+        for plot_obj in [ p_workflow ] + p_workflow.get_tasks():
+            if ( not plot_obj.C_PLOT_ACTIVE ) or ( not plot_obj.get_visualization() ): continue
+            if id(plot_obj) in self._plot_methods: continue
+
+            self._plot_methods[id(plot_obj)] = plot_obj.update_plot
+            self._plot_objs.append(plot_obj)
+            plot_obj.update_plot = self._get_publisher(plot_obj)
+
+        self.log(self.C_LOG_TYPE_I, 'Rendering', len(self._plot_objs), 'plot objects')
+
+
+## -------------------------------------------------------------------------------------------------
+    def detach(self):
+        """
+        Renders the pending updates and restores the inline plot updates of all attached objects.
+        """
+
+        self.flush()
+
+        for plot_obj in self._plot_objs:
+            del plot_obj.update_plot
+
+        self._plot_objs    = []
+        self._plot_methods = {}
+        self._plot_inited  = set()
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_publisher(self, p_plot_obj):
+
+        def publish(p_instances : InstDict = None, **p_kwargs):
+            self.publish( p_plot_obj = p_plot_obj, p_instances = p_instances, **p_kwargs )
+
+        return publish
+
+
+## -------------------------------------------------------------------------------------------------
+    def publish(self, p_plot_obj, p_instances : InstDict = None, **p_kwargs):
+        """
+        Takes over a plot update of an attached object until the next frame.
+
+        Parameters
+        ----------
+        p_plot_obj
+            Attached plot object.
+        p_instances : InstDict
+            Instances to be plotted.
+        p_kwargs : dict
+            Further optional plot parameters. The latest ones are used for the next frame.
+        """
+
+        if id(p_plot_obj) not in self._plot_inited:
+            self._plot_inited.add(id(p_plot_obj))
+            self._plot_methods[id(p_plot_obj)]( p_instances = p_instances, **p_kwargs )
+            return
+
+        if p_instances is None:
+            # Instances of the current run are taken from the shared object as in class StreamTask
+            try:
+                p_instances = p_plot_obj.get_so().get_instances( p_task_ids = [p_plot_obj.get_tid()] )
+            except AttributeError:
+                pass
+
+        if p_instances is not None:
+            snapshot = {}
+            for inst_id, (inst_type, inst) in p_instances.items():
+                snapshot[inst_id] = ( inst_type, inst.copy() if inst_type == InstTypeNew else inst )
+        else:
+            snapshot = None
+
+        with self._lock:
+            self._num_updates += 1
+
+            try:
+                instances, kwargs = self._pending[id(p_plot_obj)]
+            except KeyError:
+                self._pending[id(p_plot_obj)] = ( snapshot, p_kwargs )
+                return
+
+            if snapshot is not None:
+                if instances is None:
+                    instances = snapshot
+                else:
+                    for inst_id, (inst_type, inst) in snapshot.items():
+                        if ( inst_type == InstTypeDel ) and ( instances.get(inst_id, (None,))[0] == InstTypeNew ):
+                            del instances[inst_id]
+                        else:
+                            instances[inst_id] = ( inst_type, inst )
+
+            kwargs.update(p_kwargs)
+            self._pending[id(p_plot_obj)] = ( instances, kwargs )
+
+
+## -------------------------------------------------------------------------------------------------
+    def render(self, p_force : bool = False):
+        """
+        Draws a frame with all pending plot updates, if the next frame is due.
+
+        Parameters
+        ----------
+        p_force : bool
+            If True, the frame is drawn in any case. Default = False.
+
+        Returns
+        -------
+        bool
+            True, if a frame was drawn. False otherwise.
+        """
+
+        tp_start = time.perf_counter()
+        if ( not p_force ) and ( tp_start < self._tp_next_frame ): return False
+
+        pending = self._take_updates()
+        if len(pending) == 0: return False
+
+        self._apply_updates( p_pending = pending )
+
+        tp_end               = time.perf_counter()
+        duration             = tp_end - tp_start
+        self._tp_next_frame  = tp_start + max( self._frame_len, duration / self._max_load )
+        self._num_frames    += 1
+
+        return True
+
+
+## -------------------------------------------------------------------------------------------------
+    def _take_updates(self) -> dict:
+        """
+        Takes the pending plot updates of all attached objects.
+        """
+
+        with self._lock:
+            pending       = self._pending
+            self._pending = {}
+
+        return pending
+
+
+## -------------------------------------------------------------------------------------------------
+    def _apply_updates(self, p_pending : dict):
+        """
+        Applies merged plot updates to the attached objects in the order of their attachment.
+        """
+
+        for plot_obj in self._plot_objs:
+            try:
+                instances, kwargs = p_pending[id(plot_obj)]
+            except KeyError:
+                continue
+
+            if instances is None:
+                self._plot_methods[id(plot_obj)](**kwargs)
+            else:
+                self._plot_methods[id(plot_obj)]( p_instances = instances, **kwargs )
+
+
+## -------------------------------------------------------------------------------------------------
+    def flush(self):
+        """
+        Draws all pending plot updates immediately.
+        """
+
+        self.render( p_force = True )
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_num_frames(self) -> int:
+        return self._num_frames
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_num_updates(self) -> int:
+        return self._num_updates
@@ -0,0 +1,340 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Package    : mlwa.streams
+## -- Module     : scheduling.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-17)
+
+This module provides a deadline-aware scheduler for the cycles of stream scenarios in real-time mode.
+
+"""
+
+import time
+
+import numpy as np
+
+from mlpro.bf.exceptions import ParamError
+from mlpro.bf.various import Log
+
+
+
+# Export list for public API
+__all__ = [ 'CycleScheduler' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class CycleScheduler (Log):
+    """
+    Deadline-aware scheduler for the cycles of a scenario in real-time mode (see parameter p_scheduler
+    of class mlwa.oa.OAStreamScenario):
+
+    - Each instance of the stream owns a time slot of p_cycle_period seconds. The slots are placed on
+      an absolute schedule relative to the start of the run, measured by the monotonic high-resolution
+      clock time.perf_counter(). Hence, the delays of single cycles do not add up to a drift.
+
+    - The deadline of a cycle is the end of the slots of its instances. At the end of each cycle, the
+      scheduler records the lateness (end of processing - deadline; negative values are the remaining
+      slack) and waits for the next slot. The waiting time is slept and the last C_SPIN_TIME seconds
+      are busy-waited for precision. Afterwards, the start jitter (start - scheduled start) is
+      recorded.
+
+    - Cycles finishing after their deadline are counted as deadline misses. Late cycles are caught up
+      by starting the next cycles immediately (p_catch_up = True), or the schedule is restarted at the
+      end of the late cycle (p_catch_up = False).
+
+    - Lateness and jitter are collected in histograms with the bin edges C_LATENESS_BINS and
+      C_JITTER_BINS (multiples of the cycle period). See methods get_statistics() and
+      log_statistics().
+
+    Optionally, a load-shedding policy (p_shedding = True) reacts on processing falling behind. Every
+    C_WINDOW cycles, the deadline misses of the last window are evaluated. If their rate exceeds
+    p_max_miss_rate, the next shedding level is activated. If all cycles of a window met their
+    deadline and their mean processing time leaves at least C_RECOVERY_SLACK of the slots of the
+    previous level, the previous level is restored. The levels are:
+
+    1. Skipping the visualization (p_shed_plots = True)
+    2. Sampling of the instances with factors 2, 4, ... up to p_max_sampling. The scenario then
+       processes only one of n instances and drops the others together with their slots.
+
+    Parameters
+    ----------
+    p_cycle_period : float
+        Time slot per instance in seconds.
+    p_catch_up : bool
+        If True, late cycles are caught up. Otherwise, the schedule is restarted after a late cycle.
+        Default = True.
+    p_shedding : bool
+        Boolean switch for load shedding. Default = False.
+    p_shed_plots : bool
+        If True, the first shedding level skips the visualization. Default = True.
+    p_max_sampling : int
+        Maximum sampling factor for instances on load shedding. Default = C_MAX_SAMPLING.
+    p_max_miss_rate : float
+        Maximum rate of deadline misses per window before load shedding takes place. Default =
+        C_MAX_MISS_RATE.
+    p_logging
+        Log level (see constants of class Log). Default: Log.C_LOG_ALL.
+    """
+
+    C_TYPE              = 'Cycle Scheduler'
+    C_NAME              = ''
+
+    C_SPIN_TIME         = 0.0005
+    C_WINDOW            = 50
+    C_MAX_SAMPLING      = 8
+    C_MAX_MISS_RATE     = 0.1
+    C_RECOVERY_SLACK    = 0.5
+
+    C_LATENESS_BINS     = [ -np.inf, -0.75, -0.5, -0.25, 0, 0.25, 0.5, 1, 2, 4, np.inf ]
+    C_JITTER_BINS       = [ 0, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2, np.inf ]
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_cycle_period : float,
+                  p_catch_up : bool = True,
+                  p_shedding : bool = False,
+                  p_shed_plots : bool = True,
+                  p_max_sampling : int = C_MAX_SAMPLING,
+                  p_max_miss_rate : float = C_MAX_MISS_RATE,
+                  p_logging = Log.C_LOG_ALL ):
+
+        if p_cycle_period <= 0:
+            raise ParamError('Please set the parameter "p_cycle_period" > 0')
+
+        if p_max_sampling < 1:
+            raise ParamError('Please set the parameter "p_max_sampling" >= 1')
+
+        Log.__init__(self, p_logging=p_logging)
+
+        self._period            = p_cycle_period
+        self._catch_up          = p_catch_up
+        self._shedding          = p_shedding
+        self._shed_plots        = p_shed_plots
+        self._max_miss_rate     = p_max_miss_rate
+        self._lateness_bins     = np.array(self.C_LATENESS_BINS) * p_cycle_period
+        self._jitter_bins       = np.array(self.C_JITTER_BINS) * p_cycle_period
+
+        # Shedding levels: skipping the plots, followed by sampling factors 2, 4, ..., p_max_sampling
+        self._shed_levels       = [ ( False, 1 ) ]
+        if p_shed_plots: self._shed_levels.append( ( True, 1 ) )
+
+        sampling = 2
+        while sampling <= p_max_sampling:
+            self._shed_levels.append( ( p_shed_plots, sampling ) )
+            sampling *= 2
+
+        self.start()
+
+
+## -------------------------------------------------------------------------------------------------
+    def start(self):
+        """
+        Resets the statistics and starts the schedule with a slot beginning now.
+        """
+
+        self._tp_start          = time.perf_counter()
+        self._tp_release        = self._tp_start
+        self._tp_cycle_start    = self._tp_start
+        self._num_cycles        = 0
+        self._num_slots         = 0
+        self._num_misses        = 0
+        self._lateness_sum      = 0.0
+        self._lateness_max      = -np.inf
+        self._jitter_sum        = 0.0
+        self._jitter_sqsum      = 0.0
+        self._jitter_max        = 0.0
+        self._busy_sum          = 0.0
+        self._lateness_hist     = np.zeros( len(self._lateness_bins) - 1, dtype=np.int64 )
+        self._jitter_hist       = np.zeros( len(self._jitter_bins) - 1, dtype=np.int64 )
+        self._win_cycles        = 0
+        self._win_misses        = 0
+        self._win_busy_sum      = 0.0
+        self._shed_level        = 0
+
+
+## -------------------------------------------------------------------------------------------------
+    def wait(self, p_num_slots : int = 1) -> bool:
+        """
+        Finishes the current cycle and waits for the start of the next one.
+
+        Parameters
+        ----------
+        p_num_slots : int
+            Number of instances consumed by the current cycle (processed and dropped ones). Default = 1.
+
+        Returns
+        -------
+        bool
+            True, if the cycle met its deadline. False otherwise.
+        """
+
+        # 1 Lateness of the current cycle
+        tp_end      = time.perf_counter()
+        tp_deadline = self._tp_release + p_num_slots * self._period
+        lateness    = tp_end - tp_deadline
+        missed      = lateness > 0
+
+        self._num_cycles   += 1
+        self._num_slots    += p_num_slots
+        self._lateness_sum += lateness
+        self._lateness_max  = max(self._lateness_max, lateness)
+        self._busy_sum     += tp_end - self._tp_cycle_start
+        self._win_busy_sum += tp_end - self._tp_cycle_start
+        self._lateness_hist[ np.searchsorted(self._lateness_bins, lateness, side='right') - 1 ] += 1
+
+        if missed:
+            self._num_misses += 1
+            self._win_misses += 1
+
+        self._win_cycles   += 1
+        if self._shedding and ( self._win_cycles >= self.C_WINDOW ): self._adjust_shedding()
+
+
+        # 2 Start of the next cycle
+        if missed and not self._catch_up:
+            self._tp_release = tp_end
+        else:
+            self._tp_release = tp_deadline
+
+        self._sleep_until(self._tp_release)
+
+
+        # 3 Start jitter of the next cycle
+        self._tp_cycle_start = time.perf_counter()
+        jitter               = self._tp_cycle_start - self._tp_release
+        self._jitter_sum    += jitter
+        self._jitter_sqsum  += jitter * jitter
+        self._jitter_max     = max(self._jitter_max, jitter)
+        self._jitter_hist[ max(0, np.searchsorted(self._jitter_bins, jitter, side='right') - 1) ] += 1
+
+        return not missed
+
+
+## -------------------------------------------------------------------------------------------------
+    def _sleep_until(self, p_tp : float):
+
+        remaining = p_tp - time.perf_counter() - self.C_SPIN_TIME
+        if remaining > 0: time.sleep(remaining)
+        while time.perf_counter() < p_tp: pass
+
+
+## -------------------------------------------------------------------------------------------------
+    def _adjust_shedding(self):
+        """
+        Evaluates the deadline misses of the last window and changes the shedding level if required.
+        """
+
+        miss_rate = self._win_misses / self._win_cycles
+
+        if ( miss_rate > self._max_miss_rate ) and ( self._shed_level < len(self._shed_levels) - 1 ):
+            self._shed_level += 1
+            self.log(self.C_LOG_TYPE_W, 'Deadline miss rate', round(miss_rate, 3), '-> load shedding level', self._shed_level, self._get_level_text())
+
+        elif ( self._win_misses == 0 ) and ( self._shed_level > 0 ) and \
+             ( self._win_busy_sum / self._win_cycles <= ( 1 - self.C_RECOVERY_SLACK ) * self._shed_levels[self._shed_level - 1][1] * self._period ):
+            self._shed_level -= 1
+            self.log(self.C_LOG_TYPE_I, 'Deadlines met -> load shedding level', self._shed_level, self._get_level_text())
+
+        self._win_cycles    = 0
+        self._win_misses    = 0
+        self._win_busy_sum  = 0.0
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_level_text(self) -> str:
+
+        skip_plots, sampling = self._shed_levels[self._shed_level]
+        return '(visualization ' + ( 'skipped' if skip_plots else 'on' ) + ', sampling 1:' + str(sampling) + ')'
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_cycle_period(self) -> float:
+        return self._period
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_shedding_level(self) -> int:
+        return self._shed_level
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_skip_plots(self) -> bool:
+        """
+        Returns True, if the visualization shall be skipped due to load shedding.
+        """
+
+        return self._shed_levels[self._shed_level][0]
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_sampling(self) -> int:
+        """
+        Returns the current sampling factor n. The next cycle shall process one of n instances.
+        """
+
+        return self._shed_levels[self._shed_level][1]
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_num_misses(self) -> int:
+        return self._num_misses
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_statistics(self) -> dict:
+        """
+        Returns the timing statistics of the current run. Times are given in seconds.
+
+        Returns
+        -------
+        dict
+            Number of cycles and slots, deadline misses and miss rate, mean/max lateness, mean/std/max
+            start jitter, utilization (busy time per slot time) and the histograms of lateness and
+            jitter as tuples (bin edges, counts).
+        """
+
+        num_cycles = max(1, self._num_cycles)
+        jitter     = self._jitter_sum / num_cycles
+
+        return { 'cycles'           : self._num_cycles,
+                 'slots'            : self._num_slots,
+                 'misses'           : self._num_misses,
+                 'miss_rate'        : self._num_misses / num_cycles,
+                 'lateness_mean'    : self._lateness_sum / num_cycles,
+                 'lateness_max'     : self._lateness_max if self._num_cycles > 0 else 0.0,
+                 'jitter_mean'      : jitter,
+                 'jitter_std'       : max(0.0, self._jitter_sqsum / num_cycles - jitter * jitter) ** 0.5,
+                 'jitter_max'       : self._jitter_max,
+                 'utilization'      : self._busy_sum / ( max(1, self._num_slots) * self._period ),
+                 'shedding_level'   : self._shed_level,
+                 'lateness_hist'    : ( self._lateness_bins, self._lateness_hist.copy() ),
+                 'jitter_hist'      : ( self._jitter_bins, self._jitter_hist.copy() ) }
+
+
+## -------------------------------------------------------------------------------------------------
+    def log_statistics(self):
+        """
+        Logs the timing statistics of the current run.
+        """
+
+        stats = self.get_statistics()
+        ms    = lambda p_sec: str(round(p_sec * 1000, 3)) + ' ms'
+
+        self.log(self.C_LOG_TYPE_I, 'Cycles:', stats['cycles'], ', period:', ms(self._period), ', utilization:', round(stats['utilization'], 3))
+        self.log(self.C_LOG_TYPE_I, 'Deadline misses:', stats['misses'], '(rate', str(round(stats['miss_rate'], 4)) + ')')
+        self.log(self.C_LOG_TYPE_I, 'Lateness mean/max:', ms(stats['lateness_mean']), '/', ms(stats['lateness_max']))
+        self.log(self.C_LOG_TYPE_I, 'Jitter mean/std/max:', ms(stats['jitter_mean']), '/', ms(stats['jitter_std']), '/', ms(stats['jitter_max']))
+
+        for name, (edges, counts) in [ ('Lateness', stats['lateness_hist']), ('Jitter', stats['jitter_hist']) ]:
+            bins = []
+            for i, count in enumerate(counts):
+                bins.append( '[' + ms(edges[i]) + ',' + ms(edges[i+1]) + '): ' + str(count) )
+            self.log(self.C_LOG_TYPE_I, name, 'histogram', ', '.join(bins))
@@ -0,0 +1,7 @@
+"""
+### Benchmark streams with block-wise generation ('mlwa.streams.streams')
+"""
+
+from .basics import *
+from .clouds import *
+from .point_outliers import *
@@ -0,0 +1,260 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Package    : mlwa.streams.streams
+## -- Module     : basics.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-17)
+
+This module provides the block-wise generation of instances for MLPro's native benchmark streams.
+
+"""
+
+import random
+
+import numpy as np
+
+from mlpro.bf.exceptions import ParamError
+from mlpro.bf.math import Element
+from mlpro.bf.streams import Instance
+
+
+
+# Export list for public API
+__all__ = [ 'StreamMLProBlockwise' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+def _get_bitgen(p_state : tuple) -> np.random.MT19937:
+    """
+    Returns a NumPy Mersenne Twister in the given state of Python's random generator.
+    """
+
+    bitgen       = np.random.MT19937()
+    bitgen.state = { 'bit_generator' : 'MT19937',
+                     'state' : { 'key' : np.array(p_state[1][:624], dtype=np.uint32),
+                                 'pos' : p_state[1][624] } }
+    return bitgen
+
+
+## -------------------------------------------------------------------------------------------------
+def _set_random_state(p_state : tuple, p_num_words : int):
+    """
+    Sets Python's random generator to the given state advanced by the given number of 32-bit words.
+    """
+
+    bitgen = _get_bitgen(p_state)
+    bitgen.random_raw(p_num_words)
+    state  = bitgen.state['state']
+    random.setstate( ( p_state[0], tuple(state['key'].tolist()) + (int(state['pos']),), p_state[2] ) )
+
+
+## -------------------------------------------------------------------------------------------------
+def _get_random_doubles(p_words_1 : np.ndarray, p_words_2 : np.ndarray) -> np.ndarray:
+    """
+    Converts pairs of consecutive 32-bit words into floats in [0,1) exactly as random.random() does.
+    """
+
+    return ( ( p_words_1 >> 5 ) * 67108864.0 + ( p_words_2 >> 6 ) ) * ( 1.0 / 9007199254740992.0 )
+
+
+## -------------------------------------------------------------------------------------------------
+def _get_randbelow_mask(p_words : np.ndarray, p_n : int) -> tuple:
+    """
+    Emulates the rejection sampling of random.randrange(p_n) on each 32-bit word.
+
+    Returns
+    -------
+    tuple
+        Candidate values of all words and a boolean mask of the accepted ones.
+    """
+
+    k      = int(p_n).bit_length()
+    values = p_words >> ( 32 - k )
+    return values, values < p_n
+
+
+## -------------------------------------------------------------------------------------------------
+def _get_next_true(p_mask : np.ndarray) -> np.ndarray:
+    """
+    Returns for each position the next position (inclusive) with a True value in the given mask or
+    the length of the mask if there is none.
+    """
+
+    size = p_mask.size
+    pos  = np.where( p_mask, np.arange(size), size )
+    return np.minimum.accumulate( pos[::-1] )[::-1]
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class StreamMLProBlockwise:
+    """
+    Mixin for MLPro's native benchmark streams (class mlpro.bf.streams.streams.StreamMLProBase) that
+    draw their random numbers from Python's global random generator. Instead of one instance per call,
+    the feature values of a block of instances are generated at once by the custom method
+    _generate_block() and handed out as row views of the block.
+
+    The random numbers are taken from the global random generator as a block of raw 32-bit words of
+    the underlying Mersenne Twister. The custom implementation needs to consume them in exactly the
+    same way as the per-instance generation does, so that a stream provides the same instances for a
+    given seed. On loading a block, the global random generator is advanced to the end of the block.
+    If the stream is reset before all instances of a block have been handed out, it is set back to
+    the state after the last instance provided. Hence, the instances are identical to the per-instance
+    generation as long as no other code draws from the global random generator while the stream is
+    iterated.
+
+    Please call method _init_blocks() in the constructor.
+    """
+
+    C_BLOCK_SIZE    = 1024
+
+## -------------------------------------------------------------------------------------------------
+    def _init_blocks(self, p_block_size : int = None):
+        """
+        Initializes the block generation.
+
+        Parameters
+        ----------
+        p_block_size : int
+            Number of instances generated at once. Default = None (C_BLOCK_SIZE).
+        """
+
+        if p_block_size is None: p_block_size = self.C_BLOCK_SIZE
+
+        if p_block_size < 1:
+            raise ParamError('Please set the parameter "p_block_size" >= 1')
+
+        self._block_size  = p_block_size
+        self._block       = None
+        self._block_pos   = 0
+        self._block_words = None
+        self._block_state = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def _reset(self):
+        self._release_block()
+        super()._reset()
+
+
+## -------------------------------------------------------------------------------------------------
+    def _release_block(self):
+        """
+        Discards the current block and sets back the random state to the last instance provided.
+        """
+
+        if self._block is None: return
+
+        num_inst = self._block_pos
+        if num_inst < len(self._block):
+            num_words = int(self._block_words[num_inst - 1]) if num_inst > 0 else 0
+            _set_random_state( p_state = self._block_state, p_num_words = num_words )
+            self._commit_block( p_num_inst = num_inst )
+
+        self._block = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def _load_block(self, p_num_inst : int):
+        """
+        Generates the next block of instances.
+        """
+
+        state  = random.getstate()
+        bitgen = _get_bitgen(state)
+        words  = bitgen.random_raw( self._estimate_words( p_num_inst = p_num_inst ) )
+        result = self._generate_block( p_num_inst = p_num_inst, p_words = words )
+
+        while result is None:
+            # Words were not sufficient (e.g. due to rejection sampling)
+            words  = np.concatenate( (words, bitgen.random_raw( max(words.size, 64) )) )
+            result = self._generate_block( p_num_inst = p_num_inst, p_words = words )
+
+        self._block, self._block_words = result
+        self._block_pos   = 0
+        self._block_state = state
+
+        _set_random_state( p_state = state, p_num_words = int(self._block_words[-1]) )
+        self._commit_block( p_num_inst = p_num_inst )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_next(self) -> Instance:
+
+        # 1 Next block
+        if ( self._block is None ) or ( self._block_pos == len(self._block) ):
+            num_inst = self._block_size
+            if self.C_NUM_INSTANCES > 0:
+                if self._index >= self.C_NUM_INSTANCES: raise StopIteration
+                num_inst = min( num_inst, self.C_NUM_INSTANCES - self._index )
+
+            self._load_block( p_num_inst = num_inst )
+
+
+        # 2 Next instance with a row view of the block as feature values
+        feature_data = Element(self._feature_space)
+        feature_data.set_values( self._block[self._block_pos] )
+
+        self._block_pos += 1
+        self._index     += 1
+
+        return Instance( p_feature_data=feature_data )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _estimate_words(self, p_num_inst : int) -> int:
+        """
+        Custom method that returns the expected number of 32-bit words for the given number of
+        instances. Further words are provided on demand.
+        """
+
+        raise NotImplementedError
+
+
+## -------------------------------------------------------------------------------------------------
+    def _generate_block(self, p_num_inst : int, p_words : np.ndarray):
+        """
+        Custom method that generates the feature values of the given number of instances from the
+        given 32-bit words (values of type np.uint64) of the Mersenne Twister. The instance index of
+        the first instance is self._index.
+
+        Parameters
+        ----------
+        p_num_inst : int
+            Number of instances.
+        p_words : np.ndarray
+            32-bit words in the order of consumption.
+
+        Returns
+        -------
+        tuple
+            Feature values of shape (p_num_inst, num_dim) and the number of consumed words after each
+            instance of shape (p_num_inst,). None, if the words are not sufficient.
+        """
+
+        raise NotImplementedError
+
+
+## -------------------------------------------------------------------------------------------------
+    def _commit_block(self, p_num_inst : int):
+        """
+        Custom method that takes over further internal states (e.g. moving centers) after the given
+        number of instances of the current block.
+
+        Parameters
+        ----------
+        p_num_inst : int
+            Number of instances of the current block.
+        """
+
+        pass
@@ -0,0 +1,249 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Package    : mlwa.streams.streams
+## -- Module     : clouds.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-17)
+
+This module provides a drop-in replacement for MLPro's benchmark stream of random point clouds
+that generates its instances block-wise.
+
+"""
+
+import math
+
+import numpy as np
+
+from mlpro.bf.various import Log
+from mlpro.bf.streams.streams import StreamMLProClouds as StreamMLProCloudsMLPro
+
+from mlwa.streams.streams.basics import StreamMLProBlockwise, _get_random_doubles, _get_randbelow_mask, _get_next_true
+
+
+
+# Export list for public API
+__all__ = [ 'StreamMLProClouds' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class StreamMLProClouds (StreamMLProBlockwise, StreamMLProCloudsMLPro):
+    """
+    Drop-in replacement for class mlpro.bf.streams.streams.StreamMLProClouds. The instances are
+    generated in blocks by vectorized NumPy operations (see class StreamMLProBlockwise) and are
+    identical to the ones of the original class for the same seed.
+
+    See class mlpro.bf.streams.streams.StreamMLProClouds for a description of the remaining
+    parameters.
+
+    Parameters
+    ----------
+    p_block_size : int
+        Number of instances generated at once. Default = None (C_BLOCK_SIZE).
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_num_dim : int = 3,
+                  p_num_instances : int = 1000,
+                  p_num_clouds : int = 4,
+                  p_radii : list = [100.0],
+                  p_weights : list = [],
+                  p_velocity : float = 0.0,
+                  p_seed = None,
+                  p_logging = Log.C_LOG_ALL,
+                  p_block_size : int = None,
+                  **p_kwargs ):
+
+        self._init_blocks( p_block_size = p_block_size )
+        self._block_centers = None
+
+        super().__init__( p_num_dim = p_num_dim,
+                          p_num_instances = p_num_instances,
+                          p_num_clouds = p_num_clouds,
+                          p_radii = p_radii,
+                          p_weights = p_weights,
+                          p_velocity = p_velocity,
+                          p_seed = p_seed,
+                          p_logging = p_logging,
+                          **p_kwargs )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_num_cloud_draws(self) -> int:
+        if self._num_cloud_ids == 0: return self._num_clouds
+        return self._num_cloud_ids
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_radius_ranges(self) -> list:
+        """
+        Returns the number of possible integer offsets per cloud in the n-dimensional case.
+        """
+
+        ranges = []
+        for c in range(self._num_clouds):
+            radius = self._radii[0] if len(self._radii) == 1 else self._radii[c]
+            stop   = 2 * radius + 1
+            if int(stop) != stop:
+                raise ValueError('non-integer stop for randrange()')
+            if stop <= 0:
+                raise ValueError('empty range for randrange()')
+            ranges.append(int(stop))
+
+        return ranges
+
+
+## -------------------------------------------------------------------------------------------------
+    def _estimate_words(self, p_num_inst : int) -> int:
+
+        num_draws = self._get_num_cloud_draws()
+        words     = ( 1 << num_draws.bit_length() ) / num_draws
+
+        if self._num_dim in (2, 3):
+            words += 2 * self._num_dim
+        else:
+            n      = max(self._get_radius_ranges())
+            words += self._num_dim * ( 1 << n.bit_length() ) / n
+
+        return int( p_num_inst * words * 1.1 ) + 64
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_moving_centers(self, p_num_inst : int) -> np.ndarray:
+        """
+        Returns the positions of all moving centers after each of the next instances of the current
+        block as array of shape (p_num_inst + 1, num_clouds, num_dim). Row 0 contains the positions at
+        the beginning of the block. The centers are moved by sequential additions as in the original
+        class.
+        """
+
+        centers     = np.empty( (p_num_inst + 1, self._num_clouds, self._num_dim) )
+        centers[0]  = self._block_centers
+        centers[1:] = np.array(self._centers_step[:self._num_clouds])
+        return np.cumsum( centers, axis=0, out=centers )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _generate_block(self, p_num_inst : int, p_words : np.ndarray):
+
+        # 1 Intro
+        num_words  = p_words.size
+        num_dim    = self._num_dim
+        draws, acc = _get_randbelow_mask(p_words, self._get_num_cloud_draws())
+        next_draw  = _get_next_true(acc)
+
+        if self._num_cloud_ids == 0:
+            cloud_ids = list(range(self._num_clouds))
+        else:
+            cloud_ids = self._cloud_ids
+
+
+        # 2 Determination of the word positions of the cloud draws. The 2D/3D case is followed by a
+        #   fixed number of words for random.random(). The nD case is followed by num_dim accepted
+        #   draws of random.randint(0, 2 * radius) with rejection sampling.
+        pos_cloud  = []
+        pos_offset = []
+        p          = 0
+
+        if num_dim in (2, 3):
+            num_rnd = 2 * num_dim
+            for i in range(p_num_inst):
+                if p >= num_words: return None
+                j = int(next_draw[p])
+                p = j + 1 + num_rnd
+                if p > num_words: return None
+                pos_cloud.append(j)
+
+        else:
+            ranges      = self._get_radius_ranges()
+            offsets     = {}
+            offsets_acc = {}
+            offsets_cnt = {}
+            for n in set(ranges):
+                offsets[n], acc_n = _get_randbelow_mask(p_words, n)
+                offsets_acc[n]    = np.flatnonzero(acc_n)
+                offsets_cnt[n]    = np.concatenate( ([0], np.cumsum(acc_n)) )
+
+            for i in range(p_num_inst):
+                if p >= num_words: return None
+                j = int(next_draw[p])
+                if j >= num_words: return None
+                n = ranges[cloud_ids[draws[j]]]
+                b = int(offsets_cnt[n][j+1])
+                if b + num_dim > offsets_acc[n].size: return None
+                p = int(offsets_acc[n][b + num_dim - 1]) + 1
+                pos_cloud.append(j)
+                pos_offset.append(b)
+
+
+        # 3 Clouds, centers and radii of all instances
+        pos_cloud = np.array(pos_cloud, dtype=np.int64)
+        clouds    = np.array(cloud_ids, dtype=np.int64)[draws[pos_cloud]]
+        self._block_centers = np.array(self._centers[:self._num_clouds])
+
+        if self._velocity == 0.0:
+            center = self._block_centers[clouds]
+        else:
+            center = self._get_moving_centers(p_num_inst)[np.arange(1, p_num_inst + 1), clouds]
+
+        if len(self._radii) == 1:
+            radius = np.full(p_num_inst, self._radii[0], dtype=np.float64)
+        else:
+            radius = np.array(self._radii, dtype=np.float64)[clouds]
+
+
+        # 4 Generation of the feature values
+        values = np.empty( (p_num_inst, num_dim) )
+
+        if num_dim == 2:
+            # 4.1 Random 2D points within circles around the centers
+            rnd        = [ _get_random_doubles(p_words[pos_cloud + 2*k + 1], p_words[pos_cloud + 2*k + 2]) for k in range(2) ]
+            radian     = rnd[0] * 2 * math.pi
+            radius_rnd = radius * rnd[1]
+            values[:, 0] = center[:, 0] + np.array( list(map(math.cos, radian.tolist())) ) * radius_rnd
+            values[:, 1] = center[:, 1] + np.array( list(map(math.sin, radian.tolist())) ) * radius_rnd
+            word_ends    = pos_cloud + 5
+
+        elif num_dim == 3:
+            # 4.2 Random 3D points within spheres around the centers
+            rnd        = [ _get_random_doubles(p_words[pos_cloud + 2*k + 1], p_words[pos_cloud + 2*k + 2]) for k in range(3) ]
+            radian1    = ( rnd[0] * 2 * math.pi ).tolist()
+            radian2    = ( rnd[1] * 2 * math.pi ).tolist()
+            radius_rnd = radius * rnd[2]
+            cos2       = np.array( list(map(math.cos, radian2)) )
+            values[:, 0] = center[:, 0] + np.array( list(map(math.cos, radian1)) ) * cos2 * radius_rnd
+            values[:, 1] = center[:, 1] + np.array( list(map(math.sin, radian2)) ) * radius_rnd
+            values[:, 2] = center[:, 2] + np.array( list(map(math.sin, radian1)) ) * cos2 * radius_rnd
+            word_ends    = pos_cloud + 7
+
+        else:
+            # 4.3 Random nD points in hypercubes around the centers
+            pos_offset = np.array(pos_offset, dtype=np.int64)
+            ranges     = np.array(ranges, dtype=np.int64)[clouds]
+            word_ends  = np.empty(p_num_inst, dtype=np.int64)
+
+            for n in offsets:
+                rows      = np.flatnonzero(ranges == n)
+                pos       = offsets_acc[n][ pos_offset[rows, None] + np.arange(num_dim) ]
+                values[rows]    = center[rows] + offsets[n][pos] - radius[rows, None]
+                word_ends[rows] = pos[:, -1] + 1
+
+        return values, word_ends
+
+
+## -------------------------------------------------------------------------------------------------
+    def _commit_block(self, p_num_inst : int):
+
+        if self._velocity == 0.0: return
+
+        centers = self._get_moving_centers(p_num_inst)[p_num_inst]
+        for c in range(self._num_clouds):
+            self._centers[c] = centers[c].copy()
@@ -0,0 +1,144 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Package    : mlwa.streams.streams
+## -- Module     : point_outliers.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-17)
+
+This module provides a drop-in replacement for MLPro's benchmark stream with point outliers that
+generates its instances block-wise.
+
+"""
+
+import math
+
+import numpy as np
+
+from mlpro.bf.various import Log
+from mlpro.bf.streams import Instance
+from mlpro.bf.streams.streams import StreamMLProPOutliers as StreamMLProPOutliersMLPro
+
+from mlwa.streams.streams.basics import StreamMLProBlockwise, _get_random_doubles
+
+
+
+# Export list for public API
+__all__ = [ 'StreamMLProPOutliers' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class StreamMLProPOutliers (StreamMLProBlockwise, StreamMLProPOutliersMLPro):
+    """
+    Drop-in replacement for class mlpro.bf.streams.streams.StreamMLProPOutliers. The instances are
+    generated in blocks by vectorized NumPy operations (see class StreamMLProBlockwise) and are
+    identical to the ones of the original class for the same seed. Streams with further functions
+    than the ones listed in C_FUNCTIONS_BLOCKWISE are generated instance by instance.
+
+    See class mlpro.bf.streams.streams.StreamMLProPOutliers for a description of the remaining
+    parameters.
+
+    Parameters
+    ----------
+    p_block_size : int
+        Number of instances generated at once. Default = None (C_BLOCK_SIZE).
+    """
+
+    C_FUNCTIONS_BLOCKWISE   = [ 'sin', 'cos', 'const', 'lin' ]
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_num_instances : int = 1000,
+                  p_functions : list[str] = ['sin', 'cos', 'const', 'lin'],
+                  p_outlier_rate : float = 0.05,
+                  p_seed = None,
+                  p_logging = Log.C_LOG_ALL,
+                  p_block_size : int = None,
+                  **p_kwargs ):
+
+        self._init_blocks( p_block_size = p_block_size )
+        self._blockwise = all( fct in self.C_FUNCTIONS_BLOCKWISE for fct in p_functions )
+
+        super().__init__( p_num_instances = p_num_instances,
+                          p_functions = p_functions,
+                          p_outlier_rate = p_outlier_rate,
+                          p_seed = p_seed,
+                          p_logging = p_logging,
+                          **p_kwargs )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_next(self) -> Instance:
+        if self._blockwise: return super()._get_next()
+        return StreamMLProPOutliersMLPro._get_next(self)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _estimate_words(self, p_num_inst : int) -> int:
+        return int( p_num_inst * self._num_dim * 2 * ( 1 + self.p_outlier_rate ) * 1.1 ) + 64
+
+
+## -------------------------------------------------------------------------------------------------
+    def _generate_block(self, p_num_inst : int, p_words : np.ndarray):
+
+        # 1 Floats of random.random() and outlier decisions of random.uniform(0,1)
+        num_rnd = p_words.size // 2
+        rnd     = _get_random_doubles(p_words[0:2*num_rnd:2], p_words[1:2*num_rnd:2])
+        flags   = rnd <= self.p_outlier_rate
+
+
+        # 2 Determination of the decision positions. An outlier consumes the next float for its value.
+        #   Within a run of flagged floats, decisions and values alternate beginning with a decision.
+        flagged   = np.flatnonzero(flags)
+        run_start = np.ones(flagged.size, dtype=bool)
+        run_start[1:] = flagged[1:] != flagged[:-1] + 1
+        run_first = flagged[ np.maximum.accumulate( np.where(run_start, np.arange(flagged.size), 0) ) ]
+        consumed  = flagged[ ( flagged - run_first ) % 2 == 0 ] + 1
+
+        decisions = np.ones(num_rnd, dtype=bool)
+        decisions[ consumed[consumed < num_rnd] ] = False
+        decisions = np.flatnonzero(decisions)
+
+        num_dec = p_num_inst * self._num_dim
+        if decisions.size < num_dec: return None
+        decisions = decisions[:num_dec].reshape(p_num_inst, self._num_dim)
+        outliers  = flags[decisions]
+        if outliers[-1, -1] and ( decisions[-1, -1] + 1 >= num_rnd ): return None
+
+        rnd_outlier = rnd[ np.minimum(decisions + 1, num_rnd - 1) ]
+        word_ends   = 2 * ( decisions[:, -1] + 1 + outliers[:, -1] )
+
+
+        # 3 Feature values according to the functions
+        x      = np.arange(self._index, self._index + p_num_inst)
+        values = np.empty( (p_num_inst, self._num_dim) )
+        cache  = {}
+
+        for i, fct in enumerate(self._functions):
+            if fct not in cache:
+                if fct == 'sin':
+                    cache[fct] = np.array( [ math.sin( x_i * math.pi / 180 ) for x_i in x.tolist() ] ), -3
+                elif fct == 'cos':
+                    cache[fct] = np.array( [ math.cos( x_i * math.pi / 180 ) for x_i in x.tolist() ] ), -3
+                elif fct == 'const':
+                    cache[fct] = np.ones(p_num_inst), -2
+                else:
+                    cache[fct] = x.astype(np.float64), None
+
+            baseline, offset = cache[fct]
+
+            if offset is None:
+                outlier_values = ( x + rnd_outlier[:, i] * 20 ) - 10
+            else:
+                outlier_values = rnd_outlier[:, i] * 6 + offset
+
+            values[:, i] = np.where( outliers[:, i], outlier_values, baseline )
+
+        return values, word_ends
@@ -0,0 +1,7 @@
+"""
+### Extensions of MLPro's stream tasks ('mlwa.streams.tasks')
+"""
+
+from .rearranger import *
+from .ringbuffer import *
+from .recorder import *
@@ -0,0 +1,156 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Package    : mlwa.streams.tasks
+## -- Module     : rearranger.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.4.0 (2026-10-17)
+
+This module provides a rearranger task that processes all incoming instances at once as 2D arrays.
+
+"""
+
+import numpy as np
+
+from mlpro.bf.math import Element
+from mlpro.bf.streams import InstDict
+from mlpro.bf.streams.tasks import Rearranger as RearrangerMLPro
+
+from mlwa.streams.plotting import StreamTaskPlotND
+from mlwa.math import get_values_ro
+
+
+
+# Export list for public API
+__all__ = [ 'Rearranger' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class Rearranger (StreamTaskPlotND, RearrangerMLPro):
+    """
+    Drop-in replacement for class mlpro.bf.streams.tasks.Rearranger. The feature and label values of
+    all incoming instances are stacked to 2D arrays and rearranged by one column selection per
+    mapping, which is beneficial for micro-batches (see class mlwa.oa.OAStreamScenario). The ND
+    view uses a bounded plot buffer (see class mlwa.streams.StreamTaskPlotND).
+
+    Labels are only mapped for instances with label data and if the first instance provided label
+    data. Otherwise, the new features taken from labels remain zero and no label data are set.
+
+    See class mlpro.bf.streams.tasks.Rearranger for a description of the parameters.
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def _prepare_rearrangement(self, p_instance):
+
+        # 1 Feature and label spaces (a label space requires label data in the first instance)
+        features            = p_instance.get_feature_data().get_dim_ids()
+        self._feature_space = type(p_instance.get_feature_data().get_related_set())()
+
+        for f_entry in self._features_new:
+            for feature in f_entry[1]:
+                self._feature_space.add_dim(p_dim=feature)
+
+        label_data = p_instance.get_label_data()
+
+        if label_data is not None:
+            labels            = label_data.get_dim_ids()
+            self._label_space = type(label_data.get_related_set())()
+
+            for l_entry in self._labels_new:
+                for label in l_entry[1]:
+                    self._label_space.add_dim(p_dim=label)
+        else:
+            labels            = None
+            self._label_space = None
+
+
+        # 2 Mappings (new index, old index). Without label data, labels are not mapped.
+        self._mapping_f2f = []
+        self._mapping_l2f = []
+        self._mapping_f2l = []
+        self._mapping_l2l = []
+
+        for entries, mapping_f, mapping_l in [ ( self._features_new, self._mapping_f2f, self._mapping_l2f ),
+                                               ( self._labels_new, self._mapping_f2l, self._mapping_l2l ) ]:
+            i_new = 0
+            for entry in entries:
+                for dim in entry[1]:
+                    if entry[0] == 'F':
+                        mapping_f.append( ( i_new, features.index(dim.get_id()) ) )
+                    elif labels is not None:
+                        mapping_l.append( ( i_new, labels.index(dim.get_id()) ) )
+                    i_new += 1
+
+
+        # 3 Index arrays of the mappings
+        self._idx_f2f = np.array(self._mapping_f2f, dtype=np.int64).reshape(-1,2).T
+        self._idx_l2f = np.array(self._mapping_l2f, dtype=np.int64).reshape(-1,2).T
+        self._idx_f2l = np.array(self._mapping_f2l, dtype=np.int64).reshape(-1,2).T
+        self._idx_l2l = np.array(self._mapping_l2l, dtype=np.int64).reshape(-1,2).T
+
+
+## -------------------------------------------------------------------------------------------------
+    def _run(self, p_instances : InstDict):
+
+        # 1 Late preparation based on first incoming instance
+        if not self._prepared:
+            try:
+                (inst_type, inst) = next(iter(p_instances.values()))
+            except StopIteration:
+                return
+
+            self._prepare_rearrangement(p_instance=inst)
+            self._prepared = True
+
+        if len(p_instances) == 0: return
+
+
+        # 2 Stack old feature and label values. Label values are only taken from instances with label
+        #   data, and only if the first instance provided a label space.
+        instances    = [ inst for (inst_type, inst) in p_instances.values() ]
+        f_values_old = np.array([ get_values_ro(inst.get_feature_data()) for inst in instances ])
+
+        if self._label_space is not None:
+            label_data = [ inst.get_label_data() for inst in instances ]
+            rows_l     = [ i for i, l_data in enumerate(label_data) if l_data is not None ]
+        else:
+            rows_l     = []
+
+        if len(rows_l) > 0:
+            l_values_old = np.array([ get_values_ro(label_data[i]) for i in rows_l ])
+        else:
+            l_values_old = None
+
+
+        # 3 Collect new feature and label values
+        num_inst     = len(instances)
+        f_values_new = np.zeros( (num_inst, self._feature_space.get_num_dim()) )
+        f_values_new[:, self._idx_f2f[0]] = f_values_old[:, self._idx_f2f[1]]
+
+        if l_values_old is not None:
+            if self._idx_l2f.shape[1] > 0:
+                f_values_new[np.ix_(rows_l, self._idx_l2f[0])] = l_values_old[:, self._idx_l2f[1]]
+
+            l_values_new = np.zeros( (len(rows_l), self._label_space.get_num_dim()) )
+            l_values_new[:, self._idx_f2l[0]] = f_values_old[np.ix_(rows_l, self._idx_f2l[1])]
+            if self._idx_l2l.shape[1] > 0:
+                l_values_new[:, self._idx_l2l[0]] = l_values_old[:, self._idx_l2l[1]]
+
+
+        # 4 Replace feature and label data in origin instances
+        for i, inst in enumerate(instances):
+            f_data_new = Element(p_set=self._feature_space)
+            f_data_new.set_values( p_values = f_values_new[i] )
+            inst.set_feature_data(p_feature_data=f_data_new)
+
+        for j, i in enumerate(rows_l):
+            l_data_new = Element(p_set=self._label_space)
+            l_data_new.set_values( p_values = l_values_new[j] )
+            instances[i].set_label_data(p_label_data=l_data_new)
@@ -0,0 +1,110 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Package    : mlwa.streams.tasks
+## -- Module     : recorder.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-17)
+
+This module provides a stream task that records the instances passing a workflow into a stream log.
+
+"""
+
+from mlpro.bf.various import Log
+from mlpro.bf.streams import InstDict, InstTypeNew, StreamTask
+
+from mlwa.streams.recording import StreamLogWriter
+
+
+
+# Export list for public API
+__all__ = [ 'StreamTaskRecorder' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class StreamTaskRecorder (StreamTask):
+    """
+    Records all new instances it receives into a stream log (see class mlwa.streams.StreamLogWriter),
+    e.g. the output of a rearranger at the beginning of a workflow. The instances are passed on
+    unchanged. The log can be replayed by class mlwa.streams.StreamReplay.
+
+    Parameters
+    ----------
+    p_path : str
+        Path of the stream log.
+    p_append : bool
+        If True, an existing log with the same dimensions is continued. Otherwise, it is replaced.
+        Default = False.
+    p_buffer_size : int
+        Number of records collected before they are appended to the file. Default =
+        StreamLogWriter.C_BUFFER_SIZE.
+    p_name : str
+        Optional name of the task. Default = None.
+    p_range_max
+        Maximum range of asynchonicity. See class Range. Default is Range.C_RANGE_THREAD.
+    p_duplicate_data : bool
+        If True, instances will be duplicated before processing. Default = False.
+    p_visualize : bool
+        Boolean switch for visualisation. Default = False.
+    p_logging
+        Log level (see constants of class Log). Default: Log.C_LOG_ALL
+    p_kwargs : dict
+        Further optional named parameters.
+    """
+
+    C_TYPE          = 'Stream Task'
+    C_NAME          = 'Recorder'
+    C_PLOT_ACTIVE   = False
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_path : str,
+                  p_append : bool = False,
+                  p_buffer_size : int = StreamLogWriter.C_BUFFER_SIZE,
+                  p_name : str = None,
+                  p_range_max = StreamTask.C_RANGE_THREAD,
+                  p_duplicate_data : bool = False,
+                  p_visualize : bool = False,
+                  p_logging = Log.C_LOG_ALL,
+                  **p_kwargs ):
+
+        super().__init__( p_name = p_name,
+                          p_range_max = p_range_max,
+                          p_duplicate_data = p_duplicate_data,
+                          p_visualize = p_visualize,
+                          p_logging = p_logging,
+                          **p_kwargs )
+
+        self._writer = StreamLogWriter( p_path = p_path,
+                                        p_name = self.get_name(),
+                                        p_append = p_append,
+                                        p_buffer_size = p_buffer_size,
+                                        p_logging = p_logging )
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_writer(self) -> StreamLogWriter:
+        return self._writer
+
+
+## -------------------------------------------------------------------------------------------------
+    def _run(self, p_instances : InstDict):
+
+        for (inst_type, inst) in p_instances.values():
+            if inst_type == InstTypeNew: self._writer.write(inst)
+
+
+## -------------------------------------------------------------------------------------------------
+    def close(self):
+        """
+        Writes the remaining records and closes the stream log.
+        """
+
+        self._writer.close()
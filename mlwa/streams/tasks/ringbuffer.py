@@ -0,0 +1,337 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Package    : mlwa.streams.tasks
+## -- Module     : ringbuffer.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.3.0 (2026-10-17)
+
+This module provides a ring buffer with incremental window statistics.
+
+"""
+
+from collections import deque
+from typing import Union
+
+import numpy as np
+
+from mlpro.bf.various import Log
+from mlpro.bf.math import Dimension
+from mlpro.bf.math.statistics import Boundaries, BoundarySide
+from mlpro.bf.streams import InstDict, InstTypeNew, InstTypeDel, StreamTask
+from mlpro.bf.streams.tasks import RingBuffer as RingBufferMLPro
+
+from mlwa.math import get_values_ro
+
+
+
+# Export list for public API
+__all__ = [ 'RingBuffer' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class RingBuffer (RingBufferMLPro):
+    """
+    Drop-in replacement for class mlpro.bf.streams.tasks.RingBuffer. The numeric feature values of
+    the window are stored in a preallocated array addressed by the buffer position. Boundaries, mean
+    and variance of the window are maintained incrementally on each insert/evict:
+
+    - minimum and maximum by one monotonic deque per dimension,
+    - mean and variance by Welford's algorithm (extended by the removal of values).
+
+    This way, the statistics cost O(1) amortized per instance instead of O(buffer size), so that
+    large windows can be used as boundary provider (see class mlpro.oa.streams.tasks.BoundaryDetector).
+    Missing values (NaN) are ignored.
+
+    If an instance is buffered and evicted within the same run (micro-batches larger than the buffer,
+    see class mlwa.oa.OAStreamScenario), it is neither forwarded as new nor as obsolete instance.
+
+    See class mlpro.bf.streams.tasks.RingBuffer for a description of the parameters.
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_buffer_size : int,
+                  p_delay : bool = False,
+                  p_enable_statistics : bool = False,
+                  p_name : str = None,
+                  p_range_max = StreamTask.C_RANGE_THREAD,
+                  p_duplicate_data : bool = False,
+                  p_visualize : bool = False,
+                  p_logging = Log.C_LOG_ALL,
+                  **p_kwargs ):
+
+        super().__init__( p_buffer_size = p_buffer_size,
+                          p_delay = p_delay,
+                          p_enable_statistics = p_enable_statistics,
+                          p_name = p_name,
+                          p_range_max = p_range_max,
+                          p_duplicate_data = p_duplicate_data,
+                          p_visualize = p_visualize,
+                          p_logging = p_logging,
+                          **p_kwargs )
+
+        self._seq           = 0
+        self._numeric_idx   = None
+        self._deques_min    = None
+        self._deques_max    = None
+        self._stat_count    = None
+        self._stat_mean     = None
+        self._stat_m2       = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def reset(self, **p_kwargs):
+        """
+        Empties the buffer and resets the incremental statistics. The numeric features are determined
+        again on the next instance.
+        """
+
+        super().reset(**p_kwargs)
+
+        self._buffer            = {}
+        self._buffer_pos        = 0
+        self._buffer_full       = False
+        self._boundaries        = None
+        self._numeric_buffer    = None
+        self._numeric_features  = []
+        self._seq               = 0
+        self._numeric_idx       = None
+        self._deques_min        = None
+        self._deques_max        = None
+        self._stat_count        = None
+        self._stat_mean         = None
+        self._stat_m2           = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def _init_statistics(self, p_feature_data):
+        """
+        Determines the numeric features and sets up the internal data structures for the statistics.
+        """
+
+        for j in p_feature_data.get_dim_ids():
+            if p_feature_data.get_related_set().get_dim(j).get_base_set() in [ Dimension.C_BASE_SET_N,
+                                                                               Dimension.C_BASE_SET_R,
+                                                                               Dimension.C_BASE_SET_Z ]:
+                self._numeric_features.append(j)
+
+        ids                  = p_feature_data.get_dim_ids()
+        self._numeric_idx    = [ ids.index(j) for j in self._numeric_features ]
+        num_dim              = len(self._numeric_features)
+        self._numeric_buffer = np.full((self.buffer_size, num_dim), np.nan)
+        self._deques_min     = [ deque() for i in range(num_dim) ]
+        self._deques_max     = [ deque() for i in range(num_dim) ]
+        self._stat_count     = np.zeros(num_dim, dtype=np.int64)
+        self._stat_mean      = np.zeros(num_dim)
+        self._stat_m2        = np.zeros(num_dim)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _update_statistics(self, p_values : np.ndarray, p_values_del : np.ndarray):
+        """
+        Updates the incremental statistics by a new and an optionally evicted value vector.
+
+        Parameters
+        ----------
+        p_values : np.ndarray
+            Numeric feature values of the new instance.
+        p_values_del : np.ndarray
+            Numeric feature values of the evicted instance or None.
+        """
+
+        seq = self._seq
+
+        # 1 Evicted values
+        if p_values_del is not None:
+            seq_del = seq - self.buffer_size
+
+            for dq in self._deques_min:
+                if ( len(dq) > 0 ) and ( dq[0][0] == seq_del ): dq.popleft()
+
+            for dq in self._deques_max:
+                if ( len(dq) > 0 ) and ( dq[0][0] == seq_del ): dq.popleft()
+
+            valid                    = ~np.isnan(p_values_del)
+            self._stat_count[valid] -= 1
+            count                    = self._stat_count[valid]
+            empty                    = count == 0
+            delta                    = p_values_del[valid] - self._stat_mean[valid]
+            mean                     = self._stat_mean[valid] - np.divide(delta, count, out=np.zeros_like(delta), where=~empty)
+            m2                       = self._stat_m2[valid] - delta * (p_values_del[valid] - mean)
+            mean[empty]              = 0
+            m2[empty]                = 0
+            self._stat_mean[valid]   = mean
+            self._stat_m2[valid]     = np.maximum(m2, 0)
+
+
+        # 2 New values
+        for d, value in enumerate(p_values.tolist()):
+            if value != value: continue
+
+            dq = self._deques_min[d]
+            while ( len(dq) > 0 ) and ( dq[-1][1] >= value ): dq.pop()
+            dq.append( (seq, value) )
+
+            dq = self._deques_max[d]
+            while ( len(dq) > 0 ) and ( dq[-1][1] <= value ): dq.pop()
+            dq.append( (seq, value) )
+
+        valid                    = ~np.isnan(p_values)
+        self._stat_count[valid] += 1
+        delta                    = p_values[valid] - self._stat_mean[valid]
+        self._stat_mean[valid]  += delta / self._stat_count[valid]
+        self._stat_m2[valid]    += delta * (p_values[valid] - self._stat_mean[valid])
+
+        self._seq += 1
+
+
+## -------------------------------------------------------------------------------------------------
+    def _run(self, p_instances : InstDict):
+
+        # 0 Intro
+        instances = p_instances.copy()
+        p_instances.clear()
+
+
+        # 1 Main processing loop
+        for inst_id, (inst_type, instance) in sorted(instances.items()):
+
+            if inst_type != InstTypeNew:
+                # Obsolete instances need to be removed from the buffer (not yet implemented)
+                self.log(self.C_LOG_TYPE_W, 'Handling of obsolete data not yet implemented')
+                continue
+
+
+            # 1.1 A new instance is to be buffered
+            feature_data = instance.get_feature_data()
+
+            if self._numeric_buffer is None and self._statistics_enabled:
+                self._init_statistics( p_feature_data = feature_data )
+
+
+            # 1.2 Internal ring buffer already filled?
+            if len(self._buffer) == self.buffer_size:
+
+                # The oldest instance is extracted from the buffer and forwarded
+                instance_del = self._buffer[self._buffer_pos]
+                instance_del.tstamp = self.get_so().tstamp
+                if instance_del.id in p_instances:
+                    # Buffered and evicted within the same run -> neither new nor obsolete
+                    del p_instances[instance_del.id]
+                else:
+                    p_instances[instance_del.id] = ( InstTypeDel, instance_del )
+
+                p_instances[instance.id] = ( InstTypeNew, instance )
+                values_del = self._numeric_buffer[self._buffer_pos].copy() if self._statistics_enabled else None
+
+            else:
+                if not self._delay: p_instances[instance.id] = ( InstTypeNew, instance )
+                values_del = None
+
+
+            # 1.3 New instance is buffered
+            self._buffer[self._buffer_pos] = instance
+
+
+            # 1.4 Update of internal statistics
+            if self._statistics_enabled:
+                values = np.asarray(get_values_ro(feature_data), dtype=np.float64)[self._numeric_idx]
+                self._numeric_buffer[self._buffer_pos] = values
+                self._update_statistics( p_values = values, p_values_del = values_del )
+
+
+            # 1.5 Increment of buffer position
+            self._buffer_pos = (self._buffer_pos + 1) % self.buffer_size
+
+
+            # 1.6 Forward the buffered instances once the buffer is filled
+            if ( not self._buffer_full ) and ( len(self._buffer) == self.buffer_size ):
+                self._buffer_full = True
+
+                if self._delay:
+                    for i in range(self.buffer_size):
+                        instance_fwd = self._buffer[i]
+                        p_instances[instance_fwd.id] = ( InstTypeNew, instance_fwd )
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_boundaries( self,
+                        p_dim : int = None,
+                        p_side : BoundarySide = None,
+                        p_copy : bool = False ) -> Union[Boundaries, float]:
+        """
+        Returns the current value boundaries of the buffered data in O(1) per dimension. See method
+        mlpro.bf.streams.tasks.RingBuffer.get_boundaries() for further details.
+        """
+
+        # 1 Initialize boundary structure if not yet done
+        if self._boundaries is None:
+            if self._numeric_buffer is None: return None
+            self._boundaries = self._create_boundaries( p_num_dim = self._numeric_buffer.shape[1] )
+
+
+        # 2 Update of the requested boundaries from the fronts of the monotonic deques
+        dims  = range(self._boundaries.shape[0]) if p_dim is None else [p_dim]
+        sides = [ BoundarySide.LOWER, BoundarySide.UPPER ] if p_side is None else [p_side]
+
+        for side in sides:
+            deques = self._deques_min if side == BoundarySide.LOWER else self._deques_max
+            for dim in dims:
+                dq = deques[dim]
+                self._boundaries[dim, side] = dq[0][1] if len(dq) > 0 else np.nan
+
+
+        # 3 Return result (copy if requested)
+        if p_dim is None:
+            result = self._boundaries if p_side is None else self._boundaries[:, p_side]
+        elif p_side is None:
+            result = self._boundaries[p_dim, :]
+        else:
+            return self._boundaries[p_dim, p_side]
+
+        return result.copy() if p_copy else result
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_mean(self) -> np.ndarray:
+        """
+        Returns the mean of the numeric features of the buffered data.
+        """
+
+        if self._stat_count is None: return None
+
+        mean = self._stat_mean.copy()
+        mean[self._stat_count == 0] = np.nan
+        return mean
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_variance(self) -> np.ndarray:
+        """
+        Returns the (population) variance of the numeric features of the buffered data.
+        """
+
+        if self._stat_count is None: return None
+
+        count = self._stat_count
+        return np.divide( self._stat_m2, count, out=np.full(count.shape, np.nan), where=count > 0 )
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_std_deviation(self) -> np.ndarray:
+        """
+        Returns the standard deviation of the numeric features of the buffered data.
+        """
+
+        variance = self.get_variance()
+        if variance is None: return None
+
+        return np.sqrt(variance)
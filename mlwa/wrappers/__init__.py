@@ -0,0 +1,6 @@
+"""
+### Extended wrappers of MLPro's integration packages ('mlwa.wrappers')
+
+The modules of this package depend on optional third-party packages and need to be imported explicitly,
+e.g. 'from mlwa.wrappers.openml import WrStreamProviderOpenML'.
+"""
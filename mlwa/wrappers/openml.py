@@ -0,0 +1,483 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Package    : mlwa.wrappers
+## -- Module     : openml.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.3.0 (2026-10-16)
+
+This module provides drop-in replacements for the OpenML stream provider and streams of the
+integration package mlpro_int_openml. The streams provide random access to their instances (see
+class mlwa.streams.StreamSeekable).
+
+Data sets are requested by id without accessing the online list of all OpenML data sets. Local copies
+of data sets (like folder example1/dataset of this repository) are provided to the OpenML cache
+automatically. On first access, a data set is converted once into a columnar cache consisting of one
+NumPy file per feature and a pickled file with the meta data. Later accesses open these files as
+memory maps, so that neither ARFF/XML parsing nor a data frame of the entire data set is required.
+Optionally, only a subset of the feature columns is read (see class mlwa.streams.StreamColumnar).
+
+"""
+
+import os
+import shutil
+import pickle
+
+import numpy as np
+
+from mlpro.bf.various import Log
+from mlpro.bf.ops import Mode
+from mlpro.bf.math import Element, MSpace
+from mlpro.bf.streams import Feature, Label, Instance, Stream
+
+from mlpro_int_openml.wrappers.streams import WrStreamProviderOpenML as WrStreamProviderOpenMLRoot
+from mlpro_int_openml.wrappers.streams import WrStreamOpenML as WrStreamOpenMLRoot
+
+from mlwa.streams import InstanceCOW, StreamSeekable, StreamColumnar
+
+import openml
+
+
+
+# Export list for public API
+__all__ = [ 'WrStreamProviderOpenML',
+            'WrStreamOpenML' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class WrStreamProviderOpenML (WrStreamProviderOpenMLRoot):
+    """
+    Drop-in replacement for class mlpro_int_openml.WrStreamProviderOpenML that provides seekable
+    OpenML streams of type mlwa.wrappers.openml.WrStreamOpenML.
+
+    Parameters
+    ----------
+    p_local_dirs : list
+        Optional list of local folders containing copies of OpenML data sets in subfolders named by
+        the data set id. Default = None.
+    p_cache_dir : str
+        Optional root folder of the columnar cache. Default = None (subfolder 'columnar' of the OpenML
+        cache directory).
+    p_logging
+        Log level of stream objects (see constants of class Log). Default: Log.C_LOG_ALL.
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_local_dirs : list = None,
+                  p_cache_dir : str = None,
+                  p_logging = Log.C_LOG_ALL ):
+
+        super().__init__( p_logging = p_logging )
+
+        self._local_dirs = p_local_dirs or []
+        self._cache_dir  = p_cache_dir
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_stream_list(self, p_mode=Mode.C_MODE_SIM, p_logging=Log.C_LOG_ALL, **p_kwargs) -> list:
+
+        if len(self._stream_list) == 0:
+            list_datasets = openml.datasets.list_datasets(output_format='dataframe')
+
+            for row_id, row_data in list_datasets.iterrows():
+                id            = row_data.get('did', '')
+                name          = row_data.get('name', '')
+                num_instances = row_data.get('NumberOfInstances', 0)
+                version       = row_data.get('Version', 0)
+
+                s = WrStreamOpenML( p_id = id,
+                                    p_name = name,
+                                    p_num_instances = num_instances,
+                                    p_version = version,
+                                    p_cache_dir = self._cache_dir,
+                                    p_mode = p_mode,
+                                    p_logging = Log.C_LOG_WE )
+
+                self._stream_list.append(s)
+                self._stream_ids.append(id)
+                self._stream_names.append(name)
+
+        return self._stream_list
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_stream(self, p_id: str = None, p_name: str = None, p_mode=Mode.C_MODE_SIM, p_logging=Log.C_LOG_ALL, **p_kwargs) -> Stream:
+        """
+        Custom implementation to fetch an OpenML stream object. Streams requested by id are set up
+        directly (offline-first). Streams requested by name are looked up in the online list of OpenML
+        data sets.
+        """
+
+        if p_id is None:
+            return super()._get_stream( p_id = p_id, p_name = p_name, p_mode = p_mode, p_logging = p_logging, **p_kwargs )
+
+        self._provide_local_copy( p_id = int(p_id) )
+
+        stream = WrStreamOpenML( p_id = int(p_id),
+                                 p_name = '',
+                                 p_num_instances = 0,
+                                 p_version = '',
+                                 p_cache_dir = self._cache_dir,
+                                 p_mode = p_mode,
+                                 p_logging = p_logging,
+                                 **p_kwargs )
+
+        stream.log(Log.C_LOG_TYPE_I, 'Ready to access in mode', p_mode)
+
+        return stream
+
+
+## -------------------------------------------------------------------------------------------------
+    def _provide_local_copy(self, p_id : int):
+        """
+        Copies the local copy of a data set into the OpenML cache, if the data set is not yet cached.
+
+        Parameters
+        ----------
+        p_id : int
+            Id of the data set.
+        """
+
+        if len(self._local_dirs) == 0: return
+
+        openml_dir = os.path.join( openml.config.get_cache_directory(), 'datasets', str(p_id) )
+        if os.path.isdir(openml_dir): return
+
+        for local_dir in self._local_dirs:
+            local_copy = os.path.join(local_dir, str(p_id))
+            if not os.path.isdir(local_copy): continue
+
+            shutil.copytree(local_copy, openml_dir)
+            self.log(self.C_LOG_TYPE_I, 'Local copy', local_copy, 'provided in OpenML cache', openml_dir)
+            return
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class WrStreamOpenML (StreamSeekable, StreamColumnar, WrStreamOpenMLRoot):
+    """
+    Drop-in replacement for class mlpro_int_openml.WrStreamOpenML. The data set is read from a
+    memory-mapped columnar cache that is created once on first access. Instances are accessed by
+    index, so that method seek() moves the stream without materializing the skipped instances. Method
+    select_features() restricts the columns read to the features actually needed. The stream provides
+    copy-on-write instances (see class mlwa.streams.InstanceCOW).
+
+    Parameters
+    ----------
+    p_id
+        Id of the stream.
+    p_name : str
+        Name of the stream.
+    p_num_instances : int
+        Number of instances in the stream.
+    p_version : str
+        Version of the stream. Default = ''.
+    p_cache_dir : str
+        Optional root folder of the columnar cache. Default = None (subfolder 'columnar' of the OpenML
+        cache directory).
+    p_mode
+        Operation mode. Valid values are stored in constant C_VALID_MODES.
+    p_logging
+        Log level (see constants of class Log). Default: Log.C_LOG_ALL.
+    p_kwargs : dict
+        Further stream specific parameters. See class mlpro_int_openml.WrStreamOpenML.
+    """
+
+    C_CACHE_VERSION     = 1
+    C_CACHE_META        = 'meta.pkl'
+
+    # Number of rows gathered from the feature columns at once
+    C_BLOCK_SIZE        = 1024
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_id,
+                  p_name : str,
+                  p_num_instances : int,
+                  p_version : str,
+                  p_cache_dir : str = None,
+                  p_mode = Mode.C_MODE_SIM,
+                  p_logging = Log.C_LOG_ALL,
+                  **p_kwargs ):
+
+        self._cache_dir          = p_cache_dir
+        self._meta               = None
+        self._selected_indices   = None
+        self._inst_feature_space = None
+
+        super().__init__( p_id = p_id,
+                          p_name = p_name,
+                          p_num_instances = p_num_instances,
+                          p_version = p_version,
+                          p_mode = p_mode,
+                          p_logging = p_logging,
+                          **p_kwargs )
+
+        meta = self._read_cache_meta()
+        if meta is not None: self._set_meta(meta)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_cache_path(self) -> str:
+        """
+        Returns the folder of the columnar cache of this stream.
+        """
+
+        if self._cache_dir is None:
+            self._cache_dir = os.path.join(openml.config.get_cache_directory(), 'columnar')
+
+        return os.path.join(self._cache_dir, str(self._id))
+
+
+## -------------------------------------------------------------------------------------------------
+    def _read_cache_meta(self) -> dict:
+        try:
+            with open(os.path.join(self.get_cache_path(), self.C_CACHE_META), 'rb') as f:
+                meta = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+        if meta.get('cache_version') != self.C_CACHE_VERSION: return None
+        return meta
+
+
+## -------------------------------------------------------------------------------------------------
+    def _set_meta(self, p_meta : dict):
+        self._meta          = p_meta
+        self._label         = p_meta['label']
+        self._num_instances = p_meta['num_instances']
+        self._version       = p_meta['version']
+
+        if self._name in [None, '']:
+            self._name  = p_meta['name']
+            self.C_NAME = self.C_SCIREF_TITLE = p_meta['name']
+
+        self.C_SCIREF_URL, self.C_SCIREF_AUTHOR, self.C_SCIREF_ABSTRACT = p_meta['sciref']
+
+
+## -------------------------------------------------------------------------------------------------
+    def _build_cache(self, p_options : dict):
+        """
+        Downloads/parses the data set once via OpenML and converts it into the columnar cache.
+
+        Parameters
+        ----------
+        p_options : dict
+            Stream options the cache is built for.
+        """
+
+        self.log(self.C_LOG_TYPE_I, 'Building columnar cache...')
+        WrStreamOpenMLRoot._download(self)
+
+        cache_path = self.get_cache_path()
+        tmp_path   = cache_path + '.tmp'
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        os.makedirs(tmp_path)
+
+        data, labels, _, features = self._dataset
+        columns = []
+
+        for i, feature in enumerate(features):
+            try:
+                values  = data[feature].to_numpy(dtype=np.float64)
+                numeric = True
+            except (ValueError, TypeError):
+                values  = data[feature].to_numpy(dtype=object)
+                numeric = False
+
+            file = 'f_' + str(i) + '.npy'
+            np.save(os.path.join(tmp_path, file), values, allow_pickle=not numeric)
+            columns.append( (file, numeric) )
+
+        if labels is not None:
+            try:
+                values  = labels.to_numpy(dtype=np.float64)
+                numeric = True
+            except (ValueError, TypeError):
+                values  = labels.to_numpy(dtype=object)
+                numeric = False
+
+            np.save(os.path.join(tmp_path, 'label.npy'), values, allow_pickle=not numeric)
+            label_column = ('label.npy', numeric)
+        else:
+            label_column = None
+
+        meta = dict( cache_version = self.C_CACHE_VERSION,
+                     options = p_options,
+                     name = self._stream_meta.name,
+                     version = self._stream_meta.version,
+                     num_instances = len(data),
+                     features = [ str(feature) for feature in features ],
+                     label = self._label if labels is not None else '',
+                     columns = columns,
+                     label_column = label_column,
+                     sciref = ( self.C_SCIREF_URL, self.C_SCIREF_AUTHOR, self.C_SCIREF_ABSTRACT ) )
+
+        with open(os.path.join(tmp_path, self.C_CACHE_META), 'wb') as f:
+            pickle.dump(meta, f)
+
+        shutil.rmtree(cache_path, ignore_errors=True)
+        os.replace(tmp_path, cache_path)
+
+        self._dataset     = None
+        self._stream_meta = None
+        self.log(self.C_LOG_TYPE_I, 'Columnar cache created in', cache_path)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _download(self) -> bool:
+        """
+        Opens the columnar cache of the data set. On first access or if the stream options have
+        changed, the data set is fetched via OpenML and the cache is (re)built before.
+
+        Returns
+        -------
+        bool
+            True, if the data set is available.
+        """
+
+        options = self._kwargs.copy()
+        meta    = self._read_cache_meta()
+
+        if ( meta is None ) or ( meta['options'] != options ):
+            self._build_cache( p_options = options )
+            meta = self._read_cache_meta()
+
+        self._set_meta(meta)
+
+        cache_path    = self.get_cache_path()
+        self._columns = []
+
+        for file, numeric in meta['columns']:
+            self._columns.append( self._open_column( os.path.join(cache_path, file), numeric ) )
+
+        if meta['label_column'] is not None:
+            file, numeric = meta['label_column']
+            self._labels  = self._open_column( os.path.join(cache_path, file), numeric )
+        else:
+            self._labels  = None
+
+        return True
+
+
+## -------------------------------------------------------------------------------------------------
+    def _open_column(self, p_path : str, p_numeric : bool) -> np.ndarray:
+        if p_numeric:
+            return np.load(p_path, mmap_mode='r')
+        else:
+            return np.load(p_path, allow_pickle=True)
+
+
+## --------------------------------------------------------------------------------------------------
+    def _setup_feature_space(self) -> MSpace:
+        if not self._downloaded:
+            self._downloaded = self._download()
+
+        feature_space = MSpace()
+
+        for feature in self._meta['features']:
+            feature_space.add_dim(Feature(p_name_short=feature, p_name_long=feature))
+
+        return feature_space
+
+
+## --------------------------------------------------------------------------------------------------
+    def _setup_label_space(self) -> MSpace:
+        if not self._downloaded:
+            self._downloaded = self._download()
+
+        if self._labels is None: return None
+
+        label_space = MSpace()
+        label_space.add_dim(Label(p_name_short=str(self._label), p_name_long=str(self._label)))
+        return label_space
+
+
+## -------------------------------------------------------------------------------------------------
+    def _reset(self):
+
+        # Just to ensure the availability of the data and set up of feature and label space
+        self.get_feature_space()
+        self.get_label_space()
+
+        if self._inst_feature_space is None:
+            self._inst_feature_space = self._feature_space
+
+        self._index       = 0
+        self._block       = None
+        self._block_start = 0
+        self._block_stop  = 0
+
+
+## -------------------------------------------------------------------------------------------------
+    def _select_features(self, p_indices : list):
+
+        self._selected_indices = p_indices
+
+        if p_indices is None:
+            self._inst_feature_space = self._feature_space
+        else:
+            self._inst_feature_space = MSpace()
+            for i in p_indices:
+                self._inst_feature_space.add_dim( p_dim = self._feature_space.get_dim_by_name(self._meta['features'][i]) )
+
+        self._block       = None
+        self._block_start = 0
+        self._block_stop  = 0
+
+
+## -------------------------------------------------------------------------------------------------
+    def _seek(self, p_index : int):
+        self._index = p_index
+
+
+## -------------------------------------------------------------------------------------------------
+    def _load_block(self):
+        """
+        Gathers the rows of the next block from the (selected) feature columns.
+        """
+
+        if self._selected_indices is None:
+            columns = self._columns
+        else:
+            columns = [ self._columns[i] for i in self._selected_indices ]
+
+        self._block_start = self._index
+        self._block_stop  = min(self._index + self.C_BLOCK_SIZE, self._num_instances)
+        self._block       = np.column_stack([ column[self._block_start:self._block_stop] for column in columns ])
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_next(self) -> Instance:
+
+        # 1 Determine feature data
+        if self._index >= self._num_instances: raise StopIteration
+
+        if not ( self._block_start <= self._index < self._block_stop ):
+            self._load_block()
+
+        feature_data = Element( self._inst_feature_space )
+        feature_data.set_values( p_values = self._block[self._index - self._block_start].copy() )
+
+
+        # 2 Determine label data
+        if self._label_space is not None:
+            label_data = Element( self._label_space )
+            label_data.set_values( [ self._labels[self._index] ] )
+        else:
+            label_data = None
+
+        self._index += 1
+
+        return InstanceCOW( p_feature_data = feature_data, p_label_data = label_data )
@@ -0,0 +1,220 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Package    : mlwa.wrappers
+## -- Module     : river.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.2.0 (2026-10-17)
+
+This module provides a drop-in replacement for the KMeans wrapper of the integration package
+mlpro_int_river. The cluster centroids are kept in a contiguous NumPy array that is mirrored to the
+dict-based state of River, so that a renormalization is a single vectorized operation. Feature
+values are passed to River by a reusable feature dictionary with cached keys.
+
+"""
+
+import numpy as np
+
+from mlpro.bf.various import Log
+from mlpro.bf.mt import Task as MLTask
+from mlpro.bf.math.normalizers import Normalizer
+from mlpro.bf.streams import Instance
+
+from mlpro_int_river.wrappers.clusteranalyzers import WrRiverKMeans2MLPro as WrRiverKMeans2MLProRoot
+
+from mlwa.math import get_values_ro
+
+
+
+# Export list for public API
+__all__ = [ 'WrRiverKMeans2MLPro' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class _FeatureDict:
+    """
+    Internal adapter between NumPy feature vectors and River feature dictionaries. The feature keys
+    are determined once. A single dictionary is reused for all instances, since River's KMeans does
+    not keep references to it.
+
+    Parameters
+    ----------
+    p_num_dim : int
+        Number of feature dimensions.
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_num_dim : int):
+
+        self.keys  = tuple(range(1, p_num_dim + 1))
+        self._dict = dict.fromkeys(self.keys, 0.0)
+
+
+## -------------------------------------------------------------------------------------------------
+    def to_dict(self, p_values : np.ndarray) -> dict:
+        """
+        Returns the reused feature dictionary filled with the given values.
+        """
+
+        self._dict.update( zip(self.keys, p_values.tolist()) )
+        return self._dict
+
+
+## -------------------------------------------------------------------------------------------------
+    def to_array(self, p_dict : dict, p_out : np.ndarray):
+        """
+        Copies the values of a River dictionary (e.g. a cluster center) into the given array.
+        """
+
+        p_out[:] = list( map(p_dict.__getitem__, self.keys) )
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class WrRiverKMeans2MLPro (WrRiverKMeans2MLProRoot):
+    """
+    Drop-in replacement for class mlpro_int_river.wrappers.clusteranalyzers.WrRiverKMeans2MLPro.
+    The centroids of all clusters are stored in a NumPy array of shape (n_clusters, n_dims) and the
+    cluster sizes in a NumPy array of shape (n_clusters,). Row i belongs to the cluster with id i.
+
+    On adaptation, River moves the center of the closest cluster only. Hence, only this row and the
+    related MLPro cluster are updated. On renormalization, all centroids are renormalized at once
+    and written back to River and the MLPro clusters.
+
+    See class mlpro_int_river.wrappers.clusteranalyzers.WrRiverKMeans2MLPro for a description of
+    the parameters.
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_name : str = None,
+                  p_range_max = MLTask.C_RANGE_THREAD,
+                  p_ada : bool = True,
+                  p_visualize : bool = False,
+                  p_logging = Log.C_LOG_ALL,
+                  p_n_clusters : int = 5,
+                  p_halflife : float = 0.5,
+                  p_mu : float = 0,
+                  p_sigma : float = 1,
+                  p_p : int = 2,
+                  p_seed : int = None,
+                  **p_kwargs ):
+
+        super().__init__( p_name = p_name,
+                          p_range_max = p_range_max,
+                          p_ada = p_ada,
+                          p_visualize = p_visualize,
+                          p_logging = p_logging,
+                          p_n_clusters = p_n_clusters,
+                          p_halflife = p_halflife,
+                          p_mu = p_mu,
+                          p_sigma = p_sigma,
+                          p_p = p_p,
+                          p_seed = p_seed,
+                          **p_kwargs )
+
+        self._centroids    = None
+        self._sizes        = None
+        self._feature_dict = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def _init_centroids(self, p_num_dim : int):
+        """
+        Creates the centroid and size arrays and takes over the current centers from River.
+        """
+
+        centers         = self._river_algo.centers
+        self._centroids = np.zeros( (len(centers), p_num_dim), dtype=np.float64 )
+        self._sizes     = np.zeros( len(centers), dtype=np.int64 )
+
+        for cluster_id in sorted(centers.keys()):
+            self._feature_dict.to_array( centers[cluster_id], self._centroids[cluster_id] )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _adapt(self, p_instance_new : Instance) -> bool:
+
+        # 1 River adaptation on the new instance
+        feature_values = np.asarray(get_values_ro(p_instance_new.get_feature_data()), dtype=np.float64).ravel()
+        if self._feature_dict is None: self._feature_dict = _FeatureDict( p_num_dim = feature_values.size )
+
+        self.log(self.C_LOG_TYPE_I, 'Cluster is adapted...')
+        closest = self._river_algo.learn_predict_one( self._feature_dict.to_dict(feature_values) )
+
+
+        # 2 Mirror the moved center and the cluster size
+        if self._centroids is None:
+            self._init_centroids( p_num_dim = feature_values.size )
+            self._get_clusters()
+        else:
+            self._feature_dict.to_array( self._river_algo.centers[closest], self._centroids[closest] )
+
+        self._sizes[closest] += 1
+
+        cluster = self._clusters[closest]
+        cluster.centroid.value = self._centroids[closest]
+        cluster.size.value     = int(self._sizes[closest])
+
+        return True
+
+
+## -------------------------------------------------------------------------------------------------
+    def _renormalize(self, p_normalizer : Normalizer):
+        """
+        Internal renormalization of all clusters by a single vectorized operation on the centroid
+        array. The results are written back to River and the MLPro clusters.
+
+        Parameters
+        ----------
+        p_normalizer : Normalizer
+            Normalizer object to be applied on task-specific
+        """
+
+        if self._centroids is None: return
+
+        self._centroids = np.asarray( p_normalizer.renormalize( p_data = self._centroids ), dtype=np.float64 )
+
+        for cluster_id, centroid in enumerate(self._centroids):
+            self._river_algo.centers[cluster_id].update( zip(self._feature_dict.keys, centroid.tolist()) )
+            self._clusters[cluster_id].centroid.value = centroid
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_centroids(self) -> np.ndarray:
+        """
+        Returns the centroids of all clusters.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (n_clusters, n_dims). Row i contains the centroid of the cluster with id i.
+            None, if no instance has been processed yet.
+        """
+
+        return self._centroids
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_cluster_sizes(self) -> np.ndarray:
+        """
+        Returns the sizes of all clusters.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (n_clusters,). Entry i contains the number of instances assigned to the
+            cluster with id i. None, if no instance has been processed yet.
+        """
+
+        return self._sizes
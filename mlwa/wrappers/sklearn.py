@@ -0,0 +1,250 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Package    : mlwa.wrappers
+## -- Module     : sklearn.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.2.0 (2026-10-17)
+
+This module provides a drop-in replacement for the anomaly detector wrapper of the integration
+package mlpro_int_sklearn. The instances are buffered in a ring buffer and scored block-wise, either
+by a single fit_predict() call on the window or by a single predict() call of a reused model on the
+instances that have not been scored yet. Detected anomalies are buffered in a bounded anomaly store
+with a time index.
+
+"""
+
+import numpy as np
+from sklearn.base import OutlierMixin
+
+from mlpro.bf.exceptions import ParamError
+from mlpro.bf.various import Log
+from mlpro.bf.streams import StreamTask, Instance, InstDict, InstTypeNew
+from mlpro.oa.streams.tasks.changedetectors.anomalydetectors.anomalies.instancebased import PointAnomaly
+
+from mlpro_int_sklearn.wrappers.anomalydetectors import WrAnomalyDetectorSklearn2MLPro as WrAnomalyDetectorSklearn2MLProRoot
+
+from mlwa.oa.tasks import AnomalyStore
+from mlwa.math import get_values_ro
+
+
+
+# Export list for public API
+__all__ = [ 'WrAnomalyDetectorSklearn2MLPro' ]
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class WrAnomalyDetectorSklearn2MLPro (WrAnomalyDetectorSklearn2MLProRoot):
+    """
+    Drop-in replacement for class mlpro_int_sklearn.wrappers.anomalydetectors.WrAnomalyDetectorSklearn2MLPro.
+    With the default parameters, it raises the same anomalies as the original wrapper. The instance
+    buffer is a ring buffer in both modes (sliding window and block mode), so that new instances are
+    not shifted through the buffer. The chronological window is arranged once per detection.
+
+    Two optional extensions reduce the number of scikit-learn calls:
+
+    - Batch scoring (p_batch_scoring=True): all new instances of a run (micro-batches, see class
+      mlwa.oa.OAStreamScenario) are added to the window before a single detection takes place. A
+      detection is brought forward only if the window would otherwise lose instances that have not
+      been scored yet.
+
+    - Model reuse (p_refit_tolerance): the algorithm is only refitted if the window has materially
+      changed since the last fit, i.e. the mean or the standard deviation of a feature deviates by
+      more than p_refit_tolerance times the standard deviation at the last fit. Otherwise, only the
+      instances not scored yet are scored by a single predict() call of the fitted model. This
+      requires an algorithm providing the method predict() (e.g. IsolationForest, EllipticEnvelope or
+      LocalOutlierFactor with novelty=True). Algorithms without the method fit_predict() (e.g.
+      LocalOutlierFactor with novelty=True) are fitted and applied by fit() and predict().
+
+    The anomalies are buffered in an anomaly store (see class mlwa.oa.tasks.AnomalyStore). If the
+    algorithm provides outlier factors of the fitted samples (e.g. LocalOutlierFactor), they are
+    stored as scores of the anomalies.
+
+    See class mlpro_int_sklearn.wrappers.anomalydetectors.WrAnomalyDetectorSklearn2MLPro for a
+    description of the remaining parameters.
+
+    Parameters
+    ----------
+    p_anomaly_max_age
+        Maximum age of buffered anomalies relative to the newest one (see class
+        mlwa.oa.tasks.AnomalyStore). Default = None (unlimited).
+    p_batch_scoring : bool
+        If True, all new instances of a run are scored at once. Default = False.
+    p_refit_tolerance : float
+        Relative tolerance for the reuse of the fitted algorithm. Default = None (refit on each
+        detection).
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def __init__( self,
+                  p_algo_scikit_learn : OutlierMixin,
+                  p_range_max = StreamTask.C_RANGE_THREAD,
+                  p_duplicate_data = False,
+                  p_visualize = False,
+                  p_logging = Log.C_LOG_ALL,
+                  p_anomaly_buffer_size = 100,
+                  p_instance_buffer_size : int = 20,
+                  p_detection_steprate : int = 1,
+                  p_group_anomaly_det : bool = True,
+                  p_anomaly_max_age = None,
+                  p_batch_scoring : bool = False,
+                  p_refit_tolerance : float = None,
+                  **p_kwargs ):
+
+        if ( p_refit_tolerance is not None ) and ( p_refit_tolerance < 0 ):
+            raise ParamError('Please set the parameter "p_refit_tolerance" >= 0')
+
+        super().__init__( p_algo_scikit_learn = p_algo_scikit_learn,
+                          p_range_max = p_range_max,
+                          p_duplicate_data = p_duplicate_data,
+                          p_visualize = p_visualize,
+                          p_logging = p_logging,
+                          p_anomaly_buffer_size = p_anomaly_buffer_size,
+                          p_instance_buffer_size = p_instance_buffer_size,
+                          p_detection_steprate = p_detection_steprate,
+                          p_group_anomaly_det = p_group_anomaly_det,
+                          **p_kwargs )
+
+        self.changes             = AnomalyStore( p_max_count = max(p_anomaly_buffer_size, 1), p_max_age = p_anomaly_max_age )
+        self.anomalies           = self.changes
+        self._batch_scoring      = p_batch_scoring
+        self._refit_tolerance    = p_refit_tolerance
+        self._reuse_possible     = ( p_refit_tolerance is not None ) and hasattr(p_algo_scikit_learn, 'predict')
+        self._inst_unscored      = 0
+        self._inst_last          = None
+        self._fit_stats          = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def _run(self, p_instances : InstDict):
+
+        if self._batch_scoring:
+            # Determination of the last new instance of the run, after which the detection takes place
+            self._inst_last = None
+            for (inst_type, inst) in p_instances.values():
+                if inst_type == InstTypeNew: self._inst_last = inst
+
+        super()._run( p_instances = p_instances )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _detect(self, p_instance : Instance, **p_kwargs):
+
+        # 1 Intro
+        feature_data = p_instance.get_feature_data()
+        size         = self._inst_buffer_size
+
+        if self._inst_data_buffer is None:
+            self._inst_data_buffer = np.empty((size, feature_data.get_related_set().get_num_dim()))
+
+
+        # 2 Update of the ring buffer
+        pos = self._inst_buffer_pos
+        self._inst_data_buffer[pos] = get_values_ro(feature_data)
+        self._inst_ref_buffer[pos]  = p_instance
+        self._inst_buffer_pos       = ( pos + 1 ) % size
+        self._inst_unscored        += 1
+
+        if self._inst_buffer_pos == 0: self._inst_data_buffer_full = True
+
+
+        # 3 Detection, once the buffer is filled and the step rate has been reached. In batch mode, the
+        #   detection is postponed to the last new instance of the run as long as no unscored instance
+        #   would be overwritten by the next one.
+        if not self._inst_data_buffer_full: return
+
+        if self._inst_unscored < size:
+            if self._inst_unscored < self._detection_steprate: return
+            if self._batch_scoring and ( p_instance is not self._inst_last ): return
+
+        self._detect_window( p_instance = p_instance )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _fit_required(self, p_window : np.ndarray) -> bool:
+        """
+        Checks whether the algorithm needs to be refitted on the given window. The statistics of the
+        window are stored on each fit.
+        """
+
+        if not self._reuse_possible: return True
+
+        mean = p_window.mean(axis=0)
+        std  = p_window.std(axis=0)
+
+        if self._fit_stats is not None:
+            mean_fit, std_fit = self._fit_stats
+            tolerance         = self._refit_tolerance * std_fit + 1e-10
+
+            if ( np.abs(mean - mean_fit) <= tolerance ).all() and ( np.abs(std - std_fit) <= tolerance ).all():
+                return False
+
+        self._fit_stats = (mean, std)
+        return True
+
+
+## -------------------------------------------------------------------------------------------------
+    def _detect_window(self, p_instance : Instance):
+        """
+        Scores the current window and raises a point anomaly for each outlier that has not been
+        reported before.
+
+        Parameters
+        ----------
+        p_instance : Instance
+            Instance that triggered the detection.
+        """
+
+        # 1 Arrangement of the window in chronological order
+        size  = self._inst_buffer_size
+        order = np.roll( np.arange(size), -self._inst_buffer_pos )
+
+        if self._inst_buffer_pos == 0:
+            window = self._inst_data_buffer
+        else:
+            window = self._inst_data_buffer[order]
+
+        num_unscored        = self._inst_unscored
+        self._inst_unscored = 0
+
+
+        # 2 Scoring of the complete window (refit) or of the instances not scored yet (reuse)
+        algo = self._algo_scikitlearn
+
+        outlier_factors = None
+
+        if self._fit_required( p_window = window ):
+            start = 0
+            if hasattr(algo, 'fit_predict'):
+                scores = algo.fit_predict(window)
+            else:
+                scores = algo.fit(window).predict(window)
+
+            if hasattr(algo, 'negative_outlier_factor_'): outlier_factors = -algo.negative_outlier_factor_
+        else:
+            start  = size - num_unscored
+            scores = algo.predict(window[start:])
+
+
+        # 3 Raise of new anomalies in chronological order. Each instance is reported only once.
+        for j in start + np.flatnonzero(scores == -1):
+            i = order[j]
+            related_instance = self._inst_ref_buffer[i]
+            if related_instance is np.nan: continue
+            self._inst_ref_buffer[i] = np.nan
+
+            anomaly = PointAnomaly( p_status = True,
+                                    p_tstamp = related_instance.tstamp,
+                                    p_visualize = self.get_visualization(),
+                                    p_raising_object = self,
+                                    p_instances = [related_instance] )
+
+            self._raise_anomaly_event( p_anomaly = anomaly, p_instance = p_instance )
+            if outlier_factors is not None: self.anomalies.set_score( p_id = anomaly.id, p_score = outlier_factors[j] )
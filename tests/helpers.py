@@ -0,0 +1,131 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Module     : helpers.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.1.0 (2026-10-17)
+
+Helpers for the tests: a stream of given values, a stream task collecting the instances it processes
+and a runner for stream scenarios that collects task states after each cycle.
+
+"""
+
+import numpy as np
+
+from mlpro.bf.various import Log
+from mlpro.bf.ops import Mode
+from mlpro.bf.math import Element, MSpace
+from mlpro.bf.streams import Feature, Instance, InstTypeNew, Stream, StreamTask
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+def get_random_walk(p_num_inst : int = 400, p_num_dim : int = 3, p_seed : int = 1) -> np.ndarray:
+    """
+    Returns a drifting signal, so that normalizers and boundary detectors keep adapting.
+    """
+
+    rng = np.random.default_rng(p_seed)
+    return np.cumsum( rng.normal( size = (p_num_inst, p_num_dim) ), axis = 0 )
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class StreamArray (Stream):
+    """
+    Stream providing the rows of a 2D array as instances with real-valued features.
+    """
+
+    C_TYPE = 'Array Stream'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_values : np.ndarray, p_logging = Log.C_LOG_NOTHING):
+
+        self._values = np.asarray(p_values, dtype=np.float64)
+        self._index  = 0
+
+        feature_space = MSpace()
+        for i in range(self._values.shape[1]):
+            feature_space.add_dim( Feature( p_name_short = 'x' + str(i + 1) ) )
+
+        super().__init__( p_id = 'array',
+                          p_name = 'Array',
+                          p_num_instances = len(self._values),
+                          p_feature_space = feature_space,
+                          p_mode = Mode.C_MODE_SIM,
+                          p_logging = p_logging )
+
+
+## -------------------------------------------------------------------------------------------------
+    def _reset(self):
+        self._index = 0
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_next(self) -> Instance:
+
+        if self._index >= len(self._values): raise StopIteration
+
+        feature_data = Element( self._feature_space )
+        feature_data.set_values( self._values[self._index].copy() )
+        self._index += 1
+
+        return Instance( p_feature_data = feature_data )
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class StreamTaskCollector (StreamTask):
+    """
+    Stream task collecting the ids and feature values of the new instances it processes in attribute
+    instances.
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_name : str = 'Collector', p_logging = Log.C_LOG_NOTHING, **p_kwargs):
+
+        super().__init__( p_name = p_name,
+                          p_range_max = StreamTask.C_RANGE_NONE,
+                          p_logging = p_logging,
+                          **p_kwargs )
+
+        self.instances = []
+
+
+## -------------------------------------------------------------------------------------------------
+    def _run(self, p_instances):
+
+        for inst_id, (inst_type, inst) in sorted(p_instances.items()):
+            if inst_type == InstTypeNew:
+                self.instances.append( ( inst_id, inst.get_feature_data().get_values().copy() ) )
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+def run_cycles(p_scenario, p_num_cycles : int, p_get_state) -> list:
+    """
+    Resets a scenario, runs the given number of cycles one by one and returns the task states
+    determined by p_get_state(p_scenario) after each cycle.
+    """
+
+    p_scenario.reset( p_seed = 1 )
+    states = []
+
+    for cycle in range(p_num_cycles):
+        p_scenario.run_cycle()
+        states.append( p_get_state(p_scenario) )
+
+    return states
@@ -0,0 +1,128 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Module     : test_math_basics.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.1.0 (2026-10-17)
+
+Tests of the copy-on-write elements and instances.
+
+"""
+
+import numpy as np
+import pytest
+
+from mlpro.bf.various import Log
+from mlpro.bf.math import Element, MSpace
+from mlpro.bf.math.normalizers import NormalizerMinMax
+from mlpro.bf.streams import Feature, InstTypeNew
+
+from mlwa.math import ElementCOW, get_values_ro
+from mlwa.streams import InstanceCOW
+import mlwa.streams.tasks as mlwa_stream_tasks
+import mlwa.oa.tasks as mlwa_oa_tasks
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+def get_element(p_cls = Element) -> Element:
+
+    space = MSpace()
+    for i in range(3): space.add_dim( Feature( p_name_short = 'x' + str(i + 1) ) )
+
+    element = p_cls( space )
+    element.set_values( np.array([ 1.0, 2.0, 3.0 ]) )
+    return element
+
+
+## -------------------------------------------------------------------------------------------------
+def test_in_place_write_after_share():
+
+    for cls in [ Element, ElementCOW ]:
+        original  = get_element(cls)
+        duplicate = ElementCOW.share(original)
+
+        original.get_values()[0] = 10
+        duplicate.get_values()[1] = 20
+
+        assert list(original.get_values()) == [ 10, 2, 3 ]
+        assert list(duplicate.get_values()) == [ 1, 20, 3 ]
+
+
+## -------------------------------------------------------------------------------------------------
+def test_shared_buffer_is_copied_once():
+
+    original   = get_element(ElementCOW)
+    duplicates = [ original.copy() for i in range(2) ]
+    buffer     = original.get_values()
+
+    assert duplicates[0].is_shared()
+    duplicates[0].set_value( p_dim_id = duplicates[0].get_dim_ids()[2], p_value = 30 )
+    duplicates[1].set_values( np.zeros(3) )
+
+    # The last element of the sharing group keeps the buffer
+    assert not original.is_shared()
+    assert original.get_values() is buffer
+    assert list(original.get_values()) == [ 1, 2, 3 ]
+    assert list(duplicates[0].get_values()) == [ 1, 2, 30 ]
+    assert original.get_value( p_dim_id = original.get_dim_ids()[1] ) == 2
+
+
+## -------------------------------------------------------------------------------------------------
+def test_normalizer_on_duplicated_instance():
+
+    instance    = InstanceCOW( p_feature_data = get_element() )
+    instance.id = 1
+    duplicate   = instance.copy()
+
+    normalizer = NormalizerMinMax()
+    normalizer.update_parameters( p_boundaries = np.array([ [0, 4], [0, 4], [0, 4] ]) )
+
+    feature_data = duplicate.get_feature_data()
+    feature_data.set_values( normalizer.normalize( p_data = feature_data.get_values() ) )
+
+    assert list(feature_data.get_values()) == [ -0.5, 0, 0.5 ]
+    assert list(instance.get_feature_data().get_values()) == [ 1, 2, 3 ]
+
+
+## -------------------------------------------------------------------------------------------------
+def test_read_only_access_keeps_buffer_shared():
+
+    original  = get_element(ElementCOW)
+    duplicate = original.copy()
+    values    = get_values_ro(duplicate)
+
+    assert duplicate.is_shared()
+    assert np.shares_memory( values, get_values_ro(original) )
+    with pytest.raises(ValueError): values[0] = 10
+
+    # Copy on the first real write only
+    duplicate.set_value( p_dim_id = duplicate.get_dim_ids()[0], p_value = 10 )
+    assert not duplicate.is_shared()
+    assert list(get_values_ro(original)) == [ 1, 2, 3 ]
+
+
+## -------------------------------------------------------------------------------------------------
+def test_read_only_tasks_on_duplicated_branch():
+
+    instance    = InstanceCOW( p_feature_data = get_element(ElementCOW) )
+    instance.id = 1
+    duplicate   = instance.copy()
+    buffer      = get_values_ro( instance.get_feature_data() )
+
+    tasks = [ mlwa_stream_tasks.RingBuffer( p_buffer_size = 5, p_enable_statistics = True, p_logging = Log.C_LOG_NOTHING ),
+              mlwa_oa_tasks.MovingAverage( p_logging = Log.C_LOG_NOTHING ) ]
+
+    for task in tasks:
+        task._run( p_instances = { duplicate.id : ( InstTypeNew, duplicate ) } )
+
+    # No task copied the shared buffer
+    assert duplicate.get_feature_data().is_shared()
+    assert np.shares_memory( get_values_ro( duplicate.get_feature_data() ), buffer )
+    assert list(tasks[0].get_mean()) == [ 1, 2, 3 ]
+    assert list(tasks[1]._moving_avg) == [ 1, 2, 3 ]
@@ -0,0 +1,106 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Module     : test_oa_anomalydetectors.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.1.0 (2026-10-17)
+
+Tests of the anomaly store mlwa.oa.tasks.AnomalyStore and of the incremental LOF anomaly detector
+mlwa.oa.tasks.AnomalyDetectorLOF.
+
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+from sklearn.neighbors import LocalOutlierFactor
+
+from mlpro.bf.various import Log
+from mlpro.bf.math import Element, MSpace
+from mlpro.bf.streams import Feature, Instance
+from mlpro.oa.streams.tasks.changedetectors.anomalydetectors.anomalies.instancebased import PointAnomaly
+
+from mlwa.oa.tasks import AnomalyStore, AnomalyDetectorLOF
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+def get_anomaly(p_space : MSpace, p_inst_id : int, p_tstamp) -> PointAnomaly:
+
+    instance    = Instance( p_feature_data = Element( p_space ) )
+    instance.id = p_inst_id
+    anomaly     = PointAnomaly( p_status = True, p_instances = [ instance ] )
+
+    # Anomalies get the current time if no time stamp is given
+    anomaly.tstamp = p_tstamp
+    return anomaly
+
+
+## -------------------------------------------------------------------------------------------------
+def test_time_index_typed_by_first_tstamp():
+
+    space = MSpace()
+    space.add_dim( Feature( p_name_short = 'x' ) )
+
+    t0      = datetime(2026, 1, 1)
+    tstamps = [ None, t0 + timedelta(seconds=2), None, t0, t0 + timedelta(seconds=9) ]
+    store   = AnomalyStore( p_max_age = timedelta(seconds=5) )
+
+    assert store.get_range( p_tstamp_from = t0 ) == []
+
+    store[0] = get_anomaly( space, 0, tstamps[0] )
+    assert store.get_range( p_tstamp_from = t0 ) == []
+    assert [ a.instances[0].id for a in store.get_range() ] == [ 0 ]
+
+    for i in range(1, 4): store[i] = get_anomaly( space, i, tstamps[i] )
+
+    # Anomalies without time stamp are sorted behind all others and are not part of a time range
+    assert [ a.instances[0].id for a in store.get_range() ] == [ 3, 1, 0, 2 ]
+    assert [ a.instances[0].id for a in store.get_range( t0, t0 + timedelta(seconds=2) ) ] == [ 3, 1 ]
+    assert list(store.get_records( p_tstamp_to = t0 )['id']) == [ 3 ]
+
+    # Retention by time with the time stamps of the first typed anomaly
+    store[4] = get_anomaly( space, 4, tstamps[4] )
+    assert [ a.instances[0].id for a in store.get_range( p_tstamp_from = t0 ) ] == [ 4 ]
+
+
+## -------------------------------------------------------------------------------------------------
+def test_lof_parity_with_sklearn():
+
+    rng    = np.random.default_rng(3)
+    values = rng.normal( size = (200, 3) )
+    values[ rng.choice( 200, 12, replace = False ) ] *= 6
+
+    space = MSpace()
+    for i in range(3): space.add_dim( Feature( p_name_short = 'x' + str(i + 1) ) )
+
+    detector = AnomalyDetectorLOF( p_window_size = 30, p_n_neighbors = 5, p_logging = Log.C_LOG_NOTHING )
+    outliers = set()
+
+    for inst_id, row in enumerate(values):
+        element = Element( space )
+        element.set_values( row )
+        instance    = Instance( p_feature_data = element )
+        instance.id = inst_id
+        detector._detect( instance )
+
+        if inst_id < 29: continue
+
+        # Refit of scikit-learn on the current window after each insert/evict
+        lof  = LocalOutlierFactor( n_neighbors = 5 )
+        flag = lof.fit_predict( detector._values ) == -1
+        ids  = np.array([ inst.id for inst in detector._inst_ref ])
+
+        np.testing.assert_allclose( detector._lof, -lof.negative_outlier_factor_, rtol = 0, atol = 1e-9 )
+        np.testing.assert_array_equal( detector._lof > 1.5, flag )
+        outliers |= set( ids[flag].tolist() )
+
+    # Each outlier of any window is reported once
+    reported = [ anomaly.instances[0].id for anomaly in detector.anomalies.values() ]
+    assert len(outliers) > 0
+    assert sorted(reported) == sorted(outliers)
@@ -0,0 +1,247 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Module     : test_oa_basics.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.2.0 (2026-10-17)
+
+Behavior of the stream scenario mlwa.oa.OAStreamScenario (moving the stream and running a range of
+instances) and of the workflow mlwa.oa.OAStreamWorkflow (thread and process mode compared to the
+sequential execution).
+
+"""
+
+import multiprocessing as mp
+
+import numpy as np
+import pytest
+
+from mlpro.bf.various import Log
+from mlpro.bf.ops import Mode
+from mlpro.bf.exceptions import ParamError
+
+from mlwa.oa import OAStreamScenario, OAStreamWorkflow, OAStreamTask
+from mlwa.oa.tasks import BoundaryDetector, NormalizerMinMax, MovingAverage
+from mlwa.streams import StreamRecorder, StreamReplay
+from mlwa.streams.tasks import RingBuffer
+
+from helpers import StreamArray, StreamTaskCollector, get_random_walk
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+def get_scenario(p_stream, p_cycle_limit : int = 0):
+    """
+    Scenario passing the instances of the given stream to a collector.
+    """
+
+    class Scenario (OAStreamScenario):
+
+        C_NAME = 'Collect'
+
+        def _setup(self, p_mode, p_ada : bool, p_visualize : bool, p_logging):
+
+            workflow = OAStreamWorkflow( p_name = 'Collect',
+                                         p_range_max = OAStreamWorkflow.C_RANGE_NONE,
+                                         p_ada = p_ada,
+                                         p_logging = p_logging )
+
+            self.collector = StreamTaskCollector()
+            workflow.add_task( p_task = self.collector )
+            return p_stream, workflow
+
+    return Scenario( p_mode = Mode.C_MODE_SIM, p_cycle_limit = p_cycle_limit, p_visualize = False, p_logging = Log.C_LOG_NOTHING )
+
+
+## -------------------------------------------------------------------------------------------------
+def get_stream(p_seekable : bool, p_values : np.ndarray, p_path):
+    """
+    Returns a seekable replay of the values or a stream that can only be fast-forwarded.
+    """
+
+    if not p_seekable: return StreamArray( p_values )
+
+    recorder = StreamRecorder( p_stream = StreamArray( p_values ), p_path = str(p_path / 'stream.log'), p_logging = Log.C_LOG_NOTHING )
+    for inst in recorder: pass
+    recorder.close()
+
+    return StreamReplay( p_path = str(p_path / 'stream.log'), p_logging = Log.C_LOG_NOTHING )
+
+
+## -------------------------------------------------------------------------------------------------
+@pytest.mark.parametrize('p_seekable', [ False, True ])
+def test_run_range_matches_linear_read(tmp_path, p_seekable : bool):
+
+    values = get_random_walk( p_num_inst = 200 )
+
+    # Linear read of all instances
+    scenario = get_scenario( get_stream( p_seekable, values, tmp_path ) )
+    scenario.reset( p_seed = 1 )
+    scenario.run()
+    linear = scenario.collector.instances
+
+    assert [ inst_id for inst_id, inst_values in linear ] == list(range(200))
+
+    # Range [70, 130). Seekable streams don't materialize the skipped instances.
+    stream   = get_stream( p_seekable, values, tmp_path )
+    get_next = stream._get_next
+    num_read = []
+
+    def get_next_counted():
+        num_read.append(1)
+        return get_next()
+
+    stream._get_next = get_next_counted
+
+    scenario = get_scenario( stream )
+    scenario.reset( p_seed = 1 )
+    scenario.run( p_start = 70, p_stop = 130 )
+    ranged = scenario.collector.instances
+
+    assert scenario.get_stream_index() == 130
+    assert len(num_read) == ( 60 if p_seekable else 130 )
+    assert [ inst_id for inst_id, inst_values in ranged ] == list(range(70, 130))
+    np.testing.assert_array_equal( np.array([ v for i, v in ranged ]), np.array([ v for i, v in linear[70:130] ]) )
+
+
+## -------------------------------------------------------------------------------------------------
+@pytest.mark.parametrize('p_seekable', [ False, True ])
+def test_seek_continues_with_index(tmp_path, p_seekable : bool):
+
+    values   = get_random_walk( p_num_inst = 200 )
+    scenario = get_scenario( get_stream( p_seekable, values, tmp_path ), p_cycle_limit = 10 )
+    scenario.reset( p_seed = 1 )
+
+    scenario.seek( p_index = 25 )
+    assert scenario.get_stream_index() == 25
+
+    scenario.run()
+    collected = scenario.collector.instances
+
+    assert [ inst_id for inst_id, inst_values in collected ] == list(range(25, 35))
+    np.testing.assert_array_equal( np.array([ v for i, v in collected ]), values[25:35] )
+
+    # Seekable streams move backwards as well, all other streams have to be reset before
+    if p_seekable:
+        scenario.seek( p_index = 5 )
+        assert next(scenario._iterator).id == 5
+    else:
+        with pytest.raises(ParamError):
+            scenario.seek( p_index = 5 )
+
+
+
+## -------------------------------------------------------------------------------------------------
+def get_scenario_branches(p_values : np.ndarray, p_range_max : int, p_num_cycles : int):
+    """
+    Workflow of example 1a with two branches behind the raw data: a moving average and a boundary
+    detector -> minmax normalizer -> moving average renormalized on events. The outputs of both
+    branches are collected.
+    """
+
+    class Scenario (OAStreamScenario):
+
+        C_NAME = 'Branches'
+
+        def _setup(self, p_mode, p_ada : bool, p_visualize : bool, p_logging):
+
+            workflow = OAStreamWorkflow( p_name = 'Branches',
+                                         p_range_max = p_range_max,
+                                         p_ada = p_ada,
+                                         p_logging = p_logging )
+
+            window    = RingBuffer( p_buffer_size = 50, p_delay = True, p_enable_statistics = True, p_duplicate_data = True, p_logging = p_logging )
+            raw       = OAStreamTask( p_ada = p_ada, p_logging = p_logging )
+            ma_raw    = MovingAverage( p_ada = p_ada, p_remove_obs = True, p_logging = p_logging )
+            bd        = BoundaryDetector( p_ada = p_ada, p_boundary_provider = window, p_logging = p_logging )
+            norm      = NormalizerMinMax( p_ada = p_ada, p_duplicate_data = True, p_dst_boundaries = [-1, 1], p_logging = p_logging )
+            ma_norm   = MovingAverage( p_ada = p_ada, p_remove_obs = True, p_logging = p_logging )
+            coll_raw  = StreamTaskCollector( p_name = 'Collector raw' )
+            coll_norm = StreamTaskCollector( p_name = 'Collector norm' )
+
+            workflow.add_task( p_task = window )
+            workflow.add_task( p_task = raw, p_pred_tasks = [ window ] )
+            workflow.add_task( p_task = ma_raw, p_pred_tasks = [ raw ] )
+            workflow.add_task( p_task = bd, p_pred_tasks = [ raw ] )
+            workflow.add_task( p_task = norm, p_pred_tasks = [ bd ] )
+            workflow.add_task( p_task = ma_norm, p_pred_tasks = [ norm ] )
+            workflow.add_task( p_task = coll_raw, p_pred_tasks = [ ma_raw ] )
+            workflow.add_task( p_task = coll_norm, p_pred_tasks = [ ma_norm ] )
+
+            bd.register_event_handler( p_event_id = bd.C_EVENT_ADAPTED, p_event_handler = norm.adapt_on_event )
+            norm.register_event_handler( p_event_id = norm.C_EVENT_ADAPTED, p_event_handler = ma_norm.renormalize_on_event )
+
+            self.collectors = [ coll_raw, coll_norm ]
+            return StreamArray( p_values ), workflow
+
+    return Scenario( p_mode = Mode.C_MODE_SIM, p_cycle_limit = p_num_cycles, p_visualize = False, p_logging = Log.C_LOG_NOTHING )
+
+
+## -------------------------------------------------------------------------------------------------
+def run_branches(p_range_max : int, p_num_cycles : int = 300):
+    """
+    Runs the scenario with branches and returns it with the collected outputs of both branches.
+    """
+
+    scenario = get_scenario_branches( get_random_walk(), p_range_max, p_num_cycles )
+    scenario.reset( p_seed = 1 )
+    scenario.run()
+
+    outputs = [ ( [ i for i, v in coll.instances ], np.array([ v for i, v in coll.instances ]) ) for coll in scenario.collectors ]
+    return scenario, outputs
+
+
+## -------------------------------------------------------------------------------------------------
+def assert_outputs_equal(p_outputs, p_outputs_ref):
+
+    for (ids, values), (ids_ref, values_ref) in zip(p_outputs, p_outputs_ref):
+        assert ids == ids_ref
+        np.testing.assert_array_equal( values, values_ref )
+
+
+## -------------------------------------------------------------------------------------------------
+def test_thread_mode_matches_sequential():
+
+    scenario_seq, outputs_seq = run_branches( OAStreamWorkflow.C_RANGE_NONE )
+    scenario, outputs         = run_branches( OAStreamWorkflow.C_RANGE_THREAD )
+
+    # The moving average and the boundary detector run concurrently on one level
+    workflow = scenario.get_workflow()
+    assert [ len(level) for level in workflow.get_levels() ] == [ 1, 1, 2, 2, 1, 1 ]
+    assert workflow._pool is not None
+
+    # The sliding window delays the instances until it is filled
+    assert outputs_seq[0][0] == list(range(49, 300))
+    assert_outputs_equal( outputs, outputs_seq )
+
+
+## -------------------------------------------------------------------------------------------------
+@pytest.mark.skipif( 'fork' not in mp.get_all_start_methods(), reason = 'Process mode requires the start method "fork"' )
+def test_process_mode_matches_sequential():
+
+    scenario_seq, outputs_seq = run_branches( OAStreamWorkflow.C_RANGE_NONE )
+    scenario, outputs         = run_branches( OAStreamWorkflow.C_RANGE_PROCESS )
+
+    # The boundary detector refers to the sliding window and the normalizer renormalizes the moving
+    # average behind it, so only the last collector is placed in a stage of its own
+    workflow = scenario.get_workflow()
+    assert [ len(stage) for stage in workflow.get_stages() ] == [ 7, 1 ]
+    assert workflow._process_mode and ( workflow._pipeline is None )
+
+    assert_outputs_equal( outputs, outputs_seq )
+
+    # A second run continues with the states taken over from the worker processes
+    for scenario_run in [ scenario_seq, scenario ]:
+        scenario_run.set_cycle_limit(50)
+        scenario_run.run()
+
+    outputs_seq = [ coll.instances for coll in scenario_seq.collectors ]
+    outputs     = [ coll.instances for coll in scenario.collectors ]
+
+    assert_outputs_equal( [ ( [ i for i, v in out ], np.array([ v for i, v in out ]) ) for out in outputs ],
+                          [ ( [ i for i, v in out ], np.array([ v for i, v in out ]) ) for out in outputs_seq ] )
@@ -0,0 +1,91 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Module     : test_oa_clusteranalyzers.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-17)
+
+Parity of the KMeans wrapper mlwa.wrappers.river.WrRiverKMeans2MLPro and the native KMeans
+mlwa.oa.tasks.KMeans with the stock KMeans wrapper of MLPro-Int-River.
+
+"""
+
+import numpy as np
+import pytest
+
+from mlpro.bf.various import Log
+from mlpro.bf.ops import Mode
+from mlpro.bf.math.normalizers import NormalizerMinMax
+import mlpro.oa.streams as mlpro_oa
+from mlpro_int_river.wrappers.clusteranalyzers import WrRiverKMeans2MLPro as WrRiverKMeans2MLProRoot
+
+import mlwa.oa as mlwa_oa
+from mlwa.oa.tasks import KMeans
+from mlwa.wrappers.river import WrRiverKMeans2MLPro
+
+from helpers import StreamArray
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+def get_clouds(p_num_inst : int = 100, p_seed : int = 1) -> np.ndarray:
+
+    rng    = np.random.default_rng(p_seed)
+    values = np.concatenate( [ rng.normal( center, 0.3, (p_num_inst, 3) ) for center in [ [ -2, 0, 0 ], [ 2, 0, 0 ], [ 0, 2, 2 ] ] ] )
+    rng.shuffle(values)
+    return values
+
+
+## -------------------------------------------------------------------------------------------------
+def run_clusterer(p_stock : bool, p_cls, p_values : np.ndarray) -> tuple:
+    """
+    Clusters the given values and renormalizes the clusters afterwards. Returns the centroids and
+    sizes of the clusters.
+    """
+
+    oa = mlpro_oa if p_stock else mlwa_oa
+
+    class Scenario (oa.OAStreamScenario):
+
+        C_NAME = 'Parity KMeans'
+
+        def _setup(self, p_mode, p_ada : bool, p_visualize : bool, p_logging):
+
+            workflow = oa.OAStreamWorkflow( p_name = 'KMeans',
+                                            p_range_max = oa.OAStreamWorkflow.C_RANGE_NONE,
+                                            p_ada = p_ada,
+                                            p_logging = p_logging )
+
+            self.clusterer = p_cls( p_n_clusters = 4, p_halflife = 0.1, p_sigma = 3, p_seed = 42, p_logging = p_logging )
+            workflow.add_task( p_task = self.clusterer )
+            return StreamArray( p_values ), workflow
+
+    scenario = Scenario( p_mode = Mode.C_MODE_SIM, p_visualize = False, p_logging = Log.C_LOG_NOTHING )
+    scenario.reset( p_seed = 1 )
+    scenario.run()
+
+    normalizer = NormalizerMinMax()
+    normalizer.update_parameters( p_boundaries = np.array([ [ -4, 4 ] ] * 3) )
+    normalizer.update_parameters( p_boundaries = np.array([ [ -3, 5 ], [ -4, 2 ], [ -1, 1 ] ]) )
+    scenario.clusterer._renormalize( p_normalizer = normalizer )
+
+    clusters = scenario.clusterer.clusters.values()
+    return ( np.array([ np.array(cluster.centroid.value, dtype=np.float64) for cluster in clusters ]),
+             [ cluster.size.value for cluster in clusters ] )
+
+
+## -------------------------------------------------------------------------------------------------
+@pytest.mark.parametrize( 'p_cls', [ WrRiverKMeans2MLPro, KMeans ] )
+def test_kmeans_parity_with_river(p_cls):
+
+    values                       = get_clouds()
+    centroids_stock, sizes_stock = run_clusterer( True, WrRiverKMeans2MLProRoot, values )
+    centroids, sizes             = run_clusterer( False, p_cls, values )
+
+    np.testing.assert_allclose( centroids, centroids_stock, rtol = 0, atol = 1e-9 )
+    assert sizes == sizes_stock
@@ -0,0 +1,144 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Module     : test_oa_moving_average.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-17)
+
+Parity of the moving average mlwa.oa.tasks.MovingAverage with the stock task of MLPro on a sliding
+window, with renormalizations and with micro-batches.
+
+"""
+
+import numpy as np
+import pytest
+
+from mlpro.bf.various import Log
+from mlpro.bf.ops import Mode
+from mlpro.bf.math.normalizers import NormalizerMinMax
+import mlpro.bf.streams.tasks as mlpro_stream_tasks
+import mlpro.oa.streams as mlpro_oa
+import mlpro.oa.streams.tasks as mlpro_oa_tasks
+
+import mlwa.streams.tasks as mlwa_stream_tasks
+import mlwa.oa as mlwa_oa
+import mlwa.oa.tasks as mlwa_oa_tasks
+
+from helpers import StreamArray, get_random_walk
+
+
+
+
+C_NUM_CYCLES    = 200
+C_CYCLES_RENORM = [ 40, 90, 150 ]
+
+
+## -------------------------------------------------------------------------------------------------
+@pytest.fixture(autouse=True)
+def headless_moving_average(monkeypatch):
+    # The stock moving average plots even without visualization
+    monkeypatch.setattr( mlpro_oa_tasks.MovingAverage, 'update_plot', lambda self, p_instances=None, **p_kwargs: None )
+
+
+## -------------------------------------------------------------------------------------------------
+def get_scenario(p_stock : bool, p_values : np.ndarray, p_remove_obs : bool, p_batch_size : int = 1):
+    """
+    Scenario sliding window -> moving average.
+    """
+
+    oa    = mlpro_oa if p_stock else mlwa_oa
+    tasks = mlpro_oa_tasks if p_stock else mlwa_oa_tasks
+    ring  = mlpro_stream_tasks.RingBuffer if p_stock else mlwa_stream_tasks.RingBuffer
+
+    class Scenario (oa.OAStreamScenario):
+
+        C_NAME = 'Parity MA'
+
+        def _setup(self, p_mode, p_ada : bool, p_visualize : bool, p_logging):
+
+            workflow = oa.OAStreamWorkflow( p_name = 'MA',
+                                            p_range_max = oa.OAStreamWorkflow.C_RANGE_NONE,
+                                            p_ada = p_ada,
+                                            p_logging = p_logging )
+
+            window = ring( p_buffer_size = 20, p_delay = False, p_logging = p_logging )
+            ma     = tasks.MovingAverage( p_ada = p_ada, p_remove_obs = p_remove_obs, p_renormalize_plot_data = False, p_logging = p_logging )
+
+            workflow.add_task( p_task = window )
+            workflow.add_task( p_task = ma, p_pred_tasks = [ window ] )
+
+            self.ma = ma
+            return StreamArray( p_values ), workflow
+
+    kwargs = {} if p_stock else { 'p_batch_size' : p_batch_size }
+    return Scenario( p_mode = Mode.C_MODE_SIM, p_visualize = False, p_logging = Log.C_LOG_NOTHING, **kwargs )
+
+
+## -------------------------------------------------------------------------------------------------
+def get_normalizer(p_cycle : int) -> NormalizerMinMax:
+    """
+    Min/max normalizer whose parameters changed from one set of boundaries to another.
+    """
+
+    normalizer = NormalizerMinMax()
+    normalizer.update_parameters( p_boundaries = [ [ -p_cycle, p_cycle ], [ 0, 10 ], [ -5, 1 ] ] )
+    normalizer.update_parameters( p_boundaries = [ [ -p_cycle / 2, p_cycle * 2 ], [ 3, 4 ], [ -1, 20 ] ] )
+    return normalizer
+
+
+## -------------------------------------------------------------------------------------------------
+def run(p_scenario) -> np.ndarray:
+    """
+    Runs the scenario cycle by cycle, renormalizes the moving average in the cycles C_CYCLES_RENORM and
+    returns the moving average after each cycle.
+    """
+
+    p_scenario.reset( p_seed = 1 )
+    averages = []
+
+    for cycle in range(C_NUM_CYCLES):
+        p_scenario.run_cycle()
+        if cycle in C_CYCLES_RENORM: p_scenario.ma._renormalize( get_normalizer(cycle) )
+        averages.append( p_scenario.ma._moving_avg.copy() )
+
+    return np.array(averages)
+
+
+## -------------------------------------------------------------------------------------------------
+@pytest.mark.parametrize('p_remove_obs', [ False, True ])
+def test_parity_with_mlpro(p_remove_obs : bool):
+
+    values = get_random_walk()
+
+    averages_stock = run( get_scenario( True, values, p_remove_obs ) )
+    averages       = run( get_scenario( False, values, p_remove_obs ) )
+
+    np.testing.assert_allclose( averages, averages_stock, rtol = 1e-9, atol = 1e-9 )
+
+    # Without renormalization, the moving average equals the mean of the instances considered
+    first = [ max(0, i - 19) if p_remove_obs else 0 for i in range(C_CYCLES_RENORM[0]) ]
+    means = np.array([ values[first[i]:i+1].mean(axis=0) for i in range(C_CYCLES_RENORM[0]) ])
+    np.testing.assert_allclose( averages[:C_CYCLES_RENORM[0]], means, rtol = 1e-9, atol = 1e-9 )
+
+
+## -------------------------------------------------------------------------------------------------
+@pytest.mark.parametrize('p_batch_size', [ 5, 20 ])
+def test_micro_batches(p_batch_size : int):
+
+    values = get_random_walk()
+
+    scenario = get_scenario( False, values, p_remove_obs = True, p_batch_size = p_batch_size )
+    scenario.reset( p_seed = 1 )
+
+    averages = []
+    for cycle in range(C_NUM_CYCLES // p_batch_size):
+        scenario.run_cycle()
+        averages.append( scenario.ma._moving_avg.copy() )
+
+    # Moving average of the window after each batch
+    means = np.array([ values[max(0, i - 19):i+1].mean(axis=0) for i in range(p_batch_size - 1, C_NUM_CYCLES, p_batch_size) ])
+    np.testing.assert_allclose( np.array(averages), means, rtol = 1e-9, atol = 1e-9 )
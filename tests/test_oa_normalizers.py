@@ -0,0 +1,291 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Module     : test_oa_normalizers.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.2.0 (2026-10-17)
+
+Parity of the normalizer tasks of mlwa.oa.tasks with the stock tasks of MLPro in the workflows of
+examples 1a/1b (sliding window with delay, boundary detector, normalizer, moving average renormalized
+on events).
+
+"""
+
+import numpy as np
+import pytest
+
+from mlpro.bf.various import Log
+from mlpro.bf.ops import Mode
+import mlpro.bf.streams.tasks as mlpro_stream_tasks
+import mlpro.oa.streams as mlpro_oa
+from mlpro.oa.streams import OAStreamAdaptationType
+import mlpro.oa.streams.tasks as mlpro_oa_tasks
+
+import mlwa.streams.tasks as mlwa_stream_tasks
+import mlwa.oa as mlwa_oa
+import mlwa.oa.tasks as mlwa_oa_tasks
+
+from helpers import StreamArray, get_random_walk, run_cycles
+
+
+
+
+C_NUM_CYCLES = 300
+
+
+## -------------------------------------------------------------------------------------------------
+@pytest.fixture(autouse=True)
+def headless_moving_average(monkeypatch):
+    # The stock moving average plots even without visualization
+    monkeypatch.setattr( mlpro_oa_tasks.MovingAverage, 'update_plot', lambda self, p_instances=None, **p_kwargs: None )
+
+
+## -------------------------------------------------------------------------------------------------
+def get_scenario_ztrans( p_stock : bool,
+                         p_values : np.ndarray,
+                         p_batch_size : int = 1,
+                         p_coalesce_events : bool = False,
+                         p_tolerance : float = 0,
+                         p_delay : bool = True,
+                         p_remove_obs : bool = True ):
+    """
+    Scenario of example 1b: sliding window -> z-transformation -> moving average.
+    """
+
+    oa    = mlpro_oa if p_stock else mlwa_oa
+    tasks = mlpro_oa_tasks if p_stock else mlwa_oa_tasks
+    ring  = mlpro_stream_tasks.RingBuffer if p_stock else mlwa_stream_tasks.RingBuffer
+
+    class Scenario (oa.OAStreamScenario):
+
+        C_NAME = 'Parity ZTrans'
+
+        def _setup(self, p_mode, p_ada : bool, p_visualize : bool, p_logging):
+
+            workflow = oa.OAStreamWorkflow( p_name = 'ZTrans',
+                                            p_range_max = oa.OAStreamWorkflow.C_RANGE_NONE,
+                                            p_ada = p_ada,
+                                            p_logging = p_logging )
+
+            window = ring( p_buffer_size = 50, p_delay = p_delay, p_duplicate_data = True, p_logging = p_logging )
+            raw    = oa.OAStreamTask( p_ada = p_ada, p_logging = p_logging )
+            kwargs = {} if p_stock else { 'p_coalesce_events' : p_coalesce_events, 'p_tolerance' : p_tolerance }
+            norm   = tasks.NormalizerZTransform( p_ada = p_ada, p_duplicate_data = True, p_logging = p_logging, **kwargs )
+            ma     = tasks.MovingAverage( p_ada = p_ada, p_remove_obs = p_remove_obs, p_renormalize_plot_data = True, p_logging = p_logging )
+
+            workflow.add_task( p_task = window )
+            workflow.add_task( p_task = raw, p_pred_tasks = [ window ] )
+            workflow.add_task( p_task = norm, p_pred_tasks = [ raw ] )
+            workflow.add_task( p_task = ma, p_pred_tasks = [ norm ] )
+            norm.register_event_handler( p_event_id = norm.C_EVENT_ADAPTED, p_event_handler = ma.renormalize_on_event )
+
+            self.norm, self.ma = norm, ma
+            return StreamArray( p_values ), workflow
+
+    kwargs = {} if p_stock else { 'p_batch_size' : p_batch_size }
+    return Scenario( p_mode = Mode.C_MODE_SIM, p_visualize = False, p_logging = Log.C_LOG_NOTHING, **kwargs )
+
+
+## -------------------------------------------------------------------------------------------------
+def get_scenario_minmax(p_stock : bool, p_values : np.ndarray, p_coalesce_events : bool = False):
+    """
+    Scenario of example 1a: sliding window -> boundary detector -> minmax normalizer -> moving average.
+    The adaptation events of the boundary detector are collected as pairs (subtype, number of instances).
+    """
+
+    oa    = mlpro_oa if p_stock else mlwa_oa
+    tasks = mlpro_oa_tasks if p_stock else mlwa_oa_tasks
+    ring  = mlpro_stream_tasks.RingBuffer if p_stock else mlwa_stream_tasks.RingBuffer
+
+    class Scenario (oa.OAStreamScenario):
+
+        C_NAME = 'Parity MinMax'
+
+        def _setup(self, p_mode, p_ada : bool, p_visualize : bool, p_logging):
+
+            workflow = oa.OAStreamWorkflow( p_name = 'MinMax',
+                                            p_range_max = oa.OAStreamWorkflow.C_RANGE_NONE,
+                                            p_ada = p_ada,
+                                            p_logging = p_logging )
+
+            window = ring( p_buffer_size = 50, p_delay = True, p_enable_statistics = True, p_duplicate_data = True, p_logging = p_logging )
+            raw    = oa.OAStreamTask( p_ada = p_ada, p_logging = p_logging )
+            bd     = tasks.BoundaryDetector( p_ada = p_ada, p_boundary_provider = window, p_logging = p_logging )
+            kwargs = {} if p_stock else { 'p_coalesce_events' : p_coalesce_events }
+            norm   = tasks.NormalizerMinMax( p_ada = p_ada, p_duplicate_data = True, p_dst_boundaries = [-1, 1], p_logging = p_logging, **kwargs )
+            ma     = tasks.MovingAverage( p_ada = p_ada, p_remove_obs = True, p_renormalize_plot_data = True, p_logging = p_logging )
+
+            workflow.add_task( p_task = window )
+            workflow.add_task( p_task = raw, p_pred_tasks = [ window ] )
+            workflow.add_task( p_task = bd, p_pred_tasks = [ raw ] )
+            workflow.add_task( p_task = norm, p_pred_tasks = [ bd ] )
+            workflow.add_task( p_task = ma, p_pred_tasks = [ norm ] )
+            bd.register_event_handler( p_event_id = bd.C_EVENT_ADAPTED, p_event_handler = norm.adapt_on_event )
+            norm.register_event_handler( p_event_id = norm.C_EVENT_ADAPTED, p_event_handler = ma.renormalize_on_event )
+
+            self.events = []
+            bd.register_event_handler( p_event_id = bd.C_EVENT_ADAPTED,
+                                       p_event_handler = lambda p_event_id, p_event_object: self.events.append( ( p_event_object.subtype, p_event_object.num_inst ) ) )
+
+            self.bd, self.norm, self.ma = bd, norm, ma
+            return StreamArray( p_values ), workflow
+
+    return Scenario( p_mode = Mode.C_MODE_SIM, p_visualize = False, p_logging = Log.C_LOG_NOTHING )
+
+
+## -------------------------------------------------------------------------------------------------
+def get_state_minmax(p_scenario) -> np.ndarray:
+
+    if p_scenario.ma._moving_avg is None: return np.full(9, np.nan)
+    return np.concatenate( [ np.asarray(p_scenario.ma._moving_avg, dtype=np.float64),
+                             p_scenario.bd.get_boundaries().flatten() ] )
+
+
+## -------------------------------------------------------------------------------------------------
+def get_state_ztrans(p_scenario) -> np.ndarray:
+
+    if p_scenario.ma._moving_avg is None: return np.full(6, np.nan)
+    return np.concatenate( [ np.asarray(p_scenario.ma._moving_avg, dtype=np.float64),
+                             np.asarray(p_scenario.norm._param_new[1], dtype=np.float64) ] )
+
+
+## -------------------------------------------------------------------------------------------------
+def test_minmax_parity_with_mlpro():
+
+    values         = get_random_walk()
+    scenario_stock = get_scenario_minmax( True, values )
+    scenario_mlwa  = get_scenario_minmax( False, values )
+    stock          = run_cycles( scenario_stock, C_NUM_CYCLES, get_state_minmax )
+    mlwa           = run_cycles( scenario_mlwa, C_NUM_CYCLES, get_state_minmax )
+
+    np.testing.assert_allclose( np.array(mlwa), np.array(stock), rtol = 0, atol = 1e-9 )
+
+    # Same adaptation events of the boundary detector, forward and reverse reported separately
+    assert scenario_mlwa.events == scenario_stock.events
+    assert OAStreamAdaptationType.REVERSE in [ subtype for subtype, num_inst in scenario_mlwa.events ]
+
+
+## -------------------------------------------------------------------------------------------------
+def test_minmax_coalescing_parity_with_mlpro():
+
+    values = get_random_walk()
+    stock  = run_cycles( get_scenario_minmax( True, values ), C_NUM_CYCLES, get_state_minmax )
+    mlwa   = run_cycles( get_scenario_minmax( False, values, p_coalesce_events = True ), C_NUM_CYCLES, get_state_minmax )
+
+    np.testing.assert_allclose( np.array(mlwa), np.array(stock), rtol = 0, atol = 1e-9 )
+
+
+## -------------------------------------------------------------------------------------------------
+def get_param_ztrans(p_scenario) -> np.ndarray:
+
+    if p_scenario.norm._param_new is None: return np.full(6, np.nan)
+    return np.asarray(p_scenario.norm._param_new, dtype=np.float64).flatten()
+
+
+## -------------------------------------------------------------------------------------------------
+def test_ztrans_parity_with_mlpro():
+
+    values = get_random_walk()
+
+    # Same parameters in the workflow of example 1b
+    stock  = run_cycles( get_scenario_ztrans( True, values ), C_NUM_CYCLES, get_param_ztrans )
+    mlwa   = run_cycles( get_scenario_ztrans( False, values ), C_NUM_CYCLES, get_param_ztrans )
+
+    np.testing.assert_allclose( np.array(mlwa), np.array(stock), rtol = 0, atol = 1e-9 )
+
+    # Same successor states as long as the stock task normalizes one instance per run
+    kwargs = { 'p_delay' : False, 'p_remove_obs' : False }
+    stock  = run_cycles( get_scenario_ztrans( True, values, **kwargs ), C_NUM_CYCLES, get_state_ztrans )
+    mlwa   = run_cycles( get_scenario_ztrans( False, values, **kwargs ), C_NUM_CYCLES, get_state_ztrans )
+
+    np.testing.assert_allclose( np.array(mlwa), np.array(stock), rtol = 0, atol = 1e-9 )
+
+
+## -------------------------------------------------------------------------------------------------
+def test_ztrans_micro_batches_adapt_like_mlpro():
+
+    values   = get_random_walk()
+    stock    = get_scenario_ztrans( True, values )
+    batched  = get_scenario_ztrans( False, values, p_batch_size = 16 )
+
+    for scenario in [ stock, batched ]:
+        scenario.reset( p_seed = 1 )
+        scenario.run()
+
+    # The parameters are adapted instance by instance in any case
+    np.testing.assert_allclose( batched.norm._param_new, stock.norm._param_new, rtol = 0, atol = 1e-9 )
+
+
+## -------------------------------------------------------------------------------------------------
+@pytest.mark.parametrize('p_delay, p_remove_obs', [ (True, True), (False, False) ])
+def test_ztrans_micro_batches_successor_state(p_delay, p_remove_obs):
+
+    values = get_random_walk()
+    kwargs = { 'p_delay' : p_delay, 'p_remove_obs' : p_remove_obs }
+    states = []
+
+    for stock, batch_size in [ (True, 1), (False, 1), (False, 7), (False, 50) ]:
+        scenario = get_scenario_ztrans( stock, values, p_batch_size = batch_size, **kwargs )
+        scenario.reset( p_seed = 1 )
+        scenario.run()
+        states.append( get_state_ztrans(scenario) )
+
+    # Moving average of the values normalized with the parameters of the final window
+    window    = values[-50:]
+    values_ma = values[-50:] if p_remove_obs else values
+    expected  = ( ( values_ma - window.mean(axis=0) ) / window.std(axis=0) ).mean(axis=0)
+
+    for state in states[1:]:
+        np.testing.assert_allclose( state[:3], expected, rtol = 0, atol = 1e-9 )
+        np.testing.assert_allclose( state, states[1], rtol = 0, atol = 1e-9 )
+
+    # The stock task normalizes the delayed instances of the sliding window with different parameters
+    if not p_delay: np.testing.assert_allclose( states[0], states[1], rtol = 0, atol = 1e-9 )
+
+
+## -------------------------------------------------------------------------------------------------
+@pytest.mark.parametrize('p_delay, p_remove_obs', [ (True, True), (False, False) ])
+def test_ztrans_coalescing_successor_state(p_delay, p_remove_obs):
+
+    values = get_random_walk()
+    kwargs = { 'p_delay' : p_delay, 'p_remove_obs' : p_remove_obs }
+    states = []
+
+    # The successor is renormalized once per run by the net transformation
+    for batch_size, coalesce in [ (1, False), (1, True), (7, True) ]:
+        scenario = get_scenario_ztrans( False, values, p_batch_size = batch_size, p_coalesce_events = coalesce, **kwargs )
+        scenario.reset( p_seed = 1 )
+        scenario.run()
+        states.append( get_state_ztrans(scenario) )
+
+    for state in states[1:]:
+        np.testing.assert_allclose( state, states[0], rtol = 0, atol = 1e-9 )
+
+    if p_delay: return
+
+    # Same successor state as the stock task with one event per instance
+    stock = run_cycles( get_scenario_ztrans( True, values, **kwargs ), C_NUM_CYCLES, get_state_ztrans )
+    mlwa  = run_cycles( get_scenario_ztrans( False, values, p_coalesce_events = True, **kwargs ), C_NUM_CYCLES, get_state_ztrans )
+
+    np.testing.assert_allclose( np.array(mlwa), np.array(stock), rtol = 0, atol = 1e-9 )
+
+
+## -------------------------------------------------------------------------------------------------
+def test_ztrans_deferred_adaptation_flushed_at_end_of_run():
+
+    scenario = get_scenario_ztrans( False, get_random_walk(), p_tolerance = 0.5 )
+    events   = []
+    scenario.norm.register_event_handler( p_event_id = scenario.norm.C_EVENT_ADAPTED,
+                                          p_event_handler = lambda p_event_id, p_event_object: events.append(p_event_object) )
+
+    scenario.reset( p_seed = 1 )
+    scenario.run()
+
+    # The last event carries the final parameters, although their change is within the tolerance
+    assert not scenario.norm._adapt_pending
+    np.testing.assert_array_equal( scenario.norm._param_pub, scenario.norm._param_new )
+    assert len(events) > 0
@@ -0,0 +1,62 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Module     : test_streams_ingesting.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-17)
+
+Tests of the live stream mlwa.streams.StreamLive on an appended file.
+
+"""
+
+from mlpro.bf.various import Log
+
+from mlwa.streams import StreamLive
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+def read_file(p_path, p_lines : str) -> tuple:
+
+    p_path.write_text( p_lines )
+
+    stream = StreamLive( p_source = 'file://' + str(p_path),
+                         p_features = [ 'x1', 'x2', 'x3' ],
+                         p_timeout = 0.5,
+                         p_logging = Log.C_LOG_NOTHING )
+
+    try:
+        values = [ list(inst.get_feature_data().get_values()) for inst in stream ]
+        return values, stream.get_num_received(), stream.get_num_invalid()
+    finally:
+        stream.close()
+
+
+## -------------------------------------------------------------------------------------------------
+def test_valid_lines(tmp_path):
+
+    values, num_received, num_invalid = read_file( tmp_path / 'live.csv', '1,2,3\n\n4,5,6\n7,8,9\n' )
+
+    assert values == [ [ 1, 2, 3 ], [ 4, 5, 6 ], [ 7, 8, 9 ] ]
+    assert ( num_received, num_invalid ) == ( 3, 0 )
+
+
+## -------------------------------------------------------------------------------------------------
+def test_invalid_lines_are_skipped(tmp_path):
+
+    # Too many and too few columns compensating each other in the same chunk
+    values, num_received, num_invalid = read_file( tmp_path / 'live.csv', '1,2,3,4\n5,6\n7,8,9\n' )
+
+    assert values == [ [ 7, 8, 9 ] ]
+    assert ( num_received, num_invalid ) == ( 1, 2 )
+
+    # Non-numeric values
+    values, num_received, num_invalid = read_file( tmp_path / 'live.csv', '1,2,3\n4,x,6\n7,8,9\n' )
+
+    assert values == [ [ 1, 2, 3 ], [ 7, 8, 9 ] ]
+    assert ( num_received, num_invalid ) == ( 2, 1 )
@@ -0,0 +1,133 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Module     : test_streams_plotting.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-17)
+
+Bounded ND plot buffers and min/max downsampling of mlwa.streams.plotting.
+
+"""
+
+import numpy as np
+from matplotlib.figure import Figure
+
+from mlpro.bf.various import Log
+from mlpro.bf.plot import PlotSettings
+from mlpro.bf.math.normalizers import NormalizerMinMax
+from mlpro.bf.streams import InstTypeNew
+
+from mlwa.oa import OAStreamTask
+from mlwa.streams import PlotBufferND, downsample_minmax
+
+from helpers import StreamArray, get_random_walk
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+def test_plot_buffer_matches_list():
+
+    rng       = np.random.default_rng(2)
+    buffer    = PlotBufferND( p_capacity = 20, p_num_dim = 2 )
+    reference = []
+
+    for inst_id in range(500):
+        values = rng.normal( size = 2 )
+        assert buffer.append( p_id = inst_id, p_x = inst_id * 0.5, p_values = values ) == ( len(reference) == 20 )
+        reference.append( ( inst_id, inst_id * 0.5, values ) )
+        if len(reference) > 20: reference.pop(0)
+
+        # Removal of the oldest, of an inner and of an unknown row
+        if rng.random() < 0.3:
+            remove_id = reference[ rng.integers(len(reference)) ][0] if rng.random() < 0.5 else reference[0][0]
+            assert buffer.remove( p_id = remove_id )
+            reference = [ row for row in reference if row[0] != remove_id ]
+
+        assert not buffer.remove( p_id = -1 )
+
+        assert len(buffer) == len(reference) <= buffer.get_capacity()
+        assert list(buffer.get_ids()) == [ row[0] for row in reference ]
+        np.testing.assert_array_equal( buffer.get_xdata(), [ row[1] for row in reference ] )
+        np.testing.assert_array_equal( buffer.get_ydata(), np.array([ row[2] for row in reference ]).reshape(-1, 2) )
+
+    # Buffered data are handed over as views
+    assert np.shares_memory( buffer.get_ydata(), buffer._ydata )
+
+
+## -------------------------------------------------------------------------------------------------
+def test_plot_buffer_rescale_and_limits():
+
+    buffer = PlotBufferND( p_capacity = 5, p_num_dim = 2 )
+    assert buffer.get_limits() == ( None, None )
+
+    for inst_id in range(5): buffer.append( p_id = inst_id, p_x = inst_id, p_values = [ inst_id, np.nan ] )
+    assert buffer.get_limits() == ( 0.0, 4.0 )
+
+    buffer.rescale( p_scale = np.array([ 2.0, 1.0 ]), p_offset = np.array([ 1.0, 0.0 ]) )
+    np.testing.assert_array_equal( buffer.get_ydata()[:, 0], [ 1, 3, 5, 7, 9 ] )
+    assert buffer.get_limits() == ( 1.0, 9.0 )
+
+
+## -------------------------------------------------------------------------------------------------
+def test_downsample_minmax_keeps_envelope():
+
+    rng   = np.random.default_rng(4)
+    ydata = np.cumsum( rng.normal( size = (10007, 3) ), axis = 0 )
+    ydata[5000, 1] = 1e6
+
+    idx         = downsample_minmax( p_ydata = ydata, p_num_buckets = 100 )
+    bucket_size = -(-len(ydata) // 100)
+
+    assert idx.shape[1] == 3
+    assert len(idx) <= 2 * 100 + 2
+    assert ( np.diff(idx, axis = 0) >= 0 ).all()
+    assert ( idx[0] == 0 ).all() and ( idx[-1] == len(ydata) - 1 ).all()
+
+    # Minimum and maximum of each bucket are kept for each column
+    for col in range(3):
+        kept = set( idx[:, col].tolist() )
+        for start in range(0, len(ydata), bucket_size):
+            bucket = ydata[start:start + bucket_size, col]
+            assert start + int(np.argmin(bucket)) in kept
+            assert start + int(np.argmax(bucket)) in kept
+
+
+## -------------------------------------------------------------------------------------------------
+def test_plot_nd_bounded_and_downsampled():
+
+    values   = get_random_walk( p_num_inst = 3000 )
+    task     = OAStreamTask( p_logging = Log.C_LOG_NOTHING )
+    settings = PlotSettings( p_view = PlotSettings.C_VIEW_ND, p_step_rate = 1, p_plot_horizon = 1000, p_data_horizon = 0 )
+    task._init_plot_nd( p_figure = Figure( figsize = (2, 2), dpi = 100 ), p_settings = settings )
+
+    for inst in StreamArray( values ):
+        task._update_plot_nd( p_settings = settings, p_instances = { inst.id : ( InstTypeNew, inst ) } )
+
+    # Buffer is bounded to the plot horizon
+    buffer = task._plot_nd_buffer
+    assert buffer.get_capacity() == len(buffer) == 1000
+    np.testing.assert_array_equal( buffer.get_ydata(), values[-1000:] )
+
+    # Lines are reduced to the plot width and keep the envelope
+    num_buckets = int(settings.axes.bbox.width)
+    ylim        = settings.axes.get_ylim()
+
+    for i, feature_plot in enumerate(task._plot_nd_plots):
+        xdata, ydata = feature_plot.get_data()
+        assert len(xdata) <= 2 * num_buckets + 2
+        assert ( ydata.min(), ydata.max() ) == ( values[-1000:, i].min(), values[-1000:, i].max() )
+        assert ylim[0] <= ydata.min() and ydata.max() <= ylim[1]
+
+
+    # Renormalization of the buffered data
+    normalizer = NormalizerMinMax()
+    normalizer.update_parameters( p_boundaries = np.array([ [ -50, 50 ] ] * 3) )
+    normalizer.update_parameters( p_boundaries = np.array([ [ -20, 80 ], [ -100, 0 ], [ 0, 10 ] ]) )
+    task._update_plot_data_nd( p_normalizer = normalizer )
+
+    np.testing.assert_allclose( buffer.get_ydata(), normalizer.renormalize( p_data = values[-1000:].copy() ), rtol = 0, atol = 1e-9 )
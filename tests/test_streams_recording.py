@@ -0,0 +1,75 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Module     : test_streams_recording.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-17)
+
+Record/replay round trip of the stream classes mlwa.streams.StreamRecorder and StreamReplay.
+
+"""
+
+import numpy as np
+
+from mlpro.bf.various import Log
+
+from mlwa.streams import StreamRecorder, StreamReplay
+
+from helpers import StreamArray, get_random_walk
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+def record(p_path, p_values : np.ndarray, p_num_passes : int, p_append : bool = False) -> list:
+
+    recorder = StreamRecorder( p_stream = StreamArray( p_values ),
+                               p_path = str(p_path),
+                               p_append = p_append,
+                               p_buffer_size = 16,
+                               p_logging = Log.C_LOG_NOTHING )
+
+    instances = []
+    for i in range(p_num_passes):
+        instances = [ ( inst.id, inst.tstamp, list(inst.get_feature_data().get_values()) ) for inst in recorder ]
+
+    recorder.close()
+    return instances
+
+
+## -------------------------------------------------------------------------------------------------
+def replay(p_path) -> list:
+
+    stream = StreamReplay( p_path = str(p_path), p_logging = Log.C_LOG_NOTHING )
+    return [ ( inst.id, inst.tstamp, list(inst.get_feature_data().get_values()) ) for inst in stream ]
+
+
+## -------------------------------------------------------------------------------------------------
+def test_record_replay_round_trip(tmp_path):
+
+    values   = get_random_walk( p_num_inst = 50 )
+    recorded = record( tmp_path / 'stream.log', values, p_num_passes = 1 )
+
+    assert len(recorded) == 50
+    assert replay( tmp_path / 'stream.log' ) == recorded
+
+
+## -------------------------------------------------------------------------------------------------
+def test_reset_restarts_log(tmp_path):
+
+    values = get_random_walk( p_num_inst = 50 )
+
+    # Each pass through the stream replaces the log of the previous pass
+    recorded = record( tmp_path / 'stream.log', values, p_num_passes = 3 )
+    assert replay( tmp_path / 'stream.log' ) == recorded
+
+    # With p_append, all passes are recorded
+    record( tmp_path / 'stream_append.log', values, p_num_passes = 3, p_append = True )
+    replayed = replay( tmp_path / 'stream_append.log' )
+
+    assert len(replayed) == 150
+    np.testing.assert_array_equal( np.array([ v for i, t, v in replayed ]), np.vstack( [ values ] * 3 ) )
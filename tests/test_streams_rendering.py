@@ -0,0 +1,163 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Module     : test_streams_rendering.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-17)
+
+Frame dropping of the renderer mlwa.streams.Renderer with plot objects recording their updates.
+
+"""
+
+import time
+
+import numpy as np
+
+from mlpro.bf.various import Log
+from mlpro.bf.math import Element, MSpace
+from mlpro.bf.streams import Feature, Instance, InstTypeNew, InstTypeDel
+
+from mlwa.streams import Renderer
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class PlotObject:
+    """
+    Plot object recording the instance ids and feature values of its plot updates.
+    """
+
+    C_PLOT_ACTIVE = True
+
+    def __init__(self, p_duration : float = 0):
+        self.updates   = []
+        self._duration = p_duration
+
+    def get_visualization(self) -> bool:
+        return True
+
+    def update_plot(self, p_instances = None, **p_kwargs):
+        if self._duration > 0: time.sleep(self._duration)
+        self.updates.append( ( { inst_id : ( inst_type, inst.get_feature_data().get_values()[0] ) for inst_id, (inst_type, inst) in p_instances.items() }, p_kwargs ) )
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class Workflow (PlotObject):
+
+    def __init__(self, p_tasks : list):
+        super().__init__()
+        self._tasks = p_tasks
+
+    def get_tasks(self) -> list:
+        return self._tasks
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+def get_instances(p_ids, p_type = InstTypeNew) -> dict:
+
+    space = MSpace()
+    space.add_dim( Feature( p_name_short = 'x' ) )
+
+    instances = {}
+    for inst_id in p_ids:
+        element = Element( space )
+        element.set_values( np.array([ float(inst_id) ]) )
+        inst    = Instance( p_feature_data = element )
+        inst.id = inst_id
+        instances[inst_id] = ( p_type, inst )
+
+    return instances
+
+
+## -------------------------------------------------------------------------------------------------
+def test_frame_dropping():
+
+    tasks    = [ PlotObject(), PlotObject() ]
+    workflow = Workflow( tasks )
+    renderer = Renderer( p_frame_rate = 1e-3, p_logging = Log.C_LOG_NOTHING )
+    renderer.attach( workflow )
+
+    # 1 The first update of each object initializes its plot immediately
+    for plot_obj in [ workflow ] + tasks: plot_obj.update_plot( p_instances = get_instances([0]) )
+    assert all( len(plot_obj.updates) == 1 for plot_obj in [ workflow ] + tasks )
+
+
+    # 2 Updates are merged into one frame per object
+    for inst_id in range(1, 11):
+        for plot_obj in [ workflow ] + tasks: plot_obj.update_plot( p_instances = get_instances([inst_id]) )
+
+    assert renderer.render()
+    assert renderer.get_num_frames() == 1
+    assert renderer.get_num_updates() == 30
+
+    for plot_obj in [ workflow ] + tasks:
+        assert len(plot_obj.updates) == 2
+        assert sorted(plot_obj.updates[1][0]) == list(range(1, 11))
+
+
+    # 3 Frames that are not yet due are dropped, their updates are drawn by the next frame
+    for inst_id in range(11, 51):
+        tasks[0].update_plot( p_instances = get_instances([inst_id]) )
+        assert not renderer.render()
+
+    assert len(tasks[0].updates) == 2
+
+    renderer.flush()
+    assert renderer.get_num_frames() == 2
+    assert len(tasks[0].updates) == 3
+    assert sorted(tasks[0].updates[2][0]) == list(range(11, 51))
+    assert len(tasks[1].updates) == 2
+
+    # Nothing to draw
+    assert not renderer.render( p_force = True )
+
+
+## -------------------------------------------------------------------------------------------------
+def test_merged_updates():
+
+    task     = PlotObject()
+    renderer = Renderer( p_logging = Log.C_LOG_NOTHING )
+    renderer.attach( Workflow([ task ]) )
+    task.update_plot( p_instances = get_instances([0]) )
+
+    # 1 Instances are taken over as snapshots
+    instances = get_instances([ 1, 2, 3 ])
+    task.update_plot( p_instances = instances, p_step = 1 )
+    instances[1][1].get_feature_data().set_values( np.array([ 99.0 ]) )
+
+
+    # 2 Instances added and removed again within a frame are dropped, other removals are kept
+    task.update_plot( p_instances = { **get_instances([ 2 ], InstTypeDel), **get_instances([ 0 ], InstTypeDel) }, p_step = 2 )
+    renderer.render()
+
+    instances, kwargs = task.updates[-1]
+    assert instances == { 1 : ( InstTypeNew, 1.0 ), 3 : ( InstTypeNew, 3.0 ), 0 : ( InstTypeDel, 0.0 ) }
+    assert kwargs == { 'p_step' : 2 }
+
+
+## -------------------------------------------------------------------------------------------------
+def test_load_limit():
+
+    # Slow plots reduce the frame rate instead of the processing throughput
+    task     = PlotObject( p_duration = 0.02 )
+    renderer = Renderer( p_frame_rate = 1000, p_max_load = 0.1, p_logging = Log.C_LOG_NOTHING )
+    renderer.attach( Workflow([ task ]) )
+    task.update_plot( p_instances = get_instances([0]) )
+    task.update_plot( p_instances = get_instances([1]) )
+
+    tp_before = time.perf_counter()
+    assert renderer.render()
+
+    task.update_plot( p_instances = get_instances([2]) )
+    assert renderer._tp_next_frame >= tp_before + 0.2
+    assert not renderer.render()
@@ -0,0 +1,224 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Module     : test_streams_scheduling.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-17)
+
+Deadline pacing, deadline misses and load shedding of the cycle scheduler mlwa.streams.CycleScheduler
+on a virtual clock, and the scheduler in a stream scenario in real-time mode.
+
+"""
+
+import numpy as np
+import pytest
+
+from mlpro.bf.various import Log
+from mlpro.bf.ops import Mode
+from mlpro.bf.exceptions import ParamError
+
+import mlwa.streams.scheduling as scheduling
+from mlwa.streams import CycleScheduler
+from mlwa.oa import OAStreamScenario, OAStreamWorkflow
+
+from helpers import StreamArray, StreamTaskCollector, get_random_walk
+
+
+
+
+C_PERIOD        = 0.01
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class Clock:
+    """
+    Virtual replacement of module time. Sleeping and working advance the clock exactly, each reading
+    advances it by C_TICK as a busy-wait would.
+    """
+
+    C_TICK = 1e-7
+
+    def __init__(self):
+        self.now = 0.0
+
+    def perf_counter(self) -> float:
+        self.now += self.C_TICK
+        return self.now
+
+    def sleep(self, p_sec : float):
+        self.now += p_sec
+
+    def work(self, p_sec : float):
+        self.now += p_sec
+
+
+## -------------------------------------------------------------------------------------------------
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr( scheduling, 'time', clock )
+    return clock
+
+
+## -------------------------------------------------------------------------------------------------
+def run(p_scheduler : CycleScheduler, p_clock : Clock, p_durations : list) -> list:
+    """
+    Runs cycles of the given processing durations (multiples of C_PERIOD) and returns the results of
+    the waits. Each cycle consumes the slots of the sampling factor of the scheduler.
+    """
+
+    met = []
+    for duration in p_durations:
+        p_clock.work( duration * C_PERIOD )
+        met.append( p_scheduler.wait( p_num_slots = p_scheduler.get_sampling() ) )
+
+    return met
+
+
+## -------------------------------------------------------------------------------------------------
+def test_parameters():
+
+    with pytest.raises(ParamError):
+        CycleScheduler( p_cycle_period = 0, p_logging = Log.C_LOG_NOTHING )
+
+    with pytest.raises(ParamError):
+        CycleScheduler( p_cycle_period = C_PERIOD, p_max_sampling = 0, p_logging = Log.C_LOG_NOTHING )
+
+
+## -------------------------------------------------------------------------------------------------
+def test_pacing_without_drift(clock):
+
+    scheduler = CycleScheduler( p_cycle_period = C_PERIOD, p_logging = Log.C_LOG_NOTHING )
+    assert all( run( scheduler, clock, [ 0.4 ] * 100 ) )
+
+    # Cycles start on the absolute schedule
+    assert clock.now == pytest.approx( 100 * C_PERIOD, abs = 1e-5 )
+
+    stats = scheduler.get_statistics()
+    assert ( stats['cycles'], stats['slots'], stats['misses'] ) == ( 100, 100, 0 )
+    assert stats['lateness_mean'] == pytest.approx( -0.6 * C_PERIOD, abs = 1e-5 )
+    assert stats['utilization'] == pytest.approx( 0.4, abs = 1e-3 )
+    assert stats['jitter_max'] < 1e-5
+
+    # All lateness values are in bin [-0.75, -0.5) periods, all jitter values in the first bin
+    edges, counts = stats['lateness_hist']
+    np.testing.assert_allclose( edges[1:3], [ -0.75 * C_PERIOD, -0.5 * C_PERIOD ] )
+    assert list(counts) == [ 0, 100, 0, 0, 0, 0, 0, 0, 0, 0 ]
+    assert list(stats['jitter_hist'][1]) == [ 100, 0, 0, 0, 0, 0, 0, 0 ]
+
+    # A new start resets the statistics
+    scheduler.start()
+    assert scheduler.get_statistics()['cycles'] == 0
+
+
+## -------------------------------------------------------------------------------------------------
+@pytest.mark.parametrize('p_catch_up', [ True, False ])
+def test_deadline_misses(clock, p_catch_up : bool):
+
+    # The first cycle takes 3.5 slots
+    scheduler = CycleScheduler( p_cycle_period = C_PERIOD, p_catch_up = p_catch_up, p_logging = Log.C_LOG_NOTHING )
+    met       = run( scheduler, clock, [ 3.5 ] + [ 0.2 ] * 19 )
+
+    if p_catch_up:
+        # The next cycles start immediately until the schedule is caught up
+        assert met == [ False ] * 4 + [ True ] * 16
+        assert clock.now == pytest.approx( 20 * C_PERIOD, abs = 1e-5 )
+    else:
+        # The schedule is restarted after the late cycle
+        assert met == [ False ] + [ True ] * 19
+        assert clock.now == pytest.approx( 22.5 * C_PERIOD, abs = 1e-5 )
+
+    stats = scheduler.get_statistics()
+    assert scheduler.get_num_misses() == stats['misses'] == met.count(False)
+    assert stats['miss_rate'] == met.count(False) / 20
+    assert stats['lateness_max'] == pytest.approx( 2.5 * C_PERIOD, abs = 1e-5 )
+    assert stats['lateness_hist'][1][-2] == 1
+
+
+## -------------------------------------------------------------------------------------------------
+def test_load_shedding(clock):
+
+    scheduler = CycleScheduler( p_cycle_period = C_PERIOD, p_catch_up = False, p_shedding = True, p_logging = Log.C_LOG_NOTHING )
+    scheduler.C_WINDOW = 10
+
+    def run_windows(p_duration : float, p_num_windows : int) -> list:
+        levels = []
+        for i in range(p_num_windows):
+            run( scheduler, clock, [ p_duration ] * scheduler.C_WINDOW )
+            levels.append( ( scheduler.get_shedding_level(), scheduler.get_skip_plots(), scheduler.get_sampling() ) )
+        return levels
+
+    # Overload of 3 slots per cycle: skipping the plots, then sampling until the deadlines are met
+    assert run_windows( 3, 4 ) == [ ( 1, True, 1 ), ( 2, True, 2 ), ( 3, True, 4 ), ( 3, True, 4 ) ]
+
+    # The levels are restored one by one as soon as the slots of the previous level suffice
+    assert run_windows( 0.4, 4 ) == [ ( 2, True, 2 ), ( 1, True, 1 ), ( 0, False, 1 ), ( 0, False, 1 ) ]
+
+
+    # Without skipping the plots, sampling is limited to p_max_sampling
+    scheduler = CycleScheduler( p_cycle_period = C_PERIOD, p_catch_up = False, p_shedding = True, p_shed_plots = False, p_max_sampling = 4, p_logging = Log.C_LOG_NOTHING )
+    scheduler.C_WINDOW = 10
+
+    assert run_windows( 10, 4 ) == [ ( 1, False, 2 ), ( 2, False, 4 ), ( 2, False, 4 ), ( 2, False, 4 ) ]
+
+
+## -------------------------------------------------------------------------------------------------
+def get_scenario(p_values : np.ndarray, p_scheduler : CycleScheduler, p_mode = Mode.C_MODE_REAL):
+
+    class Scenario (OAStreamScenario):
+
+        C_NAME = 'Scheduled'
+
+        def _setup(self, p_mode, p_ada : bool, p_visualize : bool, p_logging):
+
+            workflow = OAStreamWorkflow( p_name = 'Scheduled',
+                                         p_range_max = OAStreamWorkflow.C_RANGE_NONE,
+                                         p_ada = p_ada,
+                                         p_logging = p_logging )
+
+            self.collector = StreamTaskCollector()
+            workflow.add_task( p_task = self.collector )
+            return StreamArray( p_values ), workflow
+
+    return Scenario( p_mode = p_mode, p_cycle_limit = len(p_values), p_visualize = False, p_scheduler = p_scheduler, p_logging = Log.C_LOG_NOTHING )
+
+
+## -------------------------------------------------------------------------------------------------
+@pytest.mark.parametrize('p_sampling', [ 1, 2 ])
+def test_scenario_real_time(clock, p_sampling : int):
+
+    values    = get_random_walk( p_num_inst = 40 )
+    scheduler = CycleScheduler( p_cycle_period = C_PERIOD, p_logging = Log.C_LOG_NOTHING )
+    scheduler.get_sampling = lambda: p_sampling
+
+    scenario = get_scenario( values, scheduler )
+    scenario.reset( p_seed = 1 )
+    scenario.run()
+
+    # Dropped instances own their slots, so that the run takes one slot per instance
+    collected = scenario.collector.instances
+    assert [ inst_id for inst_id, inst_values in collected ] == list(range(p_sampling - 1, 40, p_sampling))
+    np.testing.assert_array_equal( np.array([ v for i, v in collected ]), values[p_sampling - 1::p_sampling] )
+
+    stats = scheduler.get_statistics()
+    assert ( stats['cycles'], stats['slots'] ) == ( 40 // p_sampling, 40 )
+    assert clock.now >= 40 * C_PERIOD
+
+
+## -------------------------------------------------------------------------------------------------
+def test_scenario_simulation(clock):
+
+    # In simulation mode, the cycles are not paced
+    scheduler = CycleScheduler( p_cycle_period = C_PERIOD, p_logging = Log.C_LOG_NOTHING )
+    scenario  = get_scenario( get_random_walk( p_num_inst = 40 ), scheduler, p_mode = Mode.C_MODE_SIM )
+    scenario.reset( p_seed = 1 )
+    scenario.run()
+
+    assert len(scenario.collector.instances) == 40
+    assert scheduler.get_statistics()['cycles'] == 0
+    assert clock.now < C_PERIOD
@@ -0,0 +1,50 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Module     : test_streams_streams.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-17)
+
+Parity of the benchmark streams of mlwa.streams.streams with the stock streams of MLPro.
+
+"""
+
+import numpy as np
+import pytest
+
+from mlpro.bf.various import Log
+import mlpro.bf.streams.streams as mlpro_streams
+
+import mlwa.streams.streams as mlwa_streams
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+def get_instances(p_stream, p_num_passes : int = 2) -> list:
+
+    passes = []
+
+    for i in range(p_num_passes):
+        passes.append( [ ( inst.id, list(inst.get_feature_data().get_values()) ) for inst in p_stream ] )
+
+    return passes
+
+
+## -------------------------------------------------------------------------------------------------
+@pytest.mark.parametrize( 'p_cls, p_kwargs',
+                          [ ( 'StreamMLProClouds', dict( p_num_dim = 3, p_num_instances = 500, p_num_clouds = 4, p_seed = 1 ) ),
+                            ( 'StreamMLProPOutliers', dict( p_functions = [ 'sin', 'cos', 'const', 'lin' ], p_num_instances = 500, p_seed = 1 ) ) ] )
+def test_stream_parity_with_mlpro(p_cls : str, p_kwargs : dict):
+
+    stock = get_instances( getattr(mlpro_streams, p_cls)( p_logging = Log.C_LOG_NOTHING, **p_kwargs ) )
+    mlwa  = get_instances( getattr(mlwa_streams, p_cls)( p_logging = Log.C_LOG_NOTHING, **p_kwargs ) )
+
+    assert len(mlwa[0]) == 500
+    assert [ [ i for i, v in p ] for p in mlwa ] == [ [ i for i, v in p ] for p in stock ]
+    np.testing.assert_array_equal( np.array([ [ v for i, v in p ] for p in mlwa ]),
+                                   np.array([ [ v for i, v in p ] for p in stock ]) )
@@ -0,0 +1,165 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Module     : test_streams_tasks.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.1.0 (2026-10-17)
+
+Parity of the stream tasks of mlwa.streams.tasks with the stock tasks of MLPro.
+
+"""
+
+import numpy as np
+import pytest
+
+from mlpro.bf.various import Log
+from mlpro.bf.math import Element, MSpace
+from mlpro.bf.streams import Feature, Label, Instance, InstTypeNew, StreamWorkflow
+from mlpro.bf.streams.tasks import Rearranger as RearrangerMLPro
+
+from mlwa.streams.tasks import Rearranger, RingBuffer
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+def get_spaces():
+
+    feature_space = MSpace()
+    for i in range(3): feature_space.add_dim( Feature( p_name_short = 'f' + str(i + 1) ) )
+
+    label_space = MSpace()
+    for i in range(2): label_space.add_dim( Label( p_name_short = 'l' + str(i + 1) ) )
+
+    return feature_space, label_space
+
+
+## -------------------------------------------------------------------------------------------------
+def get_instances(p_feature_space, p_label_space, p_num_inst : int, p_labels : bool = True) -> dict:
+
+    instances = {}
+
+    for i in range(p_num_inst):
+        feature_data = Element( p_feature_space )
+        feature_data.set_values( np.array([ i, 10 + i, 20 + i ], dtype=np.float64) )
+
+        if p_labels:
+            label_data = Element( p_label_space )
+            label_data.set_values( np.array([ 100 + i, 200 + i ], dtype=np.float64) )
+        else:
+            label_data = None
+
+        inst = Instance( p_feature_data = feature_data, p_label_data = label_data )
+        inst.id = i
+        instances[i] = ( InstTypeNew, inst )
+
+    return instances
+
+
+## -------------------------------------------------------------------------------------------------
+def rearrange(p_cls, p_instances : dict, p_features_new : list, p_labels_new : list) -> list:
+
+    task = p_cls( p_features_new = p_features_new, p_labels_new = p_labels_new, p_logging = Log.C_LOG_NOTHING )
+    task._run( p_instances = p_instances )
+
+    result = []
+    for inst_type, inst in p_instances.values():
+        label_data = inst.get_label_data()
+        result.append( ( list(inst.get_feature_data().get_values()),
+                         None if label_data is None else list(label_data.get_values()) ) )
+    return result
+
+
+## -------------------------------------------------------------------------------------------------
+def test_rearranger_parity_with_mlpro():
+
+    feature_space, label_space = get_spaces()
+    features, labels           = feature_space.get_dims(), label_space.get_dims()
+    features_new               = [ ( 'F', [ features[2], features[0] ] ), ( 'L', [ labels[1] ] ) ]
+    labels_new                 = [ ( 'F', [ features[1] ] ), ( 'L', [ labels[0] ] ) ]
+
+    stock = rearrange( RearrangerMLPro, get_instances(feature_space, label_space, 5), features_new, labels_new )
+    mlwa  = rearrange( Rearranger, get_instances(feature_space, label_space, 5), features_new, labels_new )
+
+    assert mlwa == stock
+
+
+## -------------------------------------------------------------------------------------------------
+def test_rearranger_without_label_data():
+
+    feature_space, label_space = get_spaces()
+    features, labels           = feature_space.get_dims(), label_space.get_dims()
+
+    # Labels mapped to features, but no label space is available
+    instances = get_instances(feature_space, label_space, 3, p_labels = False)
+    result    = rearrange( Rearranger, instances, [ ( 'F', [ features[1] ] ), ( 'L', [ labels[0] ] ) ], [] )
+    assert [ f for f, l in result ] == [ [ 10 + i, 0 ] for i in range(3) ]
+
+    # Label space from the first instance, but later instances without label data
+    instances = get_instances(feature_space, label_space, 2)
+    instances.update( { i + 2 : ( t, inst ) for i, (t, inst) in enumerate(get_instances(feature_space, label_space, 2, p_labels = False).values()) } )
+    result    = rearrange( Rearranger, instances, [ ( 'F', [ features[0] ] ), ( 'L', [ labels[1] ] ) ], [ ( 'L', [ labels[0] ] ) ] )
+
+    assert result == [ ( [ 0, 200 ], [ 100 ] ),
+                       ( [ 1, 201 ], [ 101 ] ),
+                       ( [ 0, 0 ], None ),
+                       ( [ 1, 0 ], None ) ]
+
+
+## -------------------------------------------------------------------------------------------------
+def test_rearranger_configuration_error():
+
+    feature_space, label_space = get_spaces()
+    other_space, other_labels  = get_spaces()
+    rearranger = Rearranger( p_features_new = [ ( 'F', other_space.get_dims()[:1] ) ], p_logging = Log.C_LOG_NOTHING )
+
+    # Empty input is skipped, unknown features are reported
+    rearranger._run( p_instances = {} )
+    with pytest.raises(ValueError):
+        rearranger._run( p_instances = get_instances( feature_space, label_space, 2 ) )
+
+
+## -------------------------------------------------------------------------------------------------
+def test_ring_buffer_statistics():
+
+    feature_space, label_space = get_spaces()
+
+    rng    = np.random.default_rng(5)
+    values = rng.normal( size = (60, 3) )
+    values[ rng.random( values.shape ) < 0.1 ] = np.nan
+
+    ring     = RingBuffer( p_buffer_size = 10, p_enable_statistics = True, p_logging = Log.C_LOG_NOTHING )
+    workflow = StreamWorkflow( p_range_max = StreamWorkflow.C_RANGE_NONE, p_logging = Log.C_LOG_NOTHING )
+    workflow.add_task( p_task = ring )
+
+    def run(p_start : int, p_stop : int, p_first : int = 0):
+        instances = {}
+        for i in range(p_start, p_stop):
+            feature_data = Element( feature_space )
+            feature_data.set_values( values[i].copy() )
+            inst    = Instance( p_feature_data = feature_data )
+            inst.id = i
+            instances[i] = ( InstTypeNew, inst )
+
+        workflow.run( p_instances = instances )
+
+        window = values[ max(p_first, p_stop - 10) : p_stop ]
+        np.testing.assert_allclose( ring.get_boundaries()[:, 0], np.nanmin(window, axis=0), rtol = 0, atol = 1e-12 )
+        np.testing.assert_allclose( ring.get_boundaries()[:, 1], np.nanmax(window, axis=0), rtol = 0, atol = 1e-12 )
+        np.testing.assert_allclose( ring.get_mean(), np.nanmean(window, axis=0), rtol = 0, atol = 1e-12 )
+        np.testing.assert_allclose( ring.get_variance(), np.nanvar(window, axis=0), rtol = 0, atol = 1e-12 )
+
+    # Single instances, a partially filled window and a batch larger than the buffer
+    for i in range(4): run( i, i + 1 )
+    run( 4, 27 )
+    for i in range(27, 40, 3): run( i, i + 3 )
+
+    # After a reset, the statistics refer to the new instances only
+    workflow.reset()
+    assert ring.get_mean() is None
+    run( 40, 45, p_first = 40 )
+    run( 45, 60, p_first = 40 )
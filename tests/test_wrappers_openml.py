@@ -0,0 +1,191 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Module     : test_wrappers_openml.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.2.0 (2026-10-17)
+
+Behavior of the OpenML streams of mlwa.wrappers.openml and the feature pushdown of
+mlwa.oa.OAStreamScenario offline: a local copy of data set 1477 with
+the meta data of folder example1/dataset and synthetic data is provided in a temporary OpenML cache.
+
+"""
+
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import openml
+
+from mlpro.bf.various import Log
+from mlpro.bf.ops import Mode
+
+from mlwa.oa import OAStreamScenario, OAStreamWorkflow
+from mlwa.streams.tasks import Rearranger
+from mlwa.wrappers.openml import WrStreamProviderOpenML, WrStreamOpenML
+
+from helpers import StreamTaskCollector
+
+
+
+
+C_DIR_1477      = os.path.join( os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'example1', 'dataset', '1477' )
+C_NUM_INST      = 300
+C_NUM_FEATURES  = 128
+
+
+## -------------------------------------------------------------------------------------------------
+@pytest.fixture
+def local_dir(tmp_path, monkeypatch) -> tuple:
+    """
+    Temporary OpenML cache and local copy of data set 1477. Returns the folder of the local copy, the
+    feature values and the labels.
+    """
+
+    monkeypatch.setattr( openml.config, '_root_cache_directory', tmp_path / 'openml' )
+
+    # Several blocks of rows per stream
+    monkeypatch.setattr( WrStreamOpenML, 'C_BLOCK_SIZE', 64 )
+
+    rng    = np.random.default_rng(1)
+    values = rng.normal( size = (C_NUM_INST, C_NUM_FEATURES) )
+    labels = rng.integers( 1, 7, size = C_NUM_INST )
+
+    local_copy = tmp_path / 'local' / '1477'
+    shutil.copytree( C_DIR_1477, local_copy )
+
+    data          = pd.DataFrame({ 'V' + str(i + 1) : values[:, i] for i in range(C_NUM_FEATURES) })
+    data['Class'] = pd.Categorical( [ str(label) for label in labels ], categories = [ str(i) for i in range(1, 7) ] )
+    data.to_parquet( local_copy / 'dataset_1477.pq' )
+
+    return str(tmp_path / 'local'), values, labels
+
+
+## -------------------------------------------------------------------------------------------------
+def get_stream(p_local_dir : str) -> WrStreamOpenML:
+    provider = WrStreamProviderOpenML( p_local_dirs = [ p_local_dir ], p_logging = Log.C_LOG_NOTHING )
+    return provider.get_stream( p_id = '1477', p_logging = Log.C_LOG_NOTHING )
+
+
+## -------------------------------------------------------------------------------------------------
+def read(p_stream, p_num_inst : int = C_NUM_INST) -> tuple:
+    """
+    Reads instances from the current stream position without resetting the stream. Returns the
+    instance ids, feature values and labels.
+    """
+
+    ids, values, labels = [], [], []
+
+    try:
+        while len(ids) < p_num_inst:
+            inst = next(p_stream)
+            ids.append( inst.id )
+            values.append( inst.get_feature_data().get_values().copy() )
+            labels.append( inst.get_label_data().get_values()[0] )
+    except StopIteration:
+        pass
+
+    return ids, np.array(values), np.array(labels)
+
+
+## -------------------------------------------------------------------------------------------------
+def test_seek_matches_linear_read(local_dir):
+
+    stream              = get_stream( local_dir[0] )
+    ids, values, labels = read( iter(stream) )
+
+    assert ids == list(range(C_NUM_INST))
+
+    # Forwards and backwards across block boundaries
+    for index in [ 100, 63, 250, 0, C_NUM_INST - 1 ]:
+        stream.seek( p_index = index )
+        ids_seek, values_seek, labels_seek = read( stream, p_num_inst = 10 )
+
+        assert ids_seek == list(range(index, min(index + 10, C_NUM_INST)))
+        np.testing.assert_array_equal( values_seek, values[index:index + 10] )
+        np.testing.assert_array_equal( labels_seek, labels[index:index + 10] )
+
+
+## -------------------------------------------------------------------------------------------------
+def test_columnar_cache(local_dir, monkeypatch):
+
+    local_path, values, labels = local_dir
+
+    # 1 First access converts the local copy into the columnar cache
+    stream     = get_stream( local_path )
+    cache_path = stream.get_cache_path()
+    ids, values_read, labels_read = read( iter(stream) )
+
+    assert cache_path == os.path.join( openml.config.get_cache_directory(), 'columnar', '1477' )
+    assert sorted(os.listdir(cache_path)) == sorted( [ 'f_' + str(i) + '.npy' for i in range(C_NUM_FEATURES) ] + [ 'label.npy', WrStreamOpenML.C_CACHE_META ] )
+    assert stream.get_num_instances() == C_NUM_INST
+    np.testing.assert_array_equal( values_read, values )
+    np.testing.assert_array_equal( labels_read, labels )
+
+
+    # 2 Later accesses open the cache without OpenML and without the local copy
+    shutil.rmtree( local_path )
+    shutil.rmtree( os.path.join( openml.config.get_cache_directory(), 'datasets' ) )
+
+    def get_dataset(*p_args, **p_kwargs):
+        raise AssertionError('Data set parsed again')
+
+    monkeypatch.setattr( openml.datasets, 'get_dataset', get_dataset )
+
+    stream = get_stream( local_path )
+    ids, values_read, labels_read = read( iter(stream) )
+
+    assert all( isinstance(column, np.memmap) for column in stream._columns )
+    np.testing.assert_array_equal( values_read, values )
+    np.testing.assert_array_equal( labels_read, labels )
+
+
+## -------------------------------------------------------------------------------------------------
+@pytest.mark.parametrize('p_pushdown', [ False, True ])
+def test_feature_pushdown(local_dir, p_pushdown : bool):
+
+    local_path, values, labels = local_dir
+
+    class Scenario (OAStreamScenario):
+        """
+        Scenario of example 1a up to the rearranger keeping features V5-V7.
+        """
+
+        C_NAME              = 'Pushdown'
+        C_FEATURE_PUSHDOWN  = p_pushdown
+
+        def _setup(self, p_mode, p_ada : bool, p_visualize : bool, p_logging):
+
+            stream   = get_stream( local_path )
+            features = stream.get_feature_space().get_dims()
+
+            workflow = OAStreamWorkflow( p_name = 'Pushdown',
+                                         p_range_max = OAStreamWorkflow.C_RANGE_NONE,
+                                         p_ada = p_ada,
+                                         p_logging = p_logging )
+
+            rearranger = Rearranger( p_features_new = [ ( 'F', [ features[i] for i in [4, 5, 6] ] ) ], p_logging = p_logging )
+            self.collector = StreamTaskCollector()
+
+            workflow.add_task( p_task = rearranger )
+            workflow.add_task( p_task = self.collector, p_pred_tasks = [ rearranger ] )
+            return stream, workflow
+
+    scenario = Scenario( p_mode = Mode.C_MODE_SIM, p_visualize = False, p_logging = Log.C_LOG_NOTHING )
+    scenario.reset( p_seed = 1 )
+    scenario.run()
+
+    collected = scenario.collector.instances
+    stream    = scenario.get_stream()
+
+    # Same downstream values, but only the columns of V5-V7 are read with pushdown
+    assert [ inst_id for inst_id, inst_values in collected ] == list(range(C_NUM_INST))
+    np.testing.assert_array_equal( np.array([ v for i, v in collected ]), values[:, 4:7] )
+    assert stream._block.shape[1] == ( 3 if p_pushdown else C_NUM_FEATURES )
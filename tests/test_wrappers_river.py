@@ -0,0 +1,105 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Module     : test_wrappers_river.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-17)
+
+Feature dictionaries of the River KMeans wrapper mlwa.wrappers.river.WrRiverKMeans2MLPro compared to
+the conversion of the stock wrapper of mlpro_int_river.
+
+"""
+
+import numpy as np
+
+from mlpro.bf.various import Log
+from mlpro.bf.ops import Mode
+from mlpro.bf.math.normalizers import NormalizerMinMax
+import mlpro.oa.streams as mlpro_oa
+from mlpro_int_river.wrappers.clusteranalyzers import WrRiverKMeans2MLPro as WrRiverKMeans2MLProRoot
+
+import mlwa.oa as mlwa_oa
+from mlwa.wrappers.river import WrRiverKMeans2MLPro, _FeatureDict
+
+from helpers import StreamArray, run_cycles
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+def test_feature_dict_round_trip():
+
+    feature_dict = _FeatureDict( p_num_dim = 4 )
+    values       = np.array([ 1.5, -2.0, 0.0, 3.25 ])
+
+    # Same dictionary as the stock conversion, but one object for all instances
+    result = feature_dict.to_dict(values)
+    assert result == dict(enumerate(values.flatten(), 1))
+    assert all( type(value) is float for value in result.values() )
+    assert feature_dict.to_dict( values * 2 ) is result
+    assert result == dict(enumerate(( values * 2 ).flatten(), 1))
+
+    out = np.zeros(4)
+    feature_dict.to_array( { 4 : 7.0, 1 : 4.0, 3 : 6.0, 2 : 5.0 }, out )
+    np.testing.assert_array_equal( out, [ 4.0, 5.0, 6.0, 7.0 ] )
+
+
+## -------------------------------------------------------------------------------------------------
+def get_scenario(p_stock : bool, p_values : np.ndarray):
+
+    oa  = mlpro_oa if p_stock else mlwa_oa
+    cls = WrRiverKMeans2MLProRoot if p_stock else WrRiverKMeans2MLPro
+
+    class Scenario (oa.OAStreamScenario):
+
+        C_NAME = 'River KMeans'
+
+        def _setup(self, p_mode, p_ada : bool, p_visualize : bool, p_logging):
+
+            workflow = oa.OAStreamWorkflow( p_name = 'KMeans',
+                                            p_range_max = oa.OAStreamWorkflow.C_RANGE_NONE,
+                                            p_ada = p_ada,
+                                            p_logging = p_logging )
+
+            self.clusterer = cls( p_n_clusters = 3, p_halflife = 0.2, p_sigma = 2, p_seed = 7, p_logging = p_logging )
+            workflow.add_task( p_task = self.clusterer )
+            return StreamArray( p_values ), workflow
+
+    return Scenario( p_mode = Mode.C_MODE_SIM, p_visualize = False, p_logging = Log.C_LOG_NOTHING )
+
+
+## -------------------------------------------------------------------------------------------------
+def get_centers(p_scenario) -> np.ndarray:
+    centers = p_scenario.clusterer._river_algo.centers
+    return np.array([ [ centers[cluster_id][key] for key in sorted(centers[cluster_id]) ] for cluster_id in sorted(centers) ])
+
+
+## -------------------------------------------------------------------------------------------------
+def test_river_state_parity():
+
+    values = np.random.default_rng(3).normal( size = (150, 5) )
+
+    scenario_stock = get_scenario( True, values )
+    scenario       = get_scenario( False, values )
+
+    # River's centers after each instance
+    centers_stock = run_cycles( scenario_stock, 150, get_centers )
+    centers       = run_cycles( scenario, 150, get_centers )
+
+    np.testing.assert_allclose( np.array(centers), np.array(centers_stock), rtol = 0, atol = 1e-12 )
+    np.testing.assert_array_equal( scenario.clusterer.get_centroids(), centers[-1] )
+
+
+    # Renormalized centroids are written back to River with the same keys
+    normalizer = NormalizerMinMax()
+    normalizer.update_parameters( p_boundaries = np.array([ [ -3, 3 ] ] * 5) )
+    normalizer.update_parameters( p_boundaries = np.array([ [ -2, 4 ] ] * 5) )
+    scenario.clusterer._renormalize( p_normalizer = normalizer )
+
+    assert all( sorted(center) == [ 1, 2, 3, 4, 5 ] for center in scenario.clusterer._river_algo.centers.values() )
+    np.testing.assert_array_equal( get_centers(scenario), scenario.clusterer.get_centroids() )
+    np.testing.assert_allclose( scenario.clusterer.get_centroids(), normalizer.renormalize( p_data = centers[-1].copy() ), rtol = 0, atol = 1e-12 )
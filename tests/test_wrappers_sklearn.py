@@ -0,0 +1,182 @@
+## -------------------------------------------------------------------------------------------------
+## -- Paper      : MLPro 2.0 - Online machine learning in Python
+## -- Journal    : ScienceDirect, Machine Learning with Applications (MLWA)
+## -- Authors    : Detlef Arend, Laxmikant Shrikant Baheti, Steve Yuwono,
+## --              Syamraj Purushamparambil Satheesh Kumar, Andreas Schwung
+## -- Module     : test_wrappers_sklearn.py
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-17)
+
+Anomalies of the scikit-learn wrapper mlwa.wrappers.sklearn.WrAnomalyDetectorSklearn2MLPro compared
+to the stock wrapper of mlpro_int_sklearn, with default parameters, batch scoring and model reuse.
+
+"""
+
+import numpy as np
+import pytest
+from sklearn.covariance import EllipticEnvelope
+from sklearn.neighbors import LocalOutlierFactor
+
+from mlpro.bf.various import Log
+from mlpro.bf.math import Element, MSpace
+from mlpro.bf.streams import Feature, Instance, InstTypeNew
+from mlpro_int_sklearn.wrappers.anomalydetectors import WrAnomalyDetectorSklearn2MLPro as WrAnomalyDetectorSklearn2MLProRoot
+
+from mlwa.wrappers.sklearn import WrAnomalyDetectorSklearn2MLPro
+
+
+
+
+C_NUM_INST      = 200
+C_OUTLIERS      = [ 37, 38, 39, 80, 121, 166, 167 ]
+
+
+## -------------------------------------------------------------------------------------------------
+class EllipticEnvelopeCounted (EllipticEnvelope):
+    """
+    Elliptic envelope counting its fits.
+    """
+
+    num_fits = 0
+
+    def fit(self, X, y=None):
+        EllipticEnvelopeCounted.num_fits += 1
+        return super().fit(X, y)
+
+
+## -------------------------------------------------------------------------------------------------
+def get_lof():
+    return LocalOutlierFactor( n_neighbors = 5 )
+
+
+## -------------------------------------------------------------------------------------------------
+def get_envelope():
+    return EllipticEnvelopeCounted( random_state = 0 )
+
+
+## -------------------------------------------------------------------------------------------------
+def get_instances() -> list:
+    """
+    Stationary instances with a few outliers, partly consecutive (group anomalies).
+    """
+
+    rng    = np.random.default_rng(5)
+    values = rng.normal( size = (C_NUM_INST, 3) )
+    values[C_OUTLIERS] += 12
+
+    space = MSpace()
+    for i in range(3): space.add_dim( Feature( p_name_short = 'x' + str(i + 1) ) )
+
+    instances = []
+    for inst_id, row in enumerate(values):
+        element = Element( space )
+        element.set_values( row )
+        instance    = Instance( p_feature_data = element )
+        instance.id = inst_id
+        instances.append(instance)
+
+    return instances
+
+
+## -------------------------------------------------------------------------------------------------
+def run(p_detector, p_batch_size : int = 1) -> list:
+    """
+    Passes the instances to the detector in batches and returns the raised anomalies as pairs (type,
+    instance ids).
+    """
+
+    raised               = []
+    raise_anomaly_event  = p_detector._raise_anomaly_event
+
+    def raise_anomaly_event_recorded(p_anomaly, p_instance = None, p_buffer = True):
+        raised.append( ( type(p_anomaly).__name__, [ inst.id for inst in p_anomaly.instances ] ) )
+        raise_anomaly_event( p_anomaly = p_anomaly, p_instance = p_instance, p_buffer = p_buffer )
+
+    p_detector._raise_anomaly_event = raise_anomaly_event_recorded
+
+    instances = get_instances()
+    for i in range(0, C_NUM_INST, p_batch_size):
+        batch = { inst.id : ( InstTypeNew, inst ) for inst in instances[i:i + p_batch_size] }
+        p_detector._run( p_instances = batch )
+
+    return raised
+
+
+## -------------------------------------------------------------------------------------------------
+def get_detectors(p_get_algo, p_steprate : int, p_group : bool, **p_kwargs) -> tuple:
+    """
+    Returns a stock and an MLWA wrapper, each with its own algorithm created by p_get_algo().
+    """
+
+    detectors = []
+
+    for cls, kwargs in [ ( WrAnomalyDetectorSklearn2MLProRoot, {} ), ( WrAnomalyDetectorSklearn2MLPro, p_kwargs ) ]:
+        detectors.append( cls( p_algo_scikit_learn = p_get_algo(),
+                               p_instance_buffer_size = 20,
+                               p_detection_steprate = p_steprate,
+                               p_group_anomaly_det = p_group,
+                               p_anomaly_buffer_size = 1000,
+                               p_logging = Log.C_LOG_NOTHING,
+                               **kwargs ) )
+
+    return detectors
+
+
+## -------------------------------------------------------------------------------------------------
+@pytest.mark.parametrize('p_group', [ False, True ])
+@pytest.mark.parametrize('p_steprate', [ 1, 5, 20 ])
+def test_default_parity_with_stock(p_steprate : int, p_group : bool):
+
+    detector_stock, detector = get_detectors( get_lof, p_steprate, p_group )
+
+    raised_stock = run( detector_stock )
+    raised       = run( detector )
+
+    assert len(raised_stock) > 0
+    assert raised == raised_stock
+    assert [ ( type(a).__name__, [ i.id for i in a.instances ] ) for a in detector.anomalies.values() ] == \
+           [ ( type(a).__name__, [ i.id for i in a.instances ] ) for a in detector_stock.anomalies.values() ]
+
+
+## -------------------------------------------------------------------------------------------------
+@pytest.mark.parametrize('p_group', [ False, True ])
+def test_batch_scoring(p_group : bool):
+
+    # A detection per batch of 10 instances corresponds to the stock detection step rate 10
+    detector_stock = get_detectors( get_lof, 10, p_group )[0]
+    detector       = get_detectors( get_lof, 1, p_group, p_batch_scoring = True )[1]
+
+    raised_stock = run( detector_stock )
+    raised       = run( detector, p_batch_size = 10 )
+
+    assert len(raised_stock) > 0
+    assert raised == raised_stock
+
+
+## -------------------------------------------------------------------------------------------------
+def test_refit_tolerance():
+
+    # Without tolerance, the model is refitted on each detection like the stock wrapper
+    detector_stock, detector = get_detectors( get_envelope, 1, False, p_refit_tolerance = 0 )
+
+    EllipticEnvelopeCounted.num_fits = 0
+    raised_stock = run( detector_stock )
+    num_fits     = EllipticEnvelopeCounted.num_fits
+
+    EllipticEnvelopeCounted.num_fits = 0
+    assert run( detector ) == raised_stock
+    assert EllipticEnvelopeCounted.num_fits == num_fits == C_NUM_INST - 19
+
+
+    # With tolerance, the fitted model is reused on a stationary window and finds the same outliers
+    detector = get_detectors( get_envelope, 1, False, p_refit_tolerance = 0.5 )[1]
+
+    EllipticEnvelopeCounted.num_fits = 0
+    raised = run( detector )
+
+    assert EllipticEnvelopeCounted.num_fits < num_fits
+    reported = { ids[0] for name, ids in raised }
+    assert set(C_OUTLIERS) <= reported
+    assert set(C_OUTLIERS) <= { ids[0] for name, ids in raised_stock }